@@ -1 +1,3 @@
 """Make Me Unicorn CLI package."""
+
+__version__ = "0.7.0"
@@ -0,0 +1,85 @@
+"""`mmu cache export|import` — carry ``.mmu/cache`` between ephemeral CI runs.
+
+An artifact is one gzip-compressed JSON document holding the caches whose
+keys survive a fresh checkout: dependency manifests (keyed by content hash)
+and vibecheck's per-file results (keyed by git blob SHA). Caches keyed by
+mtime would be invalid after a checkout anyway, so they are left out.
+
+The artifact carries its own format version and each cache keeps the
+version its module writes; on import, a cache from an older or newer mmu is
+skipped rather than trusted, and the project simply rebuilds it.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from mmu_cli.cache import CACHE_DIR, atomic_write
+
+ARTIFACT_FORMAT = "mmu-cache"
+ARTIFACT_VERSION = 1
+
+
+def portable_caches() -> dict[str, int]:
+    """Cache file name -> the cache version this mmu reads."""
+    from mmu_cli import manifests, vibecheck
+
+    return {manifests.CACHE_NAME: manifests.CACHE_VERSION, vibecheck.FACTS_CACHE: vibecheck.FACTS_VERSION}
+
+
+def export_cache(root: Path, dest: Path) -> dict[str, Any]:
+    """Write *root*'s portable caches to *dest*; return what went in."""
+    import gzip
+
+    from mmu_cli import __version__
+
+    caches: dict[str, Any] = {}
+    for name in portable_caches():
+        try:
+            data = json.loads((root / CACHE_DIR / name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict):
+            caches[name] = data
+    doc = {"format": ARTIFACT_FORMAT, "version": ARTIFACT_VERSION, "mmu_version": __version__, "caches": caches}
+    payload = gzip.compress(json.dumps(doc, separators=(",", ":")).encode("utf-8"), mtime=0)
+    atomic_write(dest, payload)
+    return {"file": str(dest), "bytes": len(payload), "caches": sorted(caches)}
+
+
+def import_cache(root: Path, src: Path) -> dict[str, Any]:
+    """Restore the caches in *src* into *root*'s ``.mmu/cache`` (replacing them).
+
+    Raises OSError when *src* cannot be read and ValueError when it is not an
+    artifact this mmu understands.
+    """
+    import gzip
+    import zlib
+
+    raw = src.read_bytes()
+    try:
+        doc = json.loads(gzip.decompress(raw))
+    except (OSError, EOFError, zlib.error, ValueError) as exc:
+        raise ValueError(f"{src} is not an mmu cache artifact ({exc})") from None
+    if not isinstance(doc, dict) or doc.get("format") != ARTIFACT_FORMAT:
+        raise ValueError(f"{src} is not an mmu cache artifact")
+    if doc.get("version") != ARTIFACT_VERSION:
+        raise ValueError(f"{src} is cache artifact version {doc.get('version')}; this mmu reads version {ARTIFACT_VERSION}")
+    caches = doc.get("caches")
+    if not isinstance(caches, dict):
+        raise ValueError(f"{src} has no caches")
+
+    imported: list[str] = []
+    skipped: list[str] = []
+    for name, version in portable_caches().items():
+        data = caches.get(name)
+        if data is None:
+            continue
+        if not isinstance(data, dict) or data.get("version") != version:
+            skipped.append(name)
+            continue
+        atomic_write(root / CACHE_DIR / name, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        imported.append(name)
+    return {"file": str(src), "mmu_version": doc.get("mmu_version"), "caches": imported, "skipped": skipped}
@@ -0,0 +1,318 @@
+"""`mmu bench` — time mmu itself on deterministic synthetic projects.
+
+:func:`generate_repo` writes a project of a requested size from a seed: mixed
+JS/TS/Python sources spread over nested directories, webhook handlers, auth
+files, a few seeded secrets and f-string SQL, a ``node_modules`` tree that
+the index must skip, a large ``package-lock.json``, and the docs and
+blueprints ``mmu init`` creates. The same size and seed always give the same
+bytes, so timings are comparable across machines and commits.
+
+Each command runs in a fresh interpreter (start-up included, daemon off):
+once *cold*, right after ``.mmu/cache`` and ``.mmu/state.json`` are removed,
+then *warm* — best of ``repeat`` runs with the on-disk caches in place.
+Throughput is code files and code bytes per warm second; peak RSS is the
+highest memory high-water mark any of those processes reported.
+
+The report is plain JSON. :func:`compare` checks it against a stored
+baseline and lists every timing or memory figure that grew by more than the
+tolerance, so CI can fail on regressions.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+COMMANDS = ("doctor", "vibecheck", "scan", "status", "next")
+DEFAULT_SIZES = (1000,)
+DEFAULT_TOLERANCE = 0.25
+FILES_PER_DIR = 64
+STAMP = ".mmu-bench.json"
+
+# Differences below these are noise, whatever the ratio.
+MIN_DELTA_S = 0.05
+MIN_DELTA_KB = 10_240
+
+_AREAS = ("app", "src/components", "src/lib", "api/routes", "services", "workers")
+_KINDS = (".ts", ".tsx", ".js", ".py", ".py", ".ts")
+
+_LINES = {
+    ".py": (
+        "import logging",
+        "logger = logging.getLogger(__name__)",
+        "def handler_{n}(request):",
+        "    payload = request.json()",
+        "    return {{'ok': True, 'id': {n}}}",
+        "class Service{n}:",
+        "    def run(self, items):",
+        "        return [item for item in items if item]",
+        "# TODO: pagination",
+    ),
+    ".ts": (
+        "import {{ z }} from 'zod';",
+        "export const schema{n} = z.object({{ id: z.number() }});",
+        "export async function load{n}(id: number) {{",
+        "  const res = await fetch(`/api/items/${{id}}`);",
+        "  return res.json();",
+        "}}",
+        "export type Item{n} = {{ id: number; name: string }};",
+        "// keep in sync with the backend",
+    ),
+    ".tsx": (
+        "import React from 'react';",
+        "export function Card{n}({{ title }}: {{ title: string }}) {{",
+        "  return <div className=\"card\">{{title}}</div>;",
+        "}}",
+        "const styles{n} = {{ padding: 8 }};",
+    ),
+    ".js": (
+        "const express = require('express');",
+        "module.exports = function route{n}(req, res) {{",
+        "  res.json({{ ok: true }});",
+        "}};",
+        "const limit{n} = 100;",
+    ),
+}
+
+
+def _code(rng: random.Random, ext: str, n: int) -> str:
+    lines = _LINES[ext]
+    return "\n".join(rng.choice(lines).format(n=n) for _ in range(rng.randint(10, 120))) + "\n"
+
+
+def _token(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789") for _ in range(length))
+
+
+def generate_repo(root: Path, files: int, seed: int = 0) -> None:
+    """Write a synthetic project with *files* code files under *root* (deterministic per seed)."""
+    from mmu_cli.cli import command_init
+
+    rng = random.Random(seed)
+    made: set[Path] = set()
+
+    def write(rel: str, text: str) -> None:
+        path = root / rel
+        if path.parent not in made:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            made.add(path.parent)
+        path.write_text(text, encoding="utf-8")
+
+    root.mkdir(parents=True, exist_ok=True)
+    command_init(root, force=False)
+    packages = {f"pkg-{i}": f"1.{i % 10}.{i % 7}" for i in range(max(files // 2, 10))}
+    write("package.json", json.dumps({
+        "name": "bench-app",
+        "dependencies": {"next": "14.2.0", "react": "18.3.0", "stripe": "15.0.0", "zod": "3.23.0"},
+        "devDependencies": {"typescript": "5.4.0", "vitest": "1.6.0"},
+    }, indent=2))
+    write("requirements.txt", "fastapi==0.111.0\npydantic==2.7.0\nsqlalchemy==2.0.30\n")
+    write("package-lock.json", json.dumps({
+        "name": "bench-app",
+        "lockfileVersion": 3,
+        "packages": {f"node_modules/{name}": {"version": version, "resolved": f"https://registry.npmjs.org/{name}/-/{name}-{version}.tgz",
+                                              "integrity": "sha512-" + _token(rng, 86)} for name, version in packages.items()},
+    }, indent=2))
+
+    for i in range(files):
+        ext = rng.choice(_KINDS)
+        area = _AREAS[i % len(_AREAS)]
+        directory = f"{area}/mod{i // FILES_PER_DIR:04}"
+        name = f"file{i:06}{ext}"
+        text = _code(rng, ext, i)
+        if i % 100 == 7:
+            directory, name = "app/api/webhooks", f"provider{i:06}{ext}"
+            text += "// verify stripe-signature before handling\n" if i % 200 == 7 else ""
+        elif i % 150 == 11:
+            name = f"login{i:06}{ext}"
+        if i % 997 == 13:
+            text += f'STRIPE_KEY = "sk_test_{_token(rng, 24)}"\n'
+        if ext == ".py" and i % 499 == 17:
+            text += 'query = f"SELECT * FROM users WHERE id = {user_id}"\n'
+        write(f"{directory}/{name}", text)
+
+    for i in range(files // 4):
+        write(f"node_modules/pkg-{i // 8}/lib/index{i % 8}.js", _code(rng, ".js", i))
+    write(STAMP, json.dumps({"files": files, "seed": seed}))
+
+
+# Runs one mmu command in the child and reports that process's own memory
+# high-water mark. The parent's rusage cannot be used: on Linux a child's
+# ru_maxrss starts from the parent's RSS at fork time.
+_CHILD = """
+import sys
+from mmu_cli.cli import main
+try:
+    code = main(sys.argv[1:])
+finally:
+    rss = None
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            rss = next(int(line.split()[1]) for line in status if line.startswith("VmHWM:"))
+    except (OSError, StopIteration, ValueError):
+        try:
+            import resource
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1)
+        except ImportError:
+            pass
+    if rss is not None:
+        sys.stderr.write(f"\\n%s {rss}\\n")
+sys.exit(code)
+"""
+_RSS_MARKER = "mmu-bench-peak-rss-kb"
+
+
+def _timed(args: list[str], env: dict[str, str]) -> tuple[float, int, int | None]:
+    """Run ``mmu *args*`` in a fresh interpreter; return (seconds, exit code, peak RSS in KiB or None)."""
+    import subprocess
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD % _RSS_MARKER, *args],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env, check=False,
+    )
+    elapsed = time.perf_counter() - start
+    rss = None
+    for line in proc.stderr.decode("utf-8", "replace").splitlines():
+        if line.startswith(_RSS_MARKER):
+            rss = int(line.split()[1])
+    return elapsed, proc.returncode, rss
+
+
+def _child_env() -> dict[str, str]:
+    from mmu_cli.daemon import DISABLE_ENV
+
+    env = dict(os.environ)
+    package_parent = str(Path(__file__).resolve().parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (package_parent, env.get("PYTHONPATH")) if p)
+    env[DISABLE_ENV] = "1"
+    env["NO_COLOR"] = "1"
+    return env
+
+
+def _clear_caches(root: Path) -> None:
+    from mmu_cli.cache import CACHE_DIR
+    from mmu_cli.state import STATE_PATH
+
+    shutil.rmtree(root / CACHE_DIR, ignore_errors=True)
+    try:
+        (root / STATE_PATH).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def measure(root: Path, command: str, repeat: int = 3) -> dict[str, Any]:
+    """Cold and best-of-*repeat* warm timings of one command on *root*."""
+    argv = [command, "--json", "--root", str(root)]
+    env = _child_env()
+    _clear_caches(root)
+    cold, exit_code, cold_rss = _timed(argv, env)
+    warm_runs = [_timed(argv, env) for _ in range(max(repeat, 1))]
+    rss = [r for r in (cold_rss, *(run[2] for run in warm_runs)) if r is not None]
+    return {
+        "command": command,
+        "exit_code": exit_code,
+        "cold_s": round(cold, 4),
+        "warm_s": round(min(run[0] for run in warm_runs), 4),
+        "peak_rss_kb": max(rss) if rss else None,
+    }
+
+
+def prepare(workdir: Path, files: int, seed: int) -> Path:
+    """The synthetic repo for (*files*, *seed*) under *workdir*, generated unless already there."""
+    root = workdir / f"files-{files}-seed-{seed}"
+    try:
+        if json.loads((root / STAMP).read_text(encoding="utf-8")) == {"files": files, "seed": seed}:
+            return root
+    except (OSError, ValueError):
+        pass
+    shutil.rmtree(root, ignore_errors=True)
+    generate_repo(root, files, seed)
+    return root
+
+
+def run_bench(
+    workdir: Path,
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    commands: tuple[str, ...] = COMMANDS,
+    repeat: int = 3,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Benchmark *commands* on one synthetic repo per size; return the JSON report."""
+    import platform
+
+    from mmu_cli import __version__
+    from mmu_cli.index import ProjectIndex
+
+    results = []
+    for files in sizes:
+        started = time.perf_counter()
+        root = prepare(workdir, files, seed)
+        generated_s = time.perf_counter() - started
+        index = ProjectIndex.build(root)
+        size = sum(path.stat().st_size for path in index.files)
+        for command in commands:
+            row = measure(root, command, repeat)
+            warm = max(row["warm_s"], 1e-9)
+            results.append({
+                "files": files,
+                "code_files": len(index),
+                "bytes": size,
+                **row,
+                "files_per_s": round(len(index) / warm, 1),
+                "mb_per_s": round(size / 1_048_576 / warm, 2),
+                "setup_s": round(generated_s, 3),
+            })
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Regressions of *report* against *baseline*, one line each; empty when none."""
+    base = {(row["command"], row["files"]): row for row in baseline.get("results", [])}
+    regressions = []
+    for row in report["results"]:
+        old = base.get((row["command"], row["files"]))
+        if old is None:
+            continue
+        for key, floor, unit in (("cold_s", MIN_DELTA_S, "s"), ("warm_s", MIN_DELTA_S, "s"), ("peak_rss_kb", MIN_DELTA_KB, " KiB")):
+            before, after = old.get(key), row.get(key)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + tolerance) and after - before > floor:
+                regressions.append(
+                    f"{row['command']} @ {row['files']} files: {key} {before}{unit} -> {after}{unit} "
+                    f"(+{(after / before - 1) * 100 if before else float('inf'):.0f}%)"
+                )
+    return regressions
+
+
+def format_report(report: dict[str, Any], regressions: list[str] | None = None) -> list[str]:
+    lines = [f"mmu bench — mmu {report['version']}, Python {report['python']} on {report['platform']}", ""]
+    lines.append(f"  {'command':<10} {'files':>8} {'cold s':>8} {'warm s':>8} {'files/s':>10} {'MB/s':>8} {'peak RSS':>10}")
+    for row in report["results"]:
+        rss = f"{row['peak_rss_kb'] / 1024:.0f} MiB" if row["peak_rss_kb"] is not None else "n/a"
+        lines.append(
+            f"  {row['command']:<10} {row['code_files']:>8} {row['cold_s']:>8.3f} {row['warm_s']:>8.3f} "
+            f"{row['files_per_s']:>10.0f} {row['mb_per_s']:>8.2f} {rss:>10}"
+        )
+    if regressions is not None:
+        lines.append("")
+        if regressions:
+            lines.append(f"Bench result: {len(regressions)} regression(s) against the baseline")
+            lines.extend(f"  [fail] {line}" for line in regressions)
+        else:
+            lines.append("Bench result: no regressions against the baseline")
+    return lines
@@ -0,0 +1,254 @@
+"""Parsed blueprint model shared by every checklist consumer.
+
+Blueprints and the ``from_scratch`` gate checklist are markdown files with
+``## Section`` headings, ``- [ ]`` / ``- [x]`` items, optional ``[P0]``/``[P1]``
+priority tags, ``<!-- if:flag --> ... <!-- endif -->`` condition blocks and
+optional ``<!-- id: name -->`` / ``<!-- after: a, b -->`` dependency
+annotations on item lines (see :mod:`mmu_cli.graph`).
+:func:`load_blueprint` is the one parser for that format. Results are memoized
+per file by (mtime, size, flags), and :func:`write_blueprint` drops the memo
+for files rewritten in-process, so repeated reads within a command (or a
+long-lived process) never re-run the regexes on an unchanged file.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+from mmu_cli import trace
+from mmu_cli.cache import atomic_write
+
+ITEM_RE = re.compile(r"^(\s*-\s*)\[(x|X|\s)\](\s+.+)$")
+SECTION_RE = re.compile(r"^##\s+(.+)$")
+STAGE_RE = re.compile(r"^##\s*(M\d+)\s+(.+?)\s*$")
+CONDITION_IF = re.compile(r"^<!--\s*if:(\w+)\s*-->")
+CONDITION_ENDIF = re.compile(r"^<!--\s*endif\s*-->")
+PRIORITY_RE = re.compile(r"^\[P([012])\]\s*", re.IGNORECASE)
+ANNOTATION_RE = re.compile(r"\s*<!--\s*(id|after)\s*:\s*(.*?)\s*-->", re.IGNORECASE)
+
+# Bound on memoized (file, flags) entries; plenty for every blueprint plus gates.
+MEMO_SIZE = 64
+
+
+def parse_priority(text: str) -> tuple[int, str]:
+    """Extract priority tag from item text. Returns (priority, clean_text)."""
+    m = PRIORITY_RE.match(text)
+    if m:
+        return int(m.group(1)), text[m.end():].strip()
+    return 2, text  # default priority
+
+
+@dataclass(frozen=True)
+class Item:
+    """One checkbox line."""
+
+    line: int  # 0-based line index in the file
+    done: bool
+    raw: str  # text after the checkbox, priority tag included
+    text: str  # text with the priority tag removed
+    priority: int
+    section: str  # last ``## `` heading above the item ("" before the first)
+    stage: str  # last ``## M<n> Title`` heading above the item ("" if none)
+    active: bool  # False inside a disabled ``<!-- if:flag -->`` block
+    number: int  # 1-based position among active items (what `mmu check` takes); 0 if skipped
+    id: str = ""  # from ``<!-- id: name -->``, lowercased
+    after: tuple[str, ...] = ()  # ids from ``<!-- after: a, b -->``, lowercased
+
+
+@dataclass(frozen=True)
+class Section:
+    title: str
+    line: int
+    active: bool
+
+
+@dataclass(frozen=True)
+class Blueprint:
+    path: Path
+    lines: tuple[str, ...]
+    trailing_newline: bool
+    sections: tuple[Section, ...]
+    stages: tuple[str, ...]  # "M0 Problem Fit", ... in file order
+    items: tuple[Item, ...]
+
+    @cached_property
+    def active_items(self) -> tuple[Item, ...]:
+        return tuple(item for item in self.items if item.active)
+
+    @property
+    def done(self) -> int:
+        return sum(1 for item in self.items if item.active and item.done)
+
+    @property
+    def total(self) -> int:
+        return sum(1 for item in self.items if item.active)
+
+    @property
+    def skipped(self) -> int:
+        return sum(1 for item in self.items if not item.active)
+
+    def item(self, number: int) -> Item | None:
+        """Active item by its 1-based number, or None when out of range."""
+        active = self.active_items
+        return active[number - 1] if 1 <= number <= len(active) else None
+
+    @cached_property
+    def stage_items(self) -> dict[str, tuple[Item, ...]]:
+        """Stage label -> its items in file order, for every stage heading (active or not)."""
+        out: dict[str, list[Item]] = {stage: [] for stage in self.stages}
+        for item in self.items:
+            if item.stage:
+                out[item.stage].append(item)
+        return {stage: tuple(items) for stage, items in out.items()}
+
+    def stage_counts(self) -> list[tuple[str, int, int]]:
+        """[(stage_label, done, total), ...] over every stage heading, empty ones included."""
+        counts = {stage: [0, 0] for stage in self.stages}
+        for item in self.items:
+            if item.stage and item.active:
+                counts[item.stage][1] += 1
+                counts[item.stage][0] += item.done
+        return [(stage, done, total) for stage, (done, total) in counts.items()]
+
+    def render(self, updates: dict[int, bool]) -> str:
+        """File text with the items at the given line indices set done/undone."""
+        lines = list(self.lines)
+        for idx, done in updates.items():
+            m = ITEM_RE.match(lines[idx])
+            if m:
+                lines[idx] = f"{m.group(1)}[{'x' if done else ' '}]{m.group(3)}"
+        text = "\n".join(lines)
+        return text + "\n" if self.trailing_newline else text
+
+
+def parse_annotations(raw: str) -> tuple[str, str, tuple[str, ...]]:
+    """Split dependency annotations off item text. Returns (text, id, after_ids)."""
+    if "<!--" not in raw:
+        return raw, "", ()
+    item_id = ""
+    after: list[str] = []
+    for kind, value in ANNOTATION_RE.findall(raw):
+        names = [name.lower() for name in re.split(r"[\s,]+", value) if name]
+        if kind.lower() == "id":
+            item_id = names[0] if names else item_id
+        else:
+            after.extend(names)
+    return ANNOTATION_RE.sub("", raw).strip(), item_id, tuple(dict.fromkeys(after))
+
+
+def parse_blueprint(path: Path, text: str, flags: dict[str, bool] | None = None) -> Blueprint:
+    """Parse *text*. With *flags* None every condition block counts as active."""
+    lines = text.splitlines()
+    sections: list[Section] = []
+    stages: list[str] = []
+    items: list[Item] = []
+    condition_stack: list[bool] = []
+    section = ""
+    stage = ""
+    number = 0
+
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+
+        m_if = CONDITION_IF.match(stripped)
+        if m_if:
+            condition_stack.append(True if flags is None else flags.get(m_if.group(1), True))
+            continue
+        if CONDITION_ENDIF.match(stripped):
+            if condition_stack:
+                condition_stack.pop()
+            continue
+
+        active = all(condition_stack)
+
+        hm = SECTION_RE.match(line)
+        if hm:
+            section = hm.group(1).strip()
+            sections.append(Section(section, i, active))
+            sm = STAGE_RE.match(line)
+            if sm:
+                # Non-stage headings inside a stage do not reset it.
+                stage = f"{sm.group(1)} {sm.group(2)}"
+                stages.append(stage)
+            continue
+
+        m = ITEM_RE.match(line)
+        if m:
+            raw, item_id, after = parse_annotations(m.group(3).strip())
+            priority, clean = parse_priority(raw)
+            if active:
+                number += 1
+            items.append(Item(
+                line=i,
+                done=m.group(2) in "xX",
+                raw=raw,
+                text=clean,
+                priority=priority,
+                section=section,
+                stage=stage,
+                active=active,
+                number=number if active else 0,
+                id=item_id,
+                after=after,
+            ))
+
+    return Blueprint(
+        path=path,
+        lines=tuple(lines),
+        trailing_newline=text.endswith("\n"),
+        sections=tuple(sections),
+        stages=tuple(dict.fromkeys(stages)),
+        items=tuple(items),
+    )
+
+
+# (path, flags key) -> ((mtime_ns, size), Blueprint), least recently used first.
+_MEMO: OrderedDict[tuple[Path, tuple[tuple[str, bool], ...] | None], tuple[tuple[int, int], Blueprint]] = OrderedDict()
+
+
+def load_blueprint(path: Path, flags: dict[str, bool] | None = None) -> Blueprint | None:
+    """Parsed blueprint at *path*, or None if it cannot be read."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    sig = (st.st_mtime_ns, st.st_size)
+    key = (path, None if flags is None else tuple(sorted(flags.items())))
+    memo = _MEMO.get(key)
+    if memo is not None and memo[0] == sig:
+        _MEMO.move_to_end(key)
+        return memo[1]
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    with trace.span("blueprint.parse", file=path.name):
+        blueprint = parse_blueprint(path, text, flags)
+    _MEMO[key] = (sig, blueprint)
+    _MEMO.move_to_end(key)
+    while len(_MEMO) > MEMO_SIZE:
+        _MEMO.popitem(last=False)
+    return blueprint
+
+
+def invalidate(path: Path) -> None:
+    """Forget memoized parses of *path* (all flag combinations)."""
+    for key in [k for k in _MEMO if k[0] == path]:
+        del _MEMO[key]
+
+
+def write_blueprint(path: Path, text: str) -> None:
+    """Atomically replace *path* with *text* and drop its memo; a same-size
+    rewrite within one mtime tick would otherwise look unchanged."""
+    try:
+        mode = path.stat().st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    atomic_write(path, text.encode("utf-8"))
+    os.chmod(path, mode)  # mkstemp creates 0600; keep the file's permissions
+    invalidate(path)
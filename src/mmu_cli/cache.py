@@ -0,0 +1,112 @@
+"""On-disk caches under ``.mmu/cache/``.
+
+Caches are an optimization only. They are written only inside a workspace
+that already has a ``.mmu/`` directory (created by ``mmu init``), so
+read-only commands such as ``mmu vibecheck`` never create files in a project
+that has not opted in. A missing, unreadable or corrupt cache is treated as
+empty.
+
+Caches meant to outlive a checkout (see `mmu cache export`) key their
+entries by content: a hash of the bytes, or the git blob SHA from
+:func:`git_blobs`, which needs no read at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from mmu_cli import trace
+
+CACHE_DIR = ".mmu/cache"
+
+
+def cache_dir(root: Path) -> Path | None:
+    """Return the cache directory for *root*, or None if caching is off there."""
+    if not (root / ".mmu").is_dir():
+        return None
+    return root / CACHE_DIR
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a temp file + rename, so readers never see a torn file."""
+    import tempfile  # pulls in shutil and random; only writers pay for it
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_json(root: Path, name: str) -> dict[str, Any]:
+    """Load ``.mmu/cache/<name>``; {} when absent, disabled, or corrupt."""
+    directory = cache_dir(root)
+    if directory is None:
+        return {}
+    try:
+        data = json.loads((directory / name).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_json(root: Path, name: str, data: dict[str, Any]) -> bool:
+    """Persist ``.mmu/cache/<name>``. Returns False when caching is off or the write fails."""
+    directory = cache_dir(root)
+    if directory is None:
+        return False
+    try:
+        atomic_write(directory / name, json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    except OSError:
+        return False
+    return True
+
+
+def _git_ls_files(root: Path, *args: str) -> list[str] | None:
+    import subprocess
+
+    try:
+        out = subprocess.run(
+            ["git", "-C", str(root), "ls-files", "-z", *args],
+            capture_output=True, check=True, timeout=60,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.decode("utf-8", errors="surrogateescape").split("\0")[:-1]
+
+
+def git_blobs(root: Path) -> dict[str, str]:
+    """Root-relative path -> git blob SHA for every tracked regular file the work
+    tree has not modified; {} when *root* is not in a git work tree.
+
+    Paths git reports as modified (or deleted) are left out, so a SHA always
+    names the bytes on disk and callers can use it instead of reading them.
+    """
+    with trace.span("git.ls_files", "io", root=str(root)):
+        staged = _git_ls_files(root, "--stage")
+        modified = _git_ls_files(root, "--modified") if staged else None
+    if not staged or modified is None:
+        return {}
+    changed = set(modified)
+    blobs: dict[str, str] = {}
+    for line in staged:
+        info, _, rel = line.partition("\t")
+        mode, sha, stage = info.split(" ")
+        if stage == "0" and mode in {"100644", "100755"} and rel not in changed:
+            blobs[rel] = sha
+    return blobs
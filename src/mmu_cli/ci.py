@@ -0,0 +1,185 @@
+"""`mmu ci` — doctor, the configured stage gates and vibecheck in one process.
+
+One run walks the project once: doctor and vibecheck share the memoized code
+file index (:func:`mmu_cli.index.load_index`), and every gate is evaluated
+from one parse of the ``from_scratch`` checklist (:func:`mmu_cli.cli.iter_gates`).
+Each tool becomes a :class:`Suite` of :class:`Case` results, rendered as
+text, JSON or JUnit XML.
+
+The exit code is the highest of the blocking suites' own exit codes (doctor
+and vibecheck 2, a gate that does not pass 3, a bad stage or checklist 1);
+suites named in ``advisory`` are reported but never fail the run.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+_TARGET_LINE = re.compile(r"^\s*(M\d+)\s*$")
+
+
+@dataclass
+class Case:
+    name: str
+    status: str  # "ok" | "fail" | "warn" | "skip"
+    message: str = ""
+    details: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Suite:
+    name: str
+    exit_code: int
+    cases: list[Case] = field(default_factory=list)
+    advisory: bool = False
+
+    def counts(self) -> dict[str, int]:
+        out = {"ok": 0, "fail": 0, "warn": 0, "skip": 0}
+        for case in self.cases:
+            out[case.status] += 1
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), **self.counts()}
+
+
+def read_targets(path: Path, errors: list[str] | None = None) -> list[str]:
+    """Stages listed one per line in *path* (comments ignored); none when it is missing.
+
+    A targets file that exists but cannot be read (a directory, no
+    permission, not UTF-8) gives no stages and a message in *errors*.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+    except (OSError, UnicodeDecodeError) as exc:
+        if errors is not None:
+            errors.append(f"cannot read {path}: {exc}")
+        return []
+    return [m.group(1) for m in map(_TARGET_LINE.match, text.splitlines()) if m]
+
+
+def doctor_suite(root: Path) -> Suite:
+    from mmu_cli.cli import iter_doctor
+
+    suite = Suite("doctor", 0)
+    for event in iter_doctor(root):
+        if event["event"] == "check":
+            suite.cases.append(Case(event["message"], event["status"]))
+        else:
+            suite.exit_code = event["exit_code"]
+    return suite
+
+
+def gates_suite(root: Path, stages: list[str]) -> Suite:
+    from mmu_cli.cli import iter_gates
+
+    suite = Suite("gates", 0)
+    if not stages:
+        return suite
+    pending: list[str] = []
+    errors: list[str] = []
+    for event in iter_gates(stages, root):
+        if event["event"] == "pending":
+            pending.append(event["item"])
+        elif event["event"] == "error":
+            errors.append(event["message"])
+        elif event["event"] == "stage":
+            if errors:
+                case = Case(event["stage"], "fail", errors[0], errors[1:])
+            elif pending:
+                case = Case(event["heading"], "fail", f"{len(pending)} item(s) pending", pending)
+            else:
+                case = Case(event["heading"], "ok", "pass")
+            suite.cases.append(case)
+            pending, errors = [], []
+        else:
+            suite.exit_code = event["exit_code"]
+    return suite
+
+
+def vibecheck_suite(root: Path) -> Suite:
+    from mmu_cli.vibecheck import iter_vibecheck
+
+    suite = Suite("vibecheck", 0)
+    for event in iter_vibecheck(root):
+        if event["event"] == "finding":
+            details = list(event["files"])
+            if event["hint"]:
+                details.append(f"↳ {event['hint']}")
+            suite.cases.append(Case(f"({event['severity']}) {event['check']}", event["status"], event["message"], details))
+        elif event["event"] == "summary":
+            suite.exit_code = event["exit_code"]
+    return suite
+
+
+def run_ci(root: Path, stages: list[str], advisory: frozenset[str] = frozenset()) -> list[Suite]:
+    suites = [doctor_suite(root), gates_suite(root, stages), vibecheck_suite(root)]
+    for suite in suites:
+        suite.advisory = suite.name in advisory
+    return suites
+
+
+def exit_code(suites: list[Suite]) -> int:
+    return max((s.exit_code for s in suites if not s.advisory), default=0)
+
+
+def format_suites(suites: list[Suite]) -> list[str]:
+    lines: list[str] = []
+    for suite in suites:
+        label = f"{suite.name} (advisory)" if suite.advisory else suite.name
+        lines.append(f"CI: {label}")
+        if not suite.cases:
+            lines.append("  [skip] no gate targets configured")
+        for case in suite.cases:
+            text = f"{case.name}: {case.message}" if case.message else case.name
+            lines.append(f"  [{case.status}] {text}")
+            if case.status in {"fail", "warn"}:
+                lines.extend(f"        {line}" for line in case.details[:5])
+                if len(case.details) > 5:
+                    lines.append(f"        … and {len(case.details) - 5} more")
+        lines.append("")
+    parts = []
+    for suite in suites:
+        fails = suite.counts()["fail"]
+        parts.append(f"{suite.name} {'clean' if not fails else f'{fails} failed'}{' (advisory)' if suite.advisory and fails else ''}")
+    code = exit_code(suites)
+    lines.append(f"CI result: {'PASS' if code == 0 else 'FAIL'} — {', '.join(parts)}")
+    return lines
+
+
+def to_junit(suites: list[Suite]) -> str:
+    """JUnit XML: one ``<testsuite>`` per tool, failures as ``<failure>``, skips as ``<skipped>``.
+
+    Advisory failures are reported as ``<skipped>`` so test report viewers do
+    not count them against the build.
+    """
+    import xml.etree.ElementTree as ET
+
+    top = ET.Element("testsuites", name="mmu ci")
+    totals = {"tests": 0, "failures": 0, "skipped": 0}
+    for suite in suites:
+        node = ET.SubElement(top, "testsuite", name=f"mmu.{suite.name}")
+        failures = skipped = 0
+        for case in suite.cases:
+            el = ET.SubElement(node, "testcase", classname=f"mmu.{suite.name}", name=case.name)
+            body = "\n".join([case.message, *case.details]).strip()
+            if case.status == "fail" and not suite.advisory:
+                failures += 1
+                ET.SubElement(el, "failure", message=case.message).text = body
+            elif case.status == "skip" or case.status == "fail":
+                skipped += 1
+                ET.SubElement(el, "skipped", message=case.message or case.name)
+            elif case.status == "warn":
+                ET.SubElement(el, "system-out").text = body
+        counts = {"tests": len(suite.cases), "failures": failures, "skipped": skipped}
+        node.attrib.update({k: str(v) for k, v in counts.items()})
+        for key, value in counts.items():
+            totals[key] += value
+    top.attrib.update({k: str(v) for k, v in totals.items()})
+    ET.indent(top)
+    return '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(top, encoding="unicode") + "\n"
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
-import argparse
-import datetime as dt
-import json
 import os
 import re
-import subprocess
 import sys
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from textwrap import dedent
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-try:
-    import tomllib
-except ModuleNotFoundError:
-    try:
-        import tomli as tomllib  # type: ignore[no-redef]
-    except ModuleNotFoundError:
-        tomllib = None  # type: ignore[assignment]
+from mmu_cli import trace
+
+# Config lives in mmu_cli.config; the old names stay importable from here.
+from mmu_cli.config import DEFAULT_SKIP_PATHS, FEATURE_FLAG_DEFAULTS, Config  # noqa: F401
+from mmu_cli.config import generate_stack_config as _generate_stack_config
+from mmu_cli.config import parse_simple_toml as _parse_simple_toml  # noqa: F401
+
+if TYPE_CHECKING:
+    import argparse
+
+    from mmu_cli.blueprint import Blueprint
 
 MODES = {
     "problem": ["docs/core/strategy.md", "docs/research/competitors.md", "docs/research/user_feedback.md"],
@@ -57,25 +58,7 @@ REQUIRED_FILES = [
     "prompts/adr.md",
 ]
 
-DEFAULT_SKIP_PATHS = {
-    ".git",
-    ".venv",
-    "node_modules",
-    "dist",
-    "build",
-    "docs",
-    ".mmu",
-    ".github",
-    "src/mmu_cli",
-    "scripts",
-    "examples",
-    "cli",
-    "tests",
-}
-
 CODE_EXTENSIONS = {".js", ".jsx", ".ts", ".tsx", ".py", ".go", ".rb", ".java", ".cs"}
-HEADING_PATTERN = re.compile(r"^##\s*(M\d+)\s+(.+?)\s*$")
-UNCHECKED_PATTERN = re.compile(r"^\s*-\s*\[\s\]\s+(.+)$")
 
 INIT_TEMPLATES: dict[str, str] = {
     "README.md": dedent(
@@ -214,125 +197,318 @@ INIT_TEMPLATES: dict[str, str] = {
 
 
 class Result(dict):
+    """Structured command outcome; ``messages`` holds the terminal lines.
+
+    Commands whose terminal output is expensive pass ``render=`` (and, for
+    other display-only keys, ``lazy=``) instead: callables that build the value
+    on first access. ``--json`` output reads only the structured fields, so it
+    never pays for string formatting.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        render: Callable[[], list[str]] | None = None,
+        lazy: dict[str, Callable[[], Any]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy = dict(lazy or {})
+        if render is not None:
+            self._lazy["messages"] = render
+
+    def _materialize(self, key: Any) -> None:
+        if key in self._lazy and not dict.__contains__(self, key):
+            self[key] = self._lazy.pop(key)()
+
+    def __getitem__(self, key: Any) -> Any:
+        self._materialize(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._lazy or super().__contains__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._materialize(key)
+        return super().get(key, default)
+
     @property
     def exit_code(self) -> int:
         return int(self.get("exit_code", 1))
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(prog="mmu", description="Make Me Unicorn CLI")
-    parser.add_argument("--root", default=".", help="Project root path")
-    parser.add_argument("--json", action="store_true", help="Output structured JSON")
+JSON_HELP = "Output structured JSON"
+ROOT_HELP = "Project root path"
+FORMAT_HELP = "text (default), json (same as --json) or ndjson: one JSON event per line as results come in, then a summary"
+
+
+def _common(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--json", action="store_true", help=JSON_HELP)
+    p.add_argument("--root", default=".", help=ROOT_HELP)
+
+
+def _add_format(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--format", dest="output_format", choices=["text", "json", "ndjson"], default="text", help=FORMAT_HELP)
+
+
+def _add_init(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    p.add_argument("--force", action="store_true", help="Overwrite existing files")
+    p.add_argument("--interactive", action="store_true", help="LLM-guided project setup (requires anthropic SDK)")
+
+
+def _add_start(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    p.add_argument("--mode", required=True, choices=sorted(MODES.keys()))
+    p.add_argument("--emit", choices=["list", "bundle"], default="list", help="Output format")
+    p.add_argument("--output", help="Write bundle output to a file")
+    p.add_argument("--clipboard", action="store_true", help="Copy bundle output to clipboard")
+    p.add_argument("--agent", action="store_true", help="Format context for LLM agent injection")
+
+
+def _add_doctor(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    p.add_argument("--deep", action="store_true", help="LLM-powered semantic analysis (requires anthropic SDK)")
+    _add_format(p)
+
+
+def _add_vibecheck(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    _add_format(p)
+    p.add_argument("action", nargs="?", choices=["merge"], help="merge: combine --shard results into one report")
+    p.add_argument("shards", nargs="*", metavar="SHARD_FILE", help="merge: one result file per shard")
+    p.add_argument("--shard", metavar="K/N", help="Scan only shard K of N (split by a hash of each path) and write a partial result")
+    p.add_argument("--output", "-o", help="--shard: partial result file (default: shard-K-of-N.json; '-' for stdout)")
+
+
+def _add_fleet(p: argparse.ArgumentParser) -> None:
+    fleet_sub = p.add_subparsers(dest="fleet_command", required=True)
+    p_vc = fleet_sub.add_parser("vibecheck", help="Vibecheck each repo; stream NDJSON per repo plus a summary")
+    p_vc.add_argument("dir", help="Directory to search for git repositories")
+    p_vc.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    p_vc.add_argument("--chunk-size", type=int, default=256, help="Files per scan task (default: 256)")
+
+
+def _add_gate(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    which = p.add_mutually_exclusive_group(required=True)
+    which.add_argument("--stage", help="Stage key, or several comma-separated (for example: M0 or M0,M1,M2)")
+    which.add_argument("--all", action="store_true", help="Every stage in docs/checklists/from_scratch.md")
+    _add_format(p)
+
+
+def _add_status(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    p.add_argument("--why", action="store_true", help="Show score breakdown (applicable/checked/skipped per blueprint)")
+    p.add_argument("--trend", action="store_true", help="Append score sparklines from .mmu/history.jsonl")
+    p.add_argument("--roots-file", help="Portfolio mode: file with one project root per line")
+    p.add_argument("--glob", action="append", default=[], metavar="PATTERN",
+                   help="Portfolio mode: project roots matching PATTERN (repeatable, e.g. '~/clients/*')")
+    p.add_argument("--workers", type=int, default=None, help="Portfolio mode: worker processes (default: CPU count)")
+    p.add_argument("--export", metavar="PATH", help="Portfolio mode: also write rows to PATH (.csv or .json)")
+
+
+def _add_history(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--limit", type=int, default=30, help="Number of most recent records (default: 30)")
+    _common(p)
+
+
+def _add_search(p: argparse.ArgumentParser) -> None:
+    p.add_argument("query", nargs="+", help="Search terms")
+    p.add_argument("-n", type=int, default=10, help="Number of results (default: 10)")
+    _common(p)
+
+
+def _add_next(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    p.add_argument("-n", type=int, default=3, help="Number of recommendations (default: 3)")
+    p.add_argument("--vibecheck", action="store_true", help="Also rank failing vibecheck findings (scans code)")
+
+
+def _add_show(p: argparse.ArgumentParser) -> None:
+    p.add_argument("blueprint", help="Blueprint name (e.g. frontend, auth, billing, seo)")
+    _common(p)
+    p.add_argument("--graph", action="store_true", help="Show the item dependency critical path")
+
+
+def _add_check(p: argparse.ArgumentParser) -> None:
+    p.add_argument("blueprint", nargs="?", help="Blueprint name (e.g. frontend, auth)")
+    p.add_argument("items", nargs="*", help="Item numbers or ranges shown in `mmu show` (e.g. 1 3 5-9)")
+    p.add_argument("--match", metavar="TEXT", help="Also select items whose text contains TEXT")
+    p.add_argument("--all-blueprints", action="store_true", help="Apply --match across every blueprint")
+    p.add_argument("--from-file", metavar="PATH", help="Batch file: one `<blueprint> <items...>` or `--match ...` per line")
+    _common(p)
+
+
+def _add_scan(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    p.add_argument("--explain", metavar="SIGNAL", help="Show the evidence behind one detected signal (e.g. jwt)")
+    _add_format(p)
+
+
+def _add_generate(p: argparse.ArgumentParser) -> None:
+    p.add_argument("doc", help="Doc to generate (strategy, product, pricing, architecture, ux)")
+    _common(p)
+
+
+def _add_snapshot(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--json", action="store_true", help=JSON_HELP)
+    p.add_argument("--root", default=".", help="MMU root path where snapshot script exists")
+    p.add_argument("--target", default=".", help="Target project path to scan")
+    p.add_argument("--output", default="SNAPSHOT.md", help="Output report path")
+    p.add_argument("--no-md", action="store_true", help="Do not persist markdown report")
+
+
+def _add_share(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    p.add_argument("--clipboard", action="store_true", help="Copy to clipboard (macOS)")
+
+
+def _add_badge(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    p.add_argument("--format", dest="badge_format", choices=["markdown", "svg", "html"], default="markdown", help="Badge format (default: markdown)")
+    p.add_argument("--output", "-o", help="Write badge to file instead of stdout")
+    p.add_argument("--clipboard", action="store_true", help="Copy to clipboard (macOS)")
+
+
+def _add_serve_mcp(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--root", default=None, help="Path to make-me-unicorn repo (defaults to package install location)")
+    p.add_argument("--transport", choices=["stdio", "sse", "streamable-http"], default="stdio", help="MCP transport (default: stdio)")
+
+
+def _add_daemon(p: argparse.ArgumentParser) -> None:
+    p.add_argument("action", choices=["start", "stop", "status"])
+    p.add_argument("--foreground", action="store_true", help="start: serve in this process instead of detaching")
+    p.add_argument("--json", action="store_true", help=JSON_HELP)
+
+
+def _add_bench(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--files", type=int, action="append", metavar="N",
+                   help="Synthetic project size in code files; repeatable (default: 1000)")
+    p.add_argument("--commands", default="doctor,vibecheck,scan,status,next", help="Comma-separated commands to time")
+    p.add_argument("--repeat", type=int, default=3, help="Warm runs per command; the fastest counts (default: 3)")
+    p.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0)")
+    p.add_argument("--dir", help="Keep synthetic projects here and reuse them (default: a temporary directory)")
+    p.add_argument("--output", "-o", help="Also write the JSON report to this file")
+    p.add_argument("--baseline", help="Report to compare against; exit 2 on a regression")
+    p.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown/growth vs the baseline (default: 0.25)")
+    p.add_argument("--json", action="store_true", help=JSON_HELP)
+
+
+def _add_cache(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    p.add_argument("action", choices=["export", "import"])
+    p.add_argument("file", help="Artifact to write (export) or read (import), e.g. mmu-cache.gz")
+
+
+def _add_ci(p: argparse.ArgumentParser) -> None:
+    _common(p)
+    p.add_argument("--targets-file", default="docs/ops/gate_targets.txt",
+                   help="Stages to gate, one per line, relative to --root (default: docs/ops/gate_targets.txt)")
+    p.add_argument("--junit", metavar="PATH", help="Also write a JUnit XML report to PATH ('-' prints it instead of text)")
+    p.add_argument("--advisory", action="append", choices=["doctor", "gates", "vibecheck"], default=[],
+                   help="Report this suite without letting it fail the run; repeatable")
+
+
+def _add_validate(p: argparse.ArgumentParser) -> None:
+    p.add_argument("idea", help="The startup idea to validate (quote it)")
+    p.add_argument("--root", default=".", help=ROOT_HELP)
+    p.add_argument("--limit", type=int, default=30, help="Max threads per source (default: 30, 0 = no network)")
+    p.add_argument("--llm", action="store_true", help="Add Anthropic-powered synthesis (paid API call)")
+    p.add_argument("--yes", "-y", action="store_true", help="Skip --llm cost confirmation prompt")
+    p.add_argument("--output", choices=["text", "markdown", "json"], default="text", help="Output format (default: text)")
+    p.add_argument("--no-save", action="store_true", help="Do not save markdown report to reports/validate/")
+
+
+# Subcommand registry: name -> (help, adds the command's arguments). Only the
+# selected command's arguments are built; `mmu --help` needs names and help
+# strings alone. Command implementations import their modules on first use.
+SUBCOMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "init": ("Initialize baseline docs and checklists", _add_init),
+    "start": ("Start a focused mode session", _add_start),
+    "close": ("Close current session", _common),
+    "doctor": ("Run guardrail checks", _add_doctor),
+    "vibecheck": ("Scan for the security/UX gaps AI-generated code ships most (secrets, webhooks, rate limits, ...)", _add_vibecheck),
+    "fleet": ("Run checks across every git repository under a directory", _add_fleet),
+    "gate": ("Check stage gate readiness", _add_gate),
+    "status": ("Visual dashboard of launch progress", _add_status),
+    "history": ("Readiness score over time (per blueprint and gate)", _add_history),
+    "search": ("Full-text search over blueprints, checklists and core docs", _add_search),
+    "next": ("Recommend highest-impact items to tackle next", _add_next),
+    "show": ("Show detailed blueprint checklist", _add_show),
+    "check": ("Mark checklist items as done", _add_check),
+    "uncheck": ("Mark checklist items as not done", _add_check),
+    "scan": ("Auto-detect tech stack and pre-check blueprint items", _add_scan),
+    "generate": ("Generate or update a doc using LLM", _add_generate),
+    "snapshot": ("Run snapshot diagnostic from mmu CLI", _add_snapshot),
+    "share": ("Generate shareable score card", _add_share),
+    "badge": ("Generate README badge (SVG/Markdown/HTML)", _add_badge),
+    "serve-mcp": ("Run MMU as an MCP server (requires [mcp] extra)", _add_serve_mcp),
+    "validate": ("Validate a startup idea against real HN + Reddit discussions", _add_validate),
+    "daemon": ("Keep project state warm in a background process that mmu commands forward to", _add_daemon),
+    "bench": ("Time mmu's own commands on synthetic projects (JSON report, baseline comparison)", _add_bench),
+    "cache": ("Export or import .mmu/cache as one compressed artifact (CI cache restore)", _add_cache),
+    "ci": ("Run doctor, the configured stage gates and vibecheck in one pass (text, JSON or JUnit XML)", _add_ci),
+}
+
+
+def selected_command(argv: list[str]) -> str | None:
+    """The subcommand *argv* names, skipping global options (``--root`` takes a value)."""
+    args = iter(argv)
+    for arg in args:
+        if arg == "--root":
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _help_width() -> int:
+    """Help text width, as argparse would get it from ``shutil.get_terminal_size``.
+
+    Passing it in keeps argparse from importing shutil (and lzma, bz2) the
+    first time any parser adds an argument.
+    """
+    try:
+        columns = int(os.environ.get("COLUMNS", ""))
+    except ValueError:
+        columns = 0
+    if columns <= 0:
+        try:
+            columns = os.get_terminal_size(sys.__stdout__.fileno()).columns  # type: ignore[union-attr]
+        except (AttributeError, ValueError, OSError):
+            columns = 0
+    return (columns or 80) - 2
+
+
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """The `mmu` parser with arguments for *command* only (every command when None)."""
+    import argparse
+    from functools import partial
+
+    from mmu_cli import __version__
+
+    formatter = partial(argparse.HelpFormatter, width=_help_width())
+    parser = argparse.ArgumentParser(prog="mmu", description="Make Me Unicorn CLI", formatter_class=formatter)
+    parser.add_argument("--root", default=".", help=ROOT_HELP)
+    parser.add_argument("--json", action="store_true", help=JSON_HELP)
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
     sub = parser.add_subparsers(dest="command", required=False)
+    for name, (help_text, add_arguments) in SUBCOMMANDS.items():
+        p = sub.add_parser(name, help=help_text, formatter_class=formatter)
+        if command is None or name == command:
+            add_arguments(p)
+    return parser
 
-    p_init = sub.add_parser("init", help="Initialize baseline docs and checklists")
-    p_init.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_init.add_argument("--root", default=".", help="Project root path")
-    p_init.add_argument("--force", action="store_true", help="Overwrite existing files")
-    p_init.add_argument("--interactive", action="store_true", help="LLM-guided project setup (requires anthropic SDK)")
-
-    p_start = sub.add_parser("start", help="Start a focused mode session")
-    p_start.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_start.add_argument("--mode", required=True, choices=sorted(MODES.keys()))
-    p_start.add_argument("--root", default=".", help="Project root path")
-    p_start.add_argument("--emit", choices=["list", "bundle"], default="list", help="Output format")
-    p_start.add_argument("--output", help="Write bundle output to a file")
-    p_start.add_argument("--clipboard", action="store_true", help="Copy bundle output to clipboard")
-    p_start.add_argument("--agent", action="store_true", help="Format context for LLM agent injection")
-
-    p_close = sub.add_parser("close", help="Close current session")
-    p_close.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_close.add_argument("--root", default=".", help="Project root path")
-
-    p_doctor = sub.add_parser("doctor", help="Run guardrail checks")
-    p_doctor.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_doctor.add_argument("--root", default=".", help="Project root path")
-    p_doctor.add_argument("--deep", action="store_true", help="LLM-powered semantic analysis (requires anthropic SDK)")
-
-    p_vibecheck = sub.add_parser(
-        "vibecheck",
-        help="Scan for the security/UX gaps AI-generated code ships most (secrets, webhooks, rate limits, ...)",
-    )
-    p_vibecheck.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_vibecheck.add_argument("--root", default=".", help="Project root path")
-
-    p_gate = sub.add_parser("gate", help="Check stage gate readiness")
-    p_gate.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_gate.add_argument("--stage", required=True, help="Stage key (for example: M0, M1, M6)")
-    p_gate.add_argument("--root", default=".", help="Project root path")
-
-    p_status = sub.add_parser("status", help="Visual dashboard of launch progress")
-    p_status.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_status.add_argument("--root", default=".", help="Project root path")
-    p_status.add_argument("--why", action="store_true", help="Show score breakdown (applicable/checked/skipped per blueprint)")
-
-    p_next = sub.add_parser("next", help="Recommend highest-impact items to tackle next")
-    p_next.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_next.add_argument("--root", default=".", help="Project root path")
-    p_next.add_argument("-n", type=int, default=3, help="Number of recommendations (default: 3)")
-
-    p_show = sub.add_parser("show", help="Show detailed blueprint checklist")
-    p_show.add_argument("blueprint", help="Blueprint name (e.g. frontend, auth, billing, seo)")
-    p_show.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_show.add_argument("--root", default=".", help="Project root path")
-
-    p_check = sub.add_parser("check", help="Mark a checklist item as done")
-    p_check.add_argument("blueprint", help="Blueprint name (e.g. frontend, auth)")
-    p_check.add_argument("item", type=int, help="Item number (shown in `mmu show`)")
-    p_check.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_check.add_argument("--root", default=".", help="Project root path")
-
-    p_uncheck = sub.add_parser("uncheck", help="Mark a checklist item as not done")
-    p_uncheck.add_argument("blueprint", help="Blueprint name (e.g. frontend, auth)")
-    p_uncheck.add_argument("item", type=int, help="Item number (shown in `mmu show`)")
-    p_uncheck.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_uncheck.add_argument("--root", default=".", help="Project root path")
-
-    p_scan = sub.add_parser("scan", help="Auto-detect tech stack and pre-check blueprint items")
-    p_scan.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_scan.add_argument("--root", default=".", help="Project root path")
-
-    p_generate = sub.add_parser("generate", help="Generate or update a doc using LLM")
-    p_generate.add_argument("doc", help="Doc to generate (strategy, product, pricing, architecture, ux)")
-    p_generate.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_generate.add_argument("--root", default=".", help="Project root path")
-
-    p_snapshot = sub.add_parser("snapshot", help="Run snapshot diagnostic from mmu CLI")
-    p_snapshot.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_snapshot.add_argument("--root", default=".", help="MMU root path where snapshot script exists")
-    p_snapshot.add_argument("--target", default=".", help="Target project path to scan")
-    p_snapshot.add_argument("--output", default="SNAPSHOT.md", help="Output report path")
-    p_snapshot.add_argument("--no-md", action="store_true", help="Do not persist markdown report")
-
-    p_share = sub.add_parser("share", help="Generate shareable score card")
-    p_share.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_share.add_argument("--root", default=".", help="Project root path")
-    p_share.add_argument("--clipboard", action="store_true", help="Copy to clipboard (macOS)")
-
-    p_badge = sub.add_parser("badge", help="Generate README badge (SVG/Markdown/HTML)")
-    p_badge.add_argument("--json", action="store_true", help="Output structured JSON")
-    p_badge.add_argument("--root", default=".", help="Project root path")
-    p_badge.add_argument("--format", dest="badge_format", choices=["markdown", "svg", "html"], default="markdown", help="Badge format (default: markdown)")
-    p_badge.add_argument("--output", "-o", help="Write badge to file instead of stdout")
-    p_badge.add_argument("--clipboard", action="store_true", help="Copy to clipboard (macOS)")
-
-    p_mcp = sub.add_parser("serve-mcp", help="Run MMU as an MCP server (requires [mcp] extra)")
-    p_mcp.add_argument("--root", default=None, help="Path to make-me-unicorn repo (defaults to package install location)")
-    p_mcp.add_argument("--transport", choices=["stdio", "sse", "streamable-http"], default="stdio", help="MCP transport (default: stdio)")
-
-    p_validate = sub.add_parser("validate", help="Validate a startup idea against real HN + Reddit discussions")
-    p_validate.add_argument("idea", help="The startup idea to validate (quote it)")
-    p_validate.add_argument("--root", default=".", help="Project root path")
-    p_validate.add_argument("--limit", type=int, default=30, help="Max threads per source (default: 30, 0 = no network)")
-    p_validate.add_argument("--llm", action="store_true", help="Add Anthropic-powered synthesis (paid API call)")
-    p_validate.add_argument("--yes", "-y", action="store_true", help="Skip --llm cost confirmation prompt")
-    p_validate.add_argument("--output", choices=["text", "markdown", "json"], default="text", help="Output format (default: text)")
-    p_validate.add_argument("--no-save", action="store_true", help="Do not save markdown report to reports/validate/")
-
-    return parser.parse_args()
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    argv = sys.argv[1:] if argv is None else argv
+    return build_parser(selected_command(argv)).parse_args(argv)
 
 
 def utc_now() -> str:
+    import datetime as dt
+
     return dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
@@ -385,168 +561,28 @@ def should_skip_rel(rel_path: str, skip_paths: set[str]) -> bool:
     return False
 
 
-def _parse_simple_toml(text: str) -> dict[str, Any]:
-    """Minimal TOML parser for flat section/key=value configs.
-
-    Only handles ``[section]`` headers and ``key = value`` lines where
-    values are booleans, quoted strings, or numbers.  This covers the
-    .mmu/config.toml format without requiring tomllib (Python 3.11+).
-    """
-    data: dict[str, Any] = {}
-    section: dict[str, Any] | None = None
-    for raw in text.splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("[") and line.endswith("]"):
-            name = line[1:-1].strip()
-            section = {}
-            data[name] = section
-            continue
-        if "=" in line and section is not None:
-            key, _, val = line.partition("=")
-            key = key.strip()
-            val = val.split("#", 1)[0].strip()  # strip inline comments
-            if val.lower() == "true":
-                section[key] = True
-            elif val.lower() == "false":
-                section[key] = False
-            elif val.startswith('"') and val.endswith('"'):
-                section[key] = val[1:-1]
-            else:
-                try:
-                    section[key] = int(val)
-                except ValueError:
-                    section[key] = val
-    return data
-
-
 def load_config(root: Path) -> dict[str, Any]:
-    cfg_path = root / ".mmu/config.toml"
-    if not cfg_path.is_file():
-        return {}
-    content = read_text(cfg_path)
-    if content is None:
-        return {}
-    if tomllib is not None:
-        try:
-            data = tomllib.loads(content)
-        except tomllib.TOMLDecodeError as exc:
-            sys.stderr.write(f"  ⚠️  Ignoring invalid {cfg_path}: {exc}\n")
-            return {}
-        return data if isinstance(data, dict) else {}
-    # Fallback for Python < 3.11 without tomli
-    try:
-        return _parse_simple_toml(content)
-    except (ValueError, IndexError) as exc:
-        sys.stderr.write(f"  ⚠️  Ignoring unparseable {cfg_path}: {exc}\n")
-        return {}
-
-
-# ---------------------------------------------------------------------------
-# Feature flags — used by blueprint scanner to skip non-applicable items
-# ---------------------------------------------------------------------------
-
-# All flags default to True so that projects without config get the full
-# checklist (backward compatible).  Only explicitly set False flags cause
-# items to be skipped.
-
-FEATURE_FLAG_DEFAULTS: dict[str, bool] = {
-    # [features]
-    "has_billing": True,
-    "has_email_transactional": True,
-    "has_email_marketing": True,
-    "has_i18n": True,
-    "has_file_upload": True,
-    "has_mfa": True,
-    "has_push_notifications": True,
-    "has_in_app_notifications": True,
-    "has_ab_testing": True,
-    "has_webhooks_outgoing": True,
-    # [architecture]
-    "uses_containers": True,
-    "uses_iac": True,
-    "uses_ssr": True,
-    "uses_serverless": True,
-    # [market]
-    "targets_eu": True,
-    "targets_california": True,
-    "targets_korea": True,
-}
+    """Parsed ``.mmu/config.toml`` (memoized per root, see :mod:`mmu_cli.config`). Read-only."""
+    return Config.load(root).data
 
 
 def load_feature_flags(root: Path) -> dict[str, bool]:
-    """Load feature flags from .mmu/config.toml, merged with defaults.
+    """Feature flags from ``.mmu/config.toml`` merged with defaults (see :attr:`Config.features`)."""
+    return dict(Config.load(root).features)
 
-    Config format::
 
-        [features]
-        billing = false
-        i18n = false
-
-        [architecture]
-        containerized = false
-
-        [market]
-        targets_eu = false
-
-    Short config keys are mapped to canonical flag names (e.g.
-    ``billing`` -> ``has_billing``, ``containerized`` -> ``uses_containers``).
-    """
-    cfg = load_config(root)
-    flags = dict(FEATURE_FLAG_DEFAULTS)
-
-    # Mapping from short config key -> canonical flag name
-    key_map: dict[str, str] = {
-        "billing": "has_billing",
-        "email_transactional": "has_email_transactional",
-        "email_marketing": "has_email_marketing",
-        "i18n": "has_i18n",
-        "file_upload": "has_file_upload",
-        "mfa": "has_mfa",
-        "push_notifications": "has_push_notifications",
-        "in_app_notifications": "has_in_app_notifications",
-        "ab_testing": "has_ab_testing",
-        "webhooks_outgoing": "has_webhooks_outgoing",
-        "containerized": "uses_containers",
-        "iac": "uses_iac",
-        "ssr": "uses_ssr",
-        "serverless": "uses_serverless",
-        "targets_eu": "targets_eu",
-        "targets_california": "targets_california",
-        "targets_korea": "targets_korea",
-    }
-
-    for section in ("features", "architecture", "market"):
-        section_data = cfg.get(section)
-        if not isinstance(section_data, dict):
-            continue
-        for key, value in section_data.items():
-            canonical = key_map.get(key)
-            if canonical and isinstance(value, bool):
-                flags[canonical] = value
-
-    return flags
+def doctor_skip_paths(root: Path) -> set[str]:
+    return set(Config.load(root).skip_paths)
 
 
-def doctor_skip_paths(root: Path) -> set[str]:
-    cfg = load_config(root)
-    merged = set(DEFAULT_SKIP_PATHS)
-    doctor_cfg = cfg.get("doctor") if isinstance(cfg, dict) else None
-    if isinstance(doctor_cfg, dict):
-        extra = doctor_cfg.get("skip_paths")
-        if isinstance(extra, list):
-            for item in extra:
-                if isinstance(item, str) and item.strip():
-                    merged.add(item.strip())
-    return merged
-
-
-def gather_code_files(root: Path, skip_paths: set[str]) -> list[Path]:
+def gather_code_files(root: Path, skip_paths: set[str], walked: list[str] | None = None) -> list[Path]:
+    """Code files under *root* outside *skip_paths*; appends each visited directory to *walked*."""
     files: list[Path] = []
     for dirpath, dirnames, filenames in os.walk(root):
         rel_dir = Path(dirpath).relative_to(root).as_posix()
         rel_dir = "" if rel_dir == "." else rel_dir
+        if walked is not None:
+            walked.append(rel_dir)
 
         kept_dirs: list[str] = []
         for dirname in dirnames:
@@ -580,9 +616,9 @@ def detect_nextjs(root: Path) -> bool:
     next_configs = ["next.config.js", "next.config.mjs", "next.config.ts"]
     if any((root / name).exists() for name in next_configs):
         return True
-    pkg = root / "package.json"
-    pkg_text = read_text(pkg) if pkg.is_file() else None
-    if pkg_text and '"next"' in pkg_text:
+    from mmu_cli.manifests import load_manifests
+
+    if "next" in load_manifests(root).npm:
         return True
     return (root / "app").is_dir() or (root / "src/app").is_dir()
 
@@ -605,34 +641,36 @@ def has_metadata_markers(root: Path, code_files: list[Path], errors: list[str])
     return False
 
 
+WEBHOOK_SIGNATURE_MARKERS = [
+    "stripe-signature",
+    "constructevent",
+    "webhook secret",
+    "verify_signature",
+    "x-signature",
+    "svix",
+]
+WEBHOOK_IDEMPOTENCY_MARKERS = [
+    "idempotent",
+    "idempotency",
+    "event_id",
+    "processed_event",
+    "dedupe",
+    "on conflict",
+    "upsert",
+]
+
+
+def is_webhook_rel(rel: str) -> bool:
+    """Whether a (root-relative, posix) code path looks like a webhook handler."""
+    rel = rel.lower()
+    return "webhook" in rel.rsplit("/", 1)[-1] or "/webhook" in rel or "webhooks" in rel
+
+
 def detect_webhook_files(root: Path, code_files: list[Path]) -> list[Path]:
-    out: list[Path] = []
-    for file in code_files:
-        rel = file.relative_to(root).as_posix().lower()
-        name = file.name.lower()
-        if "webhook" in name or "/webhook" in rel or "webhooks" in rel:
-            out.append(file)
-    return out
+    return [file for file in code_files if is_webhook_rel(file.relative_to(root).as_posix())]
 
 
 def check_webhook_safety(webhook_files: list[Path], errors: list[str]) -> tuple[bool, bool]:
-    signature_markers = [
-        "stripe-signature",
-        "constructevent",
-        "webhook secret",
-        "verify_signature",
-        "x-signature",
-        "svix",
-    ]
-    idempotency_markers = [
-        "idempotent",
-        "idempotency",
-        "event_id",
-        "processed_event",
-        "dedupe",
-        "on conflict",
-        "upsert",
-    ]
     has_signature = False
     has_idempotency = False
     for file in webhook_files:
@@ -640,9 +678,9 @@ def check_webhook_safety(webhook_files: list[Path], errors: list[str]) -> tuple[
         if content is None:
             continue
         text = content.lower()
-        if any(m in text for m in signature_markers):
+        if any(m in text for m in WEBHOOK_SIGNATURE_MARKERS):
             has_signature = True
-        if any(m in text for m in idempotency_markers):
+        if any(m in text for m in WEBHOOK_IDEMPOTENCY_MARKERS):
             has_idempotency = True
     return has_signature, has_idempotency
 
@@ -678,6 +716,8 @@ def build_bundle(root: Path, files: list[str], read_errors: list[str]) -> tuple[
 def try_copy_clipboard(content: str) -> tuple[bool, str]:
     if sys.platform != "darwin":
         return False, "clipboard copy is only supported on macOS for now"
+    import subprocess
+
     try:
         proc = subprocess.run(["pbcopy"], input=content.encode("utf-8"), check=False)
     except OSError as exc:
@@ -740,8 +780,9 @@ def command_doctor_deep(root: Path) -> Result:
             docs_content[name] = content
 
     # Collect code files (limited)
-    skip_paths = doctor_skip_paths(root)
-    code_files = gather_code_files(root, skip_paths)[:15]
+    from mmu_cli.index import load_index
+
+    code_files = load_index(root).files[:15]
     code_content: dict[str, str] = {}
     for f in code_files:
         content = read_text(f)
@@ -924,7 +965,11 @@ def command_start(mode: str, root: Path, emit: str, output: str | None, clipboar
 
 
 def command_close(root: Path) -> Result:
+    from mmu_cli.display import take_snapshot
+    from mmu_cli.history import append_record
+
     append_text(root / ".mmu/session_close.log", f"{utc_now()}\n")
+    append_record(root, take_snapshot(root, load_feature_flags(root)), "close", force=True)
 
     messages = ["Session close checklist"]
     sprint = root / "current_sprint.md"
@@ -953,131 +998,52 @@ def _find_mmu_root() -> Path | None:
     return find_content_root()
 
 
-def _generate_stack_config(root: Path) -> str:
-    """Generate a .mmu/config.toml with feature flags.
-
-    Auto-detects what it can from the project, defaults the rest to true
-    so that users can opt-out of sections that don't apply.
-    """
-    # Basic auto-detection
-    has_docker = (root / "Dockerfile").exists() or (root / "docker-compose.yml").exists()
-    has_package_json = (root / "package.json").exists()
-
-    # Try to detect billing/email from package.json or requirements
-    billing_hint = False
-    email_hint = False
-    i18n_hint = False
-    if has_package_json:
-        try:
-            pkg = (root / "package.json").read_text(encoding="utf-8").lower()
-            billing_hint = any(k in pkg for k in ("stripe", "lemonsqueezy", "paddle", "@paypal"))
-            email_hint = any(k in pkg for k in ("resend", "postmark", "sendgrid", "nodemailer", "@react-email"))
-            i18n_hint = any(k in pkg for k in ("next-intl", "i18next", "react-i18next", "next-i18n"))
-        except OSError:
-            pass
-
-    req_path = root / "requirements.txt"
-    if req_path.exists():
-        try:
-            reqs = req_path.read_text(encoding="utf-8").lower()
-            billing_hint = billing_hint or any(k in reqs for k in ("stripe", "paddle"))
-            email_hint = email_hint or any(k in reqs for k in ("resend", "sendgrid", "postmark"))
-        except OSError:
-            pass
-
-    lines = [
-        "# MMU Feature Config — controls which checklist sections apply to your project.",
-        "# Set to false to skip sections that don't apply. This makes your score accurate.",
-        "# Regenerate with: mmu init --force",
-        "",
-        "[features]",
-        f"billing = true{_hint(billing_hint, 'detected')}",
-        "email_transactional = true",
-        f"email_marketing = true{_hint(email_hint, 'email detected')}",
-        "i18n = true" if i18n_hint else "i18n = false  # set true if your app supports multiple languages",
-        "file_upload = true",
-        "mfa = false  # set true if your app has multi-factor auth",
-        "push_notifications = false  # set true if your app sends push notifications",
-        "in_app_notifications = false  # set true if your app has a notification bell/inbox",
-        "ab_testing = false  # set true if you plan to run A/B tests",
-        "webhooks_outgoing = false  # set true if your app dispatches webhooks to external services",
-        "",
-        "[architecture]",
-        f"containerized = {'true' if has_docker else 'false'}  # Dockerfile detected" if has_docker else "containerized = false  # set true if using Docker",
-        "iac = false  # set true if using Terraform/Pulumi/SST",
-        "ssr = true",
-        "serverless = false  # set true if using Lambda/Cloudflare Workers",
-        "",
-        "[market]",
-        "targets_eu = false  # set true if you serve EU users (enables GDPR section)",
-        "targets_california = false  # set true if you serve CA users (enables CCPA section)",
-        "targets_korea = false  # set true if you target Korean market (enables Naver registration)",
-        "",
-    ]
-    return "\n".join(lines) + "\n"
-
-
-def _hint(detected: bool, label: str) -> str:
-    return f"  # {label}" if detected else ""
-
-
 def command_init(root: Path, force: bool) -> Result:
+    from mmu_cli.staging import Staging
+
     created: list[str] = []
     skipped: list[str] = []
     overwritten: list[str] = []
     messages = [f"Init workspace: {root}"]
 
-    for rel, content in INIT_TEMPLATES.items():
-        path = root / rel
-        existed_before = path.exists()
-        if existed_before and not force:
-            skipped.append(rel)
-            messages.append(f"  [skip] {rel} (already exists)")
-            continue
-        write_text(path, content)
-        if existed_before and force:
-            overwritten.append(rel)
-            messages.append(f"  [overwrite] {rel}")
-        else:
+    def wanted(rel: str, *, quiet_skip: bool = False) -> bool:
+        if not (root / rel).exists():
             created.append(rel)
             messages.append(f"  [create] {rel}")
+            return True
+        if force:
+            overwritten.append(rel)
+            messages.append(f"  [overwrite] {rel}")
+            return True
+        if not quiet_skip:
+            skipped.append(rel)
+            messages.append(f"  [skip] {rel} (already exists)")
+        return False
 
-    # Copy blueprint files from MMU package
-    mmu_root = _find_mmu_root()
-    if mmu_root:
-        bp_src = mmu_root / "docs" / "blueprints"
-        bp_dst = root / "docs" / "blueprints"
-        for bp_file in sorted(bp_src.glob("*.md")):
-            rel = f"docs/blueprints/{bp_file.name}"
-            dst = bp_dst / bp_file.name
-            existed_before = dst.exists()
-            if existed_before and not force:
-                skipped.append(rel)
-                messages.append(f"  [skip] {rel} (already exists)")
-                continue
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            dst.write_text(bp_file.read_text(encoding="utf-8"), encoding="utf-8")
-            if existed_before and force:
-                overwritten.append(rel)
-                messages.append(f"  [overwrite] {rel}")
+    # Everything is staged under .mmu/ first and moved into place by rename at
+    # the end, so an interrupted init never leaves a truncated file behind.
+    try:
+        with Staging(root) as stage:
+            for rel, content in INIT_TEMPLATES.items():
+                if wanted(rel):
+                    stage.write(rel, content.encode("utf-8"))
+
+            # Copy blueprint files from MMU package (bytes, no decode/encode)
+            mmu_root = _find_mmu_root()
+            if mmu_root:
+                for bp_file in sorted((mmu_root / "docs" / "blueprints").glob("*.md")):
+                    rel = f"docs/blueprints/{bp_file.name}"
+                    if wanted(rel):
+                        stage.copy(rel, bp_file)
             else:
-                created.append(rel)
-                messages.append(f"  [create] {rel}")
-    else:
-        messages.append("  [warn] Blueprint source not found — run from MMU repo or install from PyPI")
-
-    # Generate feature config if it doesn't exist (or force)
-    config_path = root / ".mmu" / "config.toml"
-    if not config_path.exists() or force:
-        config_content = _generate_stack_config(root)
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        config_path.write_text(config_content, encoding="utf-8")
-        rel = ".mmu/config.toml"
-        if config_path.exists() and not force:
-            pass  # already counted
-        else:
-            created.append(rel)
-            messages.append(f"  [create] {rel}")
+                messages.append("  [warn] Blueprint source not found — run from MMU repo or install from PyPI")
+
+            # Generate feature config if it doesn't exist (or force)
+            if wanted(".mmu/config.toml", quiet_skip=True):
+                stage.write(".mmu/config.toml", _generate_stack_config(root).encode("utf-8"))
+            stage.commit()
+    except OSError as exc:
+        return Result(exit_code=1, messages=[*messages[:1], f"  [fail] could not write the workspace: {exc}"])
 
     if created or overwritten:
         messages.append("Init result: workspace scaffold ready")
@@ -1099,107 +1065,112 @@ def command_init(root: Path, force: bool) -> Result:
     return Result(exit_code=0, created=[], overwritten=[], skipped=skipped, messages=messages)
 
 
-def parse_stage_headings(checklist_text: str) -> dict[str, str]:
-    out: dict[str, str] = {}
-    for line in checklist_text.splitlines():
-        m = HEADING_PATTERN.match(line)
-        if m:
-            stage = m.group(1).upper()
-            title = m.group(2).strip()
-            out[stage] = f"{stage} {title}"
-    return out
+def iter_doctor(root: Path) -> Iterator[dict[str, Any]]:
+    """Doctor checks as events: one ``check`` per result, then a ``summary``.
 
+    Document checks come first, so a stream shows them before the code file
+    index is built.
+    """
+    from mmu_cli.index import load_index
 
-def command_doctor(root: Path) -> Result:
-    messages = ["Doctor checks"]
     failures = 0
     read_errors: list[str] = []
 
-    for rel in REQUIRED_FILES:
-        if exists(root, rel):
-            messages.append(f"  [ok] {rel}")
-        else:
-            messages.append(f"  [fail] missing {rel}")
+    def check(ok: bool, passed: str, failed: str) -> dict[str, Any]:
+        nonlocal failures
+        if not ok:
             failures += 1
+        return {"event": "check", "status": "ok" if ok else "fail", "message": passed if ok else failed}
+
+    for rel in REQUIRED_FILES:
+        yield check(exists(root, rel), rel, f"missing {rel}")
 
     auth_checklist = root / "docs/checklists/auth_security.md"
     auth_text = read_text(auth_checklist, read_errors) if auth_checklist.is_file() else None
-    if auth_text and re.search(r"password reset", auth_text, re.IGNORECASE):
-        messages.append("  [ok] auth includes password reset")
-    else:
-        messages.append("  [fail] auth checklist missing password reset coverage")
-        failures += 1
+    yield check(
+        bool(auth_text and re.search(r"password reset", auth_text, re.IGNORECASE)),
+        "auth includes password reset",
+        "auth checklist missing password reset coverage",
+    )
 
     billing_checklist = root / "docs/checklists/billing_tax.md"
     billing_text = read_text(billing_checklist, read_errors) if billing_checklist.is_file() else None
-    if billing_text and ("webhook" in billing_text.lower() and "idempotent" in billing_text.lower()):
-        messages.append("  [ok] billing includes webhook safety")
-    else:
-        messages.append("  [fail] billing checklist missing webhook safety")
-        failures += 1
+    yield check(
+        bool(billing_text and ("webhook" in billing_text.lower() and "idempotent" in billing_text.lower())),
+        "billing includes webhook safety",
+        "billing checklist missing webhook safety",
+    )
 
     seo_checklist = root / "docs/checklists/seo_distribution.md"
     seo_text = read_text(seo_checklist, read_errors) if seo_checklist.is_file() else None
-    if seo_text and ("og thumbnail" in seo_text.lower() or "open graph" in seo_text.lower()):
-        messages.append("  [ok] SEO includes OG thumbnail")
-    else:
-        messages.append("  [fail] SEO checklist missing OG thumbnail")
-        failures += 1
+    yield check(
+        bool(seo_text and ("og thumbnail" in seo_text.lower() or "open graph" in seo_text.lower())),
+        "SEO includes OG thumbnail",
+        "SEO checklist missing OG thumbnail",
+    )
 
     arch_file = root / "docs/core/architecture.md"
     arch_text = read_text(arch_file, read_errors) if arch_file.is_file() else None
-    if arch_text and "dev/staging/prod" in arch_text:
-        messages.append("  [ok] architecture includes environment split")
-    else:
-        messages.append("  [fail] architecture missing dev/staging/prod split")
-        failures += 1
+    yield check(
+        bool(arch_text and "dev/staging/prod" in arch_text),
+        "architecture includes environment split",
+        "architecture missing dev/staging/prod split",
+    )
 
-    skip_paths = doctor_skip_paths(root)
-    code_files = gather_code_files(root, skip_paths)
+    code_files = load_index(root).files
     if not code_files:
-        messages.append("  [skip] codebase checks (no source files detected)")
+        yield {"event": "check", "status": "skip", "message": "codebase checks (no source files detected)"}
     else:
-        nextjs = detect_nextjs(root)
-        if nextjs:
-            if has_metadata_markers(root, code_files, read_errors):
-                messages.append("  [ok] Next.js metadata/OG markers detected")
-            else:
-                messages.append("  [fail] Next.js detected but metadata/OG markers are missing")
-                failures += 1
+        if detect_nextjs(root):
+            yield check(
+                has_metadata_markers(root, code_files, read_errors),
+                "Next.js metadata/OG markers detected",
+                "Next.js detected but metadata/OG markers are missing",
+            )
         else:
-            messages.append("  [skip] Next.js metadata check (Next.js not detected)")
+            yield {"event": "check", "status": "skip", "message": "Next.js metadata check (Next.js not detected)"}
 
         webhook_files = detect_webhook_files(root, code_files)
         if webhook_files:
             has_sig, has_idem = check_webhook_safety(webhook_files, read_errors)
-            if has_sig:
-                messages.append("  [ok] webhook signature verification markers detected")
-            else:
-                messages.append("  [fail] webhook handlers found but signature verification markers missing")
-                failures += 1
-            if has_idem:
-                messages.append("  [ok] webhook idempotency markers detected")
-            else:
-                messages.append("  [fail] webhook handlers found but idempotency markers missing")
-                failures += 1
-        else:
-            messages.append("  [skip] webhook safety check (no webhook handlers detected)")
-
-        env_example = root / ".env.example"
-        if env_example.is_file():
-            messages.append("  [ok] .env.example exists")
+            yield check(
+                has_sig,
+                "webhook signature verification markers detected",
+                "webhook handlers found but signature verification markers missing",
+            )
+            yield check(
+                has_idem,
+                "webhook idempotency markers detected",
+                "webhook handlers found but idempotency markers missing",
+            )
         else:
-            messages.append("  [fail] missing .env.example for environment documentation")
-            failures += 1
+            yield {"event": "check", "status": "skip", "message": "webhook safety check (no webhook handlers detected)"}
 
-        if has_environment_split(root):
-            messages.append("  [ok] environment split files detected (dev/staging/prod)")
-        else:
-            messages.append("  [fail] missing environment split files for dev/staging/prod")
-            failures += 1
+        yield check(
+            (root / ".env.example").is_file(),
+            ".env.example exists",
+            "missing .env.example for environment documentation",
+        )
+        yield check(
+            has_environment_split(root),
+            "environment split files detected (dev/staging/prod)",
+            "missing environment split files for dev/staging/prod",
+        )
 
     for err in read_errors:
-        messages.append(f"  [warn] {err}")
+        yield {"event": "check", "status": "warn", "message": err}
+
+    yield {"event": "summary", "failures": failures, "exit_code": 2 if failures else 0}
+
+
+def command_doctor(root: Path) -> Result:
+    messages = ["Doctor checks"]
+    failures = 0
+    for event in iter_doctor(root):
+        if event["event"] == "check":
+            messages.append(f"  [{event['status']}] {event['message']}")
+        else:
+            failures = event["failures"]
 
     if failures > 0:
         messages.append(f"Doctor result: {failures} issue(s) found")
@@ -1223,41 +1194,161 @@ def command_vibecheck(root: Path) -> Result:
     )
 
 
-def command_gate(stage: str, root: Path) -> Result:
+def command_vibecheck_shard(root: Path, shard: str, output: str | None = None) -> Result:
+    import json
+
+    from mmu_cli.vibecheck import parse_shard, scan_shard
+
+    try:
+        k, n = parse_shard(shard)
+    except ValueError as exc:
+        return Result(exit_code=2, messages=[f"Error: {exc}"])
+    doc = scan_shard(root, (k, n))
+    text = json.dumps(doc, separators=(",", ":")) + "\n"
+    if output == "-":
+        return Result(exit_code=0, **doc, messages=[text.rstrip("\n")])
+    path = Path(output or f"shard-{k}-of-{n}.json")
+    try:
+        write_text(path, text)
+    except OSError as exc:
+        return Result(exit_code=1, messages=[f"Cannot write {path}: {exc}"])
+    scanned = doc["partial"]["files"]
+    return Result(
+        exit_code=0,
+        output=str(path),
+        shard=[k, n],
+        files=doc["files"],
+        scanned=scanned,
+        messages=[f"Vibe check shard {k}/{n}: scanned {scanned:,} of {doc['files']:,} file(s) -> {path}"],
+    )
+
+
+def command_vibecheck_merge(root: Path, paths: list[str]) -> Result:
+    import json
+
+    from mmu_cli.vibecheck import format_findings, merge_shards
+
+    docs = []
+    for name in paths:
+        try:
+            docs.append(json.loads(Path(name).read_text(encoding="utf-8")))
+        except (OSError, ValueError) as exc:
+            return Result(exit_code=1, messages=[f"Cannot read shard file {name}: {exc}"])
+    try:
+        findings = merge_shards(root, docs)
+    except ValueError as exc:
+        return Result(exit_code=1, messages=[f"Cannot merge shards: {exc}"])
+    messages, exit_code = format_findings(findings)
+    return Result(
+        exit_code=exit_code,
+        failures=sum(1 for f in findings if f.status == "fail"),
+        shards=len(docs),
+        files=docs[0]["files"],
+        findings=[f.to_dict() for f in findings],
+        messages=messages,
+    )
+
+
+GATE_CHECKLIST = "docs/checklists/from_scratch.md"
+
+
+def parse_stages(value: str) -> list[str]:
+    """``"m0, M1,M1"`` -> ``["M0", "M1"]``: comma-separated, upper-cased, deduplicated."""
+    return list(dict.fromkeys(s.strip().upper() for s in value.split(",") if s.strip()))
+
+
+def _gate_events(stage: str, checklist: Blueprint | None) -> Iterator[dict[str, Any]]:
     stage = stage.upper().strip()
+    errors: list[str] = []
+    headings = {label.split(" ", 1)[0]: label for label in checklist.stages} if checklist else {}
+    heading = headings.get(stage)
     if not re.fullmatch(r"M\d+", stage):
-        return Result(exit_code=1, messages=[f"Invalid stage: {stage} (expected format M<number>)"])
+        errors = [f"Invalid stage: {stage} (expected format M<number>)"]
+    elif checklist is None:
+        errors = [f"Missing or unreadable checklist: {GATE_CHECKLIST}"]
+    elif heading is None:
+        available = ", ".join(sorted(headings)) if headings else "none"
+        errors = [f"Stage not found: {stage}", f"Available stages: {available}"]
+    if errors or checklist is None or heading is None:
+        for message in errors:
+            yield {"event": "error", "stage": stage, "message": message}
+        yield {"event": "summary", "stage": stage, "exit_code": 1}
+        return
+
+    pending = 0
+    for item in checklist.stage_items[heading]:
+        if not item.done:
+            pending += 1
+            yield {"event": "pending", "stage": stage, "item": checklist.lines[item.line].strip()}
+
+    yield {
+        "event": "summary",
+        "stage": stage,
+        "heading": heading,
+        "pending": pending,
+        "passed": not pending,
+        "exit_code": 3 if pending else 0,
+    }
 
-    checklist = root / "docs/checklists/from_scratch.md"
-    text = read_text(checklist)
-    if text is None:
-        return Result(exit_code=1, messages=["Missing or unreadable checklist: docs/checklists/from_scratch.md"])
 
-    headings = parse_stage_headings(text)
-    heading = headings.get(stage)
-    if not heading:
-        available = ", ".join(sorted(headings.keys())) if headings else "none"
-        return Result(exit_code=1, messages=[f"Stage not found: {stage}", f"Available stages: {available}"])
+def iter_gate(stage: str, root: Path) -> Iterator[dict[str, Any]]:
+    """Gate report as events: one ``pending`` per unchecked item, then a ``summary``.
 
-    lines = text.splitlines()
-    in_section = False
-    pending: list[str] = []
+    Problems with the stage or checklist are ``error`` events followed by a
+    summary with exit code 1.
+    """
+    from mmu_cli.blueprint import load_blueprint
 
-    for line in lines:
-        m = HEADING_PATTERN.match(line)
-        if m:
-            current = m.group(1).upper()
-            if current == stage:
-                in_section = True
-                continue
-            if in_section:
-                break
+    return _gate_events(stage, load_blueprint(root / GATE_CHECKLIST))
 
-        if in_section:
-            unchecked = UNCHECKED_PATTERN.match(line)
-            if unchecked:
-                pending.append(line.strip())
 
+def iter_gates(stages: list[str] | None, root: Path) -> Iterator[dict[str, Any]]:
+    """Several gates (every stage in the checklist when *stages* is None) from one parse.
+
+    Each stage reports like :func:`iter_gate`, except that its closing event is
+    ``stage`` instead of ``summary``; one ``summary`` with the per-stage
+    outcome and the highest exit code comes last.
+    """
+    from mmu_cli.blueprint import load_blueprint
+
+    checklist = load_blueprint(root / GATE_CHECKLIST)
+    if stages is None:
+        if checklist is None or not checklist.stages:
+            problem = "Missing or unreadable checklist" if checklist is None else "No stage headings in"
+            yield {"event": "error", "message": f"{problem}: {GATE_CHECKLIST}"}
+            yield {"event": "summary", "stages": [], "passed": [], "failed": [], "exit_code": 1}
+            return
+        stages = list(dict.fromkeys(label.split(" ", 1)[0] for label in checklist.stages))
+    results: list[dict[str, Any]] = []
+    for stage in stages:
+        for event in _gate_events(stage, checklist):
+            if event["event"] == "summary":
+                event = {**event, "event": "stage"}
+                results.append(event)
+            yield event
+    yield {
+        "event": "summary",
+        "stages": [r["stage"] for r in results],
+        "passed": [r["stage"] for r in results if r["exit_code"] == 0],
+        "failed": [r["stage"] for r in results if r["exit_code"] != 0],
+        "exit_code": max((r["exit_code"] for r in results), default=0),
+    }
+
+
+def command_gate(stage: str, root: Path) -> Result:
+    pending: list[str] = []
+    errors: list[str] = []
+    for event in iter_gate(stage, root):
+        if event["event"] == "pending":
+            pending.append(event["item"])
+        elif event["event"] == "error":
+            errors.append(event["message"])
+        else:
+            summary = event
+    if errors:
+        return Result(exit_code=1, messages=errors)
+
+    stage, heading = summary["stage"], summary["heading"]
     messages = [f"Gate report: {stage} ({heading})"]
     if pending:
         for line in pending:
@@ -1269,12 +1360,58 @@ def command_gate(stage: str, root: Path) -> Result:
     return Result(exit_code=0, stage=stage, heading=heading, pending=[], messages=messages)
 
 
+def command_gates(stages: list[str] | None, root: Path) -> Result:
+    """`mmu gate --stage M0,M1` / `--all`: per-stage reports and the highest exit code."""
+    reports: list[dict[str, Any]] = []
+    report: dict[str, Any] = {"pending": [], "errors": []}
+    errors: list[str] = []
+    for event in iter_gates(stages, root):
+        if event["event"] == "pending":
+            report["pending"].append(event["item"])
+        elif event["event"] == "error":
+            (report["errors"] if "stage" in event else errors).append(event["message"])
+        elif event["event"] == "stage":
+            reports.append({
+                "stage": event["stage"],
+                "heading": event.get("heading"),
+                "passed": event["exit_code"] == 0,
+                "exit_code": event["exit_code"],
+                **report,
+            })
+            report = {"pending": [], "errors": []}
+        else:
+            summary = event
+    if errors:
+        return Result(exit_code=1, messages=errors)
+
+    def render() -> list[str]:
+        messages: list[str] = []
+        for r in reports:
+            if r["errors"]:
+                messages.extend(f"Gate report: {m}" for m in r["errors"][:1])
+                messages.extend(f"  {m}" for m in r["errors"][1:])
+                continue
+            messages.append(f"Gate report: {r['stage']} ({r['heading']}) — {'PASS' if r['passed'] else 'NOT PASS'}")
+            messages.extend(f"  {line}" for line in r["pending"])
+        failed = summary["failed"]
+        tail = f" — not passed: {', '.join(failed)}" if failed else ""
+        messages.append(f"Gate result: {len(summary['passed'])}/{len(reports)} PASS{tail}")
+        return messages
+
+    return Result(
+        exit_code=summary["exit_code"],
+        stages=reports,
+        passed=summary["passed"],
+        failed=summary["failed"],
+        render=render,
+    )
+
+
 def command_share(root: Path, clipboard: bool = False) -> Result:
-    from mmu_cli.display import render_share_card
+    from mmu_cli.display import render_share_card, take_snapshot
 
-    flags = load_feature_flags(root)
-    cfg = load_config(root)
-    card_text = render_share_card(root, flags, cfg)
+    config = Config.load(root)
+    card_text = render_share_card(take_snapshot(root, config.features), cfg=config.data)
     messages = [card_text]
     if clipboard:
         ok, msg = try_copy_clipboard(card_text)
@@ -1293,28 +1430,17 @@ def command_badge(
         render_badge_html,
         render_badge_markdown,
         render_badge_svg,
-        scan_all_blueprints,
-        scan_gates,
-        unicorn_art,
+        take_snapshot,
+        unicorn_stage,
     )
 
-    flags = load_feature_flags(root)
-    cfg = load_config(root)
-
-    blueprints = scan_all_blueprints(root, flags)
-    gates = scan_gates(root)
-    bp_done = sum(d for _, d, _, _ in blueprints)
-    bp_total = sum(t for _, _, t, _ in blueprints)
-    gate_done = sum(d for _, d, _ in gates)
-    gate_total = sum(t for _, _, t in gates)
-
-    all_done = bp_done + gate_done
-    all_total = bp_total + gate_total
-    pct = int(all_done / all_total * 100) if all_total else 0
+    config = Config.load(root)
+    snap = take_snapshot(root, config.features)
+    pct = snap.pct_int
 
-    stage_name, _ = unicorn_art(pct / 100)
+    stage_name = unicorn_stage(pct / 100)
 
-    project_name = cfg.get("project", {}).get("name", "")
+    project_name = config.project_name
 
     if fmt == "svg":
         content = render_badge_svg(pct, stage_name)
@@ -1362,6 +1488,8 @@ def command_snapshot(root: Path, target: str, output: str, no_md: bool) -> Resul
     else:
         cmd.append(output)
 
+    import subprocess
+
     try:
         proc = subprocess.run(cmd, cwd=str(root), text=True, capture_output=True, check=False)
     except OSError as exc:
@@ -1373,7 +1501,8 @@ def command_snapshot(root: Path, target: str, output: str, no_md: bool) -> Resul
     return Result(exit_code=proc.returncode, command=cmd, messages=messages)
 
 
-def command_show(blueprint_name: str, root: Path) -> Result:
+def command_show(blueprint_name: str, root: Path, *, graph: bool = False) -> Result:
+    from mmu_cli.blueprint import load_blueprint
     from mmu_cli.display import (
         BLUEPRINT_NAMES,
         render_blueprint_detail,
@@ -1404,113 +1533,309 @@ def command_show(blueprint_name: str, root: Path) -> Result:
             ],
         )
 
+    from mmu_cli.scan import index_auto_checked, load_scan_index
+
     flags = load_feature_flags(root)
-    detail = render_blueprint_detail(bp_path, label, flags)
-    return Result(exit_code=0, blueprint=filename, messages=[detail])
+    auto_checked = index_auto_checked(load_scan_index(root)).get(filename, {})
+    bp = load_blueprint(bp_path, flags)
+    if bp is None:
+        return Result(exit_code=1, messages=[f"Cannot read {bp_path}"])
 
+    items = [
+        {
+            "number": item.number,
+            "section": item.section,
+            "priority": f"P{item.priority}",
+            "text": item.text,
+            "done": item.done,
+            "auto": auto_checked.get(item.raw) if item.done else None,
+        }
+        for item in bp.active_items
+    ]
+    fields: dict[str, Any] = {}
+    if graph:
+        from mmu_cli.graph import build_graph, summarize
+        from mmu_cli.recommend import checklist_progress, source_label
 
-def command_check(blueprint_name: str, item_num: int, root: Path, *, force_state: str | None = None) -> Result:
-    """Check/uncheck a blueprint item.
+        fields["graph"] = summarize(build_graph(checklist_progress(root, flags)), bp_path, source_label)
 
-    force_state: "check" = always mark [x], "uncheck" = always mark [ ], None = toggle.
-    """
-    from mmu_cli.display import BLUEPRINT_NAMES, resolve_blueprint
+    def render() -> list[str]:
+        from mmu_cli.display import render_dependency_graph
 
-    filename = resolve_blueprint(blueprint_name)
-    if not filename:
-        return Result(exit_code=1, messages=[f"Unknown blueprint: {blueprint_name}"])
+        out = [render_blueprint_detail(bp_path, label, flags, auto_checked=auto_checked)]
+        if graph:
+            out.append(render_dependency_graph(fields["graph"]))
+        return out
 
-    label = BLUEPRINT_NAMES[filename]
-    bp_path = root / "docs" / "blueprints" / filename
-    if not bp_path.is_file():
-        return Result(exit_code=1, messages=[f"Blueprint file not found: {bp_path}"])
+    return Result(
+        exit_code=0,
+        blueprint=filename,
+        label=label,
+        done=bp.done,
+        total=bp.total,
+        skipped=bp.skipped,
+        items=items,
+        skipped_sections=list(dict.fromkeys(sec.title for sec in bp.sections if not sec.active)),
+        render=render,
+        **fields,
+    )
 
-    text = read_text(bp_path)
-    if text is None:
-        return Result(exit_code=1, messages=[f"Cannot read {bp_path}"])
 
-    flags = load_feature_flags(root)
+class CheckSelector(NamedTuple):
+    """One `mmu check` request: numbered items and/or a text query."""
+
+    blueprint: str | None
+    specs: list[str]  # "3", "5-9"
+    match: str | None = None
+    all_blueprints: bool = False
 
-    # Find all checklist items and their line indices, respecting condition markers
-    lines = text.splitlines()
-    check_done = re.compile(r"^(\s*-\s*)\[x\](\s+.+)$", re.IGNORECASE)
-    check_todo = re.compile(r"^(\s*-\s*)\[\s\](\s+.+)$")
-    condition_if = re.compile(r"^<!--\s*if:(\w+)\s*-->")
-    condition_endif = re.compile(r"^<!--\s*endif\s*-->")
-    items: list[tuple[int, bool, str]] = []  # (line_idx, is_done, item_text)
-    condition_stack: list[bool] = []
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-
-        m_if = condition_if.match(stripped)
-        if m_if:
-            flag_name = m_if.group(1)
-            condition_stack.append(flags.get(flag_name, True))
+
+def _parse_item_specs(specs: list[str]) -> list[int]:
+    """Expand ``["1", "3", "5-9"]`` to item numbers; raises ValueError on bad input."""
+    numbers: list[int] = []
+    for spec in specs:
+        lo, sep, hi = spec.partition("-")
+        if not sep:
+            numbers.append(int(spec))
             continue
-        if condition_endif.match(stripped):
-            if condition_stack:
-                condition_stack.pop()
+        start, stop = int(lo), int(hi)
+        if start > stop:
+            raise ValueError(spec)
+        numbers.extend(range(start, stop + 1))
+    return numbers
+
+
+def parse_check_line(line: str) -> CheckSelector:
+    """Parse one ``--from-file`` line with the same syntax as the CLI arguments."""
+    import shlex
+
+    tokens = shlex.split(line)
+    positional: list[str] = []
+    match = None
+    all_blueprints = False
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token == "--match":
+            if i + 1 >= len(tokens):
+                raise ValueError("--match needs a value")
+            match = tokens[i + 1]
+            i += 2
             continue
+        if token.startswith("--match="):
+            match = token.split("=", 1)[1]
+        elif token == "--all-blueprints":
+            all_blueprints = True
+        elif token.startswith("-"):
+            raise ValueError(f"unknown option {token}")
+        else:
+            positional.append(token)
+        i += 1
+    blueprint = positional.pop(0) if positional and not all_blueprints else None
+    return CheckSelector(blueprint, positional, match, all_blueprints)
 
-        # Skip items in disabled condition blocks
-        if condition_stack and not all(condition_stack):
-            continue
 
-        dm = check_done.match(line)
-        if dm:
-            items.append((i, True, dm.group(2).strip()))
+def command_check_batch(
+    root: Path,
+    selectors: list[CheckSelector],
+    *,
+    force_state: str | None = "check",
+) -> Result:
+    """Apply many check/uncheck edits: one parse and one atomic write per blueprint file.
+
+    force_state: "check" = always mark [x], "uncheck" = always mark [ ], None = toggle.
+    All or nothing: every selector is validated first, and if any of them is
+    bad nothing is written, so a scripted batch can be fixed and re-run as is.
+    """
+    from mmu_cli.blueprint import load_blueprint, write_blueprint
+    from mmu_cli.display import BLUEPRINT_NAMES, bold, dim, green, red, resolve_blueprint
+    from mmu_cli.state import record_write
+
+    flags = load_feature_flags(root)
+    bp_dir = root / "docs" / "blueprints"
+    parsed: dict[str, Blueprint] = {}
+    updates: dict[str, dict[int, bool]] = {}
+    seen: set[tuple[str, int]] = set()
+    results: list[dict[str, Any]] = []
+    errors: list[str] = []
+    messages: list[str] = []
+
+    def load(filename: str) -> Blueprint | None:
+        if filename not in parsed:
+            bp_path = bp_dir / filename
+            if not bp_path.is_file():
+                errors.append(f"Blueprint file not found: {bp_path}")
+                return None
+            bp = load_blueprint(bp_path, flags)
+            if bp is None:
+                errors.append(f"Cannot read {bp_path}")
+                return None
+            parsed[filename] = bp
+        return parsed[filename]
+
+    for sel in selectors:
+        if sel.all_blueprints:
+            if sel.specs:
+                errors.append("Item numbers need a single blueprint, not --all-blueprints.")
+                continue
+            filenames = [f for f in BLUEPRINT_NAMES if (bp_dir / f).is_file()]
+        else:
+            filename = resolve_blueprint(sel.blueprint or "")
+            if not sel.blueprint or not filename:
+                errors.append(f"Unknown blueprint: {sel.blueprint}" if sel.blueprint else "Name a blueprint or pass --all-blueprints.")
+                continue
+            filenames = [filename]
+        if not sel.specs and not sel.match:
+            errors.append(f"Nothing to {force_state or 'toggle'} for {sel.blueprint or 'all blueprints'}: give item numbers or --match.")
+            continue
+        try:
+            numbers = _parse_item_specs(sel.specs)
+        except ValueError:
+            errors.append(f"Invalid item numbers: {' '.join(sel.specs)} (use e.g. 1 3 5-9)")
             continue
-        tm = check_todo.match(line)
-        if tm:
-            items.append((i, False, tm.group(2).strip()))
 
-    if item_num < 1 or item_num > len(items):
+        matched = 0
+        for filename in filenames:
+            bp = load(filename)
+            if bp is None:
+                continue
+            targets = []
+            for num in numbers:
+                item = bp.item(num)
+                if item is None:
+                    errors.append(
+                        f"Item #{num} out of range (1-{bp.total}). Use `mmu show {sel.blueprint}` to see items."
+                    )
+                    continue
+                targets.append(item)
+            if sel.match:
+                needle = sel.match.lower()
+                targets += [item for item in bp.active_items if needle in item.raw.lower()]
+            matched += len(targets)
+
+            label = BLUEPRINT_NAMES[filename]
+            for item in targets:
+                if (filename, item.line) in seen:
+                    continue
+                seen.add((filename, item.line))
+                want = (not item.done) if force_state is None else force_state == "check"
+                if item.done == want:
+                    action = "already_checked" if want else "already_unchecked"
+                    mark = "already ✓" if want else "already ✗"
+                    messages.append(f"  {dim(mark)} {label} #{item.number}: {item.raw}")
+                else:
+                    action = "checked" if want else "unchecked"
+                    updates.setdefault(filename, {})[item.line] = want
+                    if want:
+                        messages.append(f"  {green('✓')} {bold(label)} #{item.number}: {item.raw}")
+                    else:
+                        messages.append(f"  {red('✗')} {bold(label)} #{item.number}: {item.raw} (unchecked)")
+                results.append({
+                    "blueprint": label,
+                    "file": filename,
+                    "number": item.number,
+                    "item": item.raw,
+                    "action": action,
+                })
+        if sel.match and not matched:
+            errors.append(f"No items match {sel.match!r}.")
+
+    if errors:
         return Result(
             exit_code=1,
-            messages=[f"Item #{item_num} out of range (1-{len(items)}). Use `mmu show {blueprint_name}` to see items."],
+            results=[],
+            counts={},
+            files_written=[],
+            errors=errors,
+            messages=errors + [f"Nothing was {force_state + 'ed' if force_state else 'toggled'}: fix the selection and re-run."],
         )
 
-    idx, was_done, item_text = items[item_num - 1]
-    line = lines[idx]
-
-    # Determine action
-    if force_state == "check":
-        if was_done:
-            from mmu_cli.display import dim
-            return Result(exit_code=0, action="already_checked", item=item_text,
-                          messages=[f"  {dim('already ✓')} {label} #{item_num}: {item_text}"])
-        lines[idx] = re.sub(r"\[\s\]", "[x]", line, count=1)
-        action = "checked"
-    elif force_state == "uncheck":
-        if not was_done:
-            from mmu_cli.display import dim
-            return Result(exit_code=0, action="already_unchecked", item=item_text,
-                          messages=[f"  {dim('already ✗')} {label} #{item_num}: {item_text}"])
-        lines[idx] = re.sub(r"\[x\]", "[ ]", line, count=1, flags=re.IGNORECASE)
-        action = "unchecked"
-    else:
-        # Toggle
-        if was_done:
-            lines[idx] = re.sub(r"\[x\]", "[ ]", line, count=1, flags=re.IGNORECASE)
-            action = "unchecked"
-        else:
-            lines[idx] = re.sub(r"\[\s\]", "[x]", line, count=1)
-            action = "checked"
+    written = []
+    for filename, changes in updates.items():
+        bp_path = bp_dir / filename
+        new_text = parsed[filename].render(changes)
+        write_blueprint(bp_path, new_text)
+        record_write(root, bp_path, new_text, flags)
+        written.append(filename)
+    if written:
+        from mmu_cli.display import take_snapshot
+        from mmu_cli.history import append_record
+
+        append_record(root, take_snapshot(root, flags), "check")
 
-    write_text(bp_path, "\n".join(lines) + "\n" if text.endswith("\n") else "\n".join(lines))
+    counts: dict[str, int] = {}
+    for r in results:
+        counts[r["action"]] = counts.get(r["action"], 0) + 1
+    return Result(exit_code=0, results=results, counts=counts, files_written=written, errors=[], messages=messages)
+
+
+def command_check(blueprint_name: str, item_num: int, root: Path, *, force_state: str | None = None) -> Result:
+    """Check/uncheck a blueprint item.
 
-    from mmu_cli.display import green, red, bold
+    force_state: "check" = always mark [x], "uncheck" = always mark [ ], None = toggle.
+    """
+    batch = command_check_batch(root, [CheckSelector(blueprint_name, [str(item_num)])], force_state=force_state)
+    if batch["errors"]:
+        return Result(exit_code=1, messages=batch["errors"])
+    result = batch["results"][0]
+    return Result(exit_code=0, action=result["action"], item=result["item"], messages=batch["messages"])
+
+
+def command_scan_explain(root: Path, signal: str) -> Result:
+    """Explain why *signal* fired, using the persisted scan index when present."""
+    from mmu_cli.display import bold, cyan, dim
+    from mmu_cli.scan import (
+        collect_evidence,
+        index_auto_checked,
+        index_evidence,
+        load_scan_index,
+        resolve_evidence,
+        save_scan_index,
+    )
 
-    if action == "checked":
-        msg = f"  {green('✓')} {bold(label)} #{item_num}: {item_text}"
+    signal = signal.strip().lower().replace("-", "_")
+    index = load_scan_index(root)
+    evidence = index_evidence(index)
+    indexed = evidence.get(signal)
+    if signal not in evidence or (indexed is not None and resolve_evidence(root, indexed)["stale"]):
+        # No index yet, it predates this signal, or the project changed since:
+        # detect read-only, then refresh the index (only inside an existing .mmu/).
+        evidence = collect_evidence(root)
+        save_scan_index(root, evidence, index_auto_checked(index))
+    if signal not in evidence:
+        return Result(
+            exit_code=1,
+            messages=[f"Unknown signal: {signal}", f"Available: {', '.join(sorted(evidence))}"],
+        )
+
+    ev = evidence[signal]
+    if ev is None:
+        return Result(
+            exit_code=0,
+            signal=signal,
+            detected=False,
+            messages=[f"  {bold(signal)}: not detected", f"  {dim('Re-run')} {cyan('mmu scan')} {dim('after changing dependencies.')}"],
+        )
+
+    detail = resolve_evidence(root, ev)
+    if ev.kind == "manifest":
+        where = f"{ev.source}: dependency {bold(ev.key)}"
+    elif ev.kind == "path":
+        where = f"{ev.source} exists"
     else:
-        msg = f"  {red('✗')} {bold(label)} #{item_num}: {item_text} (unchecked)"
+        where = f"{ev.source}: matched {bold(repr(ev.key))}"
+    if detail["line"] is not None:
+        where = f"{ev.source}:{detail['line']}:{detail['column']} — " + where.split(": ", 1)[-1]
+    messages = [f"  {bold(signal)} detected", f"    {where}"]
+    if detail["snippet"]:
+        messages.append(f"    {dim(str(detail['line']).rjust(5) + ' |')} {detail['snippet']}")
+    return Result(exit_code=0, signal=signal, detected=True, evidence=detail, messages=messages)
 
-    return Result(exit_code=0, action=action, item=item_text, messages=[msg])
 
+def command_scan(root: Path, explain: str | None = None) -> Result:
+    if explain:
+        return command_scan_explain(root, explain)
 
-def command_scan(root: Path) -> Result:
     from mmu_cli.display import (
         BLUEPRINT_NAMES,
         bold,
@@ -1520,7 +1845,7 @@ def command_scan(root: Path) -> Result:
         magenta,
         mini_bar,
         progress_bar,
-        scan_all_blueprints,
+        take_snapshot,
         yellow,
     )
     from mmu_cli.scan import run_scan
@@ -1531,112 +1856,198 @@ def command_scan(root: Path) -> Result:
     checked = result["checked_count"]
     total_new = result["total_newly_checked"]
 
-    lines: list[str] = []
-    lines.append("")
-    lines.append(bold("  🔍  CODEBASE SCAN RESULTS"))
-    lines.append(dim("  ─" * 28))
-    lines.append("")
-
-    # Detected tech stack
-    lines.append(bold("  Detected Stack:"))
-    for category, items in tech.items():
-        items_str = ", ".join(bold(i) for i in items)
-        lines.append(f"    {cyan(category + ':')}  {items_str}")
-    lines.append("")
-
-    if not tech:
-        lines.append(f"    {yellow('No technologies detected.')}")
-        lines.append("    Make sure package.json or requirements.txt exists.")
-        lines.append("")
+    snap = take_snapshot(root, flags)
+    blueprints = snap.blueprints
 
-    # Blueprint updates
-    lines.append(dim("  ─" * 28))
-    if checked:
-        lines.append(bold(f"  📝  Auto-checked {total_new} items across {len(checked)} blueprints:"))
-        lines.append("")
-        for bp_file, count in sorted(checked.items()):
-            label = BLUEPRINT_NAMES.get(bp_file, bp_file)
-            lines.append(f"    {green('+')} {label}: {bold(str(count))} items newly checked")
-    else:
-        lines.append(f"  {dim('No new items to auto-check (already up to date or no blueprints found).')}")
-
-    # Show updated totals (reuse flags loaded above)
-    blueprints = scan_all_blueprints(root, flags)
-    if blueprints:
-        bp_done = sum(d for _, d, _, _ in blueprints)
-        bp_total = sum(t for _, _, t, _ in blueprints)
-        bp_skipped = sum(s for _, _, _, s in blueprints)
+    def render() -> list[str]:
+        lines: list[str] = []
         lines.append("")
+        lines.append(bold("  🔍  CODEBASE SCAN RESULTS"))
         lines.append(dim("  ─" * 28))
-        skip_note = dim(f"  [{bp_skipped} skipped]") if bp_skipped > 0 else ""
-        lines.append(f"  {bold('Updated totals:')}  {progress_bar(bp_done, bp_total)}{skip_note}")
         lines.append("")
-        for label, d, t, _s in blueprints:
-            lines.append(f"    {label:<18} {mini_bar(d, t)}")
+
+        # Detected tech stack
+        lines.append(bold("  Detected Stack:"))
+        for category, items in tech.items():
+            items_str = ", ".join(bold(i) for i in items)
+            lines.append(f"    {cyan(category + ':')}  {items_str}")
         lines.append("")
 
-    lines.append(dim("  ─" * 28))
-    if total_new > 0:
-        lines.append(f"  {magenta('✨')} Scan complete! {bold(str(total_new))} items auto-checked")
-        lines.append(f"  {dim('Review with:')} {cyan('mmu show <blueprint>')} {dim('— edit with:')} {cyan('mmu check/uncheck <blueprint> <#>')}")
-    elif blueprints:
-        lines.append(f"  {dim('All detectable items already checked. Review remaining with:')}")
-        lines.append(f"  {cyan('mmu next')} {dim('or')} {cyan('mmu show <blueprint>')}")
-    else:
-        lines.append(f"  💡 Run {cyan('mmu init')} first to create blueprint files")
-    lines.append("")
+        if not tech:
+            lines.append(f"    {yellow('No technologies detected.')}")
+            lines.append("    Make sure package.json or requirements.txt exists.")
+            lines.append("")
+
+        # Blueprint updates
+        lines.append(dim("  ─" * 28))
+        if checked:
+            lines.append(bold(f"  📝  Auto-checked {total_new} items across {len(checked)} blueprints:"))
+            lines.append("")
+            for bp_file, count in sorted(checked.items()):
+                label = BLUEPRINT_NAMES.get(bp_file, bp_file)
+                lines.append(f"    {green('+')} {label}: {bold(str(count))} items newly checked")
+        else:
+            lines.append(f"  {dim('No new items to auto-check (already up to date or no blueprints found).')}")
+
+        # Show updated totals
+        if blueprints:
+            bp_done, bp_total, bp_skipped = snap.bp_done, snap.bp_total, snap.bp_skipped
+            lines.append("")
+            lines.append(dim("  ─" * 28))
+            skip_note = dim(f"  [{bp_skipped} skipped]") if bp_skipped > 0 else ""
+            lines.append(f"  {bold('Updated totals:')}  {progress_bar(bp_done, bp_total)}{skip_note}")
+            lines.append("")
+            for label, d, t, _s in blueprints:
+                lines.append(f"    {label:<18} {mini_bar(d, t)}")
+            lines.append("")
+
+        lines.append(dim("  ─" * 28))
+        if total_new > 0:
+            lines.append(f"  {magenta('✨')} Scan complete! {bold(str(total_new))} items auto-checked")
+            lines.append(f"  {dim('Review with:')} {cyan('mmu show <blueprint>')} {dim('— edit with:')} {cyan('mmu check/uncheck <blueprint> <#>')}")
+        elif blueprints:
+            lines.append(f"  {dim('All detectable items already checked. Review remaining with:')}")
+            lines.append(f"  {cyan('mmu next')} {dim('or')} {cyan('mmu show <blueprint>')}")
+        else:
+            lines.append(f"  💡 Run {cyan('mmu init')} first to create blueprint files")
+        lines.append("")
+        return ["\n".join(lines)]
 
-    dashboard = "\n".join(lines)
     return Result(
         exit_code=0,
         tech_stack=tech,
+        evidence=result["evidence"],
         newly_checked=total_new,
         checked_by_blueprint=checked,
-        messages=[dashboard],
+        blueprints=[{"name": label, "done": d, "total": t, "skipped": sk} for label, d, t, sk in blueprints],
+        render=render,
     )
 
 
-def command_status(root: Path, why: bool = False) -> Result:
-    from mmu_cli.display import render_status, render_score_breakdown, scan_all_blueprints, scan_gates
+def command_status(root: Path, why: bool = False, trend: bool = False, trend_limit: int = 30) -> Result:
+    import functools
 
-    flags = load_feature_flags(root)
-    dashboard = render_status(root, flags)
+    from mmu_cli.display import render_score_breakdown, render_status, take_snapshot
+
+    snap = take_snapshot(root, load_feature_flags(root))
+    extra: dict[str, Any] = {}
+    records: list[dict[str, Any]] = []
+    if trend:
+        from mmu_cli.history import render_trend, series, tail
 
-    if why:
-        breakdown = render_score_breakdown(root, flags)
-        dashboard = dashboard + "\n" + breakdown
+        records = tail(root, trend_limit)
+        extra["trend"] = series(records)
 
-    blueprints = scan_all_blueprints(root, flags)
-    gates = scan_gates(root)
-    bp_done = sum(d for _, d, _, _ in blueprints)
-    bp_total = sum(t for _, _, t, _ in blueprints)
-    bp_skipped = sum(s for _, _, _, s in blueprints)
-    gate_done = sum(d for _, d, _ in gates)
-    gate_total = sum(t for _, _, t in gates)
+    @functools.cache
+    def dashboard() -> str:
+        text = render_status(snap)
+        if why:
+            text = text + "\n" + render_score_breakdown(snap)
+        if trend:
+            text = text + "\n" + render_trend(records)
+        return text
 
     return Result(
         exit_code=0,
-        dashboard=dashboard,
-        blueprint_progress={"done": bp_done, "total": bp_total, "skipped": bp_skipped},
-        gate_progress={"done": gate_done, "total": gate_total},
-        messages=[dashboard],
+        score=snap.pct_int,
+        stage=snap.stage,
+        blueprint_progress={"done": snap.bp_done, "total": snap.bp_total, "skipped": snap.bp_skipped},
+        gate_progress={"done": snap.gate_done, "total": snap.gate_total},
+        blueprints=[
+            {"name": label, "done": d, "total": t, "skipped": sk, "pct": round(d / t * 100) if t else None}
+            for label, d, t, sk in snap.blueprints
+        ],
+        gates=[{"stage": label, "done": d, "total": t, "passed": t > 0 and d == t} for label, d, t in snap.gates],
+        open_gates=snap.open_gates,
+        p0_open=snap.p0_open,
+        disabled_flags=sorted(k for k, v in (snap.flags or {}).items() if not v),
+        lazy={"dashboard": dashboard},
+        render=lambda: [dashboard()],
+        **extra,
     )
 
 
-def command_next(root: Path, count: int = 3) -> Result:
-    from mmu_cli.display import render_next_actions
+def command_portfolio(roots: list[str], *, workers: int | None = None, export_path: Path | None = None) -> Result:
+    """`mmu status` over many roots at once (see mmu_cli.portfolio)."""
+    from mmu_cli.portfolio import collect, export, format_table
+
+    rows = collect(roots, workers)
+    messages: list[str] = []
+    if export_path is not None:
+        try:
+            export(rows, export_path)
+        except OSError as exc:
+            return Result(exit_code=1, projects=rows, messages=[f"Cannot write {export_path}: {exc}"])
+        messages.append(f"Exported {len(rows)} row(s) to {export_path}")
+    failed = sum(1 for row in rows if row["score"] is None)
+    return Result(
+        exit_code=1 if failed or not rows else 0,
+        projects=rows,
+        render=lambda: format_table(rows) + ([""] + messages if messages else []),
+    )
+
+
+def command_fleet(base: Path, *, workers: int | None = None, chunk_size: int = 256) -> int:
+    """Stream `mmu fleet vibecheck` events as NDJSON; exit 2 if any repo fails a check, 1 if one could not be checked."""
+    from mmu_cli.fleet import run_fleet
+
+    if not base.is_dir():
+        print(f"Error: {base} is not a directory.", file=sys.stderr)
+        return 2
+    return render_events(run_fleet(base.resolve(), workers, chunk_size))
+
+
+def command_history(root: Path, limit: int = 30) -> Result:
+    """Readiness over time from .mmu/history.jsonl (newest records only)."""
+    from mmu_cli.display import dim
+    from mmu_cli.history import render_trend, series, tail
+
+    records = tail(root, max(limit, 1))
+    lines = [render_trend(records)]
+    for record in records[-10:]:
+        lines.append(f"    {dim(record.get('t', '')):<22} {record.get('src', ''):<6} {record.get('score', 0):>3}%")
+    if records:
+        lines.append("")
+    return Result(exit_code=0, records=records, series=series(records), messages=["\n".join(lines)])
 
-    flags = load_feature_flags(root)
-    output = render_next_actions(root, flags, count)
 
+def command_search(query: str, root: Path, limit: int = 10) -> Result:
+    from mmu_cli.search import format_results, search
+
+    results = search(root, query, max(limit, 1), load_feature_flags(root))
+    return Result(
+        exit_code=0 if results else 1,
+        query=query,
+        results=results,
+        render=lambda: format_results(query, results),
+    )
+
+
+def command_next(root: Path, count: int = 3, *, vibecheck: bool = False) -> Result:
+    from mmu_cli.display import PRIORITY_LABELS, format_next_actions
+    from mmu_cli.recommend import recommend
+
+    top, remaining = recommend(root, load_feature_flags(root), count, vibecheck=vibecheck)
+    actions = []
+    for rec in top:
+        action = rec.to_dict()
+        # "blueprint" predates the other sources; keep it for existing consumers.
+        action["blueprint"] = action["label"]
+        action["severity"] = PRIORITY_LABELS[rec.candidate.priority][1] or "normal"
+        actions.append(action)
     return Result(
         exit_code=0,
-        messages=[output],
+        actions=actions,
+        remaining=remaining,
+        render=lambda: [format_next_actions(top, remaining)],
     )
 
 
+@trace.traced("render")
 def render_result(result: Result, as_json: bool) -> int:
     if as_json:
+        import json
+
         clean = {k: v for k, v in result.items() if k != "dashboard"}
         print(json.dumps(clean, ensure_ascii=False, indent=2))
     else:
@@ -1647,6 +2058,18 @@ def render_result(result: Result, as_json: bool) -> int:
     return result.exit_code
 
 
+def render_events(events: Iterable[dict[str, Any]]) -> int:
+    """Print each event as one JSON line as soon as it exists; return the summary's exit code."""
+    import json
+
+    exit_code = 1
+    for event in events:
+        print(json.dumps(event, ensure_ascii=False), flush=True)
+        if event["event"] == "summary":
+            exit_code = event["exit_code"]
+    return exit_code
+
+
 def command_validate(
     idea: str,
     root: Path,
@@ -1657,6 +2080,8 @@ def command_validate(
     output_format: str = "text",
     save: bool = True,
 ) -> int:
+    import json
+
     from mmu_cli.validators import (
         analyze_sentiment,
         extract_competitors,
@@ -1727,8 +2152,192 @@ def command_validate(
     return 0
 
 
-def main() -> int:
-    args = parse_args()
+def command_daemon(action: str, *, foreground: bool = False) -> Result:
+    from mmu_cli import daemon
+
+    if action == "status":
+        status = daemon.request({"op": "status"})
+        if status is None:
+            return Result(exit_code=1, running=False, messages=[f"mmu daemon is not running ({daemon.socket_path()})"])
+        roots = status.get("roots", [])
+        summary = f"pid {status['pid']}, up {status['uptime']:.0f}s, {status['requests']} request(s)"
+        lines = [
+            f"mmu daemon {status['version']} — {summary}",
+            f"  socket: {daemon.socket_path()}",
+        ]
+        lines += [f"  warm: {root}" for root in roots] or ["  warm: (no roots yet)"]
+        return Result(exit_code=0, running=True, **status, messages=lines)
+    if action == "start" and foreground:
+        try:
+            daemon.serve()
+        except (OSError, RuntimeError) as exc:
+            return Result(exit_code=1, messages=[f"mmu daemon: {exc}"])
+        return Result(exit_code=0, messages=["mmu daemon stopped"])
+    ok, message = daemon.start() if action == "start" else daemon.stop()
+    return Result(exit_code=0 if ok else 1, messages=[message])
+
+
+def command_bench(
+    sizes: list[int] | None,
+    commands: list[str],
+    *,
+    repeat: int = 3,
+    seed: int = 0,
+    workdir: Path | None = None,
+    output: Path | None = None,
+    baseline: Path | None = None,
+    tolerance: float = 0.25,
+) -> Result:
+    import json
+
+    from mmu_cli import bench
+
+    sizes = sizes or list(bench.DEFAULT_SIZES)
+    unknown = sorted(set(commands) - set(bench.COMMANDS))
+    if unknown:
+        return Result(exit_code=1, messages=[f"Unknown bench command(s): {', '.join(unknown)} (choose from {', '.join(bench.COMMANDS)})"])
+    if any(n < 1 for n in sizes):
+        return Result(exit_code=1, messages=["--files must be at least 1"])
+    base = None
+    if baseline is not None:
+        try:
+            base = json.loads(baseline.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            return Result(exit_code=1, messages=[f"Cannot read baseline {baseline}: {exc}"])
+
+    if workdir is None:
+        import tempfile
+
+        with tempfile.TemporaryDirectory(prefix="mmu-bench-") as tmp:
+            report = bench.run_bench(Path(tmp), tuple(sizes), tuple(commands), repeat, seed)
+    else:
+        report = bench.run_bench(workdir, tuple(sizes), tuple(commands), repeat, seed)
+    if output is not None:
+        write_text(output, json.dumps(report, indent=2) + "\n")
+    regressions = bench.compare(report, base, tolerance) if base is not None else None
+    return Result(
+        exit_code=2 if regressions else 0,
+        **report,
+        regressions=regressions or [],
+        render=lambda: bench.format_report(report, regressions),
+    )
+
+
+def command_cache(action: str, file: Path, root: Path) -> Result:
+    from mmu_cli import artifact
+
+    if action == "export":
+        try:
+            info = artifact.export_cache(root, file)
+        except OSError as exc:
+            return Result(exit_code=1, messages=[f"Cannot write {file}: {exc}"])
+        names = ", ".join(info["caches"]) or "nothing cached yet"
+        return Result(exit_code=0, **info, messages=[f"Exported {file} ({info['bytes']:,} bytes): {names}"])
+    try:
+        info = artifact.import_cache(root, file)
+    except OSError as exc:
+        return Result(exit_code=1, messages=[f"Cannot import {file}: {exc}"])
+    except ValueError as exc:
+        return Result(exit_code=1, messages=[f"Cannot import {exc}"])
+    messages = [f"Imported {file}: {', '.join(info['caches']) or 'no usable caches'}"]
+    if info["skipped"]:
+        messages.append(f"  [skip] {', '.join(info['skipped'])} (written by a different cache version)")
+    return Result(exit_code=0, **info, messages=messages)
+
+
+def command_ci(root: Path, targets_file: str, *, advisory: list[str], junit: str | None = None) -> Result:
+    from mmu_cli import ci
+
+    targets = Path(targets_file)
+    if not targets.is_absolute():
+        targets = root / targets
+    errors: list[str] = []
+    stages = ci.read_targets(targets, errors)
+    if errors:
+        return Result(exit_code=1, errors=errors, messages=[f"CI config error: {e}" for e in errors])
+    suites = ci.run_ci(root, stages, frozenset(advisory))
+    if junit is not None and junit != "-":
+        try:
+            write_text(Path(junit), ci.to_junit(suites))
+        except OSError as exc:
+            return Result(
+                exit_code=1,
+                stages=stages,
+                suites=[s.to_dict() for s in suites],
+                messages=[*ci.format_suites(suites), f"Cannot write JUnit report {junit}: {exc}"],
+            )
+    return Result(
+        exit_code=ci.exit_code(suites),
+        stages=stages,
+        suites=[s.to_dict() for s in suites],
+        render=lambda: ci.to_junit(suites).splitlines() if junit == "-" else ci.format_suites(suites),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv == ["--version"]:  # the same line argparse prints, without importing it
+        from mmu_cli import __version__
+
+        print(f"mmu {__version__}")
+        return 0
+    if trace.enabled:
+        return run_traced(argv)
+    from mmu_cli.daemon import forward
+
+    code = forward(argv)
+    if code is not None:
+        return code
+    return run(argv)
+
+
+def run_traced(argv: list[str]) -> int:
+    """``MMU_TRACE``: run here (never in the daemon) and write the trace afterwards.
+
+    An ``mmu`` started by a traced ``mmu`` (``bench`` children) adds its
+    spans to the parent's trace instead of writing its own.
+    """
+    worker = trace.is_worker()
+    if not worker:
+        trace.start(argv)
+    try:
+        with trace.span("mmu " + (selected_command(argv) or "status"), "command", argv=argv):
+            return run(argv)
+    finally:
+        path = trace.finish()
+        if path:
+            print(f"{trace.ENV}: wrote {path}", file=sys.stderr)
+
+
+def run_ndjson(args: argparse.Namespace, root: Path) -> int:
+    """`--format ndjson` for doctor, vibecheck, scan and gate."""
+    if getattr(args, "shard", None) or getattr(args, "action", None) == "merge":
+        print("Error: --shard and merge have no ndjson output; use --format json.", file=sys.stderr)
+        return 2
+    if getattr(args, "deep", False) or getattr(args, "explain", None):
+        option = "--deep" if args.command == "doctor" else "--explain"
+        print(f"Error: {option} has no ndjson output; use --format json.", file=sys.stderr)
+        return 2
+    if args.command == "doctor":
+        return render_events(iter_doctor(root))
+    if args.command == "vibecheck":
+        from mmu_cli.vibecheck import iter_vibecheck
+
+        return render_events(iter_vibecheck(root))
+    if args.command == "scan":
+        from mmu_cli.scan import iter_scan
+
+        return render_events(iter_scan(root, load_feature_flags(root)))
+    stages = None if args.all else parse_stages(args.stage) or [args.stage]
+    if stages is not None and len(stages) == 1:
+        return render_events(iter_gate(stages[0], root))
+    return render_events(iter_gates(stages, root))
+
+
+def run(argv: list[str]) -> int:
+    """Parse *argv* and run the command in this process."""
+    with trace.span("parse_args"):
+        args = parse_args(argv)
     root = root_path(getattr(args, "root", "."))
 
     # serve-mcp validates its own --root (None means "use packaged data").
@@ -1755,6 +2364,11 @@ def main() -> int:
     if args.command == "close":
         result = command_close(root)
         return render_result(result, args.json)
+    output_format = getattr(args, "output_format", "text")
+    if output_format == "ndjson":
+        return run_ndjson(args, root)
+    if output_format == "json":
+        args.json = True
     if args.command == "doctor":
         if getattr(args, "deep", False):
             result = command_doctor_deep(root)
@@ -1764,29 +2378,107 @@ def main() -> int:
     if args.command == "generate":
         result = command_generate(args.doc, root)
         return render_result(result, args.json)
+    if args.command == "vibecheck" and args.action == "merge":
+        result = command_vibecheck_merge(root, args.shards)
+        return render_result(result, args.json)
+    if args.command == "vibecheck" and args.shard:
+        result = command_vibecheck_shard(root, args.shard, args.output)
+        if args.output == "-":
+            print("\n".join(result["messages"]))
+            return result.exit_code
+        return render_result(result, args.json)
     if args.command == "vibecheck":
         result = command_vibecheck(root)
         return render_result(result, args.json)
+    if args.command == "daemon":
+        result = command_daemon(args.action, foreground=args.foreground)
+        return render_result(result, args.json)
+    if args.command == "bench":
+        result = command_bench(
+            args.files,
+            [c.strip() for c in args.commands.split(",") if c.strip()],
+            repeat=args.repeat,
+            seed=args.seed,
+            workdir=Path(args.dir).expanduser() if args.dir else None,
+            output=Path(args.output) if args.output else None,
+            baseline=Path(args.baseline) if args.baseline else None,
+            tolerance=args.tolerance,
+        )
+        return render_result(result, args.json)
+    if args.command == "cache":
+        result = command_cache(args.action, Path(args.file), root)
+        return render_result(result, args.json)
+    if args.command == "ci":
+        result = command_ci(root, args.targets_file, advisory=args.advisory, junit=args.junit)
+        if args.junit == "-" and not args.json:
+            print("\n".join(result["messages"]))
+            return result.exit_code
+        return render_result(result, args.json)
+    if args.command == "fleet":
+        return command_fleet(Path(args.dir).expanduser(), workers=args.workers, chunk_size=args.chunk_size)
     if args.command == "gate":
-        result = command_gate(args.stage, root)
+        stages = None if args.all else parse_stages(args.stage) or [args.stage]
+        if stages is not None and len(stages) == 1:
+            result = command_gate(stages[0], root)
+        else:
+            result = command_gates(stages, root)
+        return render_result(result, args.json)
+    if args.command == "status" and (args.roots_file or args.glob):
+        from mmu_cli.portfolio import expand_globs, read_roots_file
+
+        try:
+            roots = read_roots_file(Path(args.roots_file)) if args.roots_file else []
+        except OSError as exc:
+            print(f"Cannot read {args.roots_file}: {exc}", file=sys.stderr)
+            return 2
+        roots += expand_globs(args.glob)
+        result = command_portfolio(
+            roots, workers=args.workers, export_path=Path(args.export) if args.export else None,
+        )
         return render_result(result, args.json)
     if args.command == "status":
-        result = command_status(root, why=getattr(args, "why", False))
+        result = command_status(root, why=getattr(args, "why", False), trend=getattr(args, "trend", False))
+        return render_result(result, args.json)
+    if args.command == "history":
+        result = command_history(root, limit=args.limit)
+        return render_result(result, args.json)
+    if args.command == "search":
+        result = command_search(" ".join(args.query), root, limit=args.n)
         return render_result(result, args.json)
     if args.command == "next":
-        result = command_next(root, count=getattr(args, "n", 3))
+        result = command_next(root, count=getattr(args, "n", 3), vibecheck=args.vibecheck)
         return render_result(result, args.json)
     if args.command == "show":
-        result = command_show(args.blueprint, root)
-        return render_result(result, args.json)
-    if args.command == "check":
-        result = command_check(args.blueprint, args.item, root, force_state="check")
+        result = command_show(args.blueprint, root, graph=args.graph)
         return render_result(result, args.json)
-    if args.command == "uncheck":
-        result = command_check(args.blueprint, args.item, root, force_state="uncheck")
+    if args.command in ("check", "uncheck"):
+        selectors: list[CheckSelector] = []
+        if args.all_blueprints and args.blueprint:
+            # With --all-blueprints every positional is an item spec, which is rejected below.
+            args.items.insert(0, args.blueprint)
+            args.blueprint = None
+        if args.blueprint or args.match or args.all_blueprints:
+            selectors.append(CheckSelector(args.blueprint, args.items, args.match, args.all_blueprints))
+        if args.from_file:
+            text = read_text(Path(args.from_file))
+            if text is None:
+                print(f"Cannot read {args.from_file}", file=sys.stderr)
+                return 1
+            for n, line in enumerate(text.splitlines(), 1):
+                if not line.strip() or line.lstrip().startswith("#"):
+                    continue
+                try:
+                    selectors.append(parse_check_line(line))
+                except ValueError as exc:
+                    print(f"{args.from_file}:{n}: {exc}", file=sys.stderr)
+                    return 1
+        if not selectors:
+            print(f"usage: mmu {args.command} <blueprint> <items...> | --match TEXT | --from-file PATH", file=sys.stderr)
+            return 2
+        result = command_check_batch(root, selectors, force_state=args.command)
         return render_result(result, args.json)
     if args.command == "scan":
-        result = command_scan(root)
+        result = command_scan(root, explain=getattr(args, "explain", None))
         return render_result(result, args.json)
     if args.command == "share":
         result = command_share(root, clipboard=getattr(args, "clipboard", False))
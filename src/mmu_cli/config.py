@@ -0,0 +1,306 @@
+"""`.mmu/config.toml`, parsed once per root per process.
+
+:meth:`Config.load` memoizes one :class:`Config` per project root and
+revalidates it by the file's (mtime, size, inode), so the feature flags,
+doctor skip paths, LLM key and project name read by one command (or by the
+daemon and MCP server across many requests) share a single parse, and an
+edited file is picked up on the next call.
+
+``tomllib`` (``tomli`` on Python 3.10) is imported only when a config file
+exists; without either, :func:`parse_simple_toml` covers the flat format
+`mmu init` writes.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from mmu_cli import trace
+
+CONFIG_PATH = ".mmu/config.toml"
+
+DEFAULT_SKIP_PATHS = {
+    ".git",
+    ".venv",
+    "node_modules",
+    "dist",
+    "build",
+    "docs",
+    ".mmu",
+    ".github",
+    "src/mmu_cli",
+    "scripts",
+    "examples",
+    "cli",
+    "tests",
+}
+
+# All flags default to True so that projects without config get the full
+# checklist (backward compatible).  Only explicitly set False flags cause
+# items to be skipped.
+
+FEATURE_FLAG_DEFAULTS: dict[str, bool] = {
+    # [features]
+    "has_billing": True,
+    "has_email_transactional": True,
+    "has_email_marketing": True,
+    "has_i18n": True,
+    "has_file_upload": True,
+    "has_mfa": True,
+    "has_push_notifications": True,
+    "has_in_app_notifications": True,
+    "has_ab_testing": True,
+    "has_webhooks_outgoing": True,
+    # [architecture]
+    "uses_containers": True,
+    "uses_iac": True,
+    "uses_ssr": True,
+    "uses_serverless": True,
+    # [market]
+    "targets_eu": True,
+    "targets_california": True,
+    "targets_korea": True,
+}
+
+# Short config key -> canonical flag name, read from the [features],
+# [architecture] and [market] sections.
+FLAG_KEYS: dict[str, str] = {
+    "billing": "has_billing",
+    "email_transactional": "has_email_transactional",
+    "email_marketing": "has_email_marketing",
+    "i18n": "has_i18n",
+    "file_upload": "has_file_upload",
+    "mfa": "has_mfa",
+    "push_notifications": "has_push_notifications",
+    "in_app_notifications": "has_in_app_notifications",
+    "ab_testing": "has_ab_testing",
+    "webhooks_outgoing": "has_webhooks_outgoing",
+    "containerized": "uses_containers",
+    "iac": "uses_iac",
+    "ssr": "uses_ssr",
+    "serverless": "uses_serverless",
+    "targets_eu": "targets_eu",
+    "targets_california": "targets_california",
+    "targets_korea": "targets_korea",
+}
+
+FLAG_SECTIONS = ("features", "architecture", "market")
+
+
+def parse_simple_toml(text: str) -> dict[str, Any]:
+    """Minimal TOML parser for flat section/key=value configs.
+
+    Only handles ``[section]`` headers and ``key = value`` lines where
+    values are booleans, quoted strings, or numbers.  This covers the
+    .mmu/config.toml format without requiring tomllib (Python 3.11+).
+    """
+    data: dict[str, Any] = {}
+    section: dict[str, Any] | None = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            name = line[1:-1].strip()
+            section = {}
+            data[name] = section
+            continue
+        if "=" in line and section is not None:
+            key, _, val = line.partition("=")
+            key = key.strip()
+            val = val.split("#", 1)[0].strip()  # strip inline comments
+            if val.lower() == "true":
+                section[key] = True
+            elif val.lower() == "false":
+                section[key] = False
+            elif val.startswith('"') and val.endswith('"'):
+                section[key] = val[1:-1]
+            else:
+                try:
+                    section[key] = int(val)
+                except ValueError:
+                    section[key] = val
+    return data
+
+
+def parse_config(text: str, path: Path) -> dict[str, Any]:
+    """*text* as a dict; invalid files warn on stderr and read as empty."""
+    try:
+        import tomllib
+    except ModuleNotFoundError:
+        try:
+            import tomli as tomllib  # type: ignore[no-redef]
+        except ModuleNotFoundError:
+            tomllib = None  # type: ignore[assignment]
+    if tomllib is not None:
+        try:
+            data = tomllib.loads(text)
+        except tomllib.TOMLDecodeError as exc:
+            sys.stderr.write(f"  ⚠️  Ignoring invalid {path}: {exc}\n")
+            return {}
+        return data if isinstance(data, dict) else {}
+    # Fallback for Python < 3.11 without tomli
+    try:
+        return parse_simple_toml(text)
+    except (ValueError, IndexError) as exc:
+        sys.stderr.write(f"  ⚠️  Ignoring unparseable {path}: {exc}\n")
+        return {}
+
+
+class Config:
+    """One project's parsed config with typed section accessors. Treat as read-only."""
+
+    def __init__(self, root: Path, data: dict[str, Any] | None = None) -> None:
+        self.root = root
+        self.data: dict[str, Any] = data or {}
+
+    @classmethod
+    def load(cls, root: Path) -> Config:
+        """The memoized config for *root*, re-read when the file changed."""
+        path = root / CONFIG_PATH
+        try:
+            st = os.stat(path)
+            sig: tuple[int, int, int] | None = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            sig = None
+        memo = _MEMO.get(root)
+        if memo is not None and memo[0] == sig:
+            return memo[1]
+        data: dict[str, Any] = {}
+        if sig is not None:
+            with trace.span("config.load", path=str(path)):
+                try:
+                    data = parse_config(path.read_text(encoding="utf-8"), path)
+                except (OSError, UnicodeDecodeError):
+                    data = {}
+        config = cls(root, data)
+        _MEMO[root] = (sig, config)
+        return config
+
+    def section(self, name: str) -> dict[str, Any]:
+        value = self.data.get(name)
+        return value if isinstance(value, dict) else {}
+
+    @cached_property
+    def features(self) -> dict[str, bool]:
+        """Feature flags merged over :data:`FEATURE_FLAG_DEFAULTS`.
+
+        Config format::
+
+            [features]
+            billing = false
+            i18n = false
+
+            [architecture]
+            containerized = false
+
+            [market]
+            targets_eu = false
+
+        Short config keys are mapped to canonical flag names (e.g.
+        ``billing`` -> ``has_billing``, ``containerized`` -> ``uses_containers``).
+        """
+        flags = dict(FEATURE_FLAG_DEFAULTS)
+        for name in FLAG_SECTIONS:
+            for key, value in self.section(name).items():
+                canonical = FLAG_KEYS.get(key)
+                if canonical and isinstance(value, bool):
+                    flags[canonical] = value
+        return flags
+
+    @cached_property
+    def doctor(self) -> dict[str, Any]:
+        return self.section("doctor")
+
+    @cached_property
+    def skip_paths(self) -> frozenset[str]:
+        """:data:`DEFAULT_SKIP_PATHS` plus ``[doctor] skip_paths``."""
+        merged = set(DEFAULT_SKIP_PATHS)
+        extra = self.doctor.get("skip_paths")
+        if isinstance(extra, list):
+            merged.update(item.strip() for item in extra if isinstance(item, str) and item.strip())
+        return frozenset(merged)
+
+    @cached_property
+    def llm(self) -> dict[str, Any]:
+        return self.section("llm")
+
+    @property
+    def api_key(self) -> str | None:
+        key = self.llm.get("api_key")
+        return str(key) if key else None
+
+    @cached_property
+    def vibecheck(self) -> dict[str, Any]:
+        return self.section("vibecheck")
+
+    @cached_property
+    def project(self) -> dict[str, Any]:
+        return self.section("project")
+
+    @property
+    def project_name(self) -> str:
+        name = self.project.get("name", "")
+        return name if isinstance(name, str) else ""
+
+
+# root -> ((mtime_ns, size, inode) or None when absent, config)
+_MEMO: dict[Path, tuple[tuple[int, int, int] | None, Config]] = {}
+
+
+def generate_stack_config(root: Path) -> str:
+    """Generate a .mmu/config.toml with feature flags.
+
+    Auto-detects what it can from the project, defaults the rest to true
+    so that users can opt-out of sections that don't apply.
+    """
+    from mmu_cli.manifests import load_manifests
+
+    # Basic auto-detection
+    has_docker = (root / "Dockerfile").exists() or (root / "docker-compose.yml").exists()
+
+    # Try to detect billing/email/i18n from declared dependencies
+    manifests = load_manifests(root)
+    billing_hint = manifests.mentions("stripe", "lemonsqueezy", "paddle", "@paypal")
+    email_hint = manifests.mentions("resend", "postmark", "sendgrid", "nodemailer", "@react-email")
+    i18n_hint = manifests.mentions("next-intl", "i18next", "react-i18next", "next-i18n")
+
+    lines = [
+        "# MMU Feature Config — controls which checklist sections apply to your project.",
+        "# Set to false to skip sections that don't apply. This makes your score accurate.",
+        "# Regenerate with: mmu init --force",
+        "",
+        "[features]",
+        f"billing = true{_hint(billing_hint, 'detected')}",
+        "email_transactional = true",
+        f"email_marketing = true{_hint(email_hint, 'email detected')}",
+        "i18n = true" if i18n_hint else "i18n = false  # set true if your app supports multiple languages",
+        "file_upload = true",
+        "mfa = false  # set true if your app has multi-factor auth",
+        "push_notifications = false  # set true if your app sends push notifications",
+        "in_app_notifications = false  # set true if your app has a notification bell/inbox",
+        "ab_testing = false  # set true if you plan to run A/B tests",
+        "webhooks_outgoing = false  # set true if your app dispatches webhooks to external services",
+        "",
+        "[architecture]",
+        f"containerized = {'true' if has_docker else 'false'}  # Dockerfile detected" if has_docker else "containerized = false  # set true if using Docker",
+        "iac = false  # set true if using Terraform/Pulumi/SST",
+        "ssr = true",
+        "serverless = false  # set true if using Lambda/Cloudflare Workers",
+        "",
+        "[market]",
+        "targets_eu = false  # set true if you serve EU users (enables GDPR section)",
+        "targets_california = false  # set true if you serve CA users (enables CCPA section)",
+        "targets_korea = false  # set true if you target Korean market (enables Naver registration)",
+        "",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _hint(detected: bool, label: str) -> str:
+    return f"  # {label}" if detected else ""
+
@@ -0,0 +1,331 @@
+"""`mmu daemon start|stop|status` — keep per-root state warm between calls.
+
+A resident process listens on a unix socket (``$MMU_DAEMON_SOCKET``, else
+``mmu-<uid>/daemon.sock`` under ``$XDG_RUNTIME_DIR`` or ``/tmp``). While it
+runs, every `mmu` invocation sends its argv, working directory and color
+setting there and prints the captured output. The code file index
+(:func:`mmu_cli.index.load_index`), parsed blueprints, progress state,
+manifests and the search index then stay in memory across calls instead of
+being rebuilt by every process.
+
+A polling watcher revalidates each root the daemon has served about once a
+second, so a request usually finds its root already current. Every cache
+also validates on use, so a missed poll costs speed, never correctness.
+
+Commands that prompt, stream, fork worker pools or run their own server
+always run in the client (:func:`runs_locally`). So does everything
+when no daemon answers, when its version differs, or when
+``MMU_NO_DAEMON=1`` is set.
+
+The socket directory may sit in a shared ``/tmp``, so both sides check it
+(:func:`untrusted`) before use: the directory and the socket must be real
+(not symlinks), owned by the current user and closed to group and others.
+A client that finds anything else runs the command itself; the daemon
+refuses to start.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+SOCKET_ENV = "MMU_DAEMON_SOCKET"
+DISABLE_ENV = "MMU_NO_DAEMON"
+LOCAL_COMMANDS = {"daemon", "serve-mcp", "fleet", "generate", "validate", "bench", "cache"}
+POLL_INTERVAL = 1.0  # seconds between watcher passes
+IDLE_SECONDS = 30 * 60  # stop watching a root nobody asked about for this long
+CONNECT_TIMEOUT = 0.5
+START_TIMEOUT = 5.0
+
+
+def socket_path() -> Path:
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return Path(base) / f"mmu-{os.getuid()}" / "daemon.sock"
+
+
+def untrusted(path: Path, *, socket: bool = True) -> str | None:
+    """Why *path* (the socket, else its directory) must not be used; None when it is safe.
+
+    Uses ``lstat`` so a symlink planted by another user is refused rather
+    than followed.
+    """
+    try:
+        info = os.lstat(path)
+    except OSError as exc:
+        return f"cannot stat {path}: {exc.strerror}"
+    if stat.S_ISLNK(info.st_mode):
+        return f"{path} is a symlink"
+    if not (stat.S_ISSOCK(info.st_mode) if socket else stat.S_ISDIR(info.st_mode)):
+        return f"{path} is not a {'socket' if socket else 'directory'}"
+    if info.st_uid != os.getuid():
+        return f"{path} is owned by uid {info.st_uid}, not {os.getuid()}"
+    if info.st_mode & 0o077:
+        return f"{path} is accessible to group or others (mode {stat.S_IMODE(info.st_mode):o})"
+    return None
+
+
+def _untrusted_socket(path: Path) -> str | None:
+    return untrusted(path.parent, socket=False) or untrusted(path)
+
+
+def request(payload: dict[str, Any], *, timeout: float | None = None) -> dict[str, Any] | None:
+    """Send one request and return the reply, or None when no daemon answers."""
+    import json
+    import socket
+
+    family = getattr(socket, "AF_UNIX", None)
+    if family is None:
+        return None
+    path = socket_path()
+    if _untrusted_socket(path):
+        return None
+    chunks = []
+    try:
+        with socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(path))
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        return None
+    try:
+        reply = json.loads(b"".join(chunks))
+    except ValueError:
+        return None
+    return reply if isinstance(reply, dict) else None
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run *argv* in the daemon and print its output; None means "run it here instead"."""
+    if os.environ.get(DISABLE_ENV):
+        return None
+    if runs_locally(argv):
+        return None
+    if _untrusted_socket(socket_path()):
+        return None
+    from mmu_cli import __version__
+
+    color = not os.environ.get("NO_COLOR") and hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+    reply = request({"op": "run", "argv": argv, "cwd": os.getcwd(), "color": color, "version": __version__})
+    if reply is None or "exit_code" not in reply:
+        return None
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    sys.stdout.flush()
+    return int(reply["exit_code"])
+
+
+def runs_locally(argv: list[str]) -> bool:
+    """Whether *argv* must run in the client: :data:`LOCAL_COMMANDS`, ``init
+    --interactive``, ``--format ndjson`` and portfolio ``status`` (its process
+    pool must not fork the threaded daemon)."""
+    from mmu_cli.cli import selected_command
+
+    command = selected_command(argv)
+    if command in LOCAL_COMMANDS or "--interactive" in argv or _streams(argv):
+        return True
+    return command == "status" and any(
+        a in {"--roots-file", "--glob"} or a.startswith(("--roots-file=", "--glob=")) for a in argv
+    )
+
+
+def _streams(argv: list[str]) -> bool:
+    """Whether *argv* asks for ``--format ndjson``, which must not be buffered."""
+    return "--format=ndjson" in argv or any(
+        a == "--format" and b == "ndjson" for a, b in zip(argv, argv[1:])
+    )
+
+
+def _root_arg(argv: list[str]) -> str:
+    root = "."
+    for i, arg in enumerate(argv):
+        if arg == "--root" and i + 1 < len(argv):
+            root = argv[i + 1]
+        elif arg.startswith("--root="):
+            root = arg.split("=", 1)[1]
+    return root
+
+
+class Daemon:
+    """Request handling and warm-root bookkeeping. One request runs at a time."""
+
+    def __init__(self) -> None:
+        import threading
+
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.roots: dict[Path, float] = {}  # root -> last request (monotonic)
+
+    def handle(self, req: dict[str, Any]) -> dict[str, Any]:
+        from mmu_cli import __version__
+
+        op = req.get("op")
+        if op == "status":
+            with self.lock:
+                return {
+                    "pid": os.getpid(),
+                    "version": __version__,
+                    "uptime": round(time.time() - self.started, 1),
+                    "requests": self.requests,
+                    "roots": sorted(str(root) for root in self.roots),
+                }
+        if op == "stop":
+            return {"stopping": True}
+        if op == "run":
+            if req.get("version") != __version__:
+                return {"error": f"daemon runs mmu {__version__}"}
+            if runs_locally(list(req.get("argv", []))):
+                return {"error": "this command runs in the client"}
+            return self.run(list(req.get("argv", [])), str(req.get("cwd", ".")), bool(req.get("color")))
+        return {"error": f"unknown op {op!r}"}
+
+    def run(self, argv: list[str], cwd: str, color: bool) -> dict[str, Any]:
+        import io
+        from contextlib import redirect_stderr, redirect_stdout
+
+        from mmu_cli import cli, display
+
+        out, err = io.StringIO(), io.StringIO()
+        with self.lock:
+            try:
+                os.chdir(cwd)
+            except OSError as exc:
+                return {"error": f"cannot enter {cwd}: {exc}"}
+            display.set_color(color)
+            with redirect_stdout(out), redirect_stderr(err):
+                try:
+                    code = cli.run(argv)
+                except SystemExit as exc:  # argparse: --help, usage errors
+                    code = exc.code if isinstance(exc.code, int) else 0 if exc.code is None else 1
+                    if isinstance(exc.code, str):
+                        print(exc.code, file=sys.stderr)
+                except Exception:
+                    # Always answer: no reply makes the client run the command
+                    # again, which would apply a write (a toggle, a scan) twice.
+                    import traceback
+
+                    traceback.print_exc()
+                    code = 1
+            self.requests += 1
+            root = cli.root_path(_root_arg(argv))
+            if root.is_dir():
+                self.roots[root] = time.monotonic()
+        return {"exit_code": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+    def warm(self, root: Path) -> None:
+        from mmu_cli.config import Config
+        from mmu_cli.display import take_snapshot
+        from mmu_cli.index import load_index
+        from mmu_cli.manifests import load_manifests
+
+        try:
+            load_index(root)
+            load_manifests(root)
+            take_snapshot(root, Config.load(root).features)
+        except (OSError, ValueError):
+            pass  # the next request reports it
+
+    def watch(self, stop: Any) -> None:
+        """Revalidate served roots every POLL_INTERVAL until *stop* (an Event) is set."""
+        while not stop.wait(POLL_INTERVAL):
+            with self.lock:
+                now = time.monotonic()
+                for root, used in list(self.roots.items()):
+                    if now - used > IDLE_SECONDS or not root.is_dir():
+                        del self.roots[root]
+                    else:
+                        self.warm(root)
+
+
+def serve() -> None:
+    """Run the daemon in this process until a stop request arrives."""
+    import json
+    import socketserver
+    import threading
+
+    path = socket_path()
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    problem = untrusted(path.parent, socket=False)
+    if problem:
+        raise RuntimeError(f"refusing to serve: {problem}")
+    if os.path.lexists(path):
+        problem = untrusted(path)
+        if problem:
+            raise RuntimeError(f"refusing to serve: {problem}")
+        if request({"op": "status"}) is not None:
+            raise RuntimeError(f"a daemon is already listening on {path}")
+        path.unlink()  # stale socket from a daemon that died
+
+    state = Daemon()
+    stopping = threading.Event()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            try:
+                req = json.loads(self.rfile.readline())
+            except ValueError:
+                return
+            reply = state.handle(req) if isinstance(req, dict) else {"error": "bad request"}
+            self.wfile.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+            if reply.get("stopping"):
+                stopping.set()
+                threading.Thread(target=self.server.shutdown).start()
+
+    umask = os.umask(0o177)  # the socket is created 0600, never briefly wider
+    try:
+        server = socketserver.UnixStreamServer(str(path), Handler)
+    finally:
+        os.umask(umask)
+    watcher = threading.Thread(target=state.watch, args=(stopping,), daemon=True)
+    watcher.start()
+    try:
+        server.serve_forever()
+    finally:
+        stopping.set()
+        server.server_close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def start() -> tuple[bool, str]:
+    """Spawn a detached daemon and wait until it answers."""
+    import subprocess
+
+    if request({"op": "status"}) is not None:
+        return False, f"mmu daemon already running ({socket_path()})"
+    package_parent = str(Path(__file__).resolve().parents[1])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (package_parent, env.get("PYTHONPATH")) if p)
+    subprocess.Popen(
+        [sys.executable, "-m", "mmu_cli", "daemon", "start", "--foreground"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        env=env,
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        status = request({"op": "status"})
+        if status is not None:
+            return True, f"mmu daemon started (pid {status['pid']}, {socket_path()})"
+        time.sleep(0.05)
+    return False, f"mmu daemon did not come up within {START_TIMEOUT:.0f}s"
+
+
+def stop() -> tuple[bool, str]:
+    if request({"op": "stop"}) is None:
+        return False, "mmu daemon is not running"
+    return True, "mmu daemon stopped"
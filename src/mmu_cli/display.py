@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import html as html_mod
 import os
-import re
 import sys
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Any
-from urllib.parse import quote as url_quote
-from xml.sax.saxutils import escape as xml_escape
+from typing import TYPE_CHECKING, Any
+
+from mmu_cli import trace
+
+if TYPE_CHECKING:
+    from mmu_cli.recommend import Recommendation
 
 REPO_URL = "https://github.com/minjikim89/make-me-unicorn"
 
@@ -20,6 +23,16 @@ REPO_URL = "https://github.com/minjikim89/make-me-unicorn"
 _NO_COLOR = os.environ.get("NO_COLOR") or not hasattr(sys.stdout, "isatty") or not sys.stdout.isatty()
 
 
+def color_enabled() -> bool:
+    return not _NO_COLOR
+
+
+def set_color(enabled: bool) -> None:
+    """Override the tty/NO_COLOR detection (the daemon renders for its client's terminal)."""
+    global _NO_COLOR
+    _NO_COLOR = not enabled
+
+
 def _c(code: str, text: str) -> str:
     if _NO_COLOR:
         return text
@@ -78,75 +91,89 @@ def progress_bar(done: int, total: int, width: int = 30) -> str:
 # Unicorn evolution ASCII art
 # ---------------------------------------------------------------------------
 
+# (upper bound of completion, stage name). The art itself is built on first
+# use: it is only drawn by the dashboard, and every line calls a color helper.
 UNICORN_STAGES = [
-    # 0-15%: egg
-    (0.15, "egg", [
-        dim("        .-\"\"\"-. "),
-        dim("       /       \\"),
-        dim("      |    ?    |"),
-        dim("       \\       /"),
-        dim("        '-----' "),
-    ]),
-    # 15-35%: hatching
-    (0.35, "hatching", [
-        yellow("        .--") + dim("*") + yellow("--."),
-        yellow("       / ") + bold("°v°") + yellow("  \\"),
-        yellow("      |       |"),
-        yellow("       \\ ___ /"),
-        yellow("        '---' "),
-    ]),
-    # 35-55%: foal — baby horse, no horn yet, four legs visible
-    (0.55, "foal", [
-        cyan("          ___"),
-        cyan("        ") + bold("(") + cyan("o.o") + bold(")") + cyan("~"),
-        "        " + bold("/||||\\"),
-        "         " + bold("|| ||"),
-        "          " + dim("~~~~"),
-    ]),
-    # 55-75%: young — small horn nub appears
-    (0.75, "young", [
-        magenta("         /") + bold("\\"),
-        magenta("        ") + bold("(") + magenta("o.o") + bold(")") + magenta("~~"),
-        "        " + bold("/||||\\"),
-        "         " + bold("|| ||"),
-        "          " + dim("~~~~"),
-    ]),
-    # 75-95%: unicorn — horn + mane streaming, consistent body silhouette
-    (0.95, "unicorn", [
-        "        ," + bold("/\\") + magenta(",~~"),
-        "        " + bold("(") + magenta("^.^") + bold(")") + magenta("~~~"),
-        "        " + bold("/||||\\"),
-        "         " + bold("|| ||"),
-        "          " + dim("~~~~"),
-    ]),
-    # 95-100%: legendary — same silhouette, full sparkle aura + tail
-    (1.01, "legendary", [
-        magenta("   *   ") + "," + bold("/\\") + magenta(",~~~  *"),
-        magenta("    ") + "  " + bold("(") + magenta("^o^") + bold(")") + magenta("~~~ !!"),
-        magenta("   *  ") + bold("/||||\\") + magenta(" ~*~"),
-        "         " + bold("|| ||"),
-        magenta("   *      ") + dim("~~~~") + magenta("    *"),
-    ]),
+    (0.15, "egg"),  # 0-15%
+    (0.35, "hatching"),  # 15-35%
+    (0.55, "foal"),  # 35-55%
+    (0.75, "young"),  # 55-75%
+    (0.95, "unicorn"),  # 75-95%
+    (1.01, "legendary"),  # 95-100%
 ]
 
 
+@cache
+def _unicorn_lines(color: bool) -> dict[str, list[str]]:
+    # *color* only keys the cache: the helpers below read the current setting.
+    return {
+        "egg": [
+            dim("        .-\"\"\"-. "),
+            dim("       /       \\"),
+            dim("      |    ?    |"),
+            dim("       \\       /"),
+            dim("        '-----' "),
+        ],
+        "hatching": [
+            yellow("        .--") + dim("*") + yellow("--."),
+            yellow("       / ") + bold("°v°") + yellow("  \\"),
+            yellow("      |       |"),
+            yellow("       \\ ___ /"),
+            yellow("        '---' "),
+        ],
+        # foal — baby horse, no horn yet, four legs visible
+        "foal": [
+            cyan("          ___"),
+            cyan("        ") + bold("(") + cyan("o.o") + bold(")") + cyan("~"),
+            "        " + bold("/||||\\"),
+            "         " + bold("|| ||"),
+            "          " + dim("~~~~"),
+        ],
+        # young — small horn nub appears
+        "young": [
+            magenta("         /") + bold("\\"),
+            magenta("        ") + bold("(") + magenta("o.o") + bold(")") + magenta("~~"),
+            "        " + bold("/||||\\"),
+            "         " + bold("|| ||"),
+            "          " + dim("~~~~"),
+        ],
+        # unicorn — horn + mane streaming, consistent body silhouette
+        "unicorn": [
+            "        ," + bold("/\\") + magenta(",~~"),
+            "        " + bold("(") + magenta("^.^") + bold(")") + magenta("~~~"),
+            "        " + bold("/||||\\"),
+            "         " + bold("|| ||"),
+            "          " + dim("~~~~"),
+        ],
+        # legendary — same silhouette, full sparkle aura + tail
+        "legendary": [
+            magenta("   *   ") + "," + bold("/\\") + magenta(",~~~  *"),
+            magenta("    ") + "  " + bold("(") + magenta("^o^") + bold(")") + magenta("~~~ !!"),
+            magenta("   *  ") + bold("/||||\\") + magenta(" ~*~"),
+            "         " + bold("|| ||"),
+            magenta("   *      ") + dim("~~~~") + magenta("    *"),
+        ],
+    }
+
+
+def unicorn_stage(pct: float) -> str:
+    """Stage name for the given completion percentage (0.0-1.0)."""
+    for threshold, name in UNICORN_STAGES:
+        if pct <= threshold:
+            return name
+    return UNICORN_STAGES[-1][1]
+
+
 def unicorn_art(pct: float) -> tuple[str, list[str]]:
     """Return (stage_name, art_lines) for the given completion percentage."""
-    for threshold, name, art in UNICORN_STAGES:
-        if pct <= threshold:
-            return name, art
-    return UNICORN_STAGES[-1][1], UNICORN_STAGES[-1][2]
+    name = unicorn_stage(pct)
+    return name, _unicorn_lines(color_enabled())[name]
 
 
 # ---------------------------------------------------------------------------
 # Blueprint scanner
 # ---------------------------------------------------------------------------
 
-_CHECK_DONE = re.compile(r"^\s*-\s*\[x\]\s+", re.IGNORECASE)
-_CHECK_TODO = re.compile(r"^\s*-\s*\[\s\]\s+")
-_CONDITION_IF = re.compile(r"^<!--\s*if:(\w+)\s*-->")
-_CONDITION_ENDIF = re.compile(r"^<!--\s*endif\s*-->")
-
 BLUEPRINT_NAMES = {
     "01-frontend.md": "Frontend",
     "02-backend.md": "Backend",
@@ -209,8 +236,6 @@ def resolve_blueprint(name: str) -> str | None:
     return None
 
 
-_PRIORITY_RE = re.compile(r"^\[P([012])\]\s*", re.IGNORECASE)
-
 PRIORITY_LABELS = {
     0: ("🔴", "critical"),
     1: ("🟡", "important"),
@@ -218,95 +243,45 @@ PRIORITY_LABELS = {
 }
 
 
-def _parse_priority(text: str) -> tuple[int, str]:
-    """Extract priority tag from item text. Returns (priority, clean_text)."""
-    m = _PRIORITY_RE.match(text)
-    if m:
-        return int(m.group(1)), text[m.end():].strip()
-    return 2, text  # default priority
-
-
 def render_blueprint_detail(
     path: Path,
     label: str,
     flags: dict[str, bool] | None = None,
+    auto_checked: dict[str, str] | None = None,
 ) -> str:
-    """Build a colorful detailed view of a single blueprint file."""
-    try:
-        text = path.read_text(encoding="utf-8")
-    except OSError:
+    """Build a colorful detailed view of a single blueprint file.
+
+    *auto_checked* maps raw item text to the `mmu scan` signal that checked it;
+    those items are annotated so reviewers can tell detection from judgement.
+    """
+    from mmu_cli.blueprint import load_blueprint
+
+    bp = load_blueprint(path, flags)
+    if bp is None:
         return red(f"  Cannot read {path}")
 
     lines: list[str] = []
-    section_heading = re.compile(r"^##\s+(.+)$")
-    _item_done = re.compile(r"^\s*-\s*\[x\]\s+(.+)$", re.IGNORECASE)
-    _item_todo = re.compile(r"^\s*-\s*\[\s\]\s+(.+)$")
-
-    # First pass: gather section stats
-    # items: (is_done, priority, clean_text)
-    sections: list[tuple[str, list[tuple[bool, int, str]]]] = []
-    skipped_sections: list[str] = []
-    current_section = ""
-    current_items: list[tuple[bool, int, str]] = []
-    condition_stack: list[bool] = []
-
-    for line in text.splitlines():
-        stripped = line.strip()
-
-        m_if = _CONDITION_IF.match(stripped)
-        if m_if:
-            flag_name = m_if.group(1)
-            if flags is not None:
-                condition_stack.append(flags.get(flag_name, True))
-            else:
-                condition_stack.append(True)
-            continue
-        if _CONDITION_ENDIF.match(stripped):
-            if condition_stack:
-                condition_stack.pop()
-            continue
-
-        active = _is_active(condition_stack)
-
-        hm = section_heading.match(line)
-        if hm:
-            if current_section and current_items:
-                sections.append((current_section, current_items))
-            elif current_section and not current_items and not active:
-                skipped_sections.append(current_section)
-            current_section = hm.group(1).strip()
-            current_items = []
-            continue
-
-        if not active:
-            # Track section name for skipped display but skip item
-            continue
-
-        dm = _item_done.match(line)
-        if dm:
-            pri, clean = _parse_priority(dm.group(1).strip())
-            current_items.append((True, pri, clean))
-            continue
-        tm = _item_todo.match(line)
-        if tm:
-            pri, clean = _parse_priority(tm.group(1).strip())
-            current_items.append((False, pri, clean))
-
-    if current_section and current_items:
-        sections.append((current_section, current_items))
-    elif current_section and not current_items and not _is_active(condition_stack):
-        skipped_sections.append(current_section)
+
+    # Group active items by section; items above the first heading are not shown.
+    # items: (number, is_done, priority, clean_text, auto_signal)
+    grouped: dict[str, list[tuple[int, bool, int, str, str]]] = {}
+    for item in bp.active_items:
+        if item.section:
+            auto = (auto_checked or {}).get(item.raw, "") if item.done else ""
+            grouped.setdefault(item.section, []).append((item.number, item.done, item.priority, item.text, auto))
+    sections = list(grouped.items())
+    skipped_sections = list(dict.fromkeys(sec.title for sec in bp.sections if not sec.active))
 
     # Overall stats
-    all_done = sum(1 for _, items in sections for done, _, _ in items if done)
+    all_done = sum(1 for _, items in sections for _, done, _, _, _ in items if done)
     all_total = sum(len(items) for _, items in sections)
     all_pct = all_done / all_total if all_total else 0.0
 
     # Priority stats
-    p0_total = sum(1 for _, items in sections for _, p, _ in items if p == 0)
-    p0_done = sum(1 for _, items in sections for d, p, _ in items if p == 0 and d)
-    p1_total = sum(1 for _, items in sections for _, p, _ in items if p == 1)
-    p1_done = sum(1 for _, items in sections for d, p, _ in items if p == 1 and d)
+    p0_total = sum(1 for _, items in sections for _, _, p, _, _ in items if p == 0)
+    p0_done = sum(1 for _, items in sections for _, d, p, _, _ in items if p == 0 and d)
+    p1_total = sum(1 for _, items in sections for _, _, p, _, _ in items if p == 1)
+    p1_done = sum(1 for _, items in sections for _, d, p, _, _ in items if p == 1 and d)
 
     # Header
     lines.append("")
@@ -327,12 +302,11 @@ def render_blueprint_detail(
     lines.append("")
     lines.append(dim("  ─" * 28))
 
-    # Sections with global item numbering
-    item_num = 0
+    # Sections with global item numbering (the numbers `mmu check` takes)
     for section_name, items in sections:
-        s_done = sum(1 for d, _, _ in items if d)
+        s_done = sum(1 for _, d, _, _, _ in items if d)
         s_total = len(items)
-        s_has_p0 = any(p == 0 and not d for d, p, _ in items)
+        s_has_p0 = any(p == 0 and not d for _, d, p, _, _ in items)
 
         if s_done == s_total and s_total > 0:
             section_status = green(" ✓")
@@ -347,14 +321,14 @@ def render_blueprint_detail(
         lines.append(f"  {bold(section_name)}{section_status}")
         lines.append(f"  {mini_bar(s_done, s_total)}")
 
-        for is_done, priority, item_text in items:
-            item_num += 1
+        for item_num, is_done, priority, item_text, auto in items:
             num_str = dim(f"{item_num:>3}")
             pri_icon, _ = PRIORITY_LABELS.get(priority, ("", ""))
             pri_str = f"{pri_icon} " if pri_icon else "  "
 
             if is_done:
-                lines.append(f"  {num_str} {pri_str}{green('✓')} {dim(item_text)}")
+                auto_str = f"  {cyan(f'(auto: {auto})')}" if auto else ""
+                lines.append(f"  {num_str} {pri_str}{green('✓')} {dim(item_text)}{auto_str}")
             else:
                 if priority == 0:
                     lines.append(f"  {num_str} {pri_str}{red('✗')} {red(bold(item_text))}")
@@ -392,11 +366,6 @@ def render_blueprint_detail(
     return "\n".join(lines)
 
 
-def _is_active(condition_stack: list[bool]) -> bool:
-    """Return True if all conditions in the stack are met (no false parent)."""
-    return all(condition_stack)
-
-
 def scan_blueprint(
     path: Path,
     flags: dict[str, bool] | None = None,
@@ -407,99 +376,130 @@ def scan_blueprint(
     markers are skipped if the flag is False.  Skipped items are excluded
     from both *done* and *total* and counted separately in *skipped*.
     """
-    done = 0
-    total = 0
-    skipped = 0
-    condition_stack: list[bool] = []
-
-    try:
-        text = path.read_text(encoding="utf-8")
-    except OSError:
-        return 0, 0, 0
-
-    for line in text.splitlines():
-        stripped = line.strip()
-
-        # Handle condition markers
-        m_if = _CONDITION_IF.match(stripped)
-        if m_if:
-            flag_name = m_if.group(1)
-            if flags is not None:
-                condition_stack.append(flags.get(flag_name, True))
-            else:
-                condition_stack.append(True)
-            continue
-
-        if _CONDITION_ENDIF.match(stripped):
-            if condition_stack:
-                condition_stack.pop()
-            continue
-
-        active = _is_active(condition_stack)
-
-        if _CHECK_DONE.match(line):
-            if active:
-                done += 1
-                total += 1
-            else:
-                skipped += 1
-        elif _CHECK_TODO.match(line):
-            if active:
-                total += 1
-            else:
-                skipped += 1
+    from mmu_cli.blueprint import load_blueprint
 
-    return done, total, skipped
+    bp = load_blueprint(path, flags)
+    if bp is None:
+        return 0, 0, 0
+    return bp.done, bp.total, bp.skipped
 
 
 def scan_all_blueprints(
     root: Path,
     flags: dict[str, bool] | None = None,
 ) -> list[tuple[str, int, int, int]]:
-    """Scan all blueprint files. Returns [(name, done, total, skipped), ...]."""
+    """Scan all blueprint files. Returns [(name, done, total, skipped), ...].
+
+    Counts come from ``.mmu/state.json`` while it matches the files on disk.
+    """
+    from mmu_cli.state import progress_for
+
     bp_dir = root / "docs" / "blueprints"
+    progress = progress_for(root, [bp_dir / filename for filename in BLUEPRINT_NAMES], flags)
     results = []
     for filename, label in BLUEPRINT_NAMES.items():
-        path = bp_dir / filename
-        if path.is_file():
-            done, total, skipped = scan_blueprint(path, flags)
-            results.append((label, done, total, skipped))
+        prog = progress.get(bp_dir / filename)
+        if prog is not None:
+            results.append((label, prog.done, prog.total, prog.skipped))
     return results
 
 
 def scan_gates(root: Path) -> list[tuple[str, int, int]]:
     """Scan gate stages from from_scratch.md. Returns [(stage_label, done, total), ...]."""
+    from mmu_cli.state import progress_for
+
     checklist = root / "docs" / "checklists" / "from_scratch.md"
-    try:
-        text = checklist.read_text(encoding="utf-8")
-    except OSError:
-        return []
+    prog = progress_for(root, [checklist]).get(checklist)
+    return prog.stages if prog is not None else []
 
-    heading_re = re.compile(r"^##\s*(M\d+)\s+(.+?)\s*$")
-    results = []
-    current_label = ""
-    done = 0
-    total = 0
-
-    for line in text.splitlines():
-        m = heading_re.match(line)
-        if m:
-            if current_label:
-                results.append((current_label, done, total))
-            current_label = f"{m.group(1)} {m.group(2)}"
-            done = 0
-            total = 0
-            continue
-        if current_label:
-            if _CHECK_DONE.match(line):
-                done += 1
-                total += 1
-            elif _CHECK_TODO.match(line):
-                total += 1
-
-    if current_label:
-        results.append((current_label, done, total))
-    return results
+
+# ---------------------------------------------------------------------------
+# Status snapshot
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    """Blueprint and gate progress, scanned once per invocation.
+
+    Every status-style renderer accepts a snapshot so one command never scans
+    the same markdown twice.
+    """
+
+    blueprints: list[tuple[str, int, int, int]]  # (label, done, total, skipped)
+    gates: list[tuple[str, int, int]]  # (stage_label, done, total)
+    flags: dict[str, bool] | None = None
+    p0_open: int = 0  # unchecked [P0] items across blueprints and gates
+
+    @property
+    def bp_done(self) -> int:
+        return sum(d for _, d, _, _ in self.blueprints)
+
+    @property
+    def bp_total(self) -> int:
+        return sum(t for _, _, t, _ in self.blueprints)
+
+    @property
+    def bp_skipped(self) -> int:
+        return sum(s for _, _, _, s in self.blueprints)
+
+    @property
+    def gate_done(self) -> int:
+        return sum(d for _, d, _ in self.gates)
+
+    @property
+    def gate_total(self) -> int:
+        return sum(t for _, _, t in self.gates)
+
+    @property
+    def all_done(self) -> int:
+        return self.bp_done + self.gate_done
+
+    @property
+    def all_total(self) -> int:
+        return self.bp_total + self.gate_total
+
+    @property
+    def pct(self) -> float:
+        """Overall completion as a 0..1 fraction."""
+        return self.all_done / self.all_total if self.all_total else 0.0
+
+    @property
+    def pct_int(self) -> int:
+        return int(self.pct * 100)
+
+    @property
+    def stage(self) -> str:
+        return unicorn_stage(self.pct)
+
+    @property
+    def open_gates(self) -> list[str]:
+        return [label for label, d, t in self.gates if t > 0 and d < t]
+
+
+@trace.traced("take_snapshot")
+def take_snapshot(root: Path, flags: dict[str, bool] | None = None) -> StatusSnapshot:
+    from mmu_cli.state import progress_for
+
+    bp_dir = root / "docs" / "blueprints"
+    gates_path = root / "docs" / "checklists" / "from_scratch.md"
+    progress = progress_for(root, [bp_dir / filename for filename in BLUEPRINT_NAMES], flags)
+    progress.update(progress_for(root, [gates_path]))
+    blueprints = []
+    for filename, label in BLUEPRINT_NAMES.items():
+        prog = progress.get(bp_dir / filename)
+        if prog is not None:
+            blueprints.append((label, prog.done, prog.total, prog.skipped))
+    gates = progress[gates_path].stages if gates_path in progress else []
+    p0_open = sum(1 for prog in progress.values() for done, priority, _ in prog.items if priority == 0 and not done)
+    return StatusSnapshot(blueprints, gates, flags, p0_open)
+
+
+def _as_snapshot(source: StatusSnapshot | Path, flags: dict[str, bool] | None) -> StatusSnapshot:
+    """Accept a snapshot or (for older callers) a project root to scan."""
+    if isinstance(source, StatusSnapshot):
+        return source
+    return take_snapshot(source, flags)
 
 
 # ---------------------------------------------------------------------------
@@ -523,25 +523,14 @@ def mini_bar(done: int, total: int, width: int = 16) -> str:
     return f"{bar} {done:>3}/{total:<3}"
 
 
-def render_status(root: Path, flags: dict[str, bool] | None = None) -> str:
+def render_status(source: StatusSnapshot | Path, flags: dict[str, bool] | None = None) -> str:
     """Build the full visual status dashboard string."""
     lines: list[str] = []
+    snap = _as_snapshot(source, flags)
 
-    # --- Blueprint scan ---
-    blueprints = scan_all_blueprints(root, flags)
-    bp_done = sum(d for _, d, _, _ in blueprints)
-    bp_total = sum(t for _, _, t, _ in blueprints)
-    bp_skipped = sum(s for _, _, _, s in blueprints)
-
-    # --- Gate scan ---
-    gates = scan_gates(root)
-    gate_done = sum(d for _, d, _ in gates)
-    gate_total = sum(t for _, _, t in gates)
-
-    # --- Overall ---
-    all_done = bp_done + gate_done
-    all_total = bp_total + gate_total
-    all_pct = all_done / all_total if all_total else 0.0
+    blueprints, bp_done, bp_total, bp_skipped = snap.blueprints, snap.bp_done, snap.bp_total, snap.bp_skipped
+    gates, gate_done, gate_total = snap.gates, snap.gate_done, snap.gate_total
+    all_done, all_total, all_pct = snap.all_done, snap.all_total, snap.pct
 
     # --- Unicorn art ---
     stage_name, art = unicorn_art(all_pct)
@@ -583,7 +572,7 @@ def render_status(root: Path, flags: dict[str, bool] | None = None) -> str:
     lines.append(dim("  ─" * 28))
 
     # --- Tip (context-aware) ---
-    open_gates = [label for label, d, t in gates if t > 0 and d < t]
+    open_gates = snap.open_gates
     gate_pct = gate_done / gate_total if gate_total else 0.0
 
     if all_pct == 0:
@@ -615,20 +604,14 @@ def render_status(root: Path, flags: dict[str, bool] | None = None) -> str:
 # ---------------------------------------------------------------------------
 
 
-def render_score_breakdown(root: Path, flags: dict[str, bool] | None = None) -> str:
+def render_score_breakdown(source: StatusSnapshot | Path, flags: dict[str, bool] | None = None) -> str:
     """Show transparent score decomposition: applicable, checked, skipped."""
-    blueprints = scan_all_blueprints(root, flags)
-    gates = scan_gates(root)
+    snap = _as_snapshot(source, flags)
+    flags = snap.flags
 
-    bp_done = sum(d for _, d, _, _ in blueprints)
-    bp_total = sum(t for _, _, t, _ in blueprints)
-    bp_skipped = sum(s for _, _, _, s in blueprints)
-    gate_done = sum(d for _, d, _ in gates)
-    gate_total = sum(t for _, _, t in gates)
-
-    all_done = bp_done + gate_done
-    all_total = bp_total + gate_total
-    all_pct = all_done / all_total * 100 if all_total else 0.0
+    blueprints, bp_done, bp_total, bp_skipped = snap.blueprints, snap.bp_done, snap.bp_total, snap.bp_skipped
+    gate_done, gate_total = snap.gate_done, snap.gate_total
+    all_done, all_total, all_pct = snap.all_done, snap.all_total, snap.pct * 100
 
     # Count disabled flags
     disabled_flags = []
@@ -695,86 +678,60 @@ def render_score_breakdown(root: Path, flags: dict[str, bool] | None = None) ->
     return "\n".join(lines)
 
 
-# ---------------------------------------------------------------------------
-# Next actions recommender
-# ---------------------------------------------------------------------------
+def render_dependency_graph(summary: dict[str, Any]) -> str:
+    """Critical path and blocked items of one blueprint (`mmu show --graph`)."""
 
+    def ref(node: dict[str, Any]) -> str:
+        return f"{dim(node['label'] + ' #' + str(node['number']))} {node['text']}"
 
-def _collect_unchecked_items(
-    root: Path,
-    flags: dict[str, bool] | None = None,
-) -> list[tuple[str, int, str, int]]:
-    """Collect all unchecked items across blueprints.
-
-    Returns [(blueprint_label, priority, item_text, blueprint_order), ...].
-    """
-    bp_dir = root / "docs" / "blueprints"
-    items: list[tuple[str, int, str, int]] = []
-
-    for bp_idx, (filename, label) in enumerate(BLUEPRINT_NAMES.items()):
-        path = bp_dir / filename
-        if not path.is_file():
-            continue
-        try:
-            text = path.read_text(encoding="utf-8")
-        except OSError:
-            continue
-
-        condition_stack: list[bool] = []
-        for line in text.splitlines():
-            stripped = line.strip()
-
-            m_if = _CONDITION_IF.match(stripped)
-            if m_if:
-                flag_name = m_if.group(1)
-                if flags is not None:
-                    condition_stack.append(flags.get(flag_name, True))
-                else:
-                    condition_stack.append(True)
-                continue
-            if _CONDITION_ENDIF.match(stripped):
-                if condition_stack:
-                    condition_stack.pop()
-                continue
+    lines = ["", bold("  🔗  DEPENDENCIES"), dim("  ─" * 28), ""]
+    path = summary["critical_path"]
+    if not (path or summary["blocked"] or summary["cycles"] or summary["unknown"]):
+        lines.append(f"  {dim('No open dependencies. Annotate items with <!-- id: name --> and <!-- after: name -->.')}")
+        lines.append("")
+        return "\n".join(lines)
 
-            if not _is_active(condition_stack):
-                continue
+    if path:
+        lines.append(f"  {bold('Critical path')} {dim(f'({len(path)} open items)')}")
+        for i, node in enumerate(path, 1):
+            lines.append(f"  {dim(f'{i:>3}')} {yellow('→') if i > 1 else cyan('●')} {ref(node)}")
+        lines.append("")
+    if summary["blocked"]:
+        lines.append(f"  {bold('Blocked')}")
+        for node in summary["blocked"]:
+            number = node["number"]
+            lines.append(f"  {dim(f'{number:>3}')} {red('⏸')} {node['text']}")
+            for dep in node["after"]:
+                lines.append(f"        {dim('waits on')} {ref(dep)}")
+        lines.append("")
+    for node in summary["cycles"]:
+        lines.append(f"  {red('⚠')} #{node['number']} {node['text']} {dim('is part of a dependency cycle')}")
+    for node in summary["unknown"]:
+        lines.append(f"  {yellow('⚠')} #{node['number']} {node['text']} {dim('waits on unknown id')} {node['missing']}")
+    for item_id in summary["duplicates"]:
+        lines.append(f"  {yellow('⚠')} id {item_id} {dim('is declared more than once; the first wins')}")
+    return "\n".join(lines)
 
-            m_todo = _CHECK_TODO.match(line)
-            if m_todo:
-                # Extract text after "- [ ] " using regex group, not lstrip
-                raw = re.sub(r"^\s*-\s*\[\s\]\s+", "", line)
-                pri, clean = _parse_priority(raw.strip())
-                items.append((label, pri, clean, bp_idx))
 
-    return items
+# ---------------------------------------------------------------------------
+# Next actions recommender
+# ---------------------------------------------------------------------------
 
 
 def render_next_actions(
     root: Path,
     flags: dict[str, bool] | None = None,
     count: int = 3,
+    *,
+    vibecheck: bool = False,
 ) -> str:
     """Recommend highest-impact unchecked items to tackle next."""
-    if count < 1:
-        count = 3
-    items = _collect_unchecked_items(root, flags)
-
-    # Sort by priority (P0 first), then blueprint order
-    items.sort(key=lambda x: (x[1], x[3]))
-
-    # Diversify: max 2 items per blueprint to avoid clustering
-    top: list[tuple[str, int, str, int]] = []
-    bp_counts: dict[str, int] = {}
-    for item in items:
-        label = item[0]
-        if bp_counts.get(label, 0) >= 2:
-            continue
-        top.append(item)
-        bp_counts[label] = bp_counts.get(label, 0) + 1
-        if len(top) >= count:
-            break
+    from mmu_cli.recommend import recommend
 
+    return format_next_actions(*recommend(root, flags, count, vibecheck=vibecheck))
+
+
+def format_next_actions(top: list[Recommendation], remaining: int) -> str:
     lines: list[str] = []
     lines.append("")
     lines.append(bold("  🎯  NEXT ACTIONS"))
@@ -786,11 +743,11 @@ def render_next_actions(
         lines.append("")
         return "\n".join(lines)
 
-    for i, (label, pri, text, _) in enumerate(top, 1):
+    for i, rec in enumerate(top, 1):
+        pri, text = rec.candidate.priority, rec.candidate.text
         pri_icon, pri_label = PRIORITY_LABELS.get(pri, ("", ""))
         pri_str = f"{pri_icon} " if pri_icon else "  "
-        bp_tag = dim(f"[{label}]")
-        bp_key = label.lower().replace(" & ", "-").replace(" ", "-")
+        bp_tag = dim(f"[{rec.candidate.label}]")
 
         if pri == 0:
             lines.append(f"  {bold(str(i))}. {pri_str}{red(bold(text))}")
@@ -798,10 +755,9 @@ def render_next_actions(
             lines.append(f"  {bold(str(i))}. {pri_str}{yellow(bold(text))}")
         else:
             lines.append(f"  {bold(str(i))}. {pri_str}{text}")
-        lines.append(f"     {bp_tag}  {dim('→')} {cyan('mmu show ' + bp_key)}")
+        lines.append(f"     {bp_tag}  {dim('→')} {cyan(rec.candidate.hint)}")
         lines.append("")
 
-    remaining = len(items) - len(top)
     if remaining > 0:
         lines.append(f"  {dim(f'... and {remaining} more unchecked items')}")
         lines.append("")
@@ -864,22 +820,16 @@ def _plain_bar(done: int, total: int, width: int = 16) -> str:
     return "█" * filled + "░" * empty
 
 
-def render_share_card(root: Path, flags: dict[str, bool] | None = None, cfg: dict[str, Any] | None = None) -> str:
+def render_share_card(
+    source: StatusSnapshot | Path,
+    flags: dict[str, bool] | None = None,
+    cfg: dict[str, Any] | None = None,
+) -> str:
     """Generate a plain-text share card for social posting / clipboard."""
-    blueprints = scan_all_blueprints(root, flags)
-    gates = scan_gates(root)
-
-    bp_done = sum(d for _, d, _, _ in blueprints)
-    bp_total = sum(t for _, _, t, _ in blueprints)
-    gate_done = sum(d for _, d, _ in gates)
-    gate_total = sum(t for _, _, t in gates)
-
-    all_done = bp_done + gate_done
-    all_total = bp_total + gate_total
-    all_pct = all_done / all_total if all_total else 0.0
-    pct_int = int(all_pct * 100)
-
-    stage_name, _ = unicorn_art(all_pct)
+    snap = _as_snapshot(source, flags)
+    gates = snap.gates
+    pct_int = snap.pct_int
+    stage_name = snap.stage
 
     W = 47  # total width including borders
 
@@ -955,6 +905,8 @@ def _badge_color(stage_name: str) -> str:
 
 def render_badge_svg(pct: int, stage_name: str) -> str:
     """Generate a shields.io-style SVG badge with score and stage."""
+    from xml.sax.saxutils import escape as xml_escape
+
     color = _badge_color(stage_name)
     label = xml_escape("launch readiness")
     value = xml_escape(f"{pct}% {stage_name}")
@@ -984,6 +936,8 @@ def render_badge_svg(pct: int, stage_name: str) -> str:
 
 def _shields_value(pct: int, stage_name: str) -> str:
     """URL-encode the badge value for shields.io."""
+    from urllib.parse import quote as url_quote
+
     return url_quote(f"{pct}% {stage_name}", safe="")
 
 
@@ -1006,6 +960,8 @@ def render_badge_markdown(pct: int, stage_name: str, project_name: str = "") ->
 
 def render_badge_html(pct: int, stage_name: str) -> str:
     """Generate an HTML snippet for embedding in web pages."""
+    import html as html_mod
+
     color = _badge_color(stage_name).replace("#", "")
     value = _shields_value(pct, stage_name)
     alt = html_mod.escape(f"Launch Readiness {pct}% — {stage_name}")
@@ -0,0 +1,175 @@
+"""`mmu fleet vibecheck <dir>` — vibecheck every git repository under a directory.
+
+All repositories share one process pool. Each repo first gets an index task
+(one walk, see :class:`~mmu_cli.index.ProjectIndex`); as soon as its index
+comes back, its files are split into small chunks and queued as scan tasks
+behind everyone else's. Idle workers simply take the next chunk, so one huge
+monorepo is spread over every core instead of pinning a single worker while
+the rest sit idle. The pool defaults to one worker per CPU whatever the
+number of repos (a single repo still fans out over every core); workers are
+only started as tasks queue up, so a small fleet does not pay for idle ones.
+Only ``workers=1`` scans inline. The parent merges each repo's chunk partials
+(:meth:`~mmu_cli.vibecheck.Partial.merge`) and finalizes it once all of its
+chunks are in.
+
+:func:`run_fleet` yields events as they happen, ready to print as NDJSON:
+one ``discovered`` event, one ``repo`` event per repository in completion
+order, then a ``summary``. A repo whose index or scan task raises gets a
+``repo`` event with an ``error`` and exit code 1; the others carry on.
+Exit codes follow :func:`~mmu_cli.vibecheck.summarize`: only failures block
+a repo, warnings are counted separately.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from mmu_cli import trace
+
+CHUNK_SIZE = 256
+_SKIP_DIRS = {"node_modules", "__pycache__", "venv"}
+
+
+def discover_repos(base: Path) -> list[Path]:
+    """Directories under *base* (itself included) that contain ``.git``; nested repos are not searched."""
+    repos = []
+    for dirpath, dirnames, filenames in os.walk(base):
+        if ".git" in dirnames or ".git" in filenames:
+            repos.append(Path(dirpath))
+            dirnames[:] = []
+            continue
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d not in _SKIP_DIRS)
+    return sorted(repos)
+
+
+@trace.traced("fleet.index_repo")
+def index_repo(root: str) -> tuple[str, ...]:
+    """Worker task: the sorted code file list of one repo."""
+    from mmu_cli.index import ProjectIndex
+
+    return ProjectIndex.build(Path(root)).rels
+
+
+def _totals(findings: list[Any]) -> dict[str, int]:
+    """P0/P1 failures, plus warnings of any severity (which never block)."""
+    failing = [f for f in findings if f.status == "fail"]
+    return {
+        "p0": sum(1 for f in failing if f.severity == "P0"),
+        "p1": sum(1 for f in failing if f.severity == "P1"),
+        "warnings": sum(1 for f in findings if f.status == "warn"),
+    }
+
+
+def _name(base: Path, root: Path) -> str:
+    try:
+        return root.relative_to(base).as_posix()
+    except ValueError:
+        return str(root)
+
+
+def repo_event(base: Path, root: Path, files: int, findings: list[Any]) -> dict[str, Any]:
+    from mmu_cli.vibecheck import summarize
+
+    return {
+        "event": "repo",
+        "repo": _name(base, root),
+        "files": files,
+        **_totals(findings),
+        "exit_code": summarize(findings)["exit_code"],
+        "findings": [f.to_dict() for f in findings],
+    }
+
+
+def error_event(base: Path, root: Path, exc: BaseException) -> dict[str, Any]:
+    """A repo that could not be checked: no findings, exit code 1."""
+    return {
+        "event": "repo",
+        "repo": _name(base, root),
+        "files": 0,
+        **_totals([]),
+        "exit_code": 1,
+        "error": f"{type(exc).__name__}: {exc}",
+        "findings": [],
+    }
+
+
+def summary_event(events: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "event": "summary",
+        "repos": len(events),
+        "files": sum(e["files"] for e in events),
+        "p0": sum(e["p0"] for e in events),
+        "p1": sum(e["p1"] for e in events),
+        "warnings": sum(e["warnings"] for e in events),
+        "blocked": sorted(e["repo"] for e in events if e["exit_code"] == 2),
+        "errors": sorted(e["repo"] for e in events if "error" in e),
+        "exit_code": max((e["exit_code"] for e in events), default=0),
+    }
+
+
+def run_fleet(base: Path, workers: int | None = None, chunk_size: int = CHUNK_SIZE) -> Iterator[dict[str, Any]]:
+    """Vibecheck every repo under *base*; yield events as described in the module docstring."""
+    from mmu_cli.vibecheck import Partial, finalize, run_vibecheck, scan_chunk
+
+    repos = discover_repos(base)
+    yield {"event": "discovered", "base": str(base), "repos": len(repos)}
+    workers = workers or os.cpu_count() or 1
+    events: list[dict[str, Any]] = []
+
+    if workers <= 1 or not repos:
+        from mmu_cli.index import ProjectIndex
+
+        for root in repos:
+            try:
+                index = ProjectIndex.build(root)
+                event = repo_event(base, root, len(index), run_vibecheck(root, index))
+            except Exception as exc:  # one broken repo must not end the run
+                event = error_event(base, root, exc)
+            events.append(event)
+            yield event
+        yield summary_event(events)
+        return
+
+    chunk_size = max(chunk_size, 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: dict[Future, tuple[str, Path]] = {pool.submit(index_repo, str(r)): ("index", r) for r in repos}
+        partials: dict[Path, Partial] = {}
+        remaining: dict[Path, int] = {}
+        failed: dict[Path, BaseException] = {}  # first error per repo; its other chunks still drain
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, root = pending.pop(future)
+                if kind == "index":
+                    partials[root] = Partial()
+                    remaining[root] = 0
+                    try:
+                        rels = future.result()
+                    except Exception as exc:  # worker errors arrive here; report them per repo
+                        failed[root] = exc
+                        rels = ()
+                    for start in range(0, len(rels), chunk_size):
+                        pending[pool.submit(scan_chunk, str(root), start, rels[start:start + chunk_size])] = ("scan", root)
+                        remaining[root] += 1
+                else:
+                    remaining[root] -= 1
+                    try:
+                        partials[root] = partials[root].merge(Partial.from_dict(future.result()))
+                    except Exception as exc:
+                        failed.setdefault(root, exc)
+                if remaining[root] == 0:
+                    part = partials.pop(root)
+                    if root in failed:
+                        event = error_event(base, root, failed.pop(root))
+                    else:
+                        try:
+                            event = repo_event(base, root, part.files, finalize(root, part))
+                        except Exception as exc:
+                            event = error_event(base, root, exc)
+                    events.append(event)
+                    yield event
+    yield summary_event(events)
@@ -0,0 +1,148 @@
+"""Dependency graph over annotated checklist items.
+
+Any item may carry ``<!-- id: payment-provider -->`` and/or
+``<!-- after: payment-provider, pricing -->``. Ids share one namespace across
+every blueprint and checklist (industry blueprints included), so an item in
+``04-billing.md`` can wait on one in ``industry/marketplace.md``. Only
+annotated items become nodes; everything else is unconstrained.
+
+The graph is built from the per-file progress that ``.mmu/state.json``
+already caches (annotations are stored with it), once per command. Ordering
+uses Kahn's algorithm, so the topological order, cycle detection and the
+longest open chain (the critical path) are all O(V + E).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from mmu_cli.state import FileProgress
+
+
+@dataclass(frozen=True)
+class Node:
+    path: Path
+    index: int  # 0-based among the file's active items; `mmu check` number is index + 1
+    id: str
+    text: str
+    done: bool
+
+    @property
+    def number(self) -> int:
+        return self.index + 1
+
+
+@dataclass
+class ItemGraph:
+    nodes: list[Node] = field(default_factory=list)
+    preds: list[list[int]] = field(default_factory=list)
+    succs: list[list[int]] = field(default_factory=list)
+    order: list[int] = field(default_factory=list)  # topological order of the acyclic part
+    cyclic: set[int] = field(default_factory=set)  # on or downstream of a cycle
+    unknown: list[tuple[int, str]] = field(default_factory=list)  # (node, after-id with no item)
+    duplicates: list[str] = field(default_factory=list)  # ids declared more than once (first wins)
+    _at: dict[tuple[Path, int], int] = field(default_factory=dict, repr=False)
+
+    def node_at(self, path: Path, index: int) -> int | None:
+        return self._at.get((path, index))
+
+    def blockers(self, node: int) -> list[int]:
+        """Unchecked direct prerequisites of *node*. Edges inside a cycle are not enforced."""
+        return [
+            p for p in self.preds[node]
+            if not self.nodes[p].done and not (node in self.cyclic and p in self.cyclic)
+        ]
+
+    def is_blocked(self, path: Path, index: int) -> bool:
+        node = self.node_at(path, index)
+        return node is not None and bool(self.blockers(node))
+
+    def critical_path(self, within: Path | None = None) -> list[int]:
+        """Longest chain of unchecked nodes, ending in *within* if given; prerequisites first."""
+        length: dict[int, int] = {}
+        parent: dict[int, int] = {}
+        for v in self.order:
+            if self.nodes[v].done:
+                continue
+            best = 0
+            for p in self.preds[v]:
+                if p in length and length[p] > best:
+                    best, parent[v] = length[p], p
+            length[v] = best + 1
+        ends = [v for v in length if within is None or self.nodes[v].path == within]
+        if not ends:
+            return []
+        v = max(ends, key=lambda n: (length[n], -n))
+        path = [v]
+        while path[-1] in parent:
+            path.append(parent[path[-1]])
+        return path[::-1]
+
+
+def build_graph(progress: dict[Path, FileProgress]) -> ItemGraph:
+    graph = ItemGraph()
+    wanted: list[tuple[int, tuple[str, ...]]] = []
+    ids: dict[str, int] = {}
+    for path, prog in progress.items():
+        for index, item_id, after in prog.links:
+            if not 0 <= index < len(prog.items):
+                continue
+            done, _, text = prog.items[index]
+            node = len(graph.nodes)
+            graph.nodes.append(Node(path, index, item_id, text, done))
+            graph._at[(path, index)] = node
+            if item_id:
+                if item_id in ids:
+                    graph.duplicates.append(item_id)
+                else:
+                    ids[item_id] = node
+            wanted.append((node, after))
+
+    graph.preds = [[] for _ in graph.nodes]
+    graph.succs = [[] for _ in graph.nodes]
+    for node, after in wanted:
+        for dep in after:
+            src = ids.get(dep)
+            if src is None:
+                graph.unknown.append((node, dep))
+            elif src != node:
+                graph.preds[node].append(src)
+                graph.succs[src].append(node)
+
+    # Kahn: whatever never reaches in-degree zero sits on or behind a cycle.
+    indegree = [len(p) for p in graph.preds]
+    queue = deque(n for n, d in enumerate(indegree) if d == 0)
+    while queue:
+        n = queue.popleft()
+        graph.order.append(n)
+        for s in graph.succs[n]:
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                queue.append(s)
+    graph.cyclic = {n for n, d in enumerate(indegree) if d > 0}
+    return graph
+
+
+def summarize(graph: ItemGraph, within: Path, label_of: Callable[[Path], str]) -> dict[str, Any]:
+    """JSON-ready view of the graph from one file's point of view (`mmu show --graph`)."""
+
+    def ref(n: int) -> dict[str, Any]:
+        node = graph.nodes[n]
+        return {"label": label_of(node.path), "number": node.number, "id": node.id, "text": node.text, "done": node.done}
+
+    local = [n for n, node in enumerate(graph.nodes) if node.path == within]
+    return {
+        "critical_path": [ref(n) for n in graph.critical_path(within)],
+        "blocked": [
+            {**ref(n), "after": [ref(p) for p in graph.blockers(n)]}
+            for n in local
+            if not graph.nodes[n].done and graph.blockers(n)
+        ],
+        "cycles": [ref(n) for n in local if n in graph.cyclic],
+        "unknown": [{**ref(n), "missing": dep} for n, dep in graph.unknown if graph.nodes[n].path == within],
+        "duplicates": sorted(set(graph.duplicates)),
+    }
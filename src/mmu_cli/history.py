@@ -0,0 +1,147 @@
+"""Append-only readiness history in ``.mmu/history.jsonl``.
+
+One compact JSON record is appended whenever progress changes (`mmu check`,
+`mmu scan`) and at every `mmu close`:
+
+    {"t": "2026-01-02T03:04:05Z", "src": "check", "score": 42,
+     "done": 120, "total": 286,
+     "bp": {"Frontend": [12, 30], ...}, "gates": {"M0": [5, 5], ...}}
+
+Readers only ever need the most recent records, so :func:`tail` seeks from
+the end of the file and reads backwards block by block; its cost depends on
+how many records are requested, not on how much history has accumulated.
+Like the caches, nothing is written unless ``.mmu/`` exists.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from mmu_cli.display import StatusSnapshot, bold, dim
+
+HISTORY_PATH = ".mmu/history.jsonl"
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+_BLOCK = 8192
+
+
+def make_record(snap: StatusSnapshot, source: str) -> dict[str, Any]:
+    return {
+        "t": dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "src": source,
+        "score": snap.pct_int,
+        "done": snap.all_done,
+        "total": snap.all_total,
+        "bp": {label: [d, t] for label, d, t, _ in snap.blueprints},
+        "gates": {label.split(None, 1)[0]: [d, t] for label, d, t in snap.gates},
+    }
+
+
+def _progress(record: dict[str, Any]) -> tuple[Any, ...]:
+    return record.get("done"), record.get("total"), record.get("bp"), record.get("gates")
+
+
+def append_record(root: Path, snap: StatusSnapshot, source: str, *, force: bool = False) -> bool:
+    """Append a record for *snap*; skipped when progress equals the last record (unless *force*)."""
+    if not (root / ".mmu").is_dir():
+        return False
+    record = make_record(snap, source)
+    if not force:
+        last = tail(root, 1)
+        if last and _progress(last[-1]) == _progress(record):
+            return False
+    line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+    try:
+        # O_APPEND keeps concurrent single-line writes from interleaving.
+        fd = os.open(root / HISTORY_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+    except OSError:
+        return False
+    return True
+
+
+def tail(root: Path, n: int) -> list[dict[str, Any]]:
+    """The last *n* records, oldest first, read backwards from the end of the file."""
+    if n < 1:
+        return []
+    buf = b""
+    try:
+        with open(root / HISTORY_PATH, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            # n records need n newline-terminated lines plus the boundary before them.
+            while pos > 0 and buf.count(b"\n") <= n:
+                step = min(_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+    except OSError:
+        return []
+    lines = buf.splitlines()
+    if pos > 0:
+        lines = lines[1:]  # first line may be cut mid-record
+    records = []
+    for raw in lines[-n:]:
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            continue  # torn or foreign line
+        if isinstance(record, dict):
+            records.append(record)
+    return records
+
+
+def sparkline(values: list[float]) -> str:
+    if not values:
+        return ""
+    lo, hi = min(values), max(values)
+    if hi == lo:
+        return SPARK_CHARS[-1 if hi else 0] * len(values)
+    scale = len(SPARK_CHARS) - 1
+    return "".join(SPARK_CHARS[round((v - lo) / (hi - lo) * scale)] for v in values)
+
+
+def _pct(pair: Any) -> float:
+    try:
+        done, total = pair
+        return done / total * 100 if total else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def series(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Per-record percentages: overall, per blueprint and per gate (missing entries read as 0)."""
+    bp_names = list(dict.fromkeys(k for r in records for k in r.get("bp", {})))
+    gate_names = list(dict.fromkeys(k for r in records for k in r.get("gates", {})))
+    return {
+        "times": [r.get("t", "") for r in records],
+        "score": [float(r.get("score", 0)) for r in records],
+        "blueprints": {name: [_pct(r.get("bp", {}).get(name)) for r in records] for name in bp_names},
+        "gates": {name: [_pct(r.get("gates", {}).get(name)) for r in records] for name in gate_names},
+    }
+
+
+def render_trend(records: list[dict[str, Any]]) -> str:
+    """Sparkline block for the dashboard / `mmu history`."""
+    lines = ["", bold("  📈  TREND") + dim(f"  (last {len(records)} records)"), ""]
+    if not records:
+        lines.append(f"  {dim('No history yet — it is recorded by mmu check, mmu scan and mmu close.')}")
+        lines.append("")
+        return "\n".join(lines)
+    data = series(records)
+    first, last = data["score"][0], data["score"][-1]
+    lines.append(f"    {'Overall':<18} {sparkline(data['score'])}  {first:.0f}% → {bold(f'{last:.0f}%')}")
+    lines.append("")
+    for heading, group in (("Gates", data["gates"]), ("Blueprints", data["blueprints"])):
+        if not group:
+            continue
+        lines.append(f"  {dim(heading)}")
+        for name, values in group.items():
+            lines.append(f"    {name:<18} {sparkline(values)}  {values[-1]:.0f}%")
+        lines.append("")
+    return "\n".join(lines)
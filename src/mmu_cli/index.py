@@ -0,0 +1,86 @@
+"""One walk of a project's code files, shared by the checks that read them.
+
+:class:`ProjectIndex` lists the code files ``mmu doctor`` / ``mmu vibecheck``
+consider (``CODE_EXTENSIONS`` minus ``doctor.skip_paths``) once, sorted by
+root-relative path. The fixed order gives every file a stable global index,
+so checks that sample "the first N files" give the same answer whether a
+project is scanned in one pass or in chunks on several workers.
+
+:func:`load_index` keeps one index per root for long-lived processes (the
+daemon, the MCP server). An index stays valid while the mtime of every
+directory it walked and the skip paths are unchanged: adding, removing or
+renaming a file bumps its directory's mtime, and content edits do not change
+the file list. Checking that costs one ``stat`` per directory instead of a
+full walk.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from mmu_cli import trace
+from mmu_cli.config import Config
+
+
+@dataclass(frozen=True)
+class ProjectIndex:
+    root: Path
+    rels: tuple[str, ...]  # root-relative posix paths, sorted
+    skip_paths: frozenset[str] = field(default=frozenset(), repr=False)
+    dirs: tuple[tuple[str, int], ...] = field(default=(), repr=False)  # (walked dir, mtime_ns)
+
+    @classmethod
+    def build(cls, root: Path, config: Config | None = None) -> ProjectIndex:
+        from mmu_cli.cli import gather_code_files
+
+        skip_paths = set((config or Config.load(root)).skip_paths)
+        walked: list[str] = []
+        with trace.span("index.walk", "io", root=str(root)):
+            files = gather_code_files(root, skip_paths, walked)
+        dirs = []
+        for rel in walked:
+            try:
+                dirs.append((rel, os.stat(root / rel).st_mtime_ns))
+            except OSError:
+                continue
+        rels = tuple(sorted(p.relative_to(root).as_posix() for p in files))
+        return cls(root, rels, frozenset(skip_paths), tuple(dirs))
+
+    def is_fresh(self) -> bool:
+        """True while no walked directory changed and ``doctor.skip_paths`` is the same."""
+        for rel, mtime in self.dirs:
+            try:
+                if os.stat(self.root / rel).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return Config.load(self.root).skip_paths == self.skip_paths
+
+    @property
+    def files(self) -> list[Path]:
+        return [self.root / rel for rel in self.rels]
+
+    def __len__(self) -> int:
+        return len(self.rels)
+
+    def chunks(self, size: int) -> Iterator[tuple[int, tuple[str, ...]]]:
+        """(start_index, rels) slices of at most *size* files, in order."""
+        size = max(size, 1)
+        for start in range(0, len(self.rels), size):
+            yield start, self.rels[start:start + size]
+
+
+# root -> index, for processes that check a root more than once.
+_MEMO: dict[Path, ProjectIndex] = {}
+
+
+def load_index(root: Path) -> ProjectIndex:
+    """The current index for *root*: the memoized one if still fresh, else a new walk."""
+    index = _MEMO.get(root)
+    if index is None or not index.is_fresh():
+        index = ProjectIndex.build(root)
+        _MEMO[root] = index
+    return index
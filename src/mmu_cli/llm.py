@@ -9,6 +9,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from mmu_cli import trace
+from mmu_cli.config import Config
+
 # ---------------------------------------------------------------------------
 # Lazy import gate
 # ---------------------------------------------------------------------------
@@ -37,7 +40,7 @@ def require_llm() -> None:
 # API key resolution
 # ---------------------------------------------------------------------------
 
-def get_api_key(root: Path | None = None) -> str:
+def get_api_key(root: Path | None = None, config: Config | None = None) -> str:
     """Resolve API key: env var → .mmu/config.toml → error."""
     key = os.environ.get("MMU_ANTHROPIC_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
     if key:
@@ -45,26 +48,9 @@ def get_api_key(root: Path | None = None) -> str:
 
     # Try config file
     if root:
-        cfg_path = root / ".mmu" / "config.toml"
-        if cfg_path.is_file():
-            try:
-                import tomllib
-            except ModuleNotFoundError:  # Python 3.10: tomllib landed in 3.11
-                try:
-                    import tomli as tomllib  # type: ignore[no-redef]
-                except ModuleNotFoundError:
-                    tomllib = None  # type: ignore[assignment]
-            data: dict[str, Any] = {}
-            if tomllib is None:
-                print(f"  ⚠️  Cannot parse {cfg_path}: install tomli on Python 3.10", file=sys.stderr)
-            else:
-                try:
-                    data = tomllib.loads(cfg_path.read_text(encoding="utf-8"))
-                except (OSError, tomllib.TOMLDecodeError) as exc:
-                    print(f"  ⚠️  Could not read {cfg_path}: {exc}", file=sys.stderr)
-            llm_cfg = data.get("llm", {})
-            if isinstance(llm_cfg, dict) and llm_cfg.get("api_key"):
-                return str(llm_cfg["api_key"])
+        key = (config or Config.load(root)).api_key
+        if key:
+            return key
 
     print(
         "\n  No API key found.\n"
@@ -102,13 +88,14 @@ class LLMClient:
     ) -> str:
         """Send a completion request and return the text response."""
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                system=system,
-                messages=[{"role": "user", "content": user}],
-                temperature=temperature,
-            )
+            with trace.span("llm.complete", "llm", model=self.model, max_tokens=max_tokens):
+                response = self.client.messages.create(
+                    model=self.model,
+                    max_tokens=max_tokens,
+                    system=system,
+                    messages=[{"role": "user", "content": user}],
+                    temperature=temperature,
+                )
         except anthropic.AuthenticationError:  # type: ignore[union-attr]
             print(
                 "\n  Anthropic API rejected the key. Check MMU_ANTHROPIC_API_KEY / "
@@ -0,0 +1,340 @@
+"""Parsed dependency manifests shared by scan, vibecheck and init.
+
+Every command that asks "does this project depend on X?" goes through
+:func:`load_manifests`. Each manifest is parsed properly (``json`` for
+package.json, ``tomllib`` for pyproject.toml, line readers for go.mod, lock
+files, Maven/Gradle builds and ``*.csproj``) at most once per process, and
+its normalized dependency names are cached by content hash in
+``.mmu/cache/manifests.json`` so later runs skip re-parsing unchanged files.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from mmu_cli import trace
+from mmu_cli.cache import content_hash, load_json, save_json
+
+try:
+    import tomllib
+except ModuleNotFoundError:
+    try:
+        import tomli as tomllib  # type: ignore[no-redef]
+    except ModuleNotFoundError:
+        tomllib = None  # type: ignore[assignment]
+
+CACHE_NAME = "manifests.json"
+# Bump when a parser changes what it extracts, so stale cache entries are ignored.
+CACHE_VERSION = 1
+
+_REQUIREMENT_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+def normalize_py_name(name: str) -> str:
+    """PEP 503 normalization: ``Sentry_SDK`` and ``sentry.sdk`` both become ``sentry-sdk``."""
+    return re.sub(r"[-_.]+", "-", name).lower().strip()
+
+
+def _pep508_names(requirements: Any) -> list[str]:
+    if not isinstance(requirements, list):
+        return []
+    names = []
+    for req in requirements:
+        if isinstance(req, str):
+            m = _REQUIREMENT_NAME.match(req)
+            if m:
+                names.append(normalize_py_name(m.group(1)))
+    return names
+
+
+def _npm_names(data: bytes) -> list[str]:
+    try:
+        doc = json.loads(data)
+    except ValueError:
+        return []
+    if not isinstance(doc, dict):
+        return []
+    names: list[str] = []
+    for key in ("dependencies", "devDependencies", "peerDependencies", "optionalDependencies"):
+        section = doc.get(key)
+        if isinstance(section, dict):
+            names.extend(str(name) for name in section)
+    return names
+
+
+def _requirements_names(data: bytes) -> list[str]:
+    names = []
+    for raw in data.decode("utf-8", errors="ignore").splitlines():
+        line = raw.strip()
+        # Skip comments and pip options (-r, -e, --index-url, ...).
+        if not line or line.startswith(("#", "-")):
+            continue
+        m = _REQUIREMENT_NAME.match(line)
+        if m:
+            names.append(normalize_py_name(m.group(1)))
+    return names
+
+
+def _pyproject_names_fallback(text: str) -> list[str]:
+    """Line scraper for Python 3.10 without tomli: ``dependencies = [...]`` only."""
+    names = []
+    in_deps = False
+    for line in text.splitlines():
+        if re.match(r"^\s*dependencies\s*=\s*\[", line):
+            in_deps = True
+            continue
+        if in_deps:
+            if "]" in line:
+                in_deps = False
+            m = re.match(r'^\s*"([^">=<!\[]+)', line)
+            if m:
+                names.append(normalize_py_name(m.group(1)))
+    return names
+
+
+def _pyproject_names(data: bytes) -> list[str]:
+    text = data.decode("utf-8", errors="ignore")
+    if tomllib is None:
+        return _pyproject_names_fallback(text)
+    try:
+        doc = tomllib.loads(text)
+    except tomllib.TOMLDecodeError:
+        return []
+
+    names: list[str] = []
+    project = doc.get("project")
+    if isinstance(project, dict):
+        names += _pep508_names(project.get("dependencies"))
+        optional = project.get("optional-dependencies")
+        if isinstance(optional, dict):
+            for group in optional.values():
+                names += _pep508_names(group)
+    groups = doc.get("dependency-groups")  # PEP 735
+    if isinstance(groups, dict):
+        for group in groups.values():
+            names += _pep508_names(group)
+
+    tool = doc.get("tool")
+    poetry = tool.get("poetry") if isinstance(tool, dict) else None
+    if isinstance(poetry, dict):
+        tables = [poetry.get("dependencies"), poetry.get("dev-dependencies")]
+        poetry_groups = poetry.get("group")
+        if isinstance(poetry_groups, dict):
+            tables += [g.get("dependencies") for g in poetry_groups.values() if isinstance(g, dict)]
+        for table in tables:
+            if isinstance(table, dict):
+                names += [normalize_py_name(k) for k in table if k.lower() != "python"]
+    return names
+
+
+def _lines(data: bytes) -> list[str]:
+    return data.decode("utf-8", errors="ignore").splitlines()
+
+
+_GO_REQUIRE = re.compile(r"^\s*(?:require\s+)?([A-Za-z0-9][\w.~-]*(?:/[\w.~-]+)+)\s+v\d")
+_GO_MAJOR = re.compile(r"/v\d+$")
+
+
+def _go_mod_names(data: bytes) -> list[str]:
+    """Module paths from ``require`` lines and blocks, minus the ``/vN`` major suffix."""
+    names = []
+    in_block = False
+    for line in _lines(data):
+        stripped = line.strip()
+        if stripped.startswith("require ("):
+            in_block = True
+            continue
+        if in_block and stripped.startswith(")"):
+            in_block = False
+            continue
+        if in_block or stripped.startswith("require "):
+            m = _GO_REQUIRE.match(stripped)
+            if m:
+                names.append(_GO_MAJOR.sub("", m.group(1).lower()))
+    return names
+
+
+_GEM_SPEC = re.compile(r"^    ([A-Za-z0-9][\w.-]*) \(")
+
+
+def _gemfile_lock_names(data: bytes) -> list[str]:
+    """Gems resolved under ``specs:`` (exactly four spaces of indentation)."""
+    return [m.group(1).lower() for line in _lines(data) if (m := _GEM_SPEC.match(line))]
+
+
+_CARGO_NAME = re.compile(r'^name\s*=\s*"([^"]+)"')
+
+
+def _cargo_lock_names(data: bytes) -> list[str]:
+    return [m.group(1).lower() for line in _lines(data) if (m := _CARGO_NAME.match(line))]
+
+
+# Package names are always vendor/package; author "name" keys never contain a slash.
+_COMPOSER_NAME = re.compile(r'^\s*"name"\s*:\s*"([a-z0-9_.-]+/[a-z0-9_.-]+)"', re.IGNORECASE)
+
+
+def _composer_lock_names(data: bytes) -> list[str]:
+    return [m.group(1).lower() for line in _lines(data) if (m := _COMPOSER_NAME.match(line))]
+
+
+_XML_TAG = re.compile(r"<(groupId|artifactId)>\s*([^<\s]+)\s*</\1>")
+
+
+def _pom_names(data: bytes) -> list[str]:
+    """``groupId:artifactId`` for every ``<dependency>`` block."""
+    names = []
+    in_dep = False
+    coords: dict[str, str] = {}
+    for line in _lines(data):
+        if "<dependency>" in line:
+            in_dep = True
+            coords = {}
+        if in_dep:
+            for m in _XML_TAG.finditer(line):
+                coords[m.group(1)] = m.group(2)
+        if "</dependency>" in line and in_dep:
+            in_dep = False
+            if "artifactId" in coords:
+                names.append(f"{coords.get('groupId', '')}:{coords['artifactId']}".lower())
+    return names
+
+
+_GRADLE_COORD = re.compile(r"""["']([\w.-]+):([\w.-]+)(?::[^"']*)?["']""")
+
+
+def _gradle_names(data: bytes) -> list[str]:
+    """``group:artifact`` from string coordinates (Groovy and Kotlin DSL)."""
+    return [
+        f"{m.group(1)}:{m.group(2)}".lower()
+        for line in _lines(data)
+        for m in _GRADLE_COORD.finditer(line)
+    ]
+
+
+_PACKAGE_REFERENCE = re.compile(r'<PackageReference\s+Include="([^"]+)"', re.IGNORECASE)
+
+
+def _csproj_names(data: bytes) -> list[str]:
+    return [m.group(1).lower() for line in _lines(data) for m in _PACKAGE_REFERENCE.finditer(line)]
+
+
+# (path relative to the project root, ecosystem, parser). A leading "*" matches
+# by suffix against the single listing of the project root.
+MANIFEST_FILES: list[tuple[str, str, Callable[[bytes], list[str]]]] = [
+    ("package.json", "npm", _npm_names),
+    ("requirements.txt", "pypi", _requirements_names),
+    ("requirements/base.txt", "pypi", _requirements_names),
+    ("requirements/prod.txt", "pypi", _requirements_names),
+    ("pyproject.toml", "pypi", _pyproject_names),
+    ("go.mod", "go", _go_mod_names),
+    ("Gemfile.lock", "rubygems", _gemfile_lock_names),
+    ("Cargo.lock", "cargo", _cargo_lock_names),
+    ("composer.lock", "packagist", _composer_lock_names),
+    ("pom.xml", "maven", _pom_names),
+    ("build.gradle", "maven", _gradle_names),
+    ("build.gradle.kts", "maven", _gradle_names),
+    ("*.csproj", "nuget", _csproj_names),
+]
+
+
+def _manifest_paths(root: Path) -> list[tuple[str, str, Callable[[bytes], list[str]]]]:
+    """Resolve MANIFEST_FILES against one ``os.scandir`` of *root*."""
+    try:
+        with os.scandir(root) as it:
+            top = sorted(entry.name for entry in it if entry.is_file())
+    except OSError:
+        return []
+    found = []
+    for rel, ecosystem, parser in MANIFEST_FILES:
+        if rel.startswith("*"):
+            found += [(name, ecosystem, parser) for name in top if name.endswith(rel[1:])]
+        elif "/" not in rel:
+            if rel in top:
+                found.append((rel, ecosystem, parser))
+        else:
+            # Nested manifests (requirements/*.txt) are checked individually.
+            if (root / rel).is_file():
+                found.append((rel, ecosystem, parser))
+    return found
+
+
+@dataclass
+class Manifests:
+    """Normalized dependency names per ecosystem, each mapped to its manifest."""
+
+    deps: dict[str, dict[str, str]] = field(default_factory=dict)
+    # ecosystem -> manifests found for it, even ones declaring no dependencies
+    sources: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def npm(self) -> dict[str, str]:
+        return self.deps.get("npm", {})
+
+    @property
+    def py(self) -> dict[str, str]:
+        return self.deps.get("pypi", {})
+
+    def names(self) -> set[str]:
+        return {name.lower() for eco in self.deps.values() for name in eco}
+
+    def mentions(self, *markers: str) -> bool:
+        """True if any marker is a substring of any dependency name (case-insensitive)."""
+        lowered = [m.lower() for m in markers]
+        return any(m in name for name in self.names() for m in lowered)
+
+
+# Per-process parse memo: path -> ((mtime_ns, size), names). Long-lived
+# processes re-parse only when a manifest's stat signature changes.
+_FILE_MEMO: dict[Path, tuple[tuple[int, int], list[str]]] = {}
+
+
+@trace.traced("manifests.load")
+def load_manifests(root: Path) -> Manifests:
+    """Parse (or reuse) every known manifest under *root*."""
+    result = Manifests()
+    disk: dict[str, Any] | None = None
+    dirty = False
+
+    for rel, ecosystem, parser in _manifest_paths(root):
+        path = root / rel
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        sig = (st.st_mtime_ns, st.st_size)
+        memo = _FILE_MEMO.get(path)
+        if memo is not None and memo[0] == sig:
+            names = memo[1]
+        else:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            digest = content_hash(data)
+            if disk is None:
+                cached = load_json(root, CACHE_NAME)
+                entries = cached.get("entries") if cached.get("version") == CACHE_VERSION else None
+                disk = entries if isinstance(entries, dict) else {}
+            entry = disk.get(rel)
+            if isinstance(entry, dict) and entry.get("hash") == digest and isinstance(entry.get("deps"), list):
+                names = [str(n) for n in entry["deps"]]
+            else:
+                names = parser(data)
+                disk[rel] = {"hash": digest, "deps": names}
+                dirty = True
+            _FILE_MEMO[path] = (sig, names)
+
+        result.sources.setdefault(ecosystem, []).append(rel)
+        bucket = result.deps.setdefault(ecosystem, {})
+        for name in names:
+            bucket.setdefault(name, rel)
+
+    if dirty and disk is not None:
+        save_json(root, CACHE_NAME, {"version": CACHE_VERSION, "entries": disk})
+    return result
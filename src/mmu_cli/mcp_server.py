@@ -86,6 +86,14 @@ def list_idea_templates(root: Path | None = None) -> list[dict[str, str]]:
     return [_summarize(p, repo) for p in _list_idea_template_files(repo)]
 
 
+def search_docs(query: str, limit: int = 10, root: Path | None = None) -> list[dict]:
+    from mmu_cli.config import Config
+    from mmu_cli.search import search
+
+    repo = _resolve_repo_root(root)
+    return search(repo, query, limit, dict(Config.load(repo).features))
+
+
 def _missing_validate_extra() -> bool:
     """The validators package imports lazily; check the [validate] extra's real
     dependencies up front so a missing extra becomes one friendly payload
@@ -179,6 +187,15 @@ def build_server(root: Path | None = None):
         """Fetch the full markdown content of a single blueprint by name (e.g. 'frontend', 'billing', 'ai-product')."""
         return get_blueprint(name, root)
 
+    @mcp.tool()
+    def mmu_search(query: str, limit: int = 10) -> list[dict]:
+        """Full-text (BM25) search over blueprints, checklists and core docs.
+
+        Returns ranked items and sections with path, line, section and, for
+        core blueprint items, the `mmu check` command that marks them done.
+        """
+        return search_docs(query, limit, root)
+
     @mcp.tool()
     def mmu_list_idea_templates() -> list[dict[str, str]]:
         """List MMU idea + launch templates (start/close/ADR prompts, Product Hunt kit)."""
@@ -0,0 +1,125 @@
+"""`mmu status --roots-file` / `--glob` — readiness across many projects.
+
+Each root's :class:`~mmu_cli.display.StatusSnapshot` is taken in a worker
+process, so a portfolio of a hundred-plus repos pays interpreter start-up
+and imports once per worker instead of once per repo, and parsing runs on
+every core. Rows come back as plain dicts and are sorted neediest first:
+lowest score, then most open gates, then most open P0 items.
+"""
+
+from __future__ import annotations
+
+import csv
+import glob
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from mmu_cli import trace
+
+FIELDS = ["root", "score", "stage", "open_gates", "p0_open", "done", "total", "error"]
+
+
+def read_roots_file(path: Path) -> list[str]:
+    """One root per line; blank lines and ``#`` comments skipped, ``~`` expanded."""
+    roots = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            roots.append(os.path.expanduser(line))
+    return roots
+
+
+def expand_globs(patterns: list[str]) -> list[str]:
+    roots: list[str] = []
+    for pattern in patterns:
+        roots.extend(p for p in sorted(glob.glob(os.path.expanduser(pattern))) if os.path.isdir(p))
+    return roots
+
+
+@trace.traced("portfolio.snapshot_row")
+def snapshot_row(root: str) -> dict[str, Any]:
+    """Status of one root as a flat row. Runs in a worker process."""
+    from mmu_cli.config import Config
+    from mmu_cli.display import take_snapshot
+
+    row: dict[str, Any] = {"root": root, "score": None, "stage": "", "open_gates": [], "p0_open": None,
+                           "done": None, "total": None, "error": ""}
+    path = Path(root)
+    if not path.is_dir():
+        row["error"] = "not a directory"
+        return row
+    try:
+        snap = take_snapshot(path, Config.load(path).features)
+    except (OSError, ValueError) as exc:  # one broken repo must not sink the portfolio
+        row["error"] = f"{type(exc).__name__}: {exc}"
+        return row
+    if not snap.all_total:
+        row["error"] = "no blueprints or gates (run `mmu init`)"
+    row.update(score=snap.pct_int, stage=snap.stage, open_gates=snap.open_gates, p0_open=snap.p0_open,
+               done=snap.all_done, total=snap.all_total)
+    return row
+
+
+def sort_key(row: dict[str, Any]) -> tuple[Any, ...]:
+    failed = row["score"] is None
+    return (failed, row["score"] or 0, -len(row["open_gates"]), -(row["p0_open"] or 0), row["root"])
+
+
+def collect(roots: list[str], workers: int | None = None) -> list[dict[str, Any]]:
+    """Rows for every distinct root, sorted by :func:`sort_key`."""
+    roots = list(dict.fromkeys(os.path.abspath(r) for r in roots))
+    workers = workers or min(len(roots), os.cpu_count() or 1)
+    if workers <= 1 or len(roots) <= 1:
+        rows = [snapshot_row(root) for root in roots]
+    else:
+        # A few chunks per worker: cheap dispatch without one slow repo stalling a big chunk.
+        chunksize = max(1, len(roots) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(snapshot_row, roots, chunksize=chunksize))
+    return sorted(rows, key=sort_key)
+
+
+def to_csv(rows: list[dict[str, Any]]) -> str:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=FIELDS, lineterminator="\n")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({**row, "open_gates": " ".join(g.split(None, 1)[0] for g in row["open_gates"])})
+    return out.getvalue()
+
+
+def export(rows: list[dict[str, Any]], path: Path) -> None:
+    """Write *rows* as CSV when *path* ends in ``.csv``, JSON otherwise."""
+    if path.suffix.lower() == ".csv":
+        path.write_text(to_csv(rows), encoding="utf-8")
+    else:
+        path.write_text(json.dumps(rows, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def format_table(rows: list[dict[str, Any]]) -> list[str]:
+    if not rows:
+        return ["No project roots found."]
+    width = min(max(len(row["root"]) for row in rows), 60)
+    lines = [
+        f"Portfolio — {len(rows)} project(s), neediest first",
+        "",
+        f"  {'Root':<{width}}  {'Score':>5}  {'Stage':<9}  {'Gates open':<14}  {'P0':>4}",
+    ]
+    for row in rows:
+        root = row["root"] if len(row["root"]) <= width else "…" + row["root"][-(width - 1):]
+        if row["score"] is None:
+            lines.append(f"  {root:<{width}}  {'-':>5}  {'-':<9}  {row['error']}")
+            continue
+        gates = " ".join(g.split(None, 1)[0] for g in row["open_gates"]) or "-"
+        lines.append(f"  {root:<{width}}  {row['score']:>4}%  {row['stage']:<9}  {gates:<14}  {row['p0_open']:>4}")
+    scored = [row["score"] for row in rows if row["score"] is not None]
+    if scored:
+        lines.append("")
+        lines.append(f"  Average score {sum(scored) / len(scored):.0f}% · "
+                     f"{sum(1 for row in rows if row['p0_open'])} with open P0 items · "
+                     f"{len(rows) - len(scored)} failed")
+    return lines
@@ -0,0 +1,241 @@
+"""Weighted top-k recommender behind `mmu next`.
+
+Candidates are the unchecked items of every checklist the project carries:
+the core blueprints (plus any custom ``docs/blueprints/*.md``), the
+``from_scratch.md`` gate stages, the other ``docs/checklists/*`` files and,
+on request, failing `mmu vibecheck` findings. Items blocked by an unchecked
+``<!-- after: ... -->`` prerequisite (:mod:`mmu_cli.graph`) are left out.
+Each candidate is scored as
+
+    score = 12.0 * priority + 3.0 * gate + 1.0 * depth + 1.0 * recency
+
+where every factor is in 0..1 (see :func:`score`), so one priority step (6.0)
+outweighs everything else and the other factors order items within a tier.
+Selection keeps a two-entry min-heap per source file (the diversity cap) and
+takes :func:`heapq.nlargest` over the survivors, so picking k items out of N
+costs O(N + S log k) for S sources instead of a full sort. Every
+recommendation carries its per-factor contributions as a rationale.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from mmu_cli.display import BLUEPRINT_NAMES
+from mmu_cli.graph import build_graph
+from mmu_cli.state import FileProgress, progress_for
+
+WEIGHTS = {"priority": 12.0, "gate": 3.0, "depth": 1.0, "recency": 1.0}
+PER_SOURCE = 2  # at most this many recommendations from one file
+RECENCY_DAYS = 7.0  # a file edited this many days ago scores half the recency weight
+GATES_FILE = "from_scratch.md"
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """One open item, with the raw inputs to its score."""
+
+    source: str  # "blueprint" | "gate" | "checklist" | "vibecheck"
+    group: str  # diversity bucket: the source file (or "vibecheck")
+    label: str  # "Frontend", "Gate M1 Build Fit", "Auth Security", ...
+    key: str  # what to pass to the hint command
+    hint: str  # command or file to open next
+    priority: int  # 0 (P0) .. 2
+    text: str
+    order: int  # position in collection order; lower wins ties
+    depth: int = 0  # open items ahead of this one in the same section
+    gate_distance: int | None = None  # stages past the first open gate; None if not gated
+    gate_ratio: float = 0.0  # done/total of that gate stage
+    age_days: float = 0.0  # since the source file was last modified
+    path: Path | None = None  # checklist file, for dependency lookups
+    index: int = -1  # 0-based among the file's active items
+
+
+@dataclass(frozen=True)
+class Recommendation:
+    candidate: Candidate
+    score: float
+    rationale: dict[str, float]  # weighted contribution per factor
+
+    def to_dict(self) -> dict[str, Any]:
+        c = self.candidate
+        return {
+            "source": c.source,
+            "label": c.label,
+            "key": c.key,
+            "hint": c.hint,
+            "priority": f"P{c.priority}",
+            "text": c.text,
+            "score": round(self.score, 3),
+            "rationale": {
+                **{name: round(value, 3) for name, value in self.rationale.items()},
+                "depth_items": c.depth,
+                "gate_distance": c.gate_distance,
+                "age_days": round(c.age_days, 1),
+            },
+        }
+
+
+def score(candidate: Candidate) -> tuple[float, dict[str, float]]:
+    """Weighted score of *candidate* and the contribution of each factor."""
+    factors = {
+        "priority": (2 - min(max(candidate.priority, 0), 2)) / 2,
+        "gate": 0.0 if candidate.gate_distance is None
+        else (1 + candidate.gate_ratio) / (2 * (1 + candidate.gate_distance)),
+        "depth": 1 / (1 + candidate.depth),
+        "recency": 1 / (1 + max(candidate.age_days, 0.0) / RECENCY_DAYS),
+    }
+    rationale = {name: WEIGHTS[name] * value for name, value in factors.items()}
+    return sum(rationale.values()), rationale
+
+
+def top_k(candidates: list[Candidate], k: int, per_source: int = PER_SOURCE) -> list[Recommendation]:
+    """The *k* best candidates, at most *per_source* from any one group, best first."""
+    heaps: dict[str, list[tuple[float, int, Recommendation]]] = {}
+    for candidate in candidates:
+        total, rationale = score(candidate)
+        entry = (total, -candidate.order, Recommendation(candidate, total, rationale))
+        heap = heaps.setdefault(candidate.group, [])
+        if len(heap) < per_source:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    survivors = (entry for heap in heaps.values() for entry in heap)
+    return [rec for _, _, rec in heapq.nlargest(k, survivors, key=lambda e: e[:2])]
+
+
+def _age_days(path: Path, now: float) -> float:
+    try:
+        return max(now - path.stat().st_mtime, 0.0) / 86400
+    except OSError:
+        return 0.0
+
+
+def _open_items(prog: FileProgress) -> list[tuple[int, int, str, int]]:
+    """[(item_index, priority, text, depth), ...] for the unchecked items of *prog*."""
+    ahead: dict[int, int] = {}
+    out = []
+    for idx, (done, priority, text) in enumerate(prog.items):
+        group = prog.groups[idx] if idx < len(prog.groups) else 0
+        if done:
+            continue
+        out.append((idx, priority, text, ahead.get(group, 0)))
+        ahead[group] = ahead.get(group, 0) + 1
+    return out
+
+
+def source_label(path: Path) -> str:
+    """Display label of a checklist file: "Frontend", "Auth Security", "Ai Product", ..."""
+    if path.name in BLUEPRINT_NAMES:
+        return BLUEPRINT_NAMES[path.name]
+    stem = path.stem.split("-", 1)[1] if path.stem[:2].isdigit() and "-" in path.stem else path.stem
+    return stem.replace("_", " ").replace("-", " ").title()
+
+
+def checklist_progress(root: Path, flags: dict[str, bool] | None = None) -> dict[Path, FileProgress]:
+    """Progress of every checklist file: blueprints (custom and industry ones
+    included), ``docs/checklists/*`` and, last, the gate checklist."""
+    bp_dir = root / "docs" / "blueprints"
+    cl_dir = root / "docs" / "checklists"
+
+    def listing(directory: Path) -> list[Path]:
+        return sorted(p for p in directory.glob("*.md") if p.name != "README.md")
+
+    core = [bp_dir / name for name in BLUEPRINT_NAMES]
+    custom = [p for p in listing(bp_dir) if p.name not in BLUEPRINT_NAMES]
+    checklists = [p for p in listing(cl_dir) if p.name != GATES_FILE]
+    progress = progress_for(root, core + custom + listing(bp_dir / "industry") + checklists, flags)
+    # Gates share the flag-free state entry with `mmu status`.
+    progress.update(progress_for(root, [cl_dir / GATES_FILE]))
+    return progress
+
+
+def _gate_candidates(path: Path, gates: FileProgress, out: list[Candidate], age: float) -> None:
+    stage_of: list[int | None] = [None] * (gates.total - sum(total for _, _, total in gates.stages))
+    for idx, (_, _, total) in enumerate(gates.stages):
+        stage_of.extend([idx] * total)
+    first_open = next((i for i, (_, done, total) in enumerate(gates.stages) if done < total), 0)
+    for idx, priority, text, depth in _open_items(gates):
+        stage = stage_of[idx] if idx < len(stage_of) else None
+        if stage is None:
+            continue
+        label, done, total = gates.stages[stage]
+        code = label.split(None, 1)[0]
+        out.append(Candidate(
+            "gate", str(path), f"Gate {label}", code, f"mmu gate {code}", priority, text, len(out),
+            depth, stage - first_open, done / total if total else 0.0, age, path=path, index=idx,
+        ))
+
+
+def collect_candidates(
+    root: Path,
+    progress: dict[Path, FileProgress],
+    *,
+    vibecheck: bool = False,
+) -> list[Candidate]:
+    """Every open item in *progress* (see :func:`checklist_progress`), industry
+    blueprints excepted, plus failing vibecheck findings on request."""
+    now = time.time()
+    bp_dir = root / "docs" / "blueprints"
+    cl_dir = root / "docs" / "checklists"
+    out: list[Candidate] = []
+
+    for path, prog in progress.items():
+        age = _age_days(path, now)
+        if path.parent == cl_dir and path.name == GATES_FILE:
+            _gate_candidates(path, prog, out, age)
+            continue
+        if path.parent not in (bp_dir, cl_dir):
+            continue  # industry blueprints only feed the dependency graph
+        label = source_label(path)
+        if path.name in BLUEPRINT_NAMES:
+            key = label.lower().replace(" & ", "-").replace(" ", "-")
+            source, hint = "blueprint", f"mmu show {key}"
+        else:
+            key = path.stem
+            source, hint = "blueprint" if path.parent == bp_dir else "checklist", path.relative_to(root).as_posix()
+        for idx, priority, text, depth in _open_items(prog):
+            out.append(Candidate(
+                source, str(path), label, key, hint, priority, text, len(out), depth,
+                age_days=age, path=path, index=idx,
+            ))
+
+    if vibecheck:
+        from mmu_cli.vibecheck import run_vibecheck
+
+        for finding in run_vibecheck(root):
+            if finding.status not in {"fail", "warn"}:
+                continue
+            out.append(Candidate(
+                "vibecheck", "vibecheck", "Vibe check", finding.check, "mmu vibecheck",
+                0 if finding.severity == "P0" else 1, f"{finding.check}: {finding.message}", len(out),
+                # A failing check blocks launch outright: treat it as the open gate.
+                gate_distance=0 if finding.status == "fail" else None, gate_ratio=1.0,
+            ))
+    return out
+
+
+def recommend(
+    root: Path,
+    flags: dict[str, bool] | None = None,
+    count: int = 3,
+    *,
+    vibecheck: bool = False,
+) -> tuple[list[Recommendation], int]:
+    """Top *count* recommendations (3 if *count* < 1) and how many open items remain.
+
+    Items still waiting on an unchecked ``<!-- after: ... -->`` prerequisite
+    are never recommended; they count as remaining.
+    """
+    if count < 1:
+        count = 3
+    progress = checklist_progress(root, flags)
+    graph = build_graph(progress)
+    candidates = collect_candidates(root, progress, vibecheck=vibecheck)
+    ready = [c for c in candidates if c.path is None or not graph.is_blocked(c.path, c.index)]
+    top = top_k(ready, count)
+    return top, len(candidates) - len(top)
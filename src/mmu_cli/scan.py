@@ -4,10 +4,51 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
+from mmu_cli import trace
+from mmu_cli.blueprint import load_blueprint, write_blueprint
+from mmu_cli.manifests import Manifests, load_manifests
+from mmu_cli.state import record_write
+
+# Where `mmu scan` records why each signal fired, so `mmu scan --explain`
+# and `mmu show` can cite evidence without rescanning the codebase.
+SCAN_INDEX_PATH = ".mmu/scan_index.json"
+
+
+@dataclass
+class Evidence:
+    """Why a signal fired.
+
+    Only cheap facts are captured during the scan: the manifest key, the path
+    that exists, or the character offset of the first pattern match. Line,
+    column and snippet text are resolved lazily by :func:`resolve_evidence`.
+    """
+
+    kind: str  # "manifest" | "file" | "path"
+    source: str  # path relative to the project root
+    key: str = ""  # dependency name or matched pattern
+    offset: int = -1  # character offset of the first match (kind == "file")
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Evidence:
+        return cls(
+            kind=str(data.get("kind", "")),
+            source=str(data.get("source", "")),
+            key=str(data.get("key", "")),
+            offset=int(data.get("offset", -1)),
+        )
+
+
 # ---------------------------------------------------------------------------
 # Detection helpers
+# Each helper returns an Evidence when the signal is present, else None, so
+# detectors compose with `or` and keep the first piece of evidence found.
 # ---------------------------------------------------------------------------
 
 
@@ -18,250 +59,481 @@ def _read(path: Path) -> str | None:
         return None
 
 
-def _has_file(root: Path, *names: str) -> bool:
-    return any((root / n).is_file() for n in names)
+def _rel(path: Path, root: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return str(path)
 
 
-def _has_dir(root: Path, *names: str) -> bool:
-    return any((root / n).is_dir() for n in names)
+def _has_file(root: Path, *names: str) -> Evidence | None:
+    for n in names:
+        if (root / n).is_file():
+            return Evidence("path", n)
+    return None
 
 
-def _pkg_deps(root: Path) -> set[str]:
-    """Return all dependency names from package.json."""
-    text = _read(root / "package.json")
-    if not text:
-        return set()
-    try:
-        data = json.loads(text)
-    except json.JSONDecodeError:
-        return set()
-    deps: set[str] = set()
-    for key in ("dependencies", "devDependencies", "peerDependencies"):
-        section = data.get(key, {})
-        if isinstance(section, dict):
-            deps.update(section.keys())
-    return deps
-
-
-def _py_deps(root: Path) -> set[str]:
-    """Return dependency names from requirements.txt or pyproject.toml."""
-    deps: set[str] = set()
-    # requirements.txt
-    for name in ("requirements.txt", "requirements/base.txt", "requirements/prod.txt"):
-        text = _read(root / name)
-        if text:
-            for line in text.splitlines():
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    # Extract package name before version specifier
-                    pkg = re.split(r"[>=<!\[\s]", line)[0].lower().strip()
-                    if pkg:
-                        deps.add(pkg)
-    # pyproject.toml (basic parsing)
-    text = _read(root / "pyproject.toml")
-    if text:
-        in_deps = False
-        for line in text.splitlines():
-            if re.match(r"^\s*dependencies\s*=\s*\[", line):
-                in_deps = True
-                continue
-            if in_deps:
-                if "]" in line:
-                    in_deps = False
-                m = re.match(r'^\s*"([^">=<!\[]+)', line)
-                if m:
-                    deps.add(m.group(1).lower().strip())
-    return deps
+def _has_dir(root: Path, *names: str) -> Evidence | None:
+    for n in names:
+        if (root / n).is_dir():
+            return Evidence("path", n)
+    return None
+
 
+def _dep(deps: dict[str, str], *names: str) -> Evidence | None:
+    """Evidence for the first of *names* declared in *deps* ({name: manifest})."""
+    for name in names:
+        if name in deps:
+            return Evidence("manifest", deps[name], name)
+    return None
 
-def _file_contains(root: Path, rel: str, *patterns: str) -> bool:
+
+def _dep_prefix(deps: dict[str, str], prefix: str) -> Evidence | None:
+    for name, manifest in deps.items():
+        if name.startswith(prefix):
+            return Evidence("manifest", manifest, name)
+    return None
+
+
+def _pattern(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(p) for p in patterns), re.IGNORECASE)
+
+
+def _file_contains(root: Path, rel: str, *patterns: str) -> Evidence | None:
     text = _read(root / rel)
     if not text:
-        return False
-    text_lower = text.lower()
-    return any(p.lower() in text_lower for p in patterns)
+        return None
+    m = _pattern(patterns).search(text)
+    if m:
+        return Evidence("file", rel, m.group(0), m.start())
+    return None
 
 
-def _any_file_contains(root: Path, globs: list[str], *patterns: str) -> bool:
+def _any_file_contains(root: Path, globs: list[str], *patterns: str) -> Evidence | None:
+    regex = _pattern(patterns)
     for g in globs:
         for path in root.glob(g):
             if path.is_file():
                 text = _read(path)
-                if text and any(p.lower() in text.lower() for p in patterns):
-                    return True
-    return False
+                if not text:
+                    continue
+                m = regex.search(text)
+                if m:
+                    return Evidence("file", _rel(path, root), m.group(0), m.start())
+    return None
+
+
+# Existing signals as declared by non-JS/Python manifests: signal -> {ecosystem: names}.
+# Names are normalized the way manifests.py stores them (lowercase, Go modules
+# without their /vN suffix, Maven as group:artifact).
+ECOSYSTEM_DEPS: dict[str, dict[str, tuple[str, ...]]] = {
+    "stripe": {
+        "go": ("github.com/stripe/stripe-go",),
+        "rubygems": ("stripe",),
+        "cargo": ("async-stripe", "stripe-rust"),
+        "packagist": ("stripe/stripe-php",),
+        "maven": ("com.stripe:stripe-java",),
+        "nuget": ("stripe.net",),
+    },
+    "sentry": {
+        "go": ("github.com/getsentry/sentry-go",),
+        "rubygems": ("sentry-ruby", "sentry-rails", "sentry-raven"),
+        "cargo": ("sentry",),
+        "packagist": ("sentry/sentry", "sentry/sentry-laravel", "sentry/sentry-symfony"),
+        "maven": ("io.sentry:sentry", "io.sentry:sentry-spring-boot-starter", "io.sentry:sentry-spring-boot-starter-jakarta"),
+        "nuget": ("sentry", "sentry.aspnetcore"),
+    },
+    "posthog": {
+        "go": ("github.com/posthog/posthog-go",),
+        "rubygems": ("posthog-ruby",),
+        "packagist": ("posthog/posthog-php",),
+        "maven": ("com.posthog.java:posthog",),
+        "nuget": ("posthog",),
+    },
+    "postgresql": {
+        "go": ("github.com/lib/pq", "github.com/jackc/pgx"),
+        "rubygems": ("pg",),
+        "cargo": ("postgres", "tokio-postgres"),
+        "maven": ("org.postgresql:postgresql",),
+        "nuget": ("npgsql", "npgsql.entityframeworkcore.postgresql"),
+    },
+    "mysql": {
+        "go": ("github.com/go-sql-driver/mysql",),
+        "rubygems": ("mysql2",),
+        "cargo": ("mysql", "mysql_async"),
+        "maven": ("com.mysql:mysql-connector-j", "mysql:mysql-connector-java"),
+        "nuget": ("mysql.data", "mysqlconnector"),
+    },
+    "mongodb": {
+        "go": ("go.mongodb.org/mongo-driver",),
+        "rubygems": ("mongo", "mongoid"),
+        "cargo": ("mongodb",),
+        "packagist": ("mongodb/mongodb",),
+        "maven": ("org.mongodb:mongodb-driver-sync",),
+        "nuget": ("mongodb.driver",),
+    },
+    "sqlite": {
+        "go": ("github.com/mattn/go-sqlite3", "modernc.org/sqlite"),
+        "rubygems": ("sqlite3",),
+        "cargo": ("rusqlite",),
+        "maven": ("org.xerial:sqlite-jdbc",),
+        "nuget": ("microsoft.data.sqlite",),
+    },
+    "resend": {
+        "go": ("github.com/resend/resend-go",),
+        "rubygems": ("resend",),
+        "packagist": ("resend/resend-php",),
+        "nuget": ("resend",),
+    },
+    "sendgrid": {
+        "go": ("github.com/sendgrid/sendgrid-go",),
+        "rubygems": ("sendgrid-ruby",),
+        "packagist": ("sendgrid/sendgrid",),
+        "maven": ("com.sendgrid:sendgrid-java",),
+        "nuget": ("sendgrid",),
+    },
+    "postmark": {
+        "rubygems": ("postmark",),
+        "packagist": ("wildbit/postmark-php",),
+        "nuget": ("postmark",),
+    },
+    "auth0": {
+        "go": ("github.com/auth0/go-auth0",),
+        "rubygems": ("omniauth-auth0",),
+        "packagist": ("auth0/auth0-php",),
+        "maven": ("com.auth0:auth0",),
+        "nuget": ("auth0.aspnetcore.authentication",),
+    },
+    "firebase_auth": {
+        "go": ("firebase.google.com/go",),
+        "packagist": ("kreait/firebase-php",),
+        "maven": ("com.google.firebase:firebase-admin",),
+        "nuget": ("firebaseadmin",),
+    },
+    "jwt": {
+        "go": ("github.com/golang-jwt/jwt",),
+        "rubygems": ("jwt",),
+        "cargo": ("jsonwebtoken",),
+        "packagist": ("firebase/php-jwt", "lcobucci/jwt"),
+        "maven": ("io.jsonwebtoken:jjwt-api", "com.auth0:java-jwt"),
+        "nuget": ("system.identitymodel.tokens.jwt",),
+    },
+    "playwright": {
+        "go": ("github.com/playwright-community/playwright-go",),
+        "maven": ("com.microsoft.playwright:playwright",),
+        "nuget": ("microsoft.playwright",),
+    },
+    "structured_logging": {
+        "go": ("go.uber.org/zap", "github.com/sirupsen/logrus", "github.com/rs/zerolog"),
+        "cargo": ("tracing",),
+        "packagist": ("monolog/monolog",),
+        "nuget": ("serilog",),
+    },
+}
+
+# Language signals backed by the presence of an ecosystem's manifest.
+ECOSYSTEM_LANGUAGES: dict[str, str] = {
+    "go": "go",
+    "rubygems": "ruby",
+    "cargo": "rust",
+    "packagist": "php",
+    "maven": "java",
+    "nuget": "dotnet",
+}
+
+
+def _ecosystem_dep(manifests: Manifests, signal: str) -> Evidence | None:
+    for ecosystem, names in ECOSYSTEM_DEPS.get(signal, {}).items():
+        found = _dep(manifests.deps.get(ecosystem, {}), *names)
+        if found:
+            return found
+    return None
 
 
 # ---------------------------------------------------------------------------
-# Detection rules: (signal_name, detector_fn)
-# Each detector returns True if the signal is present.
+# Detection rules: signal_name -> evidence
+# Each detector yields Evidence if the signal is present, else None.
 # ---------------------------------------------------------------------------
 
 
-def _build_detectors(root: Path) -> dict[str, bool]:
-    """Run all detectors and return {signal: bool}."""
-    npm = _pkg_deps(root)
-    py = _py_deps(root)
+@trace.traced("scan.collect_evidence")
+def collect_evidence(root: Path) -> dict[str, Evidence | None]:
+    """Run all detectors and return {signal: Evidence or None}."""
+    manifests = load_manifests(root)
+    npm = manifests.npm
+    py = manifests.py
     all_deps = npm | py
 
-    signals: dict[str, bool] = {}
+    ev: dict[str, Evidence | None] = {}
 
     # -- Frameworks --
-    signals["react"] = "react" in npm
-    signals["nextjs"] = "next" in npm
-    signals["vue"] = "vue" in npm
-    signals["svelte"] = "svelte" in npm or "@sveltejs/kit" in npm
-    signals["angular"] = "@angular/core" in npm
-    signals["fastapi"] = "fastapi" in py
-    signals["django"] = "django" in py
-    signals["flask"] = "flask" in py
-    signals["express"] = "express" in npm
+    ev["react"] = _dep(npm, "react")
+    ev["nextjs"] = _dep(npm, "next")
+    ev["vue"] = _dep(npm, "vue")
+    ev["svelte"] = _dep(npm, "svelte", "@sveltejs/kit")
+    ev["angular"] = _dep(npm, "@angular/core")
+    ev["fastapi"] = _dep(py, "fastapi")
+    ev["django"] = _dep(py, "django")
+    ev["flask"] = _dep(py, "flask")
+    ev["express"] = _dep(npm, "express")
 
     # -- Languages --
-    signals["typescript"] = "typescript" in npm or _has_file(root, "tsconfig.json")
-    signals["python"] = bool(py) or _has_file(root, "pyproject.toml", "setup.py", "requirements.txt")
+    ev["typescript"] = _dep(npm, "typescript") or _has_file(root, "tsconfig.json")
+    ev["python"] = _dep(py, *py) or _has_file(root, "pyproject.toml", "setup.py", "requirements.txt")
+    for ecosystem, language in ECOSYSTEM_LANGUAGES.items():
+        sources = manifests.sources.get(ecosystem)
+        ev[language] = Evidence("path", sources[0]) if sources else None
 
     # -- CSS/UI --
-    signals["tailwind"] = "tailwindcss" in npm or _has_file(root, "tailwind.config.js", "tailwind.config.ts")
-    signals["shadcn"] = _has_dir(root, "components/ui") or _has_dir(root, "src/components/ui")
-    signals["radix"] = any(d.startswith("@radix-ui") for d in npm)
+    ev["tailwind"] = _dep(npm, "tailwindcss") or _has_file(root, "tailwind.config.js", "tailwind.config.ts")
+    ev["shadcn"] = _has_dir(root, "components/ui", "src/components/ui")
+    ev["radix"] = _dep_prefix(npm, "@radix-ui")
 
     # -- State / Data --
-    signals["tanstack_query"] = "@tanstack/react-query" in npm
-    signals["redux"] = "redux" in npm or "@reduxjs/toolkit" in npm
-    signals["zustand"] = "zustand" in npm
+    ev["tanstack_query"] = _dep(npm, "@tanstack/react-query")
+    ev["redux"] = _dep(npm, "redux", "@reduxjs/toolkit")
+    ev["zustand"] = _dep(npm, "zustand")
 
     # -- Forms --
-    signals["react_hook_form"] = "react-hook-form" in npm
-    signals["zod"] = "zod" in npm or "zod" in py
-    signals["pydantic"] = "pydantic" in py
+    ev["react_hook_form"] = _dep(npm, "react-hook-form")
+    ev["zod"] = _dep(npm, "zod") or _dep(py, "zod")
+    ev["pydantic"] = _dep(py, "pydantic")
 
     # -- Router --
-    signals["react_router"] = "react-router-dom" in npm or "react-router" in npm
+    ev["react_router"] = _dep(npm, "react-router-dom", "react-router")
 
     # -- Auth --
-    signals["supabase_auth"] = "@supabase/supabase-js" in npm or "supabase" in py or "gotrue" in py
-    signals["firebase_auth"] = "firebase" in npm or "firebase-admin" in py
-    signals["auth0"] = "@auth0/auth0-react" in npm or "auth0" in py
-    signals["clerk"] = "@clerk/nextjs" in npm or "@clerk/clerk-react" in npm
-    signals["nextauth"] = "next-auth" in npm
+    ev["supabase_auth"] = _dep(npm, "@supabase/supabase-js") or _dep(py, "supabase", "gotrue")
+    ev["firebase_auth"] = _dep(npm, "firebase") or _dep(py, "firebase-admin")
+    ev["auth0"] = _dep(npm, "@auth0/auth0-react") or _dep(py, "auth0")
+    ev["clerk"] = _dep(npm, "@clerk/nextjs", "@clerk/clerk-react")
+    ev["nextauth"] = _dep(npm, "next-auth")
 
     # -- Database --
-    signals["postgresql"] = (
-        "pg" in npm or "postgres" in npm or "psycopg2" in py or "psycopg2-binary" in py
-        or "asyncpg" in py or "sqlalchemy" in py
+    ev["postgresql"] = (
+        _dep(npm, "pg", "postgres")
+        or _dep(py, "psycopg2", "psycopg2-binary", "asyncpg", "sqlalchemy")
         or _file_contains(root, ".env.example", "POSTGRES", "postgresql")
         or _file_contains(root, ".env", "POSTGRES", "postgresql")
     )
-    signals["mongodb"] = "mongoose" in npm or "mongodb" in npm or "pymongo" in py
-    signals["mysql"] = "mysql2" in npm or "mysqlclient" in py
-    signals["sqlite"] = "better-sqlite3" in npm or "sqlite3" in py
-    signals["supabase_db"] = signals["supabase_auth"]  # Usually implies Supabase PG
-    signals["prisma"] = "prisma" in npm or "@prisma/client" in npm
-    signals["drizzle"] = "drizzle-orm" in npm
-    signals["sqlalchemy"] = "sqlalchemy" in py
-    signals["typeorm"] = "typeorm" in npm
+    ev["mongodb"] = _dep(npm, "mongoose", "mongodb") or _dep(py, "pymongo")
+    ev["mysql"] = _dep(npm, "mysql2") or _dep(py, "mysqlclient")
+    ev["sqlite"] = _dep(npm, "better-sqlite3") or _dep(py, "sqlite3")
+    ev["supabase_db"] = ev["supabase_auth"]  # Usually implies Supabase PG
+    ev["prisma"] = _dep(npm, "prisma", "@prisma/client")
+    ev["drizzle"] = _dep(npm, "drizzle-orm")
+    ev["sqlalchemy"] = _dep(py, "sqlalchemy")
+    ev["typeorm"] = _dep(npm, "typeorm")
 
     # -- Payment --
-    signals["stripe"] = "stripe" in npm or "stripe" in py
-    signals["lemon_squeezy"] = (
-        "@lemonsqueezy/lemonsqueezy.js" in npm
+    ev["stripe"] = _dep(npm, "stripe") or _dep(py, "stripe")
+    ev["lemon_squeezy"] = (
+        _dep(npm, "@lemonsqueezy/lemonsqueezy.js")
         or _any_file_contains(root, ["**/*.py", "**/*.ts", "**/*.js"], "lemonsqueezy", "lemon_squeezy")
     )
-    signals["paddle"] = "paddle" in all_deps
+    ev["paddle"] = _dep(all_deps, "paddle")
 
     # -- Email --
-    signals["resend"] = "resend" in npm or "resend" in py
-    signals["sendgrid"] = "@sendgrid/mail" in npm or "sendgrid" in py
-    signals["postmark"] = "postmark" in npm or "postmarker" in py
-    signals["nodemailer"] = "nodemailer" in npm
+    ev["resend"] = _dep(npm, "resend") or _dep(py, "resend")
+    ev["sendgrid"] = _dep(npm, "@sendgrid/mail") or _dep(py, "sendgrid")
+    ev["postmark"] = _dep(npm, "postmark") or _dep(py, "postmarker")
+    ev["nodemailer"] = _dep(npm, "nodemailer")
 
     # -- Monitoring --
-    signals["sentry"] = "@sentry/react" in npm or "@sentry/node" in npm or "sentry-sdk" in py
-    signals["posthog"] = "posthog-js" in npm or "posthog" in py
+    ev["sentry"] = _dep(npm, "@sentry/react", "@sentry/node") or _dep(py, "sentry-sdk")
+    ev["posthog"] = _dep(npm, "posthog-js") or _dep(py, "posthog")
 
     # -- Testing --
-    signals["vitest"] = "vitest" in npm
-    signals["jest"] = "jest" in npm
-    signals["playwright"] = "@playwright/test" in npm or "playwright" in py
-    signals["cypress"] = "cypress" in npm
-    signals["pytest"] = "pytest" in py
+    ev["vitest"] = _dep(npm, "vitest")
+    ev["jest"] = _dep(npm, "jest")
+    ev["playwright"] = _dep(npm, "@playwright/test") or _dep(py, "playwright")
+    ev["cypress"] = _dep(npm, "cypress")
+    ev["pytest"] = _dep(py, "pytest")
 
     # -- Animation --
-    signals["framer_motion"] = "framer-motion" in npm
+    ev["framer_motion"] = _dep(npm, "framer-motion")
 
     # -- CI/CD --
-    signals["github_actions"] = _has_dir(root, ".github/workflows")
-    signals["docker"] = _has_file(root, "Dockerfile", "docker-compose.yml", "docker-compose.yaml")
+    ev["github_actions"] = _has_dir(root, ".github/workflows")
+    ev["docker"] = _has_file(root, "Dockerfile", "docker-compose.yml", "docker-compose.yaml")
 
     # -- Hosting --
-    signals["vercel"] = _has_file(root, "vercel.json") or _has_dir(root, ".vercel")
-    signals["railway"] = _file_contains(root, "railway.toml", "railway") or _file_contains(root, "railway.json", "railway")
-    signals["netlify"] = _has_file(root, "netlify.toml")
+    ev["vercel"] = _has_file(root, "vercel.json") or _has_dir(root, ".vercel")
+    ev["railway"] = _file_contains(root, "railway.toml", "railway") or _file_contains(root, "railway.json", "railway")
+    ev["netlify"] = _has_file(root, "netlify.toml")
 
     # -- SEO / Marketing --
-    signals["robots_txt"] = _has_file(root, "public/robots.txt", "static/robots.txt", "robots.txt")
-    signals["sitemap"] = _has_file(root, "public/sitemap.xml", "static/sitemap.xml", "sitemap.xml")
-    signals["og_meta"] = _any_file_contains(
+    ev["robots_txt"] = _has_file(root, "public/robots.txt", "static/robots.txt", "robots.txt")
+    ev["sitemap"] = _has_file(root, "public/sitemap.xml", "static/sitemap.xml", "sitemap.xml")
+    ev["og_meta"] = _any_file_contains(
         root, ["src/**/*.tsx", "src/**/*.jsx", "app/**/*.tsx", "**/*.html"],
         "og:title", "og:image", "openGraph", "open_graph",
     )
-    signals["ga4"] = _any_file_contains(
+    ev["ga4"] = _any_file_contains(
         root, ["src/**/*.tsx", "src/**/*.jsx", "**/*.html", "**/*.ts", "**/*.js"],
         "G-", "gtag", "google-analytics", "GoogleAnalytics",
     )
 
     # -- Security --
-    signals["cors"] = _any_file_contains(
+    ev["cors"] = _any_file_contains(
         root, ["**/*.py", "**/*.ts", "**/*.js"],
         "cors", "CORSMiddleware", "Access-Control-Allow",
     )
-    signals["rate_limiting"] = _any_file_contains(
+    ev["rate_limiting"] = _any_file_contains(
         root, ["**/*.py", "**/*.ts", "**/*.js"],
         "rate_limit", "rateLimit", "throttle", "Limiter",
     )
-    signals["jwt"] = _any_file_contains(
+    ev["jwt"] = _any_file_contains(
         root, ["**/*.py", "**/*.ts", "**/*.js"],
         "jwt", "jsonwebtoken", "JWT", "Bearer",
     )
-    signals["https_ssl"] = _any_file_contains(
+    ev["https_ssl"] = _any_file_contains(
         root, ["**/*.py", "**/*.ts", "**/*.js", "**/*.toml", "**/*.yaml"],
         "https://", "ssl", "tls", "certificate",
     )
 
     # -- Webhook --
-    signals["webhook_handler"] = _any_file_contains(
+    ev["webhook_handler"] = _any_file_contains(
         root, ["**/*.py", "**/*.ts", "**/*.js"],
         "webhook",
     )
-    signals["webhook_signature"] = _any_file_contains(
+    ev["webhook_signature"] = _any_file_contains(
         root, ["**/*.py", "**/*.ts", "**/*.js"],
         "verify_signature", "constructEvent", "x-signature", "webhook_secret", "hmac",
     )
 
     # -- Legal --
-    signals["privacy_policy"] = _any_file_contains(
+    ev["privacy_policy"] = _any_file_contains(
         root, ["src/**/*.tsx", "src/**/*.jsx", "**/*.html", "**/*.md"],
         "privacy policy", "privacy-policy", "PrivacyPolicy",
     )
-    signals["terms_of_service"] = _any_file_contains(
+    ev["terms_of_service"] = _any_file_contains(
         root, ["src/**/*.tsx", "src/**/*.jsx", "**/*.html", "**/*.md"],
         "terms of service", "terms-of-service", "TermsOfService",
     )
 
     # -- Logging --
-    signals["structured_logging"] = _any_file_contains(
+    ev["structured_logging"] = _any_file_contains(
         root, ["**/*.py", "**/*.ts", "**/*.js"],
         "structlog", "winston", "pino", "logging.getLogger", "logger",
     )
 
     # -- Health check --
-    signals["health_check"] = _any_file_contains(
+    ev["health_check"] = _any_file_contains(
         root, ["**/*.py", "**/*.ts", "**/*.js"],
         "/health", "healthcheck", "health_check",
     )
 
-    return signals
+    # -- Other ecosystems (go.mod, Gemfile.lock, Cargo.lock, composer.lock, Maven/Gradle, .csproj) --
+    for signal in ECOSYSTEM_DEPS:
+        ev[signal] = ev[signal] or _ecosystem_dep(manifests, signal)
+
+    return ev
+
+
+def _build_detectors(root: Path) -> dict[str, bool]:
+    """Run all detectors and return {signal: bool}."""
+    return {signal: ev is not None for signal, ev in collect_evidence(root).items()}
+
+
+# ---------------------------------------------------------------------------
+# Evidence index: persisted by `mmu scan`, resolved lazily by `--explain`
+# ---------------------------------------------------------------------------
+
+
+def load_scan_index(root: Path) -> dict:
+    """Return the persisted scan index, or {} if missing or unreadable."""
+    text = _read(root / SCAN_INDEX_PATH)
+    if not text:
+        return {}
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def index_auto_checked(index: dict) -> dict[str, dict[str, str]]:
+    """Decode the ``auto_checked`` table of a persisted scan index."""
+    table = index.get("auto_checked", {})
+    if not isinstance(table, dict):
+        return {}
+    return {
+        str(bp_file): {str(k): str(v) for k, v in items.items()}
+        for bp_file, items in table.items()
+        if isinstance(items, dict)
+    }
+
+
+def save_scan_index(
+    root: Path,
+    evidence: dict[str, Evidence | None],
+    auto_checked: dict[str, dict[str, str]] | None = None,
+) -> None:
+    """Persist signal evidence plus {blueprint: {item_text: signal}} auto-checks.
+
+    *auto_checked* replaces the stored table. Like the caches, the index is
+    only written into an existing ``.mmu/`` directory; a project without one
+    is never given one by a scan.
+    """
+    if not (root / ".mmu").is_dir():
+        return
+    from mmu_cli.cache import atomic_write
+
+    data = {
+        "signals": {sig: (ev.to_dict() if ev else None) for sig, ev in sorted(evidence.items())},
+        "auto_checked": auto_checked or {},
+    }
+    atomic_write(root / SCAN_INDEX_PATH, (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode("utf-8"))
+
+
+def index_evidence(index: dict) -> dict[str, Evidence | None]:
+    """Decode the ``signals`` table of a persisted scan index."""
+    signals = index.get("signals", {})
+    if not isinstance(signals, dict):
+        return {}
+    return {
+        sig: (Evidence.from_dict(ev) if isinstance(ev, dict) else None)
+        for sig, ev in signals.items()
+    }
+
+
+def resolve_evidence(root: Path, ev: Evidence) -> dict:
+    """Resolve an Evidence to line/column/snippet by reading its source once.
+
+    ``stale`` is true when the evidence no longer holds: its path is gone,
+    or its file no longer has the dependency or match where it was recorded.
+    """
+    out = ev.to_dict()
+    out.update({"line": None, "column": None, "snippet": "", "stale": True})
+    if ev.kind == "path":
+        out["stale"] = not (root / ev.source).exists()
+        return out
+    text = _read(root / ev.source)
+    if text is None:
+        return out
+    offset = ev.offset
+    if ev.kind == "manifest":
+        # Manifests only record the dependency name; locate it on demand.
+        m = re.search(r"(?<![\w@/.-])" + re.escape(ev.key) + r"(?![\w/-])", text, re.IGNORECASE)
+        if m is None:
+            # Go modules drop their /vN suffix; Maven names join group:artifact.
+            needle = ev.key.rsplit(":", 1)[-1]
+            m = re.search(r"(?<![\w@/.-])" + re.escape(needle), text, re.IGNORECASE)
+        offset = m.start() if m else -1
+    elif text[offset:offset + len(ev.key)] != ev.key:
+        offset = -1
+    if offset < 0 or offset > len(text):
+        return out
+    out["stale"] = False
+    line_start = text.rfind("\n", 0, offset) + 1
+    line_end = text.find("\n", offset)
+    if line_end == -1:
+        line_end = len(text)
+    out["line"] = text.count("\n", 0, offset) + 1
+    out["column"] = offset - line_start + 1
+    out["snippet"] = text[line_start:line_end].strip()[:200]
+    return out
 
 
 # ---------------------------------------------------------------------------
@@ -423,187 +695,183 @@ SCAN_RULES: list[tuple[str, str, str]] = [
 # ---------------------------------------------------------------------------
 
 
-_CONDITION_IF = re.compile(r"^<!--\s*if:(\w+)\s*-->")
-_CONDITION_ENDIF = re.compile(r"^<!--\s*endif\s*-->")
-
-
-def run_scan(root: Path, flags: dict[str, bool] | None = None) -> dict:
-    """Scan codebase and return detection results + auto-check counts.
-
-    When *flags* is provided, items inside disabled ``<!-- if:flag -->``
-    blocks are **not** auto-checked, preventing false-pass score inflation.
+# Display grouping for `mmu scan`: signal -> (category, label), categories in order.
+TECH_CATEGORIES = (
+    "Framework", "Language", "Database", "Auth", "Payment", "UI/CSS", "State",
+    "Testing", "Hosting", "Email", "Monitoring", "CI/CD", "SEO", "Security",
+)
+SIGNAL_LABELS: dict[str, tuple[str, str]] = {
+    "react": ("Framework", "React"),
+    "nextjs": ("Framework", "Next.js"),
+    "vue": ("Framework", "Vue"),
+    "svelte": ("Framework", "Svelte"),
+    "angular": ("Framework", "Angular"),
+    "fastapi": ("Framework", "FastAPI"),
+    "django": ("Framework", "Django"),
+    "flask": ("Framework", "Flask"),
+    "express": ("Framework", "Express"),
+    "typescript": ("Language", "TypeScript"),
+    "python": ("Language", "Python"),
+    "go": ("Language", "Go"),
+    "ruby": ("Language", "Ruby"),
+    "rust": ("Language", "Rust"),
+    "php": ("Language", "PHP"),
+    "java": ("Language", "Java/Kotlin"),
+    "dotnet": ("Language", ".NET"),
+    "tailwind": ("UI/CSS", "Tailwind CSS"),
+    "shadcn": ("UI/CSS", "shadcn/ui"),
+    "radix": ("UI/CSS", "Radix UI"),
+    "tanstack_query": ("State", "TanStack Query"),
+    "redux": ("State", "Redux"),
+    "zustand": ("State", "Zustand"),
+    "react_hook_form": ("State", "React Hook Form"),
+    "zod": ("State", "Zod"),
+    "pydantic": ("State", "Pydantic"),
+    "react_router": ("Framework", "React Router"),
+    "framer_motion": ("UI/CSS", "Framer Motion"),
+    "supabase_auth": ("Auth", "Supabase Auth"),
+    "firebase_auth": ("Auth", "Firebase Auth"),
+    "auth0": ("Auth", "Auth0"),
+    "clerk": ("Auth", "Clerk"),
+    "nextauth": ("Auth", "NextAuth.js"),
+    "postgresql": ("Database", "PostgreSQL"),
+    "mongodb": ("Database", "MongoDB"),
+    "mysql": ("Database", "MySQL"),
+    "sqlite": ("Database", "SQLite"),
+    "prisma": ("Database", "Prisma"),
+    "drizzle": ("Database", "Drizzle"),
+    "sqlalchemy": ("Database", "SQLAlchemy"),
+    "typeorm": ("Database", "TypeORM"),
+    "stripe": ("Payment", "Stripe"),
+    "lemon_squeezy": ("Payment", "Lemon Squeezy"),
+    "paddle": ("Payment", "Paddle"),
+    "resend": ("Email", "Resend"),
+    "sendgrid": ("Email", "SendGrid"),
+    "postmark": ("Email", "Postmark"),
+    "nodemailer": ("Email", "Nodemailer"),
+    "sentry": ("Monitoring", "Sentry"),
+    "posthog": ("Monitoring", "PostHog"),
+    "vitest": ("Testing", "Vitest"),
+    "jest": ("Testing", "Jest"),
+    "playwright": ("Testing", "Playwright"),
+    "cypress": ("Testing", "Cypress"),
+    "pytest": ("Testing", "pytest"),
+    "github_actions": ("CI/CD", "GitHub Actions"),
+    "docker": ("CI/CD", "Docker"),
+    "vercel": ("Hosting", "Vercel"),
+    "railway": ("Hosting", "Railway"),
+    "netlify": ("Hosting", "Netlify"),
+    "robots_txt": ("SEO", "robots.txt"),
+    "sitemap": ("SEO", "sitemap.xml"),
+    "og_meta": ("SEO", "OG meta tags"),
+    "ga4": ("SEO", "Google Analytics"),
+    "cors": ("Security", "CORS"),
+    "rate_limiting": ("Security", "Rate limiting"),
+    "jwt": ("Security", "JWT auth"),
+    "https_ssl": ("Security", "HTTPS/TLS"),
+    "webhook_signature": ("Security", "Webhook signature verification"),
+    "privacy_policy": ("SEO", "Privacy policy page"),
+    "terms_of_service": ("SEO", "Terms of service page"),
+    "structured_logging": ("Monitoring", "Structured logging"),
+    "health_check": ("Monitoring", "Health check endpoint"),
+}
+
+
+def iter_scan(root: Path, flags: dict[str, bool] | None = None) -> Iterator[dict]:
+    """Run a scan as events: ``signal`` per detection, ``checked`` per updated blueprint, a ``summary``.
+
+    Blueprint writes, the evidence index and the history record happen as in
+    :func:`run_scan`, which is built on this generator.
     """
-    signals = _build_detectors(root)
-    active = {k for k, v in signals.items() if v}
-
-    # Group detections for display
-    tech_stack: dict[str, list[str]] = {
-        "Framework": [],
-        "Language": [],
-        "Database": [],
-        "Auth": [],
-        "Payment": [],
-        "UI/CSS": [],
-        "State": [],
-        "Testing": [],
-        "Hosting": [],
-        "Email": [],
-        "Monitoring": [],
-        "CI/CD": [],
-        "SEO": [],
-        "Security": [],
-    }
-
-    _label_map = {
-        "react": ("Framework", "React"),
-        "nextjs": ("Framework", "Next.js"),
-        "vue": ("Framework", "Vue"),
-        "svelte": ("Framework", "Svelte"),
-        "angular": ("Framework", "Angular"),
-        "fastapi": ("Framework", "FastAPI"),
-        "django": ("Framework", "Django"),
-        "flask": ("Framework", "Flask"),
-        "express": ("Framework", "Express"),
-        "typescript": ("Language", "TypeScript"),
-        "python": ("Language", "Python"),
-        "tailwind": ("UI/CSS", "Tailwind CSS"),
-        "shadcn": ("UI/CSS", "shadcn/ui"),
-        "radix": ("UI/CSS", "Radix UI"),
-        "tanstack_query": ("State", "TanStack Query"),
-        "redux": ("State", "Redux"),
-        "zustand": ("State", "Zustand"),
-        "react_hook_form": ("State", "React Hook Form"),
-        "zod": ("State", "Zod"),
-        "pydantic": ("State", "Pydantic"),
-        "react_router": ("Framework", "React Router"),
-        "framer_motion": ("UI/CSS", "Framer Motion"),
-        "supabase_auth": ("Auth", "Supabase Auth"),
-        "firebase_auth": ("Auth", "Firebase Auth"),
-        "auth0": ("Auth", "Auth0"),
-        "clerk": ("Auth", "Clerk"),
-        "nextauth": ("Auth", "NextAuth.js"),
-        "postgresql": ("Database", "PostgreSQL"),
-        "mongodb": ("Database", "MongoDB"),
-        "mysql": ("Database", "MySQL"),
-        "sqlite": ("Database", "SQLite"),
-        "prisma": ("Database", "Prisma"),
-        "drizzle": ("Database", "Drizzle"),
-        "sqlalchemy": ("Database", "SQLAlchemy"),
-        "typeorm": ("Database", "TypeORM"),
-        "stripe": ("Payment", "Stripe"),
-        "lemon_squeezy": ("Payment", "Lemon Squeezy"),
-        "paddle": ("Payment", "Paddle"),
-        "resend": ("Email", "Resend"),
-        "sendgrid": ("Email", "SendGrid"),
-        "postmark": ("Email", "Postmark"),
-        "nodemailer": ("Email", "Nodemailer"),
-        "sentry": ("Monitoring", "Sentry"),
-        "posthog": ("Monitoring", "PostHog"),
-        "vitest": ("Testing", "Vitest"),
-        "jest": ("Testing", "Jest"),
-        "playwright": ("Testing", "Playwright"),
-        "cypress": ("Testing", "Cypress"),
-        "pytest": ("Testing", "pytest"),
-        "github_actions": ("CI/CD", "GitHub Actions"),
-        "docker": ("CI/CD", "Docker"),
-        "vercel": ("Hosting", "Vercel"),
-        "railway": ("Hosting", "Railway"),
-        "netlify": ("Hosting", "Netlify"),
-        "robots_txt": ("SEO", "robots.txt"),
-        "sitemap": ("SEO", "sitemap.xml"),
-        "og_meta": ("SEO", "OG meta tags"),
-        "ga4": ("SEO", "Google Analytics"),
-        "cors": ("Security", "CORS"),
-        "rate_limiting": ("Security", "Rate limiting"),
-        "jwt": ("Security", "JWT auth"),
-        "https_ssl": ("Security", "HTTPS/TLS"),
-        "webhook_signature": ("Security", "Webhook signature verification"),
-        "privacy_policy": ("SEO", "Privacy policy page"),
-        "terms_of_service": ("SEO", "Terms of service page"),
-        "structured_logging": ("Monitoring", "Structured logging"),
-        "health_check": ("Monitoring", "Health check endpoint"),
-    }
-
-    for sig in active:
-        if sig in _label_map:
-            cat, label = _label_map[sig]
-            if label not in tech_stack[cat]:
-                tech_stack[cat].append(label)
-
-    # Remove empty categories
-    tech_stack = {k: v for k, v in tech_stack.items() if v}
+    evidence = collect_evidence(root)
+    active = {k for k, v in evidence.items() if v is not None}
+    for sig, ev in sorted(evidence.items()):
+        if ev is None:
+            continue
+        category, label = SIGNAL_LABELS.get(sig, (None, None))
+        yield {"event": "signal", "signal": sig, "category": category, "label": label, "evidence": ev.to_dict()}
 
     # --- Apply rules to blueprint files ---
     bp_dir = root / "docs" / "blueprints"
-    checked_count: dict[str, int] = {}  # filename -> newly checked items
+    # filename -> {item text: signal}, rebuilt each scan: earlier auto-checks are
+    # kept only while the item is still checked and its signal still detected.
+    previous = index_auto_checked(load_scan_index(root))
+    auto_checked: dict[str, dict[str, str]] = {}
     total_newly_checked = 0
 
-    _check_done_re = re.compile(r"^\s*-\s*\[x\]\s+", re.IGNORECASE)
-    _check_todo_re = re.compile(r"^(\s*-\s*)\[\s\](\s+.+)$")
-
     # Group rules by blueprint
-    rules_by_bp: dict[str, list[str]] = {}
+    rules_by_bp: dict[str, list[tuple[str, str]]] = {}
     for signal, bp_file, substring in SCAN_RULES:
         if signal in active:
-            rules_by_bp.setdefault(bp_file, []).append(substring)
+            rules_by_bp.setdefault(bp_file, []).append((substring.lower(), signal))
 
-    for bp_file, substrings in rules_by_bp.items():
+    for bp_file, rules in rules_by_bp.items():
         bp_path = bp_dir / bp_file
-        text = _read(bp_path)
-        if not text:
+        bp = load_blueprint(bp_path, flags)
+        if bp is None:
             continue
 
-        lines = text.splitlines()
-        newly_checked = 0
-        condition_stack: list[bool] = []
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-
-            # Track condition markers
-            m_if = _CONDITION_IF.match(stripped)
-            if m_if:
-                flag_name = m_if.group(1)
-                if flags is not None:
-                    condition_stack.append(flags.get(flag_name, True))
-                else:
-                    condition_stack.append(True)
-                continue
-            if _CONDITION_ENDIF.match(stripped):
-                if condition_stack:
-                    condition_stack.pop()
-                continue
-
-            # Skip items in disabled condition blocks
-            if condition_stack and not all(condition_stack):
+        updates: dict[int, bool] = {}
+        newly: dict[str, str] = {}
+        kept = previous.get(bp_file, {})
+        for item in bp.active_items:
+            if item.done:
+                if kept.get(item.raw) in active:
+                    auto_checked.setdefault(bp_file, {})[item.raw] = kept[item.raw]
                 continue
-
-            # Skip already-checked items
-            if _check_done_re.match(line):
-                continue
-            m = _check_todo_re.match(line)
-            if not m:
-                continue
-            item_text = m.group(2).lower()
+            item_text = item.raw.lower()
             # Check if any substring matches
-            for sub in substrings:
-                if sub.lower() in item_text:
-                    lines[i] = f"{m.group(1)}[x]{m.group(2)}"
-                    newly_checked += 1
+            for sub, signal in rules:
+                if sub in item_text:
+                    updates[item.line] = True
+                    newly[item.raw] = signal
                     break  # Don't double-check same item
 
-        if newly_checked > 0:
-            out_text = "\n".join(lines)
-            if text.endswith("\n"):
-                out_text += "\n"
-            bp_path.parent.mkdir(parents=True, exist_ok=True)
-            bp_path.write_text(out_text, encoding="utf-8")
-            checked_count[bp_file] = newly_checked
-            total_newly_checked += newly_checked
+        if updates:
+            auto_checked.setdefault(bp_file, {}).update(newly)
+            new_text = bp.render(updates)
+            write_blueprint(bp_path, new_text)
+            record_write(root, bp_path, new_text, flags)
+            total_newly_checked += len(updates)
+            yield {"event": "checked", "blueprint": bp_file, "count": len(updates), "items": newly}
+
+    save_scan_index(root, evidence, auto_checked)
+
+    from mmu_cli.display import take_snapshot
+    from mmu_cli.history import append_record
+
+    append_record(root, take_snapshot(root, flags), "scan")
+    yield {"event": "summary", "signals": len(active), "newly_checked": total_newly_checked, "exit_code": 0}
+
+
+def run_scan(root: Path, flags: dict[str, bool] | None = None) -> dict:
+    """Scan codebase and return detection results + auto-check counts.
+
+    When *flags* is provided, items inside disabled ``<!-- if:flag -->``
+    blocks are **not** auto-checked, preventing false-pass score inflation.
+
+    Evidence for every signal, plus which signal auto-checked which item, is
+    persisted to ``.mmu/scan_index.json`` (see :func:`save_scan_index`).
+    """
+    tech_stack: dict[str, list[str]] = {category: [] for category in TECH_CATEGORIES}
+    evidence: dict[str, dict] = {}
+    checked_count: dict[str, int] = {}  # filename -> newly checked items
+    total_newly_checked = 0
+    for event in iter_scan(root, flags):
+        if event["event"] == "signal":
+            evidence[event["signal"]] = event["evidence"]
+            category, label = event["category"], event["label"]
+            if category and label not in tech_stack[category]:
+                tech_stack[category].append(label)
+        elif event["event"] == "checked":
+            checked_count[event["blueprint"]] = event["count"]
+        else:
+            total_newly_checked = event["newly_checked"]
 
     return {
-        "tech_stack": tech_stack,
-        "active_signals": sorted(active),
+        "tech_stack": {k: v for k, v in tech_stack.items() if v},  # drop empty categories
+        "active_signals": sorted(evidence),
+        "evidence": evidence,
         "checked_count": checked_count,
         "total_newly_checked": total_newly_checked,
     }
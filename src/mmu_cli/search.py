@@ -0,0 +1,228 @@
+"""`mmu search` — BM25 full-text search over blueprints and checklists.
+
+Indexed: ``docs/blueprints/**/*.md``, ``docs/checklists/*.md`` and
+``docs/core/*.md``. Every checkbox item is one document; the prose of each
+heading section (heading included) is another. Each file keeps its own
+postings (token → [(doc, term frequency)]) plus its document count and total
+length, so a query only looks up its own tokens per file and a changed file
+is re-tokenized alone.
+
+The index is built lazily on the first search, persisted to
+``.mmu/cache/search_index.json`` (only when ``.mmu/`` exists, like every
+cache) and kept in memory for long-lived processes such as the MCP server.
+Files are revalidated by (mtime, size) on every lookup.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from mmu_cli.cache import load_json, save_json
+
+CACHE_NAME = "search_index.json"
+CACHE_VERSION = 1  # bump when tokenization changes
+K1 = 1.2
+B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+_ITEM_RE = re.compile(r"^\s*-\s*\[(?:x|X|\s)\]\s+(.+)$")
+# Crude suffix folding so "idempotency" finds "idempotent"; applied to both sides.
+_SUFFIXES = ("ations", "ation", "encies", "ency", "ences", "ence", "ents", "ent", "ings", "ing", "ies", "ied", "ed", "es", "s")
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "is",
+    "it", "its", "of", "on", "or", "that", "the", "this", "to", "was", "were", "will", "with",
+})
+
+
+def stem(token: str) -> str:
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 4 and not token.endswith("ss"):
+            return token[: -len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased, stemmed word tokens with stopwords dropped."""
+    return [stem(token) for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def index_paths(root: Path) -> list[Path]:
+    docs = root / "docs"
+    paths = sorted((docs / "blueprints").rglob("*.md"))
+    paths += sorted((docs / "checklists").glob("*.md"))
+    paths += sorted((docs / "core").glob("*.md"))
+    return [p for p in paths if p.is_file()]
+
+
+def index_file(text: str) -> dict[str, Any]:
+    """Per-file index entry: docs as [kind, line, section, text, length] and postings."""
+    docs: list[list[Any]] = []
+    postings: dict[str, list[list[int]]] = {}
+    section = ""
+    prose: list[str] = []
+    prose_line = 0
+
+    def add(kind: str, line: int, body: str, tokens: list[str]) -> None:
+        if not tokens:
+            return
+        doc = len(docs)
+        docs.append([kind, line, section, body, len(tokens)])
+        for token, tf in Counter(tokens).items():
+            postings.setdefault(token, []).append([doc, tf])
+
+    def flush() -> None:
+        if prose:
+            add("section", prose_line, section, tokenize(" ".join(prose)))
+
+    for i, line in enumerate(text.splitlines()):
+        hm = _HEADING_RE.match(line)
+        if hm:
+            flush()
+            section = hm.group(1).strip()
+            prose, prose_line = [section], i
+            continue
+        im = _ITEM_RE.match(line)
+        if im:
+            body = re.sub(r"<!--.*?-->", "", im.group(1)).strip()
+            add("item", i, body, tokenize(section + " " + body))
+        elif line.strip():
+            prose.append(line.strip())
+    flush()
+    return {
+        "docs": docs,
+        "postings": postings,
+        "length": sum(doc[4] for doc in docs),
+    }
+
+
+@dataclass
+class Hit:
+    path: Path
+    kind: str  # "item" | "section"
+    line: int  # 0-based
+    section: str
+    text: str
+    score: float
+
+
+class SearchIndex:
+    """Per-file postings for one project root; see the module docstring."""
+
+    def __init__(self, root: Path, files: dict[str, Any] | None = None) -> None:
+        self.root = root
+        self.files: dict[str, Any] = files or {}
+
+    def refresh(self) -> bool:
+        """Re-index files whose (mtime, size) changed; drop vanished ones. True if anything changed."""
+        dirty = False
+        seen = set()
+        for path in index_paths(self.root):
+            rel = path.relative_to(self.root).as_posix()
+            seen.add(rel)
+            try:
+                st = path.stat()
+                sig = [st.st_mtime_ns, st.st_size]
+                entry = self.files.get(rel)
+                if entry is not None and entry.get("sig") == sig:
+                    continue
+                text = path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            self.files[rel] = {"sig": sig, **index_file(text)}
+            dirty = True
+        for rel in [rel for rel in self.files if rel not in seen]:
+            del self.files[rel]
+            dirty = True
+        return dirty
+
+    def search(self, query: str, limit: int = 10) -> list[Hit]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        n_docs = sum(len(entry["docs"]) for entry in self.files.values())
+        if not n_docs:
+            return []
+        avgdl = sum(entry["length"] for entry in self.files.values()) / n_docs
+        df = {t: sum(len(entry["postings"].get(t, ())) for entry in self.files.values()) for t in terms}
+        idf = {t: math.log(1 + (n_docs - df[t] + 0.5) / (df[t] + 0.5)) for t in terms if df[t]}
+
+        scored: list[tuple[float, str, int]] = []
+        for rel, entry in self.files.items():
+            docs = entry["docs"]
+            scores: dict[int, float] = {}
+            for term, weight in idf.items():
+                for doc, tf in entry["postings"].get(term, ()):
+                    norm = K1 * (1 - B + B * docs[doc][4] / avgdl)
+                    scores[doc] = scores.get(doc, 0.0) + weight * tf * (K1 + 1) / (tf + norm)
+            scored.extend((score, rel, doc) for doc, score in scores.items())
+        scored.sort(key=lambda s: (-s[0], s[1], s[2]))
+
+        hits = []
+        for score, rel, doc in scored[:limit]:
+            kind, line, section, text, _ = self.files[rel]["docs"][doc]
+            hits.append(Hit(self.root / rel, kind, line, section, text, score))
+        return hits
+
+
+# root -> index, for processes that search more than once (MCP server).
+_MEMO: dict[Path, SearchIndex] = {}
+
+
+def load_index(root: Path) -> SearchIndex:
+    """The up-to-date index for *root*: from memory, else ``.mmu/cache``, else built."""
+    index = _MEMO.get(root)
+    if index is None:
+        cached = load_json(root, CACHE_NAME)
+        files = cached.get("files") if cached.get("version") == CACHE_VERSION else None
+        index = SearchIndex(root, files if isinstance(files, dict) else None)
+        _MEMO[root] = index
+    if index.refresh():
+        save_json(root, CACHE_NAME, {"version": CACHE_VERSION, "files": index.files})
+    return index
+
+
+def search(root: Path, query: str, limit: int = 10, flags: dict[str, bool] | None = None) -> list[dict[str, Any]]:
+    """Ranked results as dicts. Core blueprint items carry the number `mmu check` takes
+    under *flags* (None when the item sits in a disabled section)."""
+    from mmu_cli.blueprint import load_blueprint
+    from mmu_cli.display import BLUEPRINT_NAMES
+
+    bp_dir = root / "docs" / "blueprints"
+    results = []
+    for hit in load_index(root).search(query, limit):
+        result: dict[str, Any] = {
+            "path": hit.path.relative_to(root).as_posix(),
+            "kind": hit.kind,
+            "line": hit.line + 1,
+            "section": hit.section,
+            "text": hit.text,
+            "score": round(hit.score, 3),
+        }
+        if hit.kind == "item" and hit.path.parent == bp_dir and hit.path.name in BLUEPRINT_NAMES:
+            bp = load_blueprint(hit.path, flags)
+            item = next((i for i in bp.items if i.line == hit.line), None) if bp else None
+            number = item.number if item is not None and item.active else None
+            key = BLUEPRINT_NAMES[hit.path.name].lower().replace(" & ", "-").replace(" ", "-")
+            result["number"] = number
+            result["check"] = f"mmu check {key} {number}" if number else None
+        results.append(result)
+    return results
+
+
+def format_results(query: str, results: list[dict[str, Any]]) -> list[str]:
+    if not results:
+        return [f"No matches for {query!r}."]
+    lines = [f"Search: {query!r} — {len(results)} result(s)", ""]
+    for i, r in enumerate(results, 1):
+        where = f"{r['path']}:{r['line']}"
+        lines.append(f"  {i:>2}. {r['text']}")
+        lines.append(f"      {where}" + (f"  § {r['section']}" if r["section"] and r["kind"] == "item" else ""))
+        if r.get("check"):
+            lines.append(f"      ↳ {r['check']}")
+    return lines
@@ -0,0 +1,196 @@
+"""Persisted checklist progress in ``.mmu/state.json``.
+
+Status-style commands (`mmu status`, `next`, `badge`, `share`) only need
+per-item done flags, not the markdown itself. The state file keeps them per
+source file together with the file's stat signature, content hash and the
+feature-flags hash they were computed under, plus when the file was read.
+Readers trust an entry while the stat signature matches and the file's
+mtime is well before that read; otherwise they re-hash the file (a touched
+but unchanged file stays valid) and only then fall back to parsing. As in
+git's "racy" check, a file modified within :data:`RACY_NS` of being read
+could change again in the same timestamp tick without changing size (a
+``[ ]`` flipped to ``[x]``), so its signature alone is not enough.
+``mmu check`` and ``mmu scan`` refresh the entries of files they rewrite.
+
+Like the caches, the file is written only when ``.mmu/`` already exists.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from mmu_cli.blueprint import Blueprint, parse_blueprint
+from mmu_cli.cache import atomic_write, content_hash
+
+STATE_PATH = ".mmu/state.json"
+STATE_VERSION = 1
+RACY_NS = 2_000_000_000  # mtime granularity to allow for (FAT: 2 s, ext3/HFS+: 1 s)
+
+
+@dataclass
+class FileProgress:
+    """Progress of one checklist file under one set of feature flags."""
+
+    items: list[tuple[bool, int, str]] = field(default_factory=list)  # active items: (done, priority, text)
+    skipped: int = 0
+    stages: list[tuple[str, int, int]] = field(default_factory=list)  # (stage_label, done, total)
+    groups: list[int] = field(default_factory=list)  # per active item: ordinal of its ``## `` section
+    links: list[tuple[int, str, tuple[str, ...]]] = field(default_factory=list)  # annotated items: (index, id, after)
+
+    @property
+    def done(self) -> int:
+        return sum(1 for done, _, _ in self.items if done)
+
+    @property
+    def total(self) -> int:
+        return len(self.items)
+
+    @classmethod
+    def from_blueprint(cls, bp: Blueprint) -> FileProgress:
+        section_lines = [section.line for section in bp.sections]
+        return cls(
+            items=[(item.done, item.priority, item.text) for item in bp.active_items],
+            skipped=bp.skipped,
+            stages=bp.stage_counts(),
+            groups=[bisect.bisect(section_lines, item.line) for item in bp.active_items],
+            links=[
+                (idx, item.id, item.after)
+                for idx, item in enumerate(bp.active_items)
+                if item.id or item.after
+            ],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "items": [[int(done), priority, text] for done, priority, text in self.items],
+            "skipped": self.skipped,
+            "stages": [list(stage) for stage in self.stages],
+            "groups": self.groups,
+            "links": [[idx, item_id, list(after)] for idx, item_id, after in self.links],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FileProgress:
+        return cls(
+            items=[(bool(done), int(priority), str(text)) for done, priority, text in data["items"]],
+            skipped=int(data["skipped"]),
+            stages=[(str(label), int(done), int(total)) for label, done, total in data["stages"]],
+            groups=[int(group) for group in data["groups"]],
+            links=[(int(idx), str(item_id), tuple(map(str, after))) for idx, item_id, after in data["links"]],
+        )
+
+
+def flags_hash(flags: dict[str, bool] | None) -> str:
+    if flags is None:
+        return "-"
+    blob = json.dumps(sorted(flags.items()), separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(blob, digest_size=8).hexdigest()
+
+
+def _rel(path: Path, root: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def load_state(root: Path) -> dict[str, Any]:
+    try:
+        data = json.loads((root / STATE_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_state(root: Path, files: dict[str, Any]) -> bool:
+    if not (root / ".mmu").is_dir():
+        return False
+    data = {"version": STATE_VERSION, "files": files}
+    try:
+        atomic_write(root / STATE_PATH, json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    except OSError:
+        return False
+    return True
+
+
+def _settled(entry: dict[str, Any], mtime_ns: int) -> bool:
+    """Whether the file was read long enough after its mtime that a same-tick rewrite is ruled out."""
+    seen = entry.get("seen")
+    return isinstance(seen, int) and seen - mtime_ns >= RACY_NS
+
+
+def _entry(
+    path: Path, data: bytes, flags: dict[str, bool] | None, fhash: str, seen: int
+) -> tuple[dict[str, Any], FileProgress]:
+    st = path.stat()
+    progress = FileProgress.from_blueprint(parse_blueprint(path, data.decode("utf-8", errors="replace"), flags))
+    entry = {"sig": [st.st_mtime_ns, st.st_size], "hash": content_hash(data), "flags": fhash, "seen": seen}
+    entry.update(progress.to_dict())
+    return entry, progress
+
+
+def progress_for(root: Path, paths: list[Path], flags: dict[str, bool] | None = None) -> dict[Path, FileProgress]:
+    """Progress for every existing file in *paths*, from the state file when it is current."""
+    files = load_state(root)
+    fhash = flags_hash(flags)
+    dirty = False
+    out: dict[Path, FileProgress] = {}
+
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        rel = _rel(path, root)
+        entry = files.get(rel)
+        if not isinstance(entry, dict) or entry.get("flags") != fhash:
+            entry = None
+        if entry is not None and entry.get("sig") == [st.st_mtime_ns, st.st_size] and _settled(entry, st.st_mtime_ns):
+            try:
+                out[path] = FileProgress.from_dict(entry)
+                continue
+            except (KeyError, TypeError, ValueError):
+                pass
+        seen = time.time_ns()
+        try:
+            data = path.read_bytes()
+        except OSError:
+            out[path] = FileProgress()
+            continue
+        if entry is not None and entry.get("hash") == content_hash(data):
+            try:
+                out[path] = FileProgress.from_dict(entry)
+                sig = [st.st_mtime_ns, st.st_size]
+                if entry.get("sig") != sig or _settled({"seen": seen}, st.st_mtime_ns):
+                    entry["sig"], entry["seen"] = sig, seen
+                    dirty = True
+                continue
+            except (KeyError, TypeError, ValueError):
+                pass
+        files[rel], out[path] = _entry(path, data, flags, fhash, seen)
+        dirty = True
+
+    if dirty:
+        save_state(root, files)
+    return out
+
+
+def record_write(root: Path, path: Path, text: str, flags: dict[str, bool] | None = None) -> None:
+    """Refresh the state entry of a checklist file this process just rewrote."""
+    if not (root / ".mmu").is_dir():
+        return
+    files = load_state(root)
+    try:
+        files[_rel(path, root)], _ = _entry(path, text.encode("utf-8"), flags, flags_hash(flags), time.time_ns())
+    except OSError:
+        return
+    save_state(root, files)
@@ -0,0 +1,211 @@
+"""Chrome trace-event export: ``MMU_TRACE=trace.json mmu <command>``.
+
+With ``MMU_TRACE`` set, :func:`span` records one complete (``"ph": "X"``)
+event per timed block — argument parsing, config load, the code file walk,
+each file read and vibecheck check, blueprint parsing, rendering, LLM and
+HTTP calls — and :func:`finish` writes them as a trace-event JSON object
+that chrome://tracing and https://ui.perfetto.dev open directly.
+Timestamps are microseconds on the monotonic clock, which every process
+shares, so pool workers line up with their parent.
+
+Pool workers (``fleet``, ``status --roots-file``) inherit ``MMU_TRACE``.
+Each appends its events to ``<trace>.part-<pid>`` whenever its outermost
+span ends, and the parent folds those part files into the trace and deletes
+them when it finishes.
+
+Tracing is off unless the variable is set; a disabled :func:`span` returns
+a shared no-op object, so instrumented code pays one attribute check.
+"""
+
+from __future__ import annotations
+
+import _thread
+import os
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+ENV = "MMU_TRACE"
+PARENT_ENV = "MMU_TRACE_PARENT"  # pid of the process that writes the trace
+PART_SUFFIX = ".part-"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+enabled = False
+_path = ""
+_events: list[dict[str, Any]] = []
+_local = _thread._local()
+_finished = False
+
+
+def configure(path: str | None) -> None:
+    """Start (or, with None, stop) recording for a trace written to *path*."""
+    global enabled, _path, _finished
+    enabled = bool(path)
+    _path = os.path.abspath(path) if path else ""
+    _finished = False
+    _events.clear()
+
+
+def _now() -> int:
+    return time.perf_counter_ns() // 1000
+
+
+def is_worker() -> bool:
+    """Whether another process owns the trace (pool workers, ``mmu`` started by ``mmu``)."""
+    return os.environ.get(PARENT_ENV, str(os.getpid())) != str(os.getpid())
+
+
+class _Span:
+    __slots__ = ("args", "cat", "name", "start")
+
+    def __init__(self, name: str, cat: str, args: dict[str, Any]) -> None:
+        self.name, self.cat, self.args = name, cat, args
+        self.start = 0
+
+    def __enter__(self) -> _Span:
+        _local.depth = getattr(_local, "depth", 0) + 1
+        self.start = _now()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        end = _now()
+        _local.depth -= 1
+        event = {
+            "name": self.name, "cat": self.cat, "ph": "X", "ts": self.start, "dur": end - self.start,
+            "pid": os.getpid(), "tid": _thread.get_native_id(),
+        }
+        if self.args:
+            event["args"] = self.args
+        _events.append(event)
+        if _local.depth == 0 and is_worker():
+            _flush_part()
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoSpan:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str, cat: str = "mmu", **args: Any) -> _Span | _NoSpan:
+    """Context manager timing one block; *args* show up in the trace viewer."""
+    return _Span(name, cat, args) if enabled else _NO_SPAN
+
+
+def traced(name: str, cat: str = "mmu") -> Callable[[F], F]:
+    """Decorator form of :func:`span`."""
+    import functools
+
+    def wrap(fn: F) -> F:
+        @functools.wraps(fn)
+        def inner(*args: Any, **kwargs: Any) -> Any:
+            if not enabled:
+                return fn(*args, **kwargs)
+            with _Span(name, cat, {}):
+                return fn(*args, **kwargs)
+
+        return inner  # type: ignore[return-value]
+
+    return wrap
+
+
+def _metadata(label: str) -> list[dict[str, Any]]:
+    pid = os.getpid()
+    return [
+        {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": label}},
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": _thread.get_native_id(), "args": {"name": "main"}},
+    ]
+
+
+def _flush_part() -> None:
+    """Worker side: append buffered events to this process's part file."""
+    import json
+
+    path = f"{_path}{PART_SUFFIX}{os.getpid()}"
+    header = [] if os.path.exists(path) else _metadata("mmu worker")
+    try:
+        with open(path, "a", encoding="utf-8") as fh:
+            for event in header + _events:
+                fh.write(json.dumps(event) + "\n")
+    except OSError:
+        pass  # a worker never fails a command over its trace
+    _events.clear()
+
+
+def _after_fork() -> None:
+    # Forked pool workers start with the parent's buffer and span depth.
+    _events.clear()
+    _local.depth = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def start(argv: list[str]) -> None:
+    """Parent side: claim the trace for this process and label it."""
+    os.environ[PARENT_ENV] = str(os.getpid())
+    _events.extend(_metadata("mmu " + " ".join(argv)))
+
+
+def _read_parts() -> list[dict[str, Any]]:
+    import json
+
+    directory, base = os.path.split(_path)
+    events = []
+    try:
+        names = [n for n in os.listdir(directory) if n.startswith(base + PART_SUFFIX)]
+    except OSError:
+        return []
+    for name in sorted(names):
+        part = os.path.join(directory, name)
+        try:
+            with open(part, encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        events.append(json.loads(line))
+                    except ValueError:
+                        continue  # a worker killed mid-write
+            os.remove(part)
+        except OSError:
+            continue
+    return events
+
+
+def finish() -> str | None:
+    """Write the trace (own events plus workers' part files); return its path."""
+    global _finished
+    import json
+
+    if not enabled or _finished or is_worker():
+        return None
+    _finished = True
+    from mmu_cli import __version__
+
+    trace = {
+        "traceEvents": _events + _read_parts(),
+        "displayTimeUnit": "ms",
+        "otherData": {"mmu_version": __version__},
+    }
+    try:
+        with open(_path, "w", encoding="utf-8") as fh:
+            json.dump(trace, fh)
+    except OSError as exc:
+        import sys
+
+        print(f"Cannot write {ENV} trace {_path}: {exc}", file=sys.stderr)
+        return None
+    finally:
+        os.environ.pop(PARENT_ENV, None)
+    return _path
+
+
+configure(os.environ.get(ENV))
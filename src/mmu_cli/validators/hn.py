@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from mmu_cli import trace
+
 ALGOLIA_URL = "https://hn.algolia.com/api/v1/search"
 USER_AGENT = "make-me-unicorn-validator/0.6"
 
@@ -30,6 +32,7 @@ def parse_hits(payload: dict[str, Any]) -> list[dict[str, Any]]:
     return hits
 
 
+@trace.traced("http.hn_search", "http")
 def search_hn(query: str, limit: int = 30) -> list[dict[str, Any]]:
     if limit <= 0:
         return []
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from mmu_cli import trace
+
 REDDIT_SEARCH_URL = "https://www.reddit.com/search.json"
 USER_AGENT = "make-me-unicorn-validator/0.7 (+https://github.com/minjikim89/make-me-unicorn)"
 
@@ -28,6 +30,7 @@ def parse_listing(payload: dict[str, Any]) -> list[dict[str, Any]]:
     return threads
 
 
+@trace.traced("http.reddit_search", "http")
 def search_reddit(query: str, limit: int = 30) -> list[dict[str, Any]]:
     if limit <= 0:
         return []
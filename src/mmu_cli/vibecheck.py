@@ -7,14 +7,27 @@ debug mode left on, no error monitoring.
 
 Severities: P0 findings exit non-zero (block launch), P1 findings warn.
 Checks that find no relevant surface (e.g. no webhook handlers) report SKIP.
+
+Every code file is read once: :func:`scan_files` records what each check
+needs into a mergeable :class:`Partial`, and :func:`finalize` turns the
+merged evidence into findings, so a project can also be scanned in chunks
+(see `mmu fleet vibecheck`). In a git work tree with a ``.mmu/`` directory,
+what each file contained is remembered by blob SHA (:class:`FileFacts`), so
+unchanged files are not read again.
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
+from mmu_cli import trace
+from mmu_cli.cache import cache_dir, git_blobs, load_json, save_json
+from mmu_cli.index import ProjectIndex, load_index
+from mmu_cli.manifests import load_manifests
+
 # Conservative secret signatures: prefixes that only appear in real
 # credentials, not in placeholder-style docs (`sk_live_...` etc. with
 # enough trailing payload to rule out truncated examples).
@@ -76,18 +89,19 @@ class Finding:
         return asdict(self)
 
 
-# Per-run content cache: several checks scan the same files; one read each.
-# Cleared at the start of run_vibecheck so long-lived processes stay fresh.
-_READ_CACHE: dict[Path, str] = {}
+# Checks that sample the codebase look at the first SAMPLE_LIMIT code files
+# (AUTH_SAMPLE auth files for password reset) in sorted path order. Indices are
+# global per project, so chunked scans merge to the same answer as one pass.
+SAMPLE_LIMIT = 400
+AUTH_SAMPLE = 200
+MAX_READ = 2_000_000
 
 
 def _read(path: Path) -> str:
-    if path not in _READ_CACHE:
-        try:
-            _READ_CACHE[path] = path.read_bytes()[:2_000_000].decode("utf-8", errors="ignore")
-        except OSError:
-            _READ_CACHE[path] = ""
-    return _READ_CACHE[path]
+    try:
+        return path.read_bytes()[:MAX_READ].decode("utf-8", errors="ignore")
+    except OSError:
+        return ""
 
 
 def _rel(path: Path, root: Path) -> str:
@@ -97,19 +111,240 @@ def _rel(path: Path, root: Path) -> str:
         return str(path)
 
 
-def check_secrets(root: Path, code_files: list[Path]) -> Finding:
-    offenders: list[str] = []
-    details: list[str] = []
-    env_file = root / ".env"
-    for path in code_files:
-        text = _read(path)
-        if not text:
+def _min(a: int | None, b: int | None) -> int | None:
+    return b if a is None else a if b is None else min(a, b)
+
+
+@dataclass
+class Partial:
+    """Per-file evidence for some of one project's code files.
+
+    Built by :func:`scan_files` (the map step), combined with :meth:`merge`
+    (presence flags OR, offender lists union, first-hit indices min) and
+    turned into findings by :func:`finalize`. File entries are
+    ``(global_index, rel)`` pairs.
+    """
+
+    secrets: list[tuple[int, str, str]] = field(default_factory=list)  # (index, rel, signature label)
+    auth: list[tuple[int, str, bool]] = field(default_factory=list)  # (index, rel, has reset marker)
+    webhooks: list[tuple[int, str]] = field(default_factory=list)
+    webhook_signature: bool = False
+    webhook_idempotency: bool = False
+    server_hint: int | None = None  # first sampled index mentioning a server framework
+    rate_limit: int | None = None  # first sampled index with a rate limiting marker
+    cors: list[tuple[int, str]] = field(default_factory=list)
+    sql: list[tuple[int, str]] = field(default_factory=list)
+    debug: list[tuple[int, str]] = field(default_factory=list)
+    monitoring: bool = False
+    files: int = 0
+
+    def merge(self, other: Partial) -> Partial:
+        return Partial(
+            secrets=sorted(self.secrets + other.secrets),
+            auth=sorted(self.auth + other.auth),
+            webhooks=sorted(self.webhooks + other.webhooks),
+            webhook_signature=self.webhook_signature or other.webhook_signature,
+            webhook_idempotency=self.webhook_idempotency or other.webhook_idempotency,
+            server_hint=_min(self.server_hint, other.server_hint),
+            rate_limit=_min(self.rate_limit, other.rate_limit),
+            cors=sorted(self.cors + other.cors),
+            sql=sorted(self.sql + other.sql),
+            debug=sorted(self.debug + other.debug),
+            monitoring=self.monitoring or other.monitoring,
+            files=self.files + other.files,
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Partial:
+        return cls(
+            secrets=[(int(i), str(r), str(label)) for i, r, label in data.get("secrets", [])],
+            auth=[(int(i), str(r), bool(reset)) for i, r, reset in data.get("auth", [])],
+            webhooks=[(int(i), str(r)) for i, r in data.get("webhooks", [])],
+            webhook_signature=bool(data.get("webhook_signature")),
+            webhook_idempotency=bool(data.get("webhook_idempotency")),
+            server_hint=data.get("server_hint"),
+            rate_limit=data.get("rate_limit"),
+            cors=[(int(i), str(r)) for i, r in data.get("cors", [])],
+            sql=[(int(i), str(r)) for i, r in data.get("sql", [])],
+            debug=[(int(i), str(r)) for i, r in data.get("debug", [])],
+            monitoring=bool(data.get("monitoring")),
+            files=int(data.get("files", 0)),
+        )
+
+
+_DEBUG_TRUE = re.compile(r"^\s*DEBUG\s*=\s*True\b", re.MULTILINE)
+
+# What :func:`scan_files` looks for in a file depends on its path and index.
+_AUTH_FILE, _WEBHOOK_FILE, _SAMPLED, _PYTHON = 1, 2, 4, 8
+
+# What it found: one bit per marker (a secret signature is kept as its label).
+_RESET, _SIGNATURE, _IDEMPOTENCY, _EMPTY, _SERVER, _RATE_LIMIT, _CORS, _MONITORING, _SQL, _DEBUG = (
+    1 << bit for bit in range(10)
+)
+
+
+def _file_facts(text: str, need: int) -> tuple[int, str]:
+    """(marker bits, secret label or "") for one file's *text*."""
+    from mmu_cli.cli import WEBHOOK_IDEMPOTENCY_MARKERS, WEBHOOK_SIGNATURE_MARKERS
+
+    lower = text.lower()
+    found = 0
+    if need & _AUTH_FILE and any(m in lower for m in _RESET_MARKERS):
+        found |= _RESET
+    if need & _WEBHOOK_FILE:
+        if any(m in lower for m in WEBHOOK_SIGNATURE_MARKERS):
+            found |= _SIGNATURE
+        if any(m in lower for m in WEBHOOK_IDEMPOTENCY_MARKERS):
+            found |= _IDEMPOTENCY
+    if not text:
+        return found | _EMPTY, ""
+    secret = next((label for label, pattern in _SECRET_PATTERNS if pattern.search(text)), "")
+    if need & _SAMPLED:
+        if any(h in lower for h in _SERVER_HINTS):
+            found |= _SERVER
+        if any(m in lower for m in _RATE_LIMIT_MARKERS):
+            found |= _RATE_LIMIT
+        if any(m in lower for m in _CORS_WILDCARD_MARKERS):
+            found |= _CORS
+        if any(m in lower for m in _MONITORING_MARKERS):
+            found |= _MONITORING
+    if need & _PYTHON:
+        if _SQL_FSTRING.search(text):
+            found |= _SQL
+        if _DEBUG_TRUE.search(text):
+            found |= _DEBUG
+    return found, secret
+
+
+FACTS_CACHE = "vibecheck.json"
+FACTS_VERSION = 1  # bump when the markers or patterns above change
+FACTS_LIMIT = 100_000  # entries kept; the least recently used go first
+
+
+class FileFacts:
+    """Per-file scan results in ``.mmu/cache/vibecheck.json``, keyed by git blob SHA.
+
+    Only files git reports as unmodified have a blob SHA, so an entry holds
+    wherever that content is checked out — a fresh CI checkout restored with
+    `mmu cache import` included — and untracked or edited files are always
+    read.
+
+    A save keeps the entries a scan did not use, since a ``--shard k/N`` scan
+    uses only its slice of an imported cache, and the next export must still
+    carry the rest. Entries are ordered by recency: those this scan used, then
+    unused ones for blobs still in the tree, then the others. The cache is cut
+    to :data:`FACTS_LIMIT` entries from the stale end.
+    """
+
+    def __init__(self, root: Path, blobs: dict[str, str], entries: dict) -> None:
+        self.root = root
+        self.blobs = blobs
+        self.entries = entries
+        self.used: dict[str, list] = {}
+        self.added = 0
+
+    @classmethod
+    def load(cls, root: Path) -> FileFacts | None:
+        """The cache for *root*; None unless ``.mmu/`` exists and *root* is in a git work tree."""
+        if cache_dir(root) is None:
+            return None
+        blobs = git_blobs(root)
+        if not blobs:
+            return None
+        cached = load_json(root, FACTS_CACHE)
+        entries = cached.get("files") if cached.get("version") == FACTS_VERSION else None
+        return cls(root, blobs, entries if isinstance(entries, dict) else {})
+
+    def get(self, rel: str, need: int) -> tuple[int, str] | None:
+        sha = self.blobs.get(rel)
+        if sha is None:
+            return None
+        key = f"{sha}:{need}"
+        entry = self.entries.get(key)
+        if not (isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], int) and isinstance(entry[1], str)):
+            return None
+        self.used[key] = entry
+        return entry[0], entry[1]
+
+    def put(self, rel: str, need: int, facts: tuple[int, str]) -> None:
+        sha = self.blobs.get(rel)
+        if sha is not None:
+            self.used[f"{sha}:{need}"] = list(facts)
+            self.added += 1
+
+    def save(self) -> None:
+        if not self.added:
+            return
+        current = set(self.blobs.values())
+        unused = [(key, entry) for key, entry in self.entries.items() if key not in self.used]
+        kept = [item for item in unused if item[0].split(":", 1)[0] in current]
+        kept += [item for item in unused if item[0].split(":", 1)[0] not in current]
+        files = dict(self.used)
+        files.update(kept[:max(FACTS_LIMIT - len(files), 0)])
+        save_json(self.root, FACTS_CACHE, {"version": FACTS_VERSION, "files": files})
+
+
+def scan_files(root: Path, files: Iterable[tuple[int, str]], facts: FileFacts | None = None) -> Partial:
+    """Map step: read each ``(global_index, rel)`` file once and record what every check needs.
+
+    Files *facts* already knows by blob SHA are not read at all.
+    """
+    from mmu_cli.cli import is_webhook_rel
+
+    part = Partial()
+    for index, rel in files:
+        part.files += 1
+        rel_lower = rel.lower()
+        need = (
+            (_AUTH_FILE if any(h in rel_lower for h in _AUTH_FILE_HINTS) else 0)
+            | (_WEBHOOK_FILE if is_webhook_rel(rel) else 0)
+            | (_SAMPLED if index < SAMPLE_LIMIT else 0)
+            | (_PYTHON if rel_lower.endswith(".py") else 0)
+        )
+        known = facts.get(rel, need) if facts is not None else None
+        if known is None:
+            with trace.span("read", "io", file=rel):
+                text = _read(root / rel)
+            known = _file_facts(text, need)
+            if facts is not None:
+                facts.put(rel, need, known)
+        found, secret = known
+        if need & _AUTH_FILE:
+            part.auth.append((index, rel, bool(found & _RESET)))
+        if need & _WEBHOOK_FILE:
+            part.webhooks.append((index, rel))
+            part.webhook_signature = part.webhook_signature or bool(found & _SIGNATURE)
+            part.webhook_idempotency = part.webhook_idempotency or bool(found & _IDEMPOTENCY)
+        if found & _EMPTY:
             continue
-        for label, pattern in _SECRET_PATTERNS:
-            if pattern.search(text):
-                offenders.append(_rel(path, root))
-                details.append(label)
-                break
+        if secret:
+            part.secrets.append((index, rel, secret))
+        if found & _SERVER and part.server_hint is None:
+            part.server_hint = index
+        if found & _RATE_LIMIT and part.rate_limit is None:
+            part.rate_limit = index
+        if found & _CORS:
+            part.cors.append((index, rel))
+        if found & _MONITORING:
+            part.monitoring = True
+        if found & _SQL:
+            part.sql.append((index, rel))
+        if found & _DEBUG:
+            part.debug.append((index, rel))
+    return part
+
+
+def _scan_paths(root: Path, code_files: list[Path]) -> Partial:
+    return scan_files(root, ((i, _rel(p, root)) for i, p in enumerate(code_files)))
+
+
+def _secrets_finding(root: Path, part: Partial) -> Finding:
+    offenders = [rel for _, rel, _ in part.secrets]
+    details = [label for _, _, label in part.secrets]
+    env_file = root / ".env"
     if env_file.is_file():
         gitignore = _read(root / ".gitignore")
         ignored = any(line.strip() in {".env", "*.env", ".env*"} for line in gitignore.splitlines())
@@ -128,17 +363,12 @@ def check_secrets(root: Path, code_files: list[Path]) -> Finding:
     return Finding("secrets", "P0", "ok", "no hardcoded secret signatures detected")
 
 
-def check_webhooks(root: Path, code_files: list[Path]) -> list[Finding]:
-    from mmu_cli.cli import check_webhook_safety, detect_webhook_files
-
-    webhook_files = detect_webhook_files(root, code_files)
-    if not webhook_files:
+def _webhook_findings(part: Partial) -> list[Finding]:
+    if not part.webhooks:
         return [Finding("webhook-safety", "P0", "skip", "no webhook handlers detected")]
-    errors: list[str] = []
-    has_sig, has_idem = check_webhook_safety(webhook_files, errors)
-    rels = [_rel(p, root) for p in webhook_files]
+    rels = [rel for _, rel in part.webhooks]
     findings = []
-    if has_sig:
+    if part.webhook_signature:
         findings.append(Finding("webhook-signature", "P0", "ok", "webhook signature verification markers found"))
     else:
         findings.append(
@@ -151,7 +381,7 @@ def check_webhooks(root: Path, code_files: list[Path]) -> list[Finding]:
                 files=rels,
             )
         )
-    if has_idem:
+    if part.webhook_idempotency:
         findings.append(Finding("webhook-idempotency", "P0", "ok", "webhook idempotency markers found"))
     else:
         findings.append(
@@ -167,45 +397,31 @@ def check_webhooks(root: Path, code_files: list[Path]) -> list[Finding]:
     return findings
 
 
-def check_password_reset(root: Path, code_files: list[Path]) -> Finding:
-    auth_files = [
-        p for p in code_files
-        if any(h in p.name.lower() or h in _rel(p, root).lower() for h in _AUTH_FILE_HINTS)
-    ]
-    if not auth_files:
+def _password_reset_finding(part: Partial) -> Finding:
+    if not part.auth:
         return Finding("password-reset", "P0", "skip", "no auth-related files detected")
-    corpus = " ".join(_read(p).lower() for p in auth_files[:200])
-    if any(m in corpus for m in _RESET_MARKERS):
+    if any(reset for _, _, reset in part.auth[:AUTH_SAMPLE]):
         return Finding("password-reset", "P0", "ok", "password reset markers found in auth code")
     return Finding(
         "password-reset",
         "P0",
         "fail",
-        f"auth code detected ({len(auth_files)} file(s)) but no password reset flow markers",
+        f"auth code detected ({len(part.auth)} file(s)) but no password reset flow markers",
         hint="The #1 day-one lockout: users who can log in but can never get back in. Ship forgot-password before launch.",
-        files=[_rel(p, root) for p in auth_files[:10]],
+        files=[rel for _, rel, _ in part.auth[:10]],
     )
 
 
-def check_rate_limiting(root: Path, code_files: list[Path]) -> Finding:
+def _rate_limiting_finding(root: Path, part: Partial) -> Finding:
     from mmu_cli.cli import detect_nextjs
 
-    corpus_paths = code_files[:400]
-    server_detected = detect_nextjs(root)
-    pkg = _read(root / "package.json") + _read(root / "requirements.txt") + _read(root / "pyproject.toml")
-    if any(h in pkg.lower() for h in _SERVER_HINTS):
-        server_detected = True
-    has_marker = False
-    for path in corpus_paths:
-        text = _read(path).lower()
-        if not server_detected and any(h in text for h in _SERVER_HINTS):
-            server_detected = True
-        if any(m in text for m in _RATE_LIMIT_MARKERS):
-            has_marker = True
-            break
+    # Mirrors a scan that stops at the first rate limiting marker: only
+    # server hints at or before that file count.
+    sampled_hint = part.server_hint is not None and (part.rate_limit is None or part.server_hint <= part.rate_limit)
+    server_detected = detect_nextjs(root) or load_manifests(root).mentions(*_SERVER_HINTS) or sampled_hint
     if not server_detected:
         return Finding("rate-limiting", "P1", "skip", "no server framework detected")
-    if has_marker:
+    if part.rate_limit is not None:
         return Finding("rate-limiting", "P1", "ok", "rate limiting markers found")
     return Finding(
         "rate-limiting",
@@ -216,70 +432,50 @@ def check_rate_limiting(root: Path, code_files: list[Path]) -> Finding:
     )
 
 
-def check_cors(root: Path, code_files: list[Path]) -> Finding:
-    offenders = []
-    for path in code_files[:400]:
-        text = _read(path).lower()
-        if any(m in text for m in _CORS_WILDCARD_MARKERS):
-            offenders.append(_rel(path, root))
-    if offenders:
+def _cors_finding(part: Partial) -> Finding:
+    if part.cors:
         return Finding(
             "cors-wildcard",
             "P1",
             "warn",
-            f"wildcard CORS origin in {len(offenders)} file(s)",
+            f"wildcard CORS origin in {len(part.cors)} file(s)",
             hint="Allow-all origins plus cookie/header auth lets any site call your API as your users. Pin allowed origins.",
-            files=offenders,
+            files=[rel for _, rel in part.cors],
         )
     return Finding("cors-wildcard", "P1", "ok", "no wildcard CORS origins detected")
 
 
-def check_sql_strings(root: Path, code_files: list[Path]) -> Finding:
-    offenders = []
-    for path in code_files:
-        if path.suffix.lower() != ".py":
-            continue
-        if _SQL_FSTRING.search(_read(path)):
-            offenders.append(_rel(path, root))
-    if offenders:
+def _sql_finding(part: Partial) -> Finding:
+    if part.sql:
         return Finding(
             "sql-fstring",
             "P0",
             "fail",
-            f"f-string SQL queries in {len(offenders)} file(s)",
+            f"f-string SQL queries in {len(part.sql)} file(s)",
             hint="Interpolating values into SQL is the classic AI-generated injection hole. Use parameterized queries.",
-            files=offenders,
+            files=[rel for _, rel in part.sql],
         )
     return Finding("sql-fstring", "P0", "ok", "no f-string SQL queries detected")
 
 
-def check_debug_mode(root: Path, code_files: list[Path]) -> Finding:
-    pattern = re.compile(r"^\s*DEBUG\s*=\s*True\b", re.MULTILINE)
-    offenders = []
-    for path in code_files:
-        if path.suffix.lower() != ".py":
-            continue
-        if pattern.search(_read(path)):
-            offenders.append(_rel(path, root))
-    if offenders:
+def _debug_finding(part: Partial) -> Finding:
+    if part.debug:
         return Finding(
             "debug-mode",
             "P1",
             "warn",
-            f"DEBUG = True in {len(offenders)} file(s)",
+            f"DEBUG = True in {len(part.debug)} file(s)",
             hint="Debug mode in production leaks stack traces, settings, and sometimes secrets. Gate it on an env var.",
-            files=offenders,
+            files=[rel for _, rel in part.debug],
         )
     return Finding("debug-mode", "P1", "ok", "no hardcoded DEBUG = True detected")
 
 
-def check_error_monitoring(root: Path, code_files: list[Path]) -> Finding:
-    pkg = (_read(root / "package.json") + _read(root / "requirements.txt") + _read(root / "pyproject.toml")).lower()
-    if any(m in pkg for m in _MONITORING_MARKERS):
+def _monitoring_finding(root: Path, part: Partial) -> Finding:
+    if load_manifests(root).mentions(*_MONITORING_MARKERS):
         return Finding("error-monitoring", "P1", "ok", "error monitoring dependency detected")
-    for path in code_files[:400]:
-        if any(m in _read(path).lower() for m in _MONITORING_MARKERS):
-            return Finding("error-monitoring", "P1", "ok", "error monitoring markers found in code")
+    if part.monitoring:
+        return Finding("error-monitoring", "P1", "ok", "error monitoring markers found in code")
     return Finding(
         "error-monitoring",
         "P1",
@@ -289,25 +485,192 @@ def check_error_monitoring(root: Path, code_files: list[Path]) -> Finding:
     )
 
 
-def run_vibecheck(root: Path) -> list[Finding]:
-    from mmu_cli.cli import doctor_skip_paths, gather_code_files
+# Reduce-step checks in report order: name -> findings for (root, merged partial).
+_CHECKS: tuple[tuple[str, Callable[[Path, Partial], list[Finding]]], ...] = (
+    ("secrets", lambda root, part: [_secrets_finding(root, part)]),
+    ("webhooks", lambda root, part: _webhook_findings(part)),
+    ("password-reset", lambda root, part: [_password_reset_finding(part)]),
+    ("sql", lambda root, part: [_sql_finding(part)]),
+    ("rate-limiting", lambda root, part: [_rate_limiting_finding(root, part)]),
+    ("cors", lambda root, part: [_cors_finding(part)]),
+    ("debug", lambda root, part: [_debug_finding(part)]),
+    ("monitoring", lambda root, part: [_monitoring_finding(root, part)]),
+)
 
-    _READ_CACHE.clear()
-    skip_paths = doctor_skip_paths(root)
-    code_files = gather_code_files(root, skip_paths)
 
+def finalize(root: Path, part: Partial) -> list[Finding]:
+    """Reduce step: findings for the merged evidence of all of *root*'s code files."""
     findings: list[Finding] = []
-    findings.append(check_secrets(root, code_files))
-    findings.extend(check_webhooks(root, code_files))
-    findings.append(check_password_reset(root, code_files))
-    findings.append(check_sql_strings(root, code_files))
-    findings.append(check_rate_limiting(root, code_files))
-    findings.append(check_cors(root, code_files))
-    findings.append(check_debug_mode(root, code_files))
-    findings.append(check_error_monitoring(root, code_files))
+    for name, check in _CHECKS:
+        with trace.span(f"check:{name}", "check"):
+            findings.extend(check(root, part))
     return findings
 
 
+# Single-check entry points over an explicit file list (positions are indices).
+
+def check_secrets(root: Path, code_files: list[Path]) -> Finding:
+    return _secrets_finding(root, _scan_paths(root, code_files))
+
+
+def check_webhooks(root: Path, code_files: list[Path]) -> list[Finding]:
+    return _webhook_findings(_scan_paths(root, code_files))
+
+
+def check_password_reset(root: Path, code_files: list[Path]) -> Finding:
+    return _password_reset_finding(_scan_paths(root, code_files))
+
+
+def check_rate_limiting(root: Path, code_files: list[Path]) -> Finding:
+    return _rate_limiting_finding(root, _scan_paths(root, code_files))
+
+
+def check_cors(root: Path, code_files: list[Path]) -> Finding:
+    return _cors_finding(_scan_paths(root, code_files))
+
+
+def check_sql_strings(root: Path, code_files: list[Path]) -> Finding:
+    return _sql_finding(_scan_paths(root, code_files))
+
+
+def check_debug_mode(root: Path, code_files: list[Path]) -> Finding:
+    return _debug_finding(_scan_paths(root, code_files))
+
+
+def check_error_monitoring(root: Path, code_files: list[Path]) -> Finding:
+    return _monitoring_finding(root, _scan_paths(root, code_files))
+
+
+@trace.traced("vibecheck.scan_chunk")
+def scan_chunk(root: str, start: int, rels: tuple[str, ...]) -> dict:
+    """Worker task: :func:`scan_files` over one index chunk, as a picklable dict."""
+    return scan_files(Path(root), enumerate(rels, start)).to_dict()
+
+
+def run_vibecheck(root: Path, index: ProjectIndex | None = None) -> list[Finding]:
+    """All checks over *root*'s code files: one read per file, then one reduce."""
+    if index is None:
+        index = load_index(root)
+    facts = FileFacts.load(root)
+    part = scan_files(root, enumerate(index.rels), facts)
+    if facts is not None:
+        facts.save()
+    return finalize(root, part)
+
+
+def summarize(findings: list[Finding]) -> dict:
+    """Counts and exit code: 2 when anything fails, else 0."""
+    fails = sum(1 for f in findings if f.status == "fail")
+    warns = sum(1 for f in findings if f.status == "warn")
+    return {"failures": fails, "warnings": warns, "exit_code": 2 if fails else 0}
+
+
+def iter_vibecheck(root: Path, index: ProjectIndex | None = None, chunk_size: int = 256) -> Iterator[dict]:
+    """Stream a vibe check: ``progress`` per chunk, one ``finding`` each, a ``summary``.
+
+    Findings depend on every file, so they follow the last progress event;
+    the progress events are what keep a long scan visibly alive.
+    """
+    if index is None:
+        index = load_index(root)
+    facts = FileFacts.load(root)
+    part = Partial()
+    for start, rels in index.chunks(chunk_size):
+        part = part.merge(scan_files(root, enumerate(rels, start), facts))
+        yield {"event": "progress", "files": start + len(rels), "total": len(index)}
+    if facts is not None:
+        facts.save()
+    findings = finalize(root, part)
+    for finding in findings:
+        yield {"event": "finding", **finding.to_dict()}
+    yield {"event": "summary", "files": len(index), "findings": len(findings), **summarize(findings)}
+
+
+# Sharded scans: `mmu vibecheck --shard K/N` on N machines, then `merge`.
+SHARD_FORMAT = "mmu-vibecheck-shard"
+SHARD_VERSION = 1
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """``"3/8"`` -> ``(3, 8)``; shards are numbered from 1."""
+    k, sep, n = value.partition("/")
+    if not (sep and k.strip().isdigit() and n.strip().isdigit()) or not 1 <= int(k) <= int(n):
+        raise ValueError(f"invalid shard {value!r} (expected K/N with 1 <= K <= N)")
+    return int(k), int(n)
+
+
+def shard_of(rel: str, count: int) -> int:
+    """The 1-based shard owning *rel*: a hash of the path, so stable across machines and runs."""
+    import zlib
+
+    return zlib.crc32(rel.encode("utf-8", errors="surrogateescape")) % count + 1
+
+
+def _fingerprint(index: ProjectIndex) -> str:
+    from mmu_cli.cache import content_hash
+
+    return content_hash("\n".join(index.rels).encode("utf-8", errors="surrogateescape"))
+
+
+def scan_shard(root: Path, shard: tuple[int, int], index: ProjectIndex | None = None) -> dict:
+    """Scan the files of shard ``(k, n)`` only; return the partial result document.
+
+    File indices stay global, and the document records a fingerprint of the
+    whole file list, so :func:`merge_shards` can check that every shard saw
+    the same tree and reduce to exactly what one full scan would report.
+    """
+    if index is None:
+        index = load_index(root)
+    k, n = shard
+    facts = FileFacts.load(root)
+    part = scan_files(root, ((i, rel) for i, rel in enumerate(index.rels) if shard_of(rel, n) == k), facts)
+    if facts is not None:
+        facts.save()
+    return {
+        "format": SHARD_FORMAT,
+        "version": SHARD_VERSION,
+        "shard": [k, n],
+        "files": len(index),
+        "fingerprint": _fingerprint(index),
+        "partial": part.to_dict(),
+    }
+
+
+def merge_shards(root: Path, docs: list[dict]) -> list[Finding]:
+    """Findings for *root* from one partial document per shard.
+
+    Presence flags are OR'd, offender lists unioned and first-hit indices
+    min'd (:meth:`Partial.merge`); repo-wide inputs such as manifests and
+    ``.gitignore`` are read from *root* by :func:`finalize`. Raises
+    ValueError when the documents are not one complete set of shards of
+    the same file list.
+    """
+    if not docs:
+        raise ValueError("no shard files given")
+    for doc in docs:
+        if not isinstance(doc, dict) or doc.get("format") != SHARD_FORMAT:
+            raise ValueError("not a vibecheck shard file")
+        if doc.get("version") != SHARD_VERSION:
+            raise ValueError(f"shard file version {doc.get('version')}; this mmu reads version {SHARD_VERSION}")
+    counts = {doc["shard"][1] for doc in docs}
+    if len(counts) != 1:
+        raise ValueError(f"shards of different splits: {', '.join(f'/{n}' for n in sorted(counts))}")
+    if len({doc.get("fingerprint") for doc in docs}) != 1:
+        raise ValueError("shards were scanned from different file lists (another commit or skip_paths?)")
+    n = counts.pop()
+    seen = [doc["shard"][0] for doc in docs]
+    duplicates = sorted({k for k in seen if seen.count(k) > 1})
+    if duplicates:
+        raise ValueError(f"shard(s) given twice: {', '.join(f'{k}/{n}' for k in duplicates)}")
+    missing = sorted(set(range(1, n + 1)) - set(seen))
+    if missing:
+        raise ValueError(f"missing shard(s): {', '.join(f'{k}/{n}' for k in missing)}")
+    part = Partial()
+    for doc in docs:
+        part = part.merge(Partial.from_dict(doc["partial"]))
+    return finalize(root, part)
+
+
 def format_findings(findings: list[Finding]) -> tuple[list[str], int]:
     """Render findings as message lines; return (lines, exit_code)."""
     icons = {"fail": "[fail]", "warn": "[warn]", "ok": "[ok]", "skip": "[skip]"}
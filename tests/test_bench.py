@@ -0,0 +1,79 @@
+"""Tests for `mmu bench` and its synthetic project generator."""
+
+import hashlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import bench, cli  # noqa: E402
+from mmu_cli.index import ProjectIndex  # noqa: E402
+from mmu_cli.vibecheck import run_vibecheck  # noqa: E402
+
+
+def digest(root: Path) -> str:
+    h = hashlib.sha256()
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        h.update(path.relative_to(root).as_posix().encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class GenerateRepoTest(unittest.TestCase):
+    def test_deterministic_and_realistic(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            a, b = Path(tmp) / "a", Path(tmp) / "b"
+            bench.generate_repo(a, 120, seed=3)
+            bench.generate_repo(b, 120, seed=3)
+            self.assertEqual(digest(a), digest(b))
+            index = ProjectIndex.build(a)
+            self.assertEqual(len(index), 120)  # node_modules is skipped
+            self.assertTrue((a / "node_modules").is_dir())
+            self.assertTrue((a / "docs" / "blueprints").is_dir())
+            failed = {f.check for f in run_vibecheck(a) if f.status == "fail"}
+            self.assertIn("secrets", failed)
+            self.assertEqual(bench.prepare(Path(tmp), 120, 3), Path(tmp) / "files-120-seed-3")
+
+
+class BenchTest(unittest.TestCase):
+    def test_report_and_baseline_regressions(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = io.StringIO()
+            with redirect_stdout(out):
+                code = cli.main([
+                    "bench", "--files", "30", "--commands", "status,vibecheck", "--repeat", "1",
+                    "--dir", tmp, "--output", str(Path(tmp) / "report.json"), "--json",
+                ])
+            self.assertEqual(code, 0)
+            report = json.loads(out.getvalue())
+            saved = json.loads((Path(tmp) / "report.json").read_text(encoding="utf-8"))
+            self.assertEqual((report["results"], report["regressions"]), (saved["results"], []))
+            self.assertEqual([r["command"] for r in report["results"]], ["status", "vibecheck"])
+            row = report["results"][1]
+            self.assertEqual((row["files"], row["code_files"], row["exit_code"]), (30, 30, 2))
+            self.assertGreater(row["warm_s"], 0)
+            self.assertGreater(row["files_per_s"], 0)
+            if sys.platform == "linux":
+                self.assertGreater(row["peak_rss_kb"], 1024)
+
+        slower = {"results": [dict(row, warm_s=row["warm_s"] + 1.0)]}
+        self.assertEqual(bench.compare(report, report), [])
+        self.assertEqual(bench.compare(report, slower), [])  # faster than the baseline
+        [regression] = bench.compare(slower, report)
+        self.assertIn("vibecheck @ 30 files: warm_s", regression)
+
+    def test_unknown_command(self):
+        result = cli.command_bench([10], ["deploy"])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("deploy", result["messages"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Tests for the shared blueprint parser, its memo and the status snapshot."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import blueprint  # noqa: E402
+from mmu_cli import display, state  # noqa: E402
+from mmu_cli.cli import command_status  # noqa: E402
+from mmu_cli.display import render_blueprint_detail, scan_gates  # noqa: E402
+
+BLUEPRINT = """# Billing
+
+## Provider
+- [ ] [P0] Choose payment provider.
+- [x] Write refund policy.
+
+<!-- if:has_billing -->
+## Subscriptions
+- [ ] [P1] Handle plan upgrades.
+<!-- endif -->
+
+## Tax
+- [ ] Collect VAT.
+"""
+
+
+class ParseTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.path = self.root / "04-billing.md"
+        self.path.write_text(BLUEPRINT, encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_items_sections_and_numbers(self):
+        bp = blueprint.load_blueprint(self.path, {"has_billing": False})
+        self.assertEqual([s.title for s in bp.sections], ["Provider", "Subscriptions", "Tax"])
+        self.assertFalse(bp.sections[1].active)
+        self.assertEqual((bp.done, bp.total, bp.skipped), (1, 3, 1))
+        first, _, skipped, last = bp.items
+        self.assertEqual((first.priority, first.text, first.raw), (0, "Choose payment provider.", "[P0] Choose payment provider."))
+        self.assertEqual((skipped.active, skipped.number), (False, 0))
+        self.assertEqual((last.number, last.section, last.line), (3, "Tax", 12))
+        self.assertIs(bp.item(3), last)
+        self.assertIsNone(bp.item(4))
+
+    def test_render_toggles_only_requested_lines(self):
+        bp = blueprint.load_blueprint(self.path)
+        text = bp.render({bp.item(1).line: True, bp.item(2).line: False})
+        self.assertIn("- [x] [P0] Choose payment provider.", text)
+        self.assertIn("- [ ] Write refund policy.", text)
+        self.assertTrue(text.endswith("Collect VAT.\n"))
+
+    def test_memo_reused_and_invalidated_on_write(self):
+        first = blueprint.load_blueprint(self.path)
+        self.assertIs(blueprint.load_blueprint(self.path), first)
+        self.assertIsNot(blueprint.load_blueprint(self.path, {"has_billing": True}), first)
+
+        # Same size, possibly same mtime tick: only explicit invalidation catches it.
+        blueprint.write_blueprint(self.path, first.render({first.item(1).line: True}))
+        self.assertEqual(blueprint.load_blueprint(self.path).done, 2)
+
+    def test_detail_lists_skipped_sections(self):
+        detail = render_blueprint_detail(self.path, "Billing", {"has_billing": False})
+        self.assertIn("⊘ Subscriptions", detail)
+        self.assertNotIn("Handle plan upgrades", detail)
+
+
+class StageTest(unittest.TestCase):
+    def test_stage_survives_non_stage_headings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = root / "docs" / "checklists" / "from_scratch.md"
+            path.parent.mkdir(parents=True)
+            path.write_text(
+                "- [ ] preamble\n## M0 Problem Fit\n- [x] a\n## Notes\n- [ ] b\n## M1 Build Fit\n",
+                encoding="utf-8",
+            )
+            self.assertEqual(scan_gates(root), [("M0 Problem Fit", 1, 2), ("M1 Build Fit", 0, 0)])
+
+
+class StatusSnapshotTest(unittest.TestCase):
+    def test_status_with_why_scans_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            bp_dir = root / "docs" / "blueprints"
+            bp_dir.mkdir(parents=True)
+            (bp_dir / "04-billing.md").write_text(BLUEPRINT, encoding="utf-8")
+            with mock.patch.object(state, "progress_for", wraps=state.progress_for) as progress:
+                result = command_status(root, why=True)
+            # One lookup for the blueprints, one for the (flag-free) gate checklist.
+            self.assertEqual(progress.call_count, 2)
+            self.assertEqual(result["blueprint_progress"], {"done": 1, "total": 4, "skipped": 0})
+            self.assertIn("SCORE BREAKDOWN", result["dashboard"])
+
+    def test_snapshot_totals(self):
+        snap = display.StatusSnapshot([("Billing", 1, 3, 1)], [("M0 Problem Fit", 2, 2), ("M1 Build Fit", 0, 3)])
+        self.assertEqual((snap.all_done, snap.all_total, snap.pct_int), (3, 8, 37))
+        self.assertEqual(snap.open_gates, ["M1 Build Fit"])
+        self.assertIn("Score: 37%", display.render_share_card(snap))
+
+
+if __name__ == "__main__":
+    unittest.main()
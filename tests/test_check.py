@@ -0,0 +1,103 @@
+"""Tests for batch `mmu check` / `mmu uncheck`."""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import blueprint, cli  # noqa: E402
+from mmu_cli.cli import CheckSelector, command_check_batch, parse_check_line  # noqa: E402
+
+BACKEND = "# Backend\n\n## API\n" + "".join(f"- [ ] Item {n}\n" for n in range(1, 11)) + "- [ ] Add rate limit to login.\n"
+SECURITY = "# Security\n\n## Abuse\n- [ ] Add Rate Limit per IP.\n- [x] Rotate keys.\n"
+
+
+class BatchCheckTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.bp_dir = self.root / "docs" / "blueprints"
+        self.bp_dir.mkdir(parents=True)
+        (self.bp_dir / "02-backend.md").write_text(BACKEND, encoding="utf-8")
+        (self.bp_dir / "06-security.md").write_text(SECURITY, encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def backend(self) -> str:
+        return (self.bp_dir / "02-backend.md").read_text(encoding="utf-8")
+
+    def test_numbers_and_ranges_written_once(self):
+        with mock.patch.object(blueprint, "write_blueprint", wraps=blueprint.write_blueprint) as write:
+            result = command_check_batch(self.root, [CheckSelector("backend", ["1", "3", "5-9"])])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual([r["number"] for r in result["results"]], [1, 3, 5, 6, 7, 8, 9])
+        self.assertIn("- [x] Item 9", self.backend())
+        self.assertIn("- [ ] Item 2", self.backend())
+
+    def test_match_across_blueprints(self):
+        result = command_check_batch(self.root, [CheckSelector(None, [], "rate limit", True)])
+        self.assertEqual(sorted(r["file"] for r in result["results"]), ["02-backend.md", "06-security.md"])
+        self.assertEqual(sorted(result["files_written"]), ["02-backend.md", "06-security.md"])
+
+        again = command_check_batch(self.root, [CheckSelector(None, [], "rate limit", True)])
+        self.assertEqual(again["counts"], {"already_checked": 2})
+        self.assertEqual(again["files_written"], [])
+
+    def test_any_bad_selector_writes_nothing(self):
+        before = self.backend()
+        with mock.patch.object(blueprint, "write_blueprint") as write:
+            result = command_check_batch(self.root, [
+                CheckSelector("backend", ["2", "40"]),
+                CheckSelector("nope", ["1"]),
+                CheckSelector("backend", ["9-3"]),
+                CheckSelector(None, [], "rate limit", True),
+            ])
+        write.assert_not_called()
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(len(result["errors"]), 3)
+        self.assertEqual((result["results"], result["files_written"]), ([], []))
+        self.assertEqual(self.backend(), before)
+
+        batch = self.root / "typo.txt"
+        batch.write_text("backend 2\nbakend 3\n", encoding="utf-8")
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["mmu", "check", "--from-file", str(batch), "--root", str(self.root)]), \
+                redirect_stdout(out):
+            self.assertEqual(cli.main(), 1)
+        self.assertIn("Nothing was checked", out.getvalue())
+        self.assertEqual(self.backend(), before)
+
+    def test_parse_check_line(self):
+        self.assertEqual(parse_check_line("backend 1 5-9"), CheckSelector("backend", ["1", "5-9"], None, False))
+        self.assertEqual(
+            parse_check_line('--match "rate limit" --all-blueprints'),
+            CheckSelector(None, [], "rate limit", True),
+        )
+        with self.assertRaises(ValueError):
+            parse_check_line("backend --bogus")
+
+    def test_cli_from_file_emits_one_json_document(self):
+        batch = self.root / "onboarding.txt"
+        batch.write_text("# onboarding\nbackend 1-2\nsecurity --match rotate\n", encoding="utf-8")
+        out = io.StringIO()
+        argv = ["mmu", "uncheck", "--from-file", str(batch), "--root", str(self.root), "--json"]
+        with mock.patch.object(sys, "argv", argv), redirect_stdout(out):
+            code = cli.main()
+        self.assertEqual(code, 0)
+        doc = json.loads(out.getvalue())
+        self.assertEqual(doc["counts"], {"already_unchecked": 2, "unchecked": 1})
+        self.assertIn("- [ ] Rotate keys.", (self.bp_dir / "06-security.md").read_text(encoding="utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Tests for `mmu ci`: doctor, configured gates and vibecheck in one process."""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import blueprint, ci, cli, daemon  # noqa: E402
+
+CHECKLIST = """# From scratch
+
+## M0 Setup
+- [x] Repo created.
+
+## M1 Build
+- [ ] Pick a name.
+- [ ] Ship it.
+"""
+
+
+def write(root: Path, rel: str, content: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+class CiTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        write(self.root, "docs/checklists/from_scratch.md", CHECKLIST)
+        write(self.root, "docs/ops/gate_targets.txt", "# stages\nM0\n")
+        write(self.root, "app/db.py", 'q = f"SELECT * FROM users WHERE id = {uid}"\n')
+        env = mock.patch.dict(os.environ, {daemon.DISABLE_ENV: "1"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def run_cli(self, *argv: str) -> tuple[int, str]:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = cli.main(["ci", *argv, "--root", str(self.root)])
+        return code, out.getvalue()
+
+    def test_read_targets(self):
+        self.assertEqual(ci.read_targets(self.root / "docs/ops/gate_targets.txt"), ["M0"])
+        self.assertEqual(ci.read_targets(self.root / "missing.txt"), [])
+        errors: list[str] = []
+        self.assertEqual(ci.read_targets(self.root / "docs", errors), [])
+        self.assertEqual(len(errors), 1)
+        (self.root / "bad.txt").write_bytes(b"M0\n\xff\xfe\n")
+        code, out = self.run_cli("--targets-file", "bad.txt")
+        self.assertEqual(code, 1)
+        self.assertIn("CI config error: cannot read", out)
+
+    def test_one_index_and_one_checklist_parse(self):
+        write(self.root, "docs/ops/gate_targets.txt", "M0\nM1\n")
+        with mock.patch.object(cli, "gather_code_files", wraps=cli.gather_code_files) as walk, \
+                mock.patch.object(blueprint, "parse_blueprint", wraps=blueprint.parse_blueprint) as parse:
+            suites = ci.run_ci(self.root, ["M0", "M1"])
+        self.assertEqual(walk.call_count, 1)
+        self.assertEqual(parse.call_count, 1)
+        gates = suites[1]
+        self.assertEqual([c.status for c in gates.cases], ["ok", "fail"])
+        self.assertEqual(gates.cases[1].details, ["- [ ] Pick a name.", "- [ ] Ship it."])
+        self.assertEqual(gates.exit_code, 3)
+
+    def test_exit_code_and_json(self):
+        code, out = self.run_cli("--json")
+        data = json.loads(out)
+        self.assertEqual(data["stages"], ["M0"])
+        self.assertEqual([s["name"] for s in data["suites"]], ["doctor", "gates", "vibecheck"])
+        vibe = data["suites"][2]
+        self.assertEqual(vibe["exit_code"], 2)  # f-string SQL is a P0 failure
+        self.assertEqual(code, 2)
+        self.assertEqual(data["exit_code"], 2)
+
+        code, out = self.run_cli("--advisory", "doctor", "--advisory", "vibecheck")
+        self.assertEqual(code, 0)
+        self.assertIn("CI result: PASS", out)
+
+    def test_junit(self):
+        report = self.root / "reports" / "junit.xml"
+        code, _ = self.run_cli("--advisory", "doctor", "--junit", str(report))
+        self.assertEqual(code, 2)
+        top = ET.fromstring(report.read_text(encoding="utf-8"))
+        suites = {s.get("name"): s for s in top.iter("testsuite")}
+        self.assertEqual(set(suites), {"mmu.doctor", "mmu.gates", "mmu.vibecheck"})
+        self.assertEqual(suites["mmu.doctor"].get("failures"), "0")  # advisory failures are skipped
+        self.assertEqual(suites["mmu.gates"].get("tests"), "1")
+        failed = [c.get("name") for c in suites["mmu.vibecheck"].iter("testcase") if c.find("failure") is not None]
+        self.assertEqual(failed, ["(P0) sql-fstring"])
+
+        (self.root / "blocked").write_text("a file, not a directory\n", encoding="utf-8")
+        blocked = self.root / "blocked" / "junit.xml"
+        code, out = self.run_cli("--advisory", "doctor", "--advisory", "vibecheck", "--junit", str(blocked))
+        self.assertEqual(code, 1)
+        self.assertIn(f"Cannot write JUnit report {blocked}", out)
+        self.assertIn("CI result: PASS", out)  # the suites that ran are still reported
+
+        code, out = self.run_cli("--junit", "-")
+        self.assertTrue(out.startswith("<?xml"))
+        self.assertEqual(ET.fromstring(out.split("\n", 1)[1]).tag, "testsuites")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -110,6 +110,26 @@ class CLITestCase(unittest.TestCase):
         result = cli.command_gate("M0", self.root)
         self.assertEqual(result.exit_code, 0)
 
+    def test_gates_evaluates_several_stages_from_one_parse(self) -> None:
+        from unittest import mock
+
+        from mmu_cli import blueprint
+
+        self.write(
+            "docs/checklists/from_scratch.md",
+            "## M0 Problem Fit\n- [x] done\n\n## M1 Build Fit\n- [ ] signup\n## Notes\n- [ ] still M1\n",
+        )
+        with mock.patch.object(blueprint, "parse_blueprint", wraps=blueprint.parse_blueprint) as parse:
+            result = cli.command_gates(["M0", "M1", "M9"], self.root)
+            every = cli.command_gates(None, self.root)
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(result.exit_code, 3)
+        self.assertEqual((result["passed"], result["failed"]), (["M0"], ["M1", "M9"]))
+        self.assertEqual(result["stages"][1]["pending"], ["- [ ] signup", "- [ ] still M1"])
+        self.assertEqual(result["stages"][2]["errors"][0], "Stage not found: M9")
+        self.assertEqual([r["stage"] for r in every["stages"]], ["M0", "M1"])
+        self.assertEqual(cli.parse_stages("m1, M0,M1,"), ["M1", "M0"])
+
     def test_doctor_reports_missing_required_files(self) -> None:
         result = cli.command_doctor(self.root)
         self.assertEqual(result.exit_code, 2)
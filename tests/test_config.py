@@ -0,0 +1,85 @@
+"""Tests for the memoized `.mmu/config.toml` layer."""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import cli, llm  # noqa: E402
+from mmu_cli import config as config_mod  # noqa: E402
+from mmu_cli.config import DEFAULT_SKIP_PATHS, Config  # noqa: E402
+
+CONFIG = """
+[project]
+name = "Acme"
+
+[features]
+billing = false
+
+[doctor]
+skip_paths = ["legacy", "  "]
+
+[llm]
+api_key = "cfg-key"
+
+[vibecheck]
+strict = true
+"""
+
+
+class ConfigTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.path = self.root / ".mmu" / "config.toml"
+        self.path.parent.mkdir()
+        self.path.write_text(CONFIG, encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_typed_sections(self):
+        config = Config.load(self.root)
+        self.assertEqual(config.project_name, "Acme")
+        self.assertFalse(config.features["has_billing"])
+        self.assertTrue(config.features["has_mfa"])
+        self.assertEqual(config.skip_paths, frozenset(DEFAULT_SKIP_PATHS | {"legacy"}))
+        self.assertEqual(config.api_key, "cfg-key")
+        self.assertEqual(config.vibecheck, {"strict": True})
+        self.assertEqual(cli.doctor_skip_paths(self.root), set(config.skip_paths))
+
+    def test_parsed_once_until_the_file_changes(self):
+        with mock.patch.object(config_mod, "parse_config", wraps=config_mod.parse_config) as parse:
+            first = Config.load(self.root)
+            self.assertIs(Config.load(self.root), first)
+            cli.load_feature_flags(self.root)
+            cli.load_config(self.root)
+            self.assertEqual(parse.call_count, 1)
+            self.path.write_text(CONFIG.replace("Acme", "Beta"), encoding="utf-8")
+            self.assertEqual(Config.load(self.root).project_name, "Beta")
+            os.remove(self.path)
+            self.assertEqual(Config.load(self.root).data, {})
+
+    def test_invalid_file_warns_once(self):
+        self.path.write_text("not toml {{{", encoding="utf-8")
+        err = io.StringIO()
+        with redirect_stderr(err):
+            Config.load(self.root)
+            Config.load(self.root)
+        self.assertEqual(err.getvalue().count("Ignoring"), 1)
+
+    def test_llm_key_from_config(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(llm.get_api_key(self.root), "cfg-key")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Tests for `mmu daemon` and the warm code file index."""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import __version__, cli, daemon, index  # noqa: E402
+
+
+class LoadIndexTest(unittest.TestCase):
+    def test_memoized_until_a_directory_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "app").mkdir()
+            (root / "app" / "a.py").write_text("x = 1\n", encoding="utf-8")
+            first = index.load_index(root)
+            self.assertIs(index.load_index(root), first)
+            (root / "app" / "a.py").write_text("x = 2\n", encoding="utf-8")  # content edit: same file list
+            self.assertIs(index.load_index(root), first)
+            (root / "app" / "b.py").write_text("y = 1\n", encoding="utf-8")
+            mtime = dict(first.dirs)["app"] + 1  # filesystems with coarse mtimes
+            os.utime(root / "app", ns=(mtime, mtime))
+            self.assertEqual(index.load_index(root).rels, ("app/a.py", "app/b.py"))
+
+
+class DaemonTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        self.project = self.base / "project"
+        (self.project / "docs" / "blueprints").mkdir(parents=True)
+        (self.project / "docs" / "blueprints" / "01-frontend.md").write_text(
+            "## UI\n- [x] [P0] Done.\n- [ ] Open.\n", encoding="utf-8"
+        )
+        self.cwd = os.getcwd()
+        env = mock.patch.dict(os.environ, {daemon.SOCKET_ENV: str(self.base / "d.sock")})
+        env.start()
+        self.addCleanup(env.stop)
+        self.thread = threading.Thread(target=daemon.serve, daemon=True)
+        self.thread.start()
+        for _ in range(100):
+            if daemon.request({"op": "status"}) is not None:
+                break
+            time.sleep(0.02)
+
+    def tearDown(self) -> None:
+        daemon.stop()
+        self.thread.join(timeout=5)
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def run_cli(self, *argv: str) -> tuple[int, str]:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = cli.main(list(argv))
+        return code, out.getvalue()
+
+    def test_forwarded_output_matches_local_run(self):
+        argv = ["status", "--json", "--root", str(self.project)]
+        code, forwarded = self.run_cli(*argv)
+        with mock.patch.dict(os.environ, {daemon.DISABLE_ENV: "1"}):
+            local_code, local = self.run_cli(*argv)
+        self.assertEqual((code, json.loads(forwarded)), (local_code, json.loads(local)))
+        status = daemon.request({"op": "status"})
+        self.assertEqual(status["requests"], 1)
+        self.assertEqual(status["roots"], [str(self.project.resolve())])
+
+    def test_usage_errors_and_local_commands(self):
+        self.assertIsNone(daemon.forward(["fleet", "vibecheck", "."]))
+        self.assertIsNone(daemon.forward(["init", "--interactive"]))
+        request = {"op": "run", "argv": ["show"], "cwd": str(self.project)}
+        self.assertIn("error", daemon.request({**request, "version": "0.0.0"}))
+        reply = daemon.request({**request, "version": __version__})
+        self.assertEqual(reply["exit_code"], 2)
+        self.assertIn("the following arguments are required: blueprint", reply["stderr"])
+
+    def test_portfolio_status_stays_local(self):
+        self.assertIsNone(daemon.forward(["status", "--glob", "~/clients/*"]))
+        self.assertIsNone(daemon.forward(["status", "--roots-file=roots.txt"]))
+        reply = daemon.request({"op": "run", "argv": ["status", "--roots-file", "r.txt"], "cwd": ".", "version": __version__})
+        self.assertEqual(reply, {"error": "this command runs in the client"})
+
+    def test_a_crash_is_answered_not_rerun_locally(self):
+        with mock.patch.object(cli, "run", side_effect=RuntimeError("boom")) as run:
+            code, out = self.run_cli("check", "frontend", "2", "--root", str(self.project))
+            reply = daemon.request({"op": "run", "argv": ["status"], "cwd": str(self.project), "version": __version__})
+        self.assertEqual(code, 1)
+        self.assertEqual(run.call_count, 2)  # once per request, never again in the client
+        self.assertEqual(reply["exit_code"], 1)
+        self.assertIn("RuntimeError: boom", reply["stderr"])
+        self.assertIn("Traceback", reply["stderr"])
+
+    def test_cli_status_and_stop(self):
+        result = cli.command_daemon("status")
+        self.assertTrue(result["running"])
+        self.assertEqual(result["pid"], os.getpid())
+        self.assertFalse(daemon.start()[0])  # already running
+        self.assertEqual(daemon.stop(), (True, "mmu daemon stopped"))
+        self.thread.join(timeout=5)
+        self.assertFalse(cli.command_daemon("status")["running"])
+        self.assertFalse((self.base / "d.sock").exists())
+
+
+class SocketTrustTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name) / "mmu"
+        self.dir.mkdir(mode=0o700)
+        self.sock = self.dir / "daemon.sock"
+        env = mock.patch.dict(os.environ, {daemon.SOCKET_ENV: str(self.sock)})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_shared_directory_is_refused(self):
+        os.chmod(self.dir, 0o777)
+        self.assertIn("group or others", daemon.untrusted(self.dir, socket=False))
+        with self.assertRaisesRegex(RuntimeError, "refusing to serve"):
+            daemon.serve()
+        self.assertIsNone(daemon.forward(["status", "--json"]))
+
+    def test_symlinked_socket_is_refused(self):
+        target = Path(self.tmp.name) / "elsewhere.sock"
+        target.touch()
+        self.sock.symlink_to(target)
+        self.assertIn("symlink", daemon.untrusted(self.sock))
+        with self.assertRaisesRegex(RuntimeError, "refusing to serve"):
+            daemon.serve()
+        self.assertTrue(target.exists())
+        self.assertIsNone(daemon.request({"op": "status"}))
+
+    def test_symlinked_directory_is_refused(self):
+        link = Path(self.tmp.name) / "link"
+        link.symlink_to(self.dir)
+        with mock.patch.dict(os.environ, {daemon.SOCKET_ENV: str(link / "daemon.sock")}):
+            with self.assertRaisesRegex(RuntimeError, "symlink"):
+                daemon.serve()
+
+
+if __name__ == "__main__":
+    unittest.main()
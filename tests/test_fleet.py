@@ -0,0 +1,147 @@
+"""Tests for `mmu fleet vibecheck` and chunked vibecheck scans."""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import cli, fleet, vibecheck  # noqa: E402
+from mmu_cli.index import ProjectIndex  # noqa: E402
+
+_scan_chunk = vibecheck.scan_chunk
+
+
+def scan_chunk_or_fail(root: str, start: int, rels: tuple[str, ...]) -> dict:
+    """Pool task standing in for vibecheck.scan_chunk: the leaky repo's workers raise."""
+    if root.endswith("leaky"):
+        raise OSError("disk on fire")
+    return _scan_chunk(root, start, rels)
+
+
+def write(root: Path, rel: str, content: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+class FleetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        # leaky: P0 (f-string SQL, webhook without signature), spread over many files.
+        leaky = self.base / "clients" / "leaky"
+        (leaky / ".git").mkdir(parents=True)
+        for i in range(12):
+            write(leaky, f"app/mod{i:02}.py", "import flask\n" if i == 3 else "x = 1\n")
+        write(leaky, "app/db.py", 'q = f"SELECT * FROM users WHERE id = {uid}"\n')
+        write(leaky, "app/webhooks.py", "def handle(event):\n    return event\n")
+        write(leaky, "app/login.py", "def login(): pass\n")
+        # clean: no P0 findings.
+        clean = self.base / "clean"
+        (clean / ".git").mkdir(parents=True)
+        write(clean, "main.py", "import sentry_sdk\nprint('hi')\n")
+        (self.base / "notarepo").mkdir()
+        (self.base / "node_modules" / "pkg" / ".git").mkdir(parents=True)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_discovers_repos_and_skips_node_modules(self):
+        names = [p.relative_to(self.base).as_posix() for p in fleet.discover_repos(self.base)]
+        self.assertEqual(names, ["clean", "clients/leaky"])
+
+    def test_chunked_partials_merge_to_single_pass(self):
+        root = self.base / "clients" / "leaky"
+        index = ProjectIndex.build(root)
+        merged = vibecheck.Partial()
+        for start, rels in reversed(list(index.chunks(4))):
+            merged = merged.merge(vibecheck.Partial.from_dict(vibecheck.scan_chunk(str(root), start, rels)))
+        chunked = [f.to_dict() for f in vibecheck.finalize(root, merged)]
+        self.assertEqual(chunked, [f.to_dict() for f in vibecheck.run_vibecheck(root)])
+
+    def test_pool_and_inline_runs_agree(self):
+        def strip(events):
+            return sorted(json.dumps(e, sort_keys=True) for e in events if e["event"] == "repo")
+
+        pooled = list(fleet.run_fleet(self.base, workers=2, chunk_size=3))
+        inline = list(fleet.run_fleet(self.base, workers=1))
+        self.assertEqual(strip(pooled), strip(inline))
+        self.assertEqual(pooled[-1], inline[-1])
+
+    def test_cli_streams_ndjson_and_fails_on_p0(self):
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", ["mmu", "fleet", "vibecheck", str(self.base), "--workers", "1"]), \
+                redirect_stdout(out):
+            code = cli.main()
+        events = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(code, 2)
+        self.assertEqual([e["event"] for e in events], ["discovered", "repo", "repo", "summary"])
+        repos = {e["repo"]: e for e in events if e["event"] == "repo"}
+        self.assertEqual(repos["clean"]["p0"], 0)
+        self.assertGreaterEqual(repos["clients/leaky"]["p0"], 2)
+        self.assertEqual(events[-1]["blocked"], ["clients/leaky"])
+        self.assertEqual(events[-1]["files"], 16)
+
+    def test_a_failing_repo_is_reported_and_the_rest_still_run(self):
+        with mock.patch.object(vibecheck, "scan_chunk", scan_chunk_or_fail):
+            events = list(fleet.run_fleet(self.base, workers=2, chunk_size=3))
+        repos = {e["repo"]: e for e in events if e["event"] == "repo"}
+        self.assertEqual(repos["clients/leaky"]["exit_code"], 1)
+        self.assertIn("disk on fire", repos["clients/leaky"]["error"])
+        self.assertEqual((repos["clean"]["exit_code"], repos["clean"]["files"]), (0, 1))
+        self.assertEqual((events[-1]["errors"], events[-1]["blocked"], events[-1]["exit_code"]), (["clients/leaky"], [], 1))
+
+        real = vibecheck.run_vibecheck
+
+        def run_or_fail(root, index):
+            if root.name == "leaky":
+                raise ValueError("bad")
+            return real(root, index)
+
+        with mock.patch.object(vibecheck, "run_vibecheck", run_or_fail):
+            inline = list(fleet.run_fleet(self.base, workers=1))
+        self.assertEqual([e.get("error") for e in inline if e["event"] == "repo"], [None, "ValueError: bad"])
+
+    def test_one_large_repo_fans_out_over_every_cpu(self):
+        pools: list[ThreadPoolExecutor] = []
+
+        class RecordingPool(ThreadPoolExecutor):
+            def __init__(self, max_workers: int) -> None:
+                super().__init__(max_workers=max_workers)
+                self.max_workers, self.tasks = max_workers, []
+                pools.append(self)
+
+            def submit(self, fn, /, *args, **kwargs):
+                self.tasks.append(fn.__name__)
+                return super().submit(fn, *args, **kwargs)
+
+        leaky = self.base / "clients" / "leaky"
+        with mock.patch.object(fleet, "ProcessPoolExecutor", RecordingPool), \
+                mock.patch.object(fleet.os, "cpu_count", return_value=4):
+            events = list(fleet.run_fleet(leaky, chunk_size=3))
+        pool, = pools
+        self.assertEqual(pool.max_workers, 4)
+        self.assertEqual(pool.tasks, ["index_repo"] + ["scan_chunk"] * 5)  # 15 files, 3 per chunk
+        repo, = (e for e in events if e["event"] == "repo")
+        inline = next(e for e in fleet.run_fleet(leaky, workers=1) if e["event"] == "repo")
+        self.assertEqual(repo, inline)
+
+    def test_warnings_do_not_block(self):
+        warn = vibecheck.Finding("rate-limit", "P0", "warn", "No rate limiting found")
+        event = fleet.repo_event(self.base, self.base / "clean", 1, [warn])
+        self.assertEqual((event["p0"], event["warnings"], event["exit_code"]), (0, 1, 0))
+        summary = fleet.summary_event([event])
+        self.assertEqual((summary["blocked"], summary["exit_code"]), ([], 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
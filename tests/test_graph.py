@@ -0,0 +1,102 @@
+"""Tests for <!-- id --> / <!-- after --> item dependencies."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli.blueprint import parse_blueprint  # noqa: E402
+from mmu_cli.cli import command_show  # noqa: E402
+from mmu_cli.graph import build_graph  # noqa: E402
+from mmu_cli.recommend import checklist_progress, recommend  # noqa: E402
+from mmu_cli.state import FileProgress  # noqa: E402
+
+BILLING = """# Billing
+
+## Provider
+- [ ] [P1] Choose payment provider. <!-- id: provider -->
+- [ ] Set up webhook endpoints. <!-- id: webhooks --> <!-- after: provider -->
+- [ ] Handle failed payments. <!-- after: webhooks, payouts -->
+- [ ] Write refund policy.
+"""
+
+MARKETPLACE = """# Marketplace
+
+## Payouts
+- [ ] Connect seller accounts. <!-- id: payouts --> <!-- after: provider -->
+"""
+
+
+def progress(text: str, name: str = "x.md") -> dict:
+    return {Path(name): FileProgress.from_blueprint(parse_blueprint(Path(name), text))}
+
+
+class AnnotationTest(unittest.TestCase):
+    def test_annotations_are_stripped_from_text(self):
+        bp = parse_blueprint(Path("x.md"), BILLING)
+        item = bp.item(3)
+        self.assertEqual(item.text, "Handle failed payments.")
+        self.assertEqual((item.id, item.after), ("", ("webhooks", "payouts")))
+        self.assertIn("<!-- after: webhooks, payouts -->", bp.render({item.line: True}))
+
+
+class GraphTest(unittest.TestCase):
+    def test_cycle_detected_and_not_enforced(self):
+        graph = build_graph(progress(
+            "- [ ] A <!-- id: a --> <!-- after: b -->\n"
+            "- [ ] B <!-- id: b --> <!-- after: a -->\n"
+            "- [ ] C <!-- after: a -->\n"
+        ))
+        self.assertEqual(graph.cyclic, {0, 1, 2})
+        self.assertFalse(graph.is_blocked(Path("x.md"), 0))
+
+    def test_critical_path_is_longest_open_chain(self):
+        graph = build_graph(progress(
+            "- [x] A <!-- id: a -->\n"
+            "- [ ] B <!-- id: b --> <!-- after: a -->\n"
+            "- [ ] C <!-- id: c --> <!-- after: b -->\n"
+            "- [ ] D <!-- after: b, c, missing -->\n"
+        ))
+        self.assertEqual([graph.nodes[n].text for n in graph.critical_path()], ["B", "C", "D"])
+        self.assertEqual([dep for _, dep in graph.unknown], ["missing"])
+
+
+class BlockedItemsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        bp_dir = self.root / "docs" / "blueprints"
+        (bp_dir / "industry").mkdir(parents=True)
+        (bp_dir / "04-billing.md").write_text(BILLING, encoding="utf-8")
+        (bp_dir / "industry" / "marketplace.md").write_text(MARKETPLACE, encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_next_skips_blocked_items(self):
+        top, remaining = recommend(self.root, None, 5)
+        self.assertEqual([r.candidate.text for r in top], ["Choose payment provider.", "Write refund policy."])
+        self.assertEqual(remaining, 2)
+
+    def test_industry_dependency_resolves_across_files(self):
+        graph = build_graph(checklist_progress(self.root))
+        handle = graph.node_at(self.root / "docs" / "blueprints" / "04-billing.md", 2)
+        self.assertEqual([graph.nodes[n].text for n in graph.blockers(handle)], [
+            "Set up webhook endpoints.", "Connect seller accounts.",
+        ])
+        self.assertEqual(graph.unknown, [])
+
+    def test_show_graph(self):
+        result = command_show("billing", self.root, graph=True)
+        path = result["graph"]["critical_path"]
+        self.assertEqual([(n["label"], n["number"]) for n in path], [("Billing", 1), ("Billing", 2), ("Billing", 3)])
+        self.assertEqual(len(result["graph"]["blocked"]), 2)
+        self.assertIn("Critical path", result["messages"][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests for the append-only readiness history."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import history  # noqa: E402
+from mmu_cli.cli import command_check, command_close, command_history, command_status  # noqa: E402
+from mmu_cli.display import StatusSnapshot  # noqa: E402
+
+
+class HistoryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / ".mmu").mkdir()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def snap(self, done: int) -> StatusSnapshot:
+        return StatusSnapshot([("Frontend", done, 10, 0)], [("M0 Problem Fit", 1, 2)])
+
+    def test_append_skips_unchanged_progress(self):
+        self.assertTrue(history.append_record(self.root, self.snap(1), "check"))
+        self.assertFalse(history.append_record(self.root, self.snap(1), "scan"))
+        self.assertTrue(history.append_record(self.root, self.snap(1), "close", force=True))
+        self.assertTrue(history.append_record(self.root, self.snap(2), "check"))
+        records = history.tail(self.root, 10)
+        self.assertEqual([r["src"] for r in records], ["check", "close", "check"])
+        self.assertEqual(records[-1]["bp"], {"Frontend": [2, 10]})
+        self.assertEqual(records[-1]["gates"], {"M0": [1, 2]})
+
+    def test_tail_reads_backwards_across_blocks(self):
+        path = self.root / history.HISTORY_PATH
+        path.write_text("".join(json.dumps({"score": i, "pad": "x" * 50}) + "\n" for i in range(500)), encoding="utf-8")
+        with mock.patch.object(history, "_BLOCK", 64):
+            records = history.tail(self.root, 3)
+        self.assertEqual([r["score"] for r in records], [497, 498, 499])
+        self.assertEqual(len(history.tail(self.root, 1000)), 500)
+
+    def test_sparkline(self):
+        self.assertEqual(history.sparkline([0, 50, 100]), "▁▅█")
+        self.assertEqual(history.sparkline([0, 0]), "▁▁")
+
+    def test_commands_record_and_report(self):
+        bp = self.root / "docs" / "blueprints" / "01-frontend.md"
+        bp.parent.mkdir(parents=True)
+        bp.write_text("# Frontend\n\n## A\n- [ ] one\n- [ ] two\n", encoding="utf-8")
+        command_check("frontend", 1, self.root, force_state="check")
+        command_check("frontend", 1, self.root, force_state="check")  # no change, no record
+        command_close(self.root)
+
+        result = command_history(self.root)
+        self.assertEqual([r["src"] for r in result["records"]], ["check", "close"])
+        self.assertEqual(result["series"]["blueprints"]["Frontend"], [50.0, 50.0])
+
+        status = command_status(self.root, trend=True)
+        self.assertEqual(status["trend"]["score"], [50.0, 50.0])
+        self.assertIn("TREND", status["dashboard"])
+
+    def test_no_workspace_no_history(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertFalse(history.append_record(Path(tmp), self.snap(1), "check"))
+            self.assertEqual(history.tail(Path(tmp), 5), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
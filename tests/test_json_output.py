@@ -0,0 +1,85 @@
+"""Tests for structured (render-free) JSON command results."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import display  # noqa: E402
+from mmu_cli.cli import Result, command_next, command_show, command_status  # noqa: E402
+
+FRONTEND = """# Frontend
+
+## Framework
+- [ ] [P0] Choose framework.
+- [x] Set up TypeScript.
+
+<!-- if:has_i18n -->
+## Localization
+- [ ] Extract strings.
+<!-- endif -->
+"""
+
+
+class LazyResultTest(unittest.TestCase):
+    def test_render_runs_only_on_access(self):
+        calls = []
+        result = Result(exit_code=0, render=lambda: calls.append(1) or ["hello"])
+        self.assertNotIn("messages", dict(result.items()))
+        self.assertIn("messages", result)
+        self.assertEqual(calls, [])
+        self.assertEqual(result["messages"], ["hello"])
+        self.assertEqual(result.get("messages"), ["hello"])
+        self.assertEqual(calls, [1])
+
+
+class StructuredFieldsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        bp = self.root / "docs" / "blueprints" / "01-frontend.md"
+        bp.parent.mkdir(parents=True)
+        bp.write_text(FRONTEND, encoding="utf-8")
+        cfg = self.root / ".mmu" / "config.toml"
+        cfg.parent.mkdir()
+        cfg.write_text("[features]\ni18n = false\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_status_json_skips_rendering(self):
+        with mock.patch.object(display, "render_status", side_effect=AssertionError("rendered")):
+            result = command_status(self.root, why=True)
+            fields = dict(result.items())
+        self.assertEqual(fields["blueprints"][0], {"name": "Frontend", "done": 1, "total": 2, "skipped": 1, "pct": 50})
+        self.assertEqual(fields["disabled_flags"], ["has_i18n"])
+        self.assertNotIn("dashboard", fields)
+
+    def test_show_lists_items_and_skipped_sections(self):
+        result = command_show("frontend", self.root)
+        self.assertEqual(result["items"][0]["priority"], "P0")
+        self.assertEqual([i["done"] for i in result["items"]], [False, True])
+        self.assertEqual(result["skipped_sections"], ["Localization"])
+        self.assertIn("Choose framework.", result["messages"][0])
+
+    def test_next_actions(self):
+        result = command_next(self.root)
+        [action] = result["actions"]
+        self.assertEqual(
+            {k: action[k] for k in ("blueprint", "key", "priority", "severity", "text", "hint")},
+            {
+                "blueprint": "Frontend", "key": "frontend", "priority": "P0",
+                "severity": "critical", "text": "Choose framework.", "hint": "mmu show frontend",
+            },
+        )
+        self.assertEqual(set(action["rationale"]) >= {"priority", "gate", "depth", "recency"}, True)
+        self.assertEqual(result["remaining"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Tests for the shared manifest layer and its content-hash cache."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import manifests  # noqa: E402
+from mmu_cli.cache import CACHE_DIR  # noqa: E402
+
+
+class ManifestTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        manifests._FILE_MEMO.clear()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write(self, rel: str, content: str) -> None:
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+class ParsingTest(ManifestTestCase):
+    def test_pyproject_parsed_with_toml(self):
+        self.write("pyproject.toml", """
+[project]
+name = "app"
+dependencies = ["FastAPI>=0.110", "sentry_sdk[fastapi]~=2.0"]
+
+[project.optional-dependencies]
+test = ["pytest"]
+
+[tool.poetry.dependencies]
+python = "^3.11"
+Stripe = "^9"
+""")
+        py = manifests.load_manifests(self.root).py
+        self.assertEqual(set(py), {"fastapi", "sentry-sdk", "pytest", "stripe"})
+        self.assertEqual(py["fastapi"], "pyproject.toml")
+
+    def test_requirements_skip_options_and_comments(self):
+        self.write("requirements.txt", "# pinned\n-r base.txt\n--index-url https://x\nDjango==5.0  # web\npsycopg2-binary\n")
+        self.assertEqual(set(manifests.load_manifests(self.root).py), {"django", "psycopg2-binary"})
+
+    def test_package_json_sections_and_mentions(self):
+        self.write("package.json", json.dumps({
+            "dependencies": {"@sentry/node": "^7"},
+            "devDependencies": {"vitest": "^1"},
+            "scripts": {"sentry": "echo not-a-dep"},
+        }))
+        m = manifests.load_manifests(self.root)
+        self.assertEqual(set(m.npm), {"@sentry/node", "vitest"})
+        self.assertTrue(m.mentions("sentry"))
+        self.assertFalse(m.mentions("express"))
+
+    def test_invalid_manifest_is_empty(self):
+        self.write("package.json", "{not json")
+        self.assertEqual(manifests.load_manifests(self.root).npm, {})
+
+
+class EcosystemTest(ManifestTestCase):
+    def test_go_mod_require_lines_and_blocks(self):
+        self.write("go.mod", "module example.com/app\n\ngo 1.22\n\nrequire github.com/lib/pq v1.10.9\n\nrequire (\n\tgithub.com/stripe/stripe-go/v76 v76.8.0\n\tgithub.com/getsentry/sentry-go v0.27.0 // indirect\n)\n")
+        go = manifests.load_manifests(self.root).deps["go"]
+        self.assertEqual(set(go), {"github.com/lib/pq", "github.com/stripe/stripe-go", "github.com/getsentry/sentry-go"})
+
+    def test_lock_files(self):
+        self.write("Gemfile.lock", "GEM\n  remote: https://rubygems.org/\n  specs:\n    pg (1.5.4)\n    stripe (10.0.0)\n      faraday (>= 1)\n\nPLATFORMS\n  ruby\n")
+        self.write("Cargo.lock", '[[package]]\nname = "sentry"\nversion = "0.32.0"\ndependencies = [\n "serde",\n]\n')
+        self.write("composer.lock", json.dumps({"packages": [{"name": "stripe/stripe-php", "authors": [{"name": "Stripe and contributors"}]}]}, indent=4))
+        deps = manifests.load_manifests(self.root).deps
+        self.assertEqual(set(deps["rubygems"]), {"pg", "stripe"})
+        self.assertEqual(set(deps["cargo"]), {"sentry"})
+        self.assertEqual(set(deps["packagist"]), {"stripe/stripe-php"})
+
+    def test_jvm_and_dotnet_builds(self):
+        self.write("pom.xml", "<project><dependencies>\n<dependency>\n  <groupId>com.stripe</groupId>\n  <artifactId>stripe-java</artifactId>\n</dependency>\n</dependencies></project>\n")
+        self.write("build.gradle.kts", 'dependencies {\n    implementation("io.sentry:sentry:7.0.0")\n}\n')
+        self.write("Api.csproj", '<Project>\n  <ItemGroup>\n    <PackageReference Include="Npgsql" Version="8.0.0" />\n  </ItemGroup>\n</Project>\n')
+        m = manifests.load_manifests(self.root)
+        self.assertEqual(set(m.deps["maven"]), {"com.stripe:stripe-java", "io.sentry:sentry"})
+        self.assertEqual(m.deps["nuget"], {"npgsql": "Api.csproj"})
+        self.assertEqual(m.sources["maven"], ["pom.xml", "build.gradle.kts"])
+
+
+class CacheTest(ManifestTestCase):
+    def test_no_cache_written_outside_workspace(self):
+        self.write("requirements.txt", "flask\n")
+        manifests.load_manifests(self.root)
+        self.assertFalse((self.root / ".mmu").exists())
+
+    def test_cache_reused_by_content_hash(self):
+        (self.root / ".mmu").mkdir()
+        self.write("requirements.txt", "flask\n")
+        manifests.load_manifests(self.root)
+        cache_path = self.root / CACHE_DIR / manifests.CACHE_NAME
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        self.assertEqual(data["entries"]["requirements.txt"]["deps"], ["flask"])
+
+        # A later run with identical content trusts the cached parse.
+        data["entries"]["requirements.txt"]["deps"] = ["from-cache"]
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+        manifests._FILE_MEMO.clear()
+        self.assertEqual(set(manifests.load_manifests(self.root).py), {"from-cache"})
+
+        # Changed content invalidates the entry.
+        self.write("requirements.txt", "django\n")
+        manifests._FILE_MEMO.clear()
+        self.assertEqual(set(manifests.load_manifests(self.root).py), {"django"})
+
+
+if __name__ == "__main__":
+    unittest.main()
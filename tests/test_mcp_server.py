@@ -34,6 +34,12 @@ class MCPDataLayerTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             mcp_server.get_blueprint("does-not-exist", REPO_ROOT)
 
+    def test_search_docs_finds_items_with_check_numbers(self):
+        results = mcp_server.search_docs("idempotency keys", 5, REPO_ROOT)
+        top = results[0]
+        self.assertEqual(top["path"], "docs/blueprints/02-backend.md")
+        self.assertTrue(top["check"].startswith("mmu check backend "))
+
     def test_list_idea_templates(self):
         templates = mcp_server.list_idea_templates(REPO_ROOT)
         names = [t["name"] for t in templates]
@@ -0,0 +1,123 @@
+"""Tests for `--format ndjson` on doctor, vibecheck, scan and gate."""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import cli, daemon  # noqa: E402
+from mmu_cli.vibecheck import iter_vibecheck  # noqa: E402
+
+CHECKLIST = """# From scratch
+
+## M0 Setup
+- [x] Repo created.
+- [ ] Pick a name.
+  - [ ] Buy the domain.
+
+## M1 Build
+- [x] Ship it.
+"""
+
+
+def write(root: Path, rel: str, content: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+class NdjsonTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        write(self.root, "docs/checklists/from_scratch.md", CHECKLIST)
+        write(self.root, "package.json", '{"dependencies": {"next": "14", "stripe": "1"}}')
+        write(self.root, "docs/blueprints/04-billing.md", "## Billing\n- [ ] Choose a payment provider.\n")
+        for i in range(5):
+            write(self.root, f"app/mod{i}.py", "x = 1\n")
+        write(self.root, "app/db.py", 'q = f"SELECT * FROM users WHERE id = {uid}"\n')
+        env = mock.patch.dict(os.environ, {daemon.DISABLE_ENV: "1"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def run_cli(self, *argv: str) -> tuple[int, str]:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = cli.main([*argv, "--root", str(self.root)])
+        return code, out.getvalue()
+
+    def events(self, *argv: str) -> tuple[int, list[dict]]:
+        code, out = self.run_cli(*argv, "--format", "ndjson")
+        events = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual(events[-1]["event"], "summary")
+        self.assertEqual(events[-1]["exit_code"], code)
+        return code, events
+
+    def test_doctor_events_match_text_output(self):
+        code, events = self.events("doctor")
+        result = cli.command_doctor(self.root)
+        self.assertEqual(code, result.exit_code)
+        self.assertEqual([f"  [{e['status']}] {e['message']}" for e in events[:-1]], result["messages"][1:-1])
+        self.assertEqual(events[-1]["failures"], sum(e["status"] == "fail" for e in events[:-1]))
+
+    def test_vibecheck_progress_then_findings(self):
+        code, events = self.events("vibecheck")
+        kinds = [e["event"] for e in events]
+        self.assertEqual(kinds[0], "progress")
+        self.assertEqual(kinds.index("finding"), kinds.count("progress"))
+        sql = next(e for e in events if e["event"] == "finding" and e["status"] == "fail")
+        self.assertIn("app/db.py", sql["files"])
+        _, as_json = self.run_cli("vibecheck", "--json")
+        self.assertEqual([{k: v for k, v in e.items() if k != "event"} for e in events if e["event"] == "finding"],
+                         json.loads(as_json)["findings"])
+        self.assertEqual(code, 2)
+
+    def test_vibecheck_streams_before_the_scan_ends(self):
+        stream = iter_vibecheck(self.root, chunk_size=2)
+        self.assertEqual(next(stream), {"event": "progress", "files": 2, "total": 6})
+
+    def test_scan_signals_and_checked_items(self):
+        code, events = self.events("scan")
+        signals = {e["signal"] for e in events if e["event"] == "signal"}
+        self.assertTrue({"nextjs", "stripe"} <= signals)
+        [checked] = [e for e in events if e["event"] == "checked"]
+        self.assertEqual(checked["items"], {"Choose a payment provider.": "stripe"})
+        self.assertEqual((code, events[-1]["newly_checked"]), (0, 1))
+
+    def test_gate_pending_items(self):
+        code, events = self.events("gate", "--stage", "m0")
+        self.assertEqual([e["item"] for e in events[:-1]], ["- [ ] Pick a name.", "- [ ] Buy the domain."])
+        self.assertEqual((code, events[-1]["pending"]), (3, 2))
+        code, events = self.events("gate", "--stage", "M9")
+        self.assertEqual((code, events[0]["event"]), (1, "error"))
+        self.assertEqual(self.run_cli("gate", "--stage", "M1", "--format", "json")[0], 0)
+
+    def test_several_gates(self):
+        code, events = self.events("gate", "--stage", "M0,M1")
+        self.assertEqual([e["stage"] for e in events if e["event"] == "stage"], ["M0", "M1"])
+        self.assertEqual((code, events[-1]["failed"]), (3, ["M0"]))
+        code, events = self.events("gate", "--all")
+        self.assertEqual(events[-1]["stages"], ["M0", "M1"])
+
+    def test_explain_is_rejected_and_ndjson_is_never_forwarded(self):
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(self.run_cli("scan", "--explain", "jwt", "--format", "ndjson")[0], 2)
+        self.assertTrue(daemon._streams(["doctor", "--format", "ndjson"]))
+        self.assertTrue(daemon._streams(["gate", "--format=ndjson", "--stage", "M0"]))
+        self.assertFalse(daemon._streams(["doctor", "--format", "json"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Tests for portfolio status (`mmu status --roots-file` / `--glob`)."""
+
+import csv
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import cli, portfolio  # noqa: E402
+
+GATES = "## M0 Problem Fit\n- [x] a\n- [ ] b\n## M1 Build Fit\n- [ ] c\n"
+
+
+class PortfolioTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        self.make("alpha", "## UI\n- [x] [P0] Done.\n- [x] Also done.\n", "## M0 Problem Fit\n- [x] a\n")
+        self.make("beta", "## UI\n- [ ] [P0] Open.\n- [ ] [P0] Also open.\n", GATES)
+        self.make("gamma", "## UI\n- [ ] [P0] Open.\n- [x] Done.\n", GATES)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def make(self, name: str, blueprint: str, gates: str) -> None:
+        root = self.base / name
+        (root / "docs" / "blueprints").mkdir(parents=True)
+        (root / "docs" / "checklists").mkdir(parents=True)
+        (root / "docs" / "blueprints" / "01-frontend.md").write_text(blueprint, encoding="utf-8")
+        (root / "docs" / "checklists" / "from_scratch.md").write_text(gates, encoding="utf-8")
+
+    def test_rows_sorted_neediest_first_in_a_process_pool(self):
+        roots = [str(self.base / n) for n in ("alpha", "beta", "gamma", "missing")]
+        rows = portfolio.collect(roots + roots[:1], workers=2)
+        self.assertEqual([Path(r["root"]).name for r in rows], ["beta", "gamma", "alpha", "missing"])
+        beta = rows[0]
+        self.assertEqual((beta["score"], beta["p0_open"], beta["open_gates"]), (20, 2, ["M0 Problem Fit", "M1 Build Fit"]))
+        self.assertEqual(rows[-1]["error"], "not a directory")
+
+    def test_cli_glob_with_csv_export(self):
+        out_csv = self.base / "report.csv"
+        argv = ["mmu", "status", "--glob", str(self.base / "*a"), "--export", str(out_csv), "--json", "--workers", "1"]
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", argv), redirect_stdout(out):
+            code = cli.main()
+        self.assertEqual(code, 0)
+        self.assertEqual([Path(p["root"]).name for p in json.loads(out.getvalue())["projects"]], ["beta", "gamma", "alpha"])
+        rows = list(csv.DictReader(out_csv.read_text(encoding="utf-8").splitlines()))
+        self.assertEqual((rows[0]["open_gates"], rows[0]["p0_open"]), ("M0 M1", "2"))
+
+    def test_roots_file(self):
+        listing = self.base / "repos.txt"
+        listing.write_text(f"# clients\n\n{self.base / 'alpha'}\n", encoding="utf-8")
+        self.assertEqual(portfolio.read_roots_file(listing), [str(self.base / "alpha")])
+
+
+if __name__ == "__main__":
+    unittest.main()
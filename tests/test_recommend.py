@@ -0,0 +1,89 @@
+"""Tests for the weighted `mmu next` recommender."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli.recommend import Candidate, recommend, score, top_k  # noqa: E402
+
+GATES = """# From Scratch
+
+## M0 Problem Fit
+- [x] ICP defined.
+- [ ] Problem statement written.
+
+## M1 Build Fit
+- [ ] MVP scope frozen.
+"""
+
+
+def candidate(order: int, group: str = "a", priority: int = 2, **kw) -> Candidate:
+    return Candidate("blueprint", group, group, group, "", priority, f"item {order}", order, **kw)
+
+
+class ScoreTest(unittest.TestCase):
+    def test_priority_tier_dominates(self):
+        p0, _ = score(candidate(0, priority=0, depth=5, age_days=365))
+        p1, _ = score(candidate(1, priority=1, gate_distance=0, gate_ratio=0.9))
+        self.assertGreater(p0, p1)
+
+    def test_rationale_sums_to_score(self):
+        total, rationale = score(candidate(0, priority=1, depth=1, gate_distance=1, gate_ratio=0.5, age_days=7))
+        self.assertAlmostEqual(sum(rationale.values()), total)
+        self.assertAlmostEqual(rationale["recency"], 0.5)
+        self.assertAlmostEqual(rationale["depth"], 0.5)
+
+    def test_top_k_caps_each_source_and_breaks_ties_by_order(self):
+        items = [candidate(i, "a") for i in range(1000)] + [candidate(1000 + i, "b") for i in range(3)]
+        top = top_k(items, 5)
+        self.assertEqual([r.candidate.text for r in top], ["item 0", "item 1", "item 1000", "item 1001"])
+
+
+class RecommendTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write(self, rel: str, content: str, age_days: float = 0) -> None:
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        if age_days:
+            stamp = path.stat().st_mtime - age_days * 86400
+            os.utime(path, (stamp, stamp))
+
+    def test_all_sources_ranked_together(self):
+        self.write("docs/blueprints/01-frontend.md", "## UI\n- [ ] Pick a framework.\n- [ ] Add dark mode.\n", 60)
+        self.write("docs/checklists/from_scratch.md", GATES)
+        self.write("docs/checklists/auth_security.md", "## Identity\n- [ ] [P1] Password reset flow exists.\n")
+        top, remaining = recommend(self.root, None, 4)
+        self.assertEqual(
+            [(r.candidate.source, r.candidate.text) for r in top],
+            [
+                ("checklist", "Password reset flow exists."),
+                ("gate", "Problem statement written."),
+                ("gate", "MVP scope frozen."),
+                ("blueprint", "Pick a framework."),
+            ],
+        )
+        self.assertEqual(top[1].candidate.hint, "mmu gate M0")
+        self.assertEqual(top[1].to_dict()["rationale"]["gate_distance"], 0)
+        self.assertEqual(remaining, 1)
+
+    def test_depth_follows_section_order(self):
+        self.write("docs/blueprints/02-backend.md", "## API\n- [ ] First.\n- [ ] Second.\n## Data\n- [ ] Third.\n")
+        top, _ = recommend(self.root, None, 2)
+        self.assertEqual([r.candidate.text for r in top], ["First.", "Third."])
+
+
+if __name__ == "__main__":
+    unittest.main()
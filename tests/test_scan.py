@@ -0,0 +1,141 @@
+"""Tests for `mmu scan` signal evidence and the persisted scan index."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import scan  # noqa: E402
+from mmu_cli.cli import command_scan, command_show  # noqa: E402
+
+
+class ScanTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write(self, rel: str, content: str) -> None:
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+class EvidenceTest(ScanTestCase):
+    def test_manifest_evidence_names_dependency(self):
+        self.write("package.json", '{"dependencies": {"stripe": "^14"}}')
+        ev = scan.collect_evidence(self.root)["stripe"]
+        self.assertIsNotNone(ev)
+        self.assertEqual((ev.kind, ev.source, ev.key), ("manifest", "package.json", "stripe"))
+
+    def test_file_evidence_records_first_match_offset(self):
+        self.write("src/auth.py", "import os\n\nheaders = {'Authorization': 'Bearer ' + token}\n")
+        ev = scan.collect_evidence(self.root)["jwt"]
+        self.assertEqual(ev.kind, "file")
+        self.assertEqual(ev.source, "src/auth.py")
+        self.assertEqual(ev.key, "Bearer")
+        detail = scan.resolve_evidence(self.root, ev)
+        self.assertEqual(detail["line"], 3)
+        self.assertIn("Bearer", detail["snippet"])
+
+    def test_other_ecosystems_map_onto_existing_signals(self):
+        self.write("go.mod", "module example.com/api\n\nrequire (\n\tgithub.com/stripe/stripe-go/v76 v76.8.0\n\tgithub.com/jackc/pgx/v5 v5.5.0\n)\n")
+        ev = scan.collect_evidence(self.root)
+        self.assertEqual((ev["stripe"].source, ev["stripe"].key), ("go.mod", "github.com/stripe/stripe-go"))
+        self.assertIsNotNone(ev["postgresql"])
+        self.assertEqual(ev["go"].source, "go.mod")
+        self.assertIsNone(ev["rust"])
+        self.assertEqual(scan.resolve_evidence(self.root, ev["stripe"])["line"], 4)
+
+    def test_missing_signal_has_no_evidence(self):
+        self.assertIsNone(scan.collect_evidence(self.root)["stripe"])
+
+
+class ScanIndexTest(ScanTestCase):
+    BLUEPRINT = """
+## Provider
+- [ ] Choose payment provider (Stripe, Paddle).
+- [ ] Write refund policy.
+"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        (self.root / ".mmu").mkdir()
+
+    def test_run_scan_persists_index_with_auto_checked_items(self):
+        self.write("docs/blueprints/04-billing.md", self.BLUEPRINT)
+        self.write("package.json", '{"dependencies": {"stripe": "^14"}}')
+        result = scan.run_scan(self.root, None)
+        self.assertIn("stripe", result["evidence"])
+
+        index = json.loads((self.root / scan.SCAN_INDEX_PATH).read_text(encoding="utf-8"))
+        self.assertEqual(index["signals"]["stripe"]["source"], "package.json")
+        self.assertIsNone(index["signals"]["jwt"])
+        self.assertEqual(
+            index["auto_checked"]["04-billing.md"],
+            {"Choose payment provider (Stripe, Paddle).": "stripe"},
+        )
+
+    def test_show_annotates_auto_checked_items(self):
+        self.write("docs/blueprints/04-billing.md", self.BLUEPRINT)
+        self.write("package.json", '{"dependencies": {"stripe": "^14"}}')
+        scan.run_scan(self.root, None)
+        detail = command_show("billing", self.root)["messages"][0]
+        self.assertIn("(auto: stripe)", detail)
+        self.assertEqual(detail.count("(auto:"), 1)
+
+    def test_explain_resolves_line_without_rescanning(self):
+        self.write("package.json", '{\n  "dependencies": {\n    "stripe": "^14"\n  }\n}\n')
+        scan.run_scan(self.root, None)
+        with mock.patch.object(scan, "collect_evidence") as collect:
+            result = command_scan(self.root, explain="stripe")
+        collect.assert_not_called()
+        self.assertEqual((result["detected"], result["evidence"]["line"]), (True, 3))
+
+    def test_explain_rescans_when_indexed_evidence_is_stale(self):
+        self.write("package.json", '{\n  "dependencies": {\n    "stripe": "^14"\n  }\n}\n')
+        self.write("src/auth.py", "headers = {'Authorization': 'Bearer ' + token}\n")
+        scan.run_scan(self.root, None)
+        self.write("package.json", '{\n  "dependencies": {}\n}\n')
+        self.write("src/auth.py", "import os\n\n\nheaders = {'Authorization': 'Bearer ' + token}\n")
+        self.assertTrue(scan.resolve_evidence(self.root, scan.index_evidence(scan.load_scan_index(self.root))["jwt"])["stale"])
+
+        self.assertFalse(command_scan(self.root, explain="stripe")["detected"])
+        self.assertIsNone(scan.load_scan_index(self.root)["signals"]["stripe"])
+        result = command_scan(self.root, explain="jwt")
+        self.assertEqual((result["detected"], result["evidence"]["line"], result["evidence"]["stale"]), (True, 4, False))
+
+    def test_explain_does_not_create_mmu_dir(self):
+        (self.root / ".mmu").rmdir()
+        self.write("package.json", '{"dependencies": {"stripe": "^14"}}')
+        self.assertTrue(command_scan(self.root, explain="stripe")["detected"])
+        self.assertFalse((self.root / ".mmu").exists())
+
+    def test_auto_checked_is_rebuilt_from_the_current_scan(self):
+        self.write("docs/blueprints/04-billing.md", self.BLUEPRINT)
+        self.write("package.json", '{"dependencies": {"stripe": "^14"}}')
+        scan.run_scan(self.root, None)
+        scan.run_scan(self.root, None)  # the item is already checked: its annotation stays
+        self.assertEqual(scan.load_scan_index(self.root)["auto_checked"],
+                         {"04-billing.md": {"Choose payment provider (Stripe, Paddle).": "stripe"}})
+        self.write("package.json", '{"dependencies": {}}')
+        scan.run_scan(self.root, None)  # stripe is gone: so is the claim that it checked the item
+        self.assertEqual(scan.load_scan_index(self.root)["auto_checked"], {})
+
+    def test_explain_reports_line_and_unknown_signal(self):
+        self.write("package.json", '{\n  "dependencies": {\n    "stripe": "^14"\n  }\n}\n')
+        result = command_scan(self.root, explain="stripe")
+        self.assertEqual(result["evidence"]["line"], 3)
+        self.assertEqual(command_scan(self.root, explain="not-a-signal").exit_code, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""Tests for `mmu search` (BM25 over blueprints, checklists and core docs)."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import mcp_server, search  # noqa: E402
+from mmu_cli.cli import command_search  # noqa: E402
+
+BILLING = """# Billing
+
+## Webhooks
+- [ ] Verify Stripe webhook signatures.
+- [ ] Make webhook handlers idempotent.
+
+<!-- if:has_tax -->
+## Tax
+- [ ] Collect VAT IDs.
+<!-- endif -->
+- [ ] Reconcile payouts weekly.
+"""
+
+
+class TokenizeTest(unittest.TestCase):
+    def test_stems_fold_word_forms(self):
+        self.assertEqual(search.tokenize("Idempotency"), search.tokenize("idempotent"))
+        self.assertEqual(search.tokenize("the webhooks"), ["webhook"])
+
+
+class SearchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / ".mmu").mkdir()
+        self.billing = self.root / "docs" / "blueprints" / "04-billing.md"
+        self.billing.parent.mkdir(parents=True)
+        self.billing.write_text(BILLING, encoding="utf-8")
+        core = self.root / "docs" / "core" / "architecture.md"
+        core.parent.mkdir(parents=True)
+        core.write_text("# Architecture\n\n## Events\nAll consumers must be idempotent.\n", encoding="utf-8")
+        search._MEMO.clear()
+
+    def tearDown(self) -> None:
+        search._MEMO.clear()
+        self.tmp.cleanup()
+
+    def test_ranked_results_carry_check_numbers(self):
+        results = search.search(self.root, "idempotency", flags={"has_tax": False})
+        self.assertEqual([(r["path"], r["kind"]) for r in results], [
+            ("docs/blueprints/04-billing.md", "item"),
+            ("docs/core/architecture.md", "section"),
+        ])
+        self.assertEqual(results[0]["check"], "mmu check billing 2")
+
+        vat, = search.search(self.root, "VAT", flags={"has_tax": False})
+        self.assertIsNone(vat["number"])
+        payouts, = search.search(self.root, "payouts", flags={"has_tax": False})
+        self.assertEqual(payouts["number"], 3)
+
+    def test_index_persisted_and_revalidated_per_file(self):
+        search.search(self.root, "webhook")
+        self.assertTrue((self.root / ".mmu" / "cache" / search.CACHE_NAME).is_file())
+
+        search._MEMO.clear()
+        self.billing.write_text(BILLING.replace("weekly", "monthly"), encoding="utf-8")
+        os.utime(self.billing, ns=(1, 1))
+        with mock.patch.object(search, "index_file", wraps=search.index_file) as index_file:
+            results = search.search(self.root, "monthly")
+        self.assertEqual(index_file.call_count, 1)
+        self.assertEqual(results[0]["text"], "Reconcile payouts monthly.")
+
+    def test_command_exit_code(self):
+        self.assertEqual(command_search("zebra", self.root).exit_code, 1)
+        self.assertIn("Verify Stripe webhook signatures.", command_search("stripe", self.root)["messages"][2])
+
+    def test_mcp_search_numbers_items_under_project_flags(self):
+        self.billing.write_text(BILLING.replace("if:has_tax", "if:has_billing"), encoding="utf-8")
+        for enabled, number in (("false", None), ("true", 3)):
+            (self.root / ".mmu" / "config.toml").write_text(f"[features]\nbilling = {enabled}\n", encoding="utf-8")
+            vat, = mcp_server.search_docs("VAT", 5, self.root)
+            self.assertEqual(vat["number"], number)
+            self.assertEqual(command_search("VAT", self.root)["results"][0]["number"], number)
+
+
+if __name__ == "__main__":
+    unittest.main()
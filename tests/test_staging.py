@@ -0,0 +1,75 @@
+"""Tests for staged `mmu init` writes."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import cli, staging  # noqa: E402
+
+
+class CloneFileTest(unittest.TestCase):
+    def test_every_method_copies_the_bytes(self):
+        src = ROOT / "docs" / "blueprints" / "01-frontend.md"
+        with tempfile.TemporaryDirectory() as tmp:
+            method = staging.clone_file(src, Path(tmp) / "a.md")
+            self.assertIn(method, {"reflink", "copy_file_range", "copy"})
+            with mock.patch.object(staging, "_ficlone", return_value=None), \
+                    mock.patch.object(staging.os, "copy_file_range", side_effect=OSError(18, "EXDEV"), create=True):
+                self.assertEqual(staging.clone_file(src, Path(tmp) / "b.md"), "copy")
+            for name in ("a.md", "b.md"):
+                self.assertEqual((Path(tmp) / name).read_bytes(), src.read_bytes())
+            with self.assertRaises(FileExistsError):
+                staging.clone_file(src, Path(tmp) / "a.md")
+
+
+class StagedInitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_init_reports_config_and_leaves_no_staging(self):
+        result = cli.command_init(self.root, force=False)
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn(".mmu/config.toml", result["created"])
+        self.assertIn("docs/blueprints/01-frontend.md", result["created"])
+        self.assertEqual(
+            (self.root / "docs/blueprints/01-frontend.md").read_bytes(),
+            (ROOT / "docs/blueprints/01-frontend.md").read_bytes(),
+        )
+        self.assertEqual([p.name for p in (self.root / ".mmu").iterdir()], ["config.toml"])
+
+    def test_interrupted_init_writes_nothing(self):
+        with mock.patch.object(cli, "_generate_stack_config", side_effect=OSError("disk full")):
+            result = cli.command_init(self.root, force=False)
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("disk full", result["messages"][-1])
+        self.assertEqual([p.name for p in self.root.iterdir()], [".mmu"])
+        self.assertEqual(list((self.root / ".mmu").iterdir()), [])
+        self.assertEqual(cli.command_init(self.root, force=False).exit_code, 0)  # a re-run completes it
+        self.assertTrue((self.root / "Unicorn.md").is_file())
+
+    def test_stale_staging_dirs_are_removed(self):
+        stale = self.root / ".mmu" / "init-dead"
+        (stale / "docs").mkdir(parents=True)
+        old = time.time() - staging.STALE_SECONDS - 60
+        os.utime(stale, (old, old))
+        fresh = self.root / ".mmu" / "init-live"
+        fresh.mkdir()
+        cli.command_init(self.root, force=False)
+        self.assertFalse(stale.exists())
+        self.assertTrue(fresh.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
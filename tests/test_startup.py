@@ -0,0 +1,109 @@
+"""Start-up cost regression tests: what `mmu` imports before running a command."""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import __version__, cli  # noqa: E402
+
+# Total import time of a command, as a multiple of what `python -c pass`
+# imports on the same machine (bytecode precompiled, best of five runs), so
+# the budgets scale with the runner instead of assuming one. `mmu --version`
+# sits near 4.3x and `mmu status` near 8x; the budgets leave about 25% for
+# runner noise. Which modules must stay unloaded is asserted exactly below.
+VERSION_BUDGET = 6.0
+STATUS_BUDGET = 11.0
+MAIN = "import sys; from mmu_cli.cli import main; sys.exit(main())"
+
+# Modules only some commands need; none of them may load just to parse argv.
+LAZY_MODULES = {"subprocess", "json", "datetime", "tomllib", "argparse", "urllib.request", "xml.sax.saxutils"}
+
+
+PYCACHE = tempfile.TemporaryDirectory()  # compiled once, so budgets measure imports, not compiling
+
+
+def _importtime(code: str, *args: str) -> str:
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    env.update({"PYTHONPATH": str(SRC), "NO_COLOR": "1", "MMU_NO_DAEMON": "1", "PYTHONPYCACHEPREFIX": PYCACHE.name})
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        capture_output=True, text=True, env=env, cwd=str(ROOT), check=False,
+    )
+    return proc.stderr
+
+
+def importtime(code: str, *args: str) -> dict[str, int]:
+    """Module -> cumulative import time (us) of running *code* with ``-X importtime``."""
+    times = {}
+    for line in _importtime(code, *args).splitlines():
+        m = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S.*)$", line)
+        if m:
+            times[m.group(2).strip()] = int(m.group(1))
+    return times
+
+
+def total_importtime(code: str, *args: str) -> int:
+    """Sum of every module's own import time (us), best of five warm runs."""
+    _importtime(code, *args)
+    return min(
+        sum(int(t) for t in re.findall(r"import time:\s+(\d+) \|", _importtime(code, *args)))
+        for _ in range(5)
+    )
+
+
+class StartupTest(unittest.TestCase):
+    def test_cli_import_is_lazy(self):
+        times = importtime("import mmu_cli.cli")
+        self.assertIn("mmu_cli.cli", times)
+        self.assertEqual(LAZY_MODULES & set(times), set())
+
+    def test_display_leaves_checklist_modules_to_the_commands_that_read_them(self):
+        times = importtime("import mmu_cli.display")
+        self.assertNotIn("mmu_cli.blueprint", times)
+        self.assertNotIn("mmu_cli.state", times)
+
+    def test_version_and_status_import_within_budget(self):
+        baseline = total_importtime("pass")
+        version = total_importtime(MAIN, "--version")
+        self.assertNotIn("argparse", importtime(MAIN, "--version"))
+        self.assertLess(version / baseline, VERSION_BUDGET)
+        status = total_importtime(MAIN, "status")
+        self.assertLess(status / baseline, STATUS_BUDGET)
+
+    def test_status_does_not_load_badge_or_network_modules(self):
+        times = importtime(MAIN, "status")
+        self.assertIn("mmu_cli.display", times)
+        for name in ("urllib.request", "xml.sax.saxutils", "subprocess", "tomllib", "shutil"):
+            self.assertNotIn(name, times)
+
+    def test_version(self):
+        pyproject = (ROOT / "pyproject.toml").read_text(encoding="utf-8")
+        self.assertIn(f'version = "{__version__}"', pyproject)
+        with self.assertRaises(SystemExit) as ctx:
+            cli.parse_args(["--version"])
+        self.assertEqual(ctx.exception.code, 0)
+
+    def test_only_selected_command_gets_arguments(self):
+        self.assertEqual(cli.selected_command(["--root", "status", "show", "billing"]), "show")
+        self.assertIsNone(cli.selected_command(["--json"]))
+        args = cli.parse_args(["--root", ".", "show", "billing", "--graph"])
+        self.assertEqual((args.command, args.blueprint, args.graph), ("show", "billing", True))
+        parser = cli.build_parser("show")
+        sub = next(a for a in parser._actions if a.dest == "command")
+        self.assertEqual([a.dest for a in sub.choices["status"]._actions], ["help"])
+
+
+def tearDownModule() -> None:
+    PYCACHE.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
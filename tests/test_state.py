@@ -0,0 +1,93 @@
+"""Tests for persisted checklist progress in .mmu/state.json."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import state  # noqa: E402
+from mmu_cli.cli import command_check  # noqa: E402
+from mmu_cli.display import scan_all_blueprints, scan_gates  # noqa: E402
+
+FRONTEND = """# Frontend
+
+## Framework
+- [ ] Choose framework.
+- [x] Set up TypeScript.
+"""
+
+
+class StateTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / ".mmu").mkdir()
+        self.bp = self.root / "docs" / "blueprints" / "01-frontend.md"
+        self.bp.parent.mkdir(parents=True)
+        self.bp.write_text(FRONTEND, encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def entry(self) -> dict:
+        data = json.loads((self.root / state.STATE_PATH).read_text(encoding="utf-8"))
+        return data["files"]["docs/blueprints/01-frontend.md"]
+
+    def test_readers_trust_state_while_file_unchanged(self):
+        self.assertEqual(scan_all_blueprints(self.root), [("Frontend", 1, 2, 0)])
+        self.assertEqual(self.entry()["items"], [[0, 2, "Choose framework."], [1, 2, "Set up TypeScript."]])
+        with mock.patch.object(state, "parse_blueprint", side_effect=AssertionError("re-parsed")):
+            self.assertEqual(scan_all_blueprints(self.root), [("Frontend", 1, 2, 0)])
+            # Touched but identical: the hash still matches, so no parse either.
+            os.utime(self.bp, ns=(1, 1))
+            self.assertEqual(scan_all_blueprints(self.root), [("Frontend", 1, 2, 0)])
+        self.assertEqual(self.entry()["sig"][0], 1)
+
+    def test_edits_and_flag_changes_invalidate(self):
+        scan_all_blueprints(self.root)
+        self.bp.write_text(FRONTEND.replace("- [ ] Choose", "- [x] Choose"), encoding="utf-8")
+        self.assertEqual(scan_all_blueprints(self.root), [("Frontend", 2, 2, 0)])
+        scan_all_blueprints(self.root, {"has_billing": False})
+        self.assertEqual(self.entry()["flags"], state.flags_hash({"has_billing": False}))
+
+    def test_same_size_edit_in_the_same_mtime_tick_is_seen(self):
+        tick = os.stat(self.bp).st_mtime_ns
+        self.assertEqual(scan_all_blueprints(self.root), [("Frontend", 1, 2, 0)])
+        self.bp.write_text(FRONTEND.replace("- [ ] Choose", "- [x] Choose"), encoding="utf-8")
+        os.utime(self.bp, ns=(tick, tick))  # same size, same mtime: the signature cannot tell
+        self.assertEqual(scan_all_blueprints(self.root), [("Frontend", 2, 2, 0)])
+
+        os.utime(self.bp, ns=(1, 1))  # long before it was read: the signature is enough again
+        scan_all_blueprints(self.root)
+        with mock.patch.object(Path, "read_bytes", side_effect=AssertionError("re-hashed")):
+            self.assertEqual(scan_all_blueprints(self.root), [("Frontend", 2, 2, 0)])
+
+    def test_check_updates_state_in_place(self):
+        scan_all_blueprints(self.root, {})
+        result = command_check("frontend", 1, self.root, force_state="check")
+        self.assertEqual(result["action"], "checked")
+        entry = self.entry()
+        self.assertEqual([item[0] for item in entry["items"]], [1, 1])
+        self.assertEqual(entry["sig"], [self.bp.stat().st_mtime_ns, self.bp.stat().st_size])
+
+    def test_gates_and_no_workspace(self):
+        gates = self.root / "docs" / "checklists" / "from_scratch.md"
+        gates.parent.mkdir(parents=True)
+        gates.write_text("## M0 Problem Fit\n- [x] a\n- [ ] b\n", encoding="utf-8")
+        self.assertEqual(scan_gates(self.root), [("M0 Problem Fit", 1, 2)])
+
+        (self.root / state.STATE_PATH).unlink()
+        (self.root / ".mmu").rmdir()
+        self.assertEqual(scan_gates(self.root), [("M0 Problem Fit", 1, 2)])
+        self.assertFalse((self.root / ".mmu").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Tests for `MMU_TRACE` Chrome trace-event export."""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+from mmu_cli import cli, trace  # noqa: E402
+
+
+def write(root: Path, rel: str, content: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+class TraceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        self.out = self.base / "trace.json"
+        for name in ("one", "two"):
+            repo = self.base / "repos" / name
+            (repo / ".git").mkdir(parents=True)
+            for i in range(6):
+                write(repo, f"app/m{i}.py", "x = 1\n")
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop(trace.PARENT_ENV, None)
+        trace.configure(str(self.out))
+        self.addCleanup(trace.configure, None)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def run_cli(self, *argv: str) -> dict:
+        err = io.StringIO()
+        with redirect_stdout(io.StringIO()), redirect_stderr(err):
+            cli.main(list(argv))
+        self.assertIn(f"wrote {self.out}", err.getvalue())
+        return json.loads(self.out.read_text(encoding="utf-8"))
+
+    def test_command_spans(self):
+        data = self.run_cli("vibecheck", "--root", str(self.base / "repos" / "one"))
+        spans = [e for e in data["traceEvents"] if e["ph"] == "X"]
+        names = {e["name"] for e in spans}
+        self.assertTrue({"mmu vibecheck", "parse_args", "index.walk", "read", "check:secrets", "render"} <= names)
+        self.assertEqual(sum(e["name"] == "read" for e in spans), 6)
+        for event in spans:
+            self.assertEqual({"pid", "tid", "ts", "dur"} - set(event), set())
+        outer = next(e for e in spans if e["name"] == "mmu vibecheck")
+        for event in spans:
+            self.assertGreaterEqual(event["ts"], outer["ts"])
+        self.assertNotIn(trace.PARENT_ENV, os.environ)
+
+    def test_pool_workers_are_merged(self):
+        data = self.run_cli("fleet", "vibecheck", str(self.base / "repos"), "--workers", "2", "--chunk-size", "2")
+        pids = {e["pid"] for e in data["traceEvents"] if e["name"] == "vibecheck.scan_chunk"}
+        self.assertTrue(pids)
+        self.assertNotIn(os.getpid(), pids)
+        labels = [e["args"]["name"] for e in data["traceEvents"] if e["name"] == "process_name"]
+        self.assertEqual(labels[0], "mmu fleet vibecheck " + str(self.base / "repos") + " --workers 2 --chunk-size 2")
+        self.assertIn("mmu worker", labels)
+        self.assertEqual(sorted(p.name for p in self.base.iterdir()), ["repos", "trace.json"])  # parts removed
+
+    def test_disabled_records_nothing(self):
+        trace.configure(None)
+        with trace.span("x") as first, trace.span("y") as second:
+            pass
+        self.assertIs(first, second)
+        self.assertIsNone(trace.finish())
+        self.assertFalse(self.out.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
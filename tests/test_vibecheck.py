@@ -7,7 +7,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "src"))
 
 from mmu_cli import vibecheck  # noqa: E402
-from mmu_cli.cli import command_vibecheck  # noqa: E402
+from mmu_cli.cli import command_vibecheck, command_vibecheck_merge, command_vibecheck_shard  # noqa: E402
 
 
 def write(root: Path, rel: str, content: str) -> None:
@@ -151,5 +151,64 @@ class CommandTests(unittest.TestCase):
             self.assertEqual(result.exit_code, 0)
 
 
+class ShardTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        write(self.root, "app/auth/login.py", "def login(): pass")
+        write(self.root, "app/auth/forgot.py", "# forgot password flow")
+        write(self.root, "app/server.py", "from fastapi import FastAPI")
+        write(self.root, "app/limits.py", "from slowapi import Limiter")
+        write(self.root, "app/monitor.py", "import sentry_sdk")
+        write(self.root, "api/webhooks/stripe.py", "constructEvent(payload)")
+        for i in range(12):
+            write(self.root, f"app/q{i}.py", 'q = f"SELECT * FROM t WHERE id = {i}"' if i % 3 == 0 else "x = 1")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_partition_is_stable_and_complete(self):
+        rels = [f"src/file{i}.ts" for i in range(200)]
+        owners = [vibecheck.shard_of(rel, 8) for rel in rels]
+        self.assertEqual(owners, [vibecheck.shard_of(rel, 8) for rel in rels])
+        self.assertEqual(set(owners), set(range(1, 9)))
+        self.assertEqual(vibecheck.parse_shard("3/8"), (3, 8))
+        for bad in ("0/8", "9/8", "3", "a/b"):
+            with self.assertRaises(ValueError):
+                vibecheck.parse_shard(bad)
+
+    def test_merged_shards_match_a_full_scan(self):
+        expected = [f.to_dict() for f in vibecheck.run_vibecheck(self.root)]
+        for n in (1, 2, 3, 5):
+            docs = [vibecheck.scan_shard(self.root, (k, n)) for k in range(1, n + 1)]
+            self.assertEqual(sum(d["partial"]["files"] for d in docs), 18)
+            merged = [f.to_dict() for f in vibecheck.merge_shards(self.root, docs)]
+            self.assertEqual(merged, expected, f"{n} shards")
+
+    def test_merge_rejects_incomplete_or_mismatched_sets(self):
+        docs = [vibecheck.scan_shard(self.root, (k, 3)) for k in (1, 2, 3)]
+        for bad, reason in (
+            (docs[:2], "missing shard(s): 3/3"),
+            (docs + docs[:1], "given twice"),
+            (docs[:2] + [{**docs[2], "fingerprint": "x"}], "different file lists"),
+            (docs[:2] + [vibecheck.scan_shard(self.root, (3, 4))], "different splits"),
+        ):
+            with self.assertRaises(ValueError) as ctx:
+                vibecheck.merge_shards(self.root, bad)
+            self.assertIn(reason, str(ctx.exception))
+
+    def test_commands_write_and_merge_shard_files(self):
+        with tempfile.TemporaryDirectory() as out:
+            paths = [str(Path(out) / f"shard-{k}-of-2.json") for k in (1, 2)]
+            for k, path in enumerate(paths, 1):
+                self.assertEqual(command_vibecheck_shard(self.root, f"{k}/2", path).exit_code, 0)
+            merged = command_vibecheck_merge(self.root, paths)
+            incomplete = command_vibecheck_merge(self.root, paths[:1])
+        full = command_vibecheck(self.root)
+        self.assertEqual((merged.exit_code, merged["findings"]), (full.exit_code, full["findings"]))
+        self.assertEqual(incomplete.exit_code, 1)
+        self.assertIn("missing shard(s): 2/2", incomplete["messages"][0])
+
+
 if __name__ == "__main__":
     unittest.main()